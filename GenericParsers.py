@@ -16,11 +16,12 @@ Classes:
 Functions:
     parseFile()
         str/, class A, dict, logging.Logger OR `LoggingFSIO.ConsoleLogger,
-            bool OR None, bool, bool/ -> list(type A)
+            bool OR None, bool, bool, bool/ -> list(type A) OR iterator(type A)
     parseManyFiles()
         str, list(str)/, class A, dict
             logging.Logger OR `LoggingFSIO.ConsoleLogger, bool OR None, bool,
-                bool/ -> collections.OrderedDict(str : list(type A))
+                bool, int OR None, bool/
+                    -> collections.OrderedDict(str : list(type A))
 """
 
 __version__ = "0.1.0.2"
@@ -33,8 +34,13 @@ __status__ = "Production"
 
 import os
 import sys
+import re
 import collections
 import json
+import itertools
+import logging
+import multiprocessing
+import multiprocessing.pool
 import xml.etree.ElementTree as ElementTree
 
 #+ my libraries
@@ -45,15 +51,27 @@ if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
 from fsio_lib.StructureMapping import MapValues, FlattenPath, GetElement
-from fsio_lib.StructureMapping import LoadDefinition
+from fsio_lib.StructureMapping import LoadDefinition, IndexXMLTree
+from fsio_lib.StructureMapping import MapColumns
 from fsio_lib.dynamic_import import import_from_module
-from locale_fsio import LoadTable
+from locale_fsio import IterTable
 
 #globals
 
 TEMPLATES_FOLDER = os.path.join(os.path.dirname(os.path.realpath(__file__)),
                                                                     'Templates')
 
+JSON_CHUNK_SIZE = 65536 #size of a chunk (in bytes) of a JSON file read at once
+
+TSV_BATCH_SIZE = 1024 #number of rows of a TSV file mapped column-wise at once
+
+#+ regular expressions
+
+RE_JSON_BRACE = re.compile(r'[{}]') #opening or closing brace outside objects
+
+#+ string literal (possibly unterminated at the end) or brace within an object
+RE_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|[{}]', re.DOTALL)
+
 #+ look-up tables
 
 with open(os.path.join(TEMPLATES_FOLDER, 'json_search_index.json'), 'rt') as FF:
@@ -67,6 +85,117 @@ with open(os.path.join(TEMPLATES_FOLDER, 'index.json'), 'rt') as FF:
 
 #classes
 
+#+ 'private' helper classes
+
+class _LogBuffer(object):
+    """
+    Helper class to collect the log messages issued during parsing of a single
+    file by a worker process or thread, so they can be re-played into the actual
+    logger object by the calling process in the order of the files. Implements
+    the same API as logging.Logger concerning the messages logging methods used
+    by the parsers, including the lazy formatting of the message with the
+    optional arguments.
+    
+    The messages below the passed logging level are discarded without being
+    formatted; the accepted messages are formatted immediately, so only strings
+    are passed between the processes.
+    
+    Attributes:
+        Records: list(tuple(str, str)), the collected pairs of the name of the
+            logging method and the message
+        Level: int, the minimal logging level of the messages to be stored
+    
+    Methods:
+        debug(strMessage, *args)
+            str/, type A, .../ -> None
+        info(strMessage, *args)
+            str/, type A, .../ -> None
+        warning(strMessage, *args)
+            str/, type A, .../ -> None
+        error(strMessage, *args)
+            str/, type A, .../ -> None
+    
+    Version 0.1.0.0
+    """
+    
+    def __init__(self, iLevel = logging.NOTSET):
+        """
+        Initialization method. Creates an empty list of the records.
+        
+        Signature:
+            /int/ -> None
+        
+        Args:
+            iLevel: (optional) int, the minimal logging level of the messages to
+                be stored, defaults to logging.NOTSET, i.e. all
+        
+        Version 0.1.0.0
+        """
+        self.Records = []
+        self.Level = iLevel
+    
+    def _store(self, strMethod, iLevel, strMessage, tupArgs):
+        """
+        Formats the message with the arguments in the same manner as the
+        standard logger does and stores it, if the level is high enough.
+        
+        Signature:
+            str, int, str, tuple -> None
+        
+        Version 0.1.0.0
+        """
+        if iLevel >= self.Level:
+            if len(tupArgs):
+                strMessage = logging.LogRecord('', iLevel, '', 0, strMessage,
+                                                    tupArgs, None).getMessage()
+            self.Records.append((strMethod, strMessage))
+    
+    def debug(self, strMessage, *args):
+        """
+        Stores a DEBUG level message.
+        
+        Signature:
+            str/, type A, .../ -> None
+        
+        Version 0.1.0.0
+        """
+        self._store('debug', logging.DEBUG, strMessage, args)
+    
+    def info(self, strMessage, *args):
+        """
+        Stores an INFO level message.
+        
+        Signature:
+            str/, type A, .../ -> None
+        
+        Version 0.1.0.0
+        """
+        self._store('info', logging.INFO, strMessage, args)
+    
+    def warning(self, strMessage, *args):
+        """
+        Stores a WARNING level message.
+        
+        Signature:
+            str/, type A, .../ -> None
+        
+        Version 0.1.0.0
+        """
+        self._store('warning', logging.WARNING, strMessage, args)
+    
+    def error(self, strMessage, *args):
+        """
+        Stores an ERROR level message.
+        
+        Signature:
+            str/, type A, .../ -> None
+        
+        Version 0.1.0.0
+        """
+        self._store('error', logging.ERROR, strMessage, args)
+
+#+ parser classes
+
 class GenericParser(object):
     """
     Prototype singleton class for parsing data files.
@@ -78,6 +207,12 @@ class GenericParser(object):
     objects, which can be directly used as the source objects for the mapping by
     the class method parseSingleObject().
     
+    A derived class SHOULD also re-define the helper generator class method
+    _iterFile() with the same signature, which yields the same objects one by
+    one as they are read from the file, so the files can be processed in the
+    constant memory by the class method iterFile(). The prototype simply
+    iterates over the list returned by _loadFile().
+    
     The derived classes are also encouraged to define their own helper class
     method _getHints(), which can extract the file loading hints, e.g. the
     length of the header, from the file parsing template as well as the
@@ -93,7 +228,11 @@ class GenericParser(object):
                     bool, bool, bool / -> type B
         parseFile()
             logging.Logger OR `LoggingFSIO.ConsoleLogger,
-                    bool OR None, bool, bool/ -> list(type A)
+                    bool OR None, bool, bool, bool/
+                        -> list(type A) OR iterator(type A)
+        iterFile()
+            logging.Logger OR `LoggingFSIO.ConsoleLogger,
+                    bool OR None, bool, bool/ -> iterator(type A)
         parseManyFiles()
             str, list(str)/, class A, dict
                 logging.Logger OR `LoggingFSIO.ConsoleLogger,
@@ -135,6 +274,36 @@ class GenericParser(object):
         """
         return []
     
+    @classmethod
+    def _iterFile(cls, strFile, dictHints, objLogger = None):
+        """
+        Prototype for the helper generator class method for the incremental
+        parsing of the data files.
+        
+        The derived classes SHOULD define their own version of this helper
+        method, which yields the individual objects (e.g., TSV file lines, JSON
+        objects, etc.) as soon as they are read from the file. This prototype
+        simply iterates over the list returned by the method _loadFile().
+        
+        Signature:
+            str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
+                -> generator(type A)
+        
+        Args:
+            strFile: str, the path to a file to process
+            dictHints: dict, dictionary of hints for processing of the file, if
+                such are extracted from the mapping template
+            objLogger: logging.Logger OR `LoggingFSIO.ConsoleLogger, instance of
+                as a logger object with the standard API
+        
+        Yields:
+            type A: individual objects extracted from the file
+        
+        Version 0.1.0.0
+        """
+        for gEntry in cls._loadFile(strFile, dictHints, objLogger = objLogger):
+            yield gEntry
+    
     @classmethod
     def _getHints(cls, objData, dictTemplate = None):
         """
@@ -254,6 +423,105 @@ class GenericParser(object):
             strError="'DataMapping' entry's value is not a dictionary "
             raise ValueError(strError)
     
+    @classmethod
+    def _resolveTarget(cls, gEntry, clsTarget, dictTemplate, objLogger,
+                                                                bStrictTarget):
+        """
+        Helper method.
+        
+        Determines the target class, the file processing template and the
+        target strictness flag to be used based on the passed arguments and the
+        hints obtained from the first object extracted from the file.
+        
+        Signature:
+            type A, class B OR None, dict OR None,
+                logging.Logger OR `LoggingFSIO.ConsoleLogger OR None,
+                    bool OR None -> tuple(class B, dict, bool)
+        
+        Args:
+            gEntry: type A, the first object extracted from the file
+            clsTarget: class B OR None, the explicitly requested target class
+            dictTemplate: dict OR None, the explicitly passed template
+            objLogger: logging.Logger OR 'LoggingFSIO.ConsoleLogger OR None,
+                instance of, the logger object
+            bStrictTarget: bool OR None, the explicitly requested strictness of
+                the target object
+        
+        Returns:
+            tuple(class B, dict, bool): the target class, template and the
+                target strictness flag
+        
+        Raises:
+            TypeError: the template is not a dictionary
+            ValueError: the target class or the template is not specified and
+                cannot be guessed, or the template is malformed
+        
+        Version 0.1.0.0
+        """
+        try:
+            dictHints = cls._getHints(gEntry, dictTemplate = dictTemplate)
+        except Exception as Err:
+            if not (objLogger is None):
+                strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
+                objLogger.error(strMessage)
+            raise
+        _clsTarget = dictHints.get("TargetClass", None)
+        _dictTemplate = dictHints.get("Template", None)
+        if clsTarget is None:
+            if _clsTarget is None:
+                strError ='Target class is not specified and can not be guessed'
+                if not (objLogger is None):
+                    strMessage = 'ValueError: {}'.format(strError)
+                    objLogger.error(strError)
+                raise ValueError(strError)
+            if bStrictTarget is None:
+                _bStrictTarget = True
+            else:
+                _bStrictTarget = bStrictTarget
+        else:
+            if (_clsTarget is None) and (bStrictTarget is None):
+                _bStrictTarget = True
+            elif (not (clsTarget is _clsTarget)) and (bStrictTarget is None):
+                _bStrictTarget = False
+            elif bStrictTarget is None:
+                _bStrictTarget = True
+            else:
+                _bStrictTarget = bStrictTarget
+            _clsTarget = clsTarget
+        if dictTemplate is None:
+            if _dictTemplate is None:
+                strError = 'Template is not specified and can not be guessed'
+                if not (objLogger is None):
+                    strMessage = 'ValueError: {}'.format(strError)
+                    objLogger.error(strError)
+                raise ValueError(strError)
+        else:
+            _dictTemplate = dictTemplate
+        return _clsTarget, _dictTemplate, _bStrictTarget
+    
+    @classmethod
+    def _iterMapped(cls, iterEntries, clsTarget, dictTemplate, objLogger,
+                                    bStrictTarget, bStrictSource, bForceTarget):
+        """
+        Helper generator method, which maps each of the source objects onto a
+        new instance of the target class as soon as the source object is
+        obtained, see parseSingleObject().
+        
+        Signature:
+            iterable(type A), class B, dict,
+                logging.Logger OR `LoggingFSIO.ConsoleLogger OR None,
+                    bool, bool, bool -> generator(type B)
+        
+        Yields:
+            type B: an instance of the target class
+        
+        Version 0.1.0.0
+        """
+        for gEntry in iterEntries:
+            yield cls.parseSingleObject(gEntry, clsTarget, dictTemplate,
+                objLogger = objLogger, bStrictTarget = bStrictTarget,
+                    bStrictSource = bStrictSource, bForceTarget = bForceTarget)
+    
     #public class methods
     
     @classmethod
@@ -321,8 +589,7 @@ class GenericParser(object):
                 objLogger = objLogger, bStrictTarget = bStrictTarget,
                     bStrictSource = bStrictSource, bForceTarget = bForceTarget)
             if not (objLogger is None):
-                strMessage = 'Mapped {} onto {}'.format(gSource, objTarget)
-                objLogger.info(strMessage)
+                objLogger.info('Mapped %s onto %s', gSource, objTarget)
         except Exception as Err:
             if not (objLogger is None):
                 strMessage ='Exception re-raised'
@@ -333,7 +600,8 @@ class GenericParser(object):
     @classmethod
     def parseFile(cls, strFile, clsTarget = None, dictTemplate = None,
                                 objLogger = None, bStrictTarget = None,
-                                    bStrictSource = True, bForceTarget = False):
+                                    bStrictSource = True, bForceTarget = False,
+                                                                bLazy = False):
         """
         Parses a single data file according to the specified template and
         returns a list of instances of the target class.
@@ -342,9 +610,10 @@ class GenericParser(object):
             1) checks the path to the file - _checkFile() method
             2) gets file loading and parsing hints only by the parsing template
                 using _getHints(None, dictTemplate)
-            3) parses the file into a list of source data objects - _loadFile()
-            4) gets file loading and parsing hints by the file content and the
-                parsing template using _getHints(Data, dictTemplate)
+            3) parses the file into source data objects - _iterFile()
+            4) gets file loading and parsing hints by the first source data
+                object and the parsing template using _getHints(Data,
+                dictTemplate)
             5) updates the mapping rules and parameters, if required
             6) maps the data from each source object onto a new instance (1:1)
                 of the target class
@@ -358,10 +627,14 @@ class GenericParser(object):
         by the content of the file to be processed - if this is not possible the
         ValueError is raised.
         
+        With the optional flag bLazy being True, the method returns an iterator
+        instead of a list, see iterFile().
+        
         Signature:
             str/, class A, dict,
                 logging.Logger OR `LoggingFSIO.ConsoleLogger,
-                    bool OR None, bool, bool/ -> list(type A)
+                    bool OR None, bool, bool, bool/
+                        -> list(type A) OR iterator(type A)
         
         Args:
             strFile: str, full path to the data file to be parsed
@@ -382,9 +655,86 @@ class GenericParser(object):
                 are to be created in the target object, has an effect only if
                 the value of bStrictTarget is False, the default value for
                 bForceTarget False
+            bLazy: (optional) bool, flag if an iterator is to be returned
+                instead of a list, the default value is False
         
         Returns:
             list(type A): a list of an instances of the target class
+            iterator(type A): iterator over the instances of the target class,
+                if the flag bLazy is True
+        
+        Raises:
+            TypeError: wrong mapping dictionary format or missmatch between the
+                structure of the target and source objects and the mapping rules
+                or the path to a file is not a string
+            ValueError: wrong mapping dictionary format or missmatch between the
+                structure of the target and source objects and the mapping rules
+                or the template has no key 'DataMapping' or the value bound to
+                it is not a dictionary; or the file path does not reference an
+                existing file
+            AttributeError: missing element of the target or source object if
+                the corresponding flags are set to True, or an immutable element
+                in the target object
+        
+        Version 0.1.0.0
+        """
+        iterResult = cls.iterFile(strFile, clsTarget = clsTarget,
+                            dictTemplate = dictTemplate, objLogger = objLogger,
+                            bStrictTarget = bStrictTarget,
+                            bStrictSource = bStrictSource,
+                            bForceTarget = bForceTarget)
+        if bLazy:
+            gResult = iterResult
+        else:
+            gResult = list(iterResult)
+        return gResult
+    
+    @classmethod
+    def iterFile(cls, strFile, clsTarget = None, dictTemplate = None,
+                                objLogger = None, bStrictTarget = None,
+                                    bStrictSource = True, bForceTarget = False):
+        """
+        Parses a single data file according to the specified template and
+        returns an iterator over the instances of the target class, so the
+        source objects are read from the file, mapped and yielded one by one -
+        in the constant memory, as long as the _iterFile() method of the parser
+        class yields them incrementally.
+        
+        The path to the file and the template are checked, and the first source
+        object is read from the file and used to resolve the target class and
+        the template (see parseFile()) already during the call, therefore the
+        corresponding exceptions are raised immediately. The exceptions related
+        to the reading of the rest of the file and to the mapping of the data
+        are raised during the iteration.
+        
+        Signature:
+            str/, class A, dict,
+                logging.Logger OR `LoggingFSIO.ConsoleLogger,
+                    bool OR None, bool, bool/ -> iterator(type A)
+        
+        Args:
+            strFile: str, full path to the data file to be parsed
+            clsTarget: (optional) class A, class onto instances of which the
+                extracted from a file data must be mapped
+            dictTemplate: (optional) dict, file parsing template, must contain
+                the top level key 'DataMapping' with the mapping rules
+                dictionary as its value
+            objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+                instance of, the logger object, by default is None (not
+                provided)
+            bStrictTarget: (optional) bool OR None, flag if the target object
+                MUST have all expected elements, default value is None, meaning
+                that the parser decides itself
+            bStrictSource: (optional) bool, flag if the source object MUST have
+                all expected elements, default value is True
+            bForceTarget: (optional) bool, flag is the missing elements / paths
+                are to be created in the target object, has an effect only if
+                the value of bStrictTarget is False, the default value for
+                bForceTarget False
+        
+        Returns:
+            iterator(type A): iterator over the instances of the target class,
+                which is empty if the file contains no data
         
         Raises:
             TypeError: wrong mapping dictionary format or missmatch between the
@@ -410,63 +760,26 @@ class GenericParser(object):
                 objLogger.error(strMessage)
             raise
         if not (objLogger is None):
-            strMessage = 'Loading file {}'.format(strFile)
-            objLogger.info(strMessage)
-        lstEntries = cls._loadFile(strFile, dictHints, objLogger = objLogger)
-        if not len(lstEntries):
-            strMessage = 'File {} is empty - nothing is loaded'.format(strFile)
-            if not (objLogger is None):
-                objLogger.info(strMessage)
-            return []
+            objLogger.info('Loading file %s', strFile)
+        iterEntries = cls._iterFile(strFile, dictHints, objLogger = objLogger)
         try:
-            dictHints =cls._getHints(lstEntries[0], dictTemplate = dictTemplate)
-        except Exception as Err:
+            gFirstEntry = next(iterEntries)
+        except StopIteration:
             if not (objLogger is None):
-                strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
-                objLogger.error(strMessage)
-            raise
-        _clsTarget = dictHints.get("TargetClass", None)
-        _dictTemplate = dictHints.get("Template", None)
-        if clsTarget is None:
-            if _clsTarget is None:
-                strError ='Target class is not specified and can not be guessed'
-                if not (objLogger is None):
-                    strMessage = 'ValueError: {}'.format(strError)
-                    objLogger.error(strError)
-                raise ValueError(strError)
-            if bStrictTarget is None:
-                _bStrictTarget = True
-            else:
-                _bStrictTarget = bStrictTarget
-        else:
-            if (_clsTarget is None) and (bStrictTarget is None):
-                _bStrictTarget = True
-            elif (not (clsTarget is _clsTarget)) and (bStrictTarget is None):
-                _bStrictTarget = False
-            elif bStrictTarget is None:
-                _bStrictTarget = True
-            else:
-                _bStrictTarget = bStrictTarget
-            _clsTarget = clsTarget
-        if dictTemplate is None:
-            if _dictTemplate is None:
-                strError = 'Template is not specified and can not be guessed'
-                if not (objLogger is None):
-                    strMessage = 'ValueError: {}'.format(strError)
-                    objLogger.error(strError)
-                raise ValueError(strError)
-        else:
-            _dictTemplate = dictTemplate
-        lstResult = [cls.parseSingleObject(Entry, _clsTarget, _dictTemplate,
-                objLogger = objLogger, bStrictTarget = _bStrictTarget,
-                    bStrictSource = bStrictSource, bForceTarget = bForceTarget)
-                                                        for Entry in lstEntries]
-        return lstResult
+                objLogger.info('File %s is empty - nothing is loaded', strFile)
+            return iter([])
+        _clsTarget, _dictTemplate, _bStrictTarget = cls._resolveTarget(
+                                        gFirstEntry, clsTarget, dictTemplate,
+                                                    objLogger, bStrictTarget)
+        return cls._iterMapped(itertools.chain([gFirstEntry], iterEntries),
+                                _clsTarget, _dictTemplate, objLogger,
+                                _bStrictTarget, bStrictSource, bForceTarget)
     
     @classmethod
     def parseManyFiles(cls, strFolder, strlstFiles, clsTarget = None,
                 dictTemplate = None, objLogger = None, bStrictTarget = None,
-                                    bStrictSource = True, bForceTarget = False):
+                                    bStrictSource = True, bForceTarget = False,
+                                            iWorkers = None, bThreads = False):
         """
         Parses data from several specified data files within a single specified
         directory according to the specified template and returns an ordered
@@ -490,10 +803,18 @@ class GenericParser(object):
         by the content of the file to be processed - if this is not possible the
         ValueError is raised. Dynamically for each file.
         
+        With the optional argument iWorkers being an integer other than 1 the
+        files are distributed across a pool of worker processes (or threads, if
+        the flag bThreads is True), see _parseFilesInPool(). The order of the
+        entries in the returned dictionary is the same, and the messages logged
+        during parsing of each file are forwarded into the logger object in the
+        order of the files. The target class and the parsed objects must be
+        picklable in the processes mode.
+        
         Signature:
             str, list(str)/, class A, dict
                 logging.Logger OR `LoggingFSIO.ConsoleLogger,
-                    bool OR None, bool, bool/
+                    bool OR None, bool, bool, int OR None, bool/
                         -> collections.OrderedDict(str : list(type A))
         
         Args:
@@ -517,6 +838,11 @@ class GenericParser(object):
                 are to be created in the target object, has an effect only if
                 the value of bStrictTarget is False, the default value for
                 bForceTarget False
+            iWorkers: (optional) int OR None, number of the parallel workers;
+                None (default) or 1 - the files are parsed one by one in the
+                calling process, zero or negative - one worker per CPU
+            bThreads: (optional) bool, flag if a pool of threads is to be used
+                instead of a pool of processes, the default value is False
         
         Returns:
             collections.OrderedDict: an ordered dictionary of pairs of the base
@@ -527,7 +853,8 @@ class GenericParser(object):
             TypeError: wrong mapping dictionary format or missmatch between the
                 structure of the target and source objects and the mapping rules
                 or the path to a foler is not a string or any file name is not
-                a string, or the list of base names is not a sequence
+                a string, or the list of base names is not a sequence, or the
+                number of workers is neither None nor an integer
             ValueError: wrong mapping dictionary format or missmatch between the
                 structure of the target and source objects and the mapping rules
                 or the template has no key 'DataMapping' or the value bound to
@@ -562,6 +889,14 @@ class GenericParser(object):
                 strMessage ='ValueError: {}'.format(strError)
                 objLogger.error(strMessage)
             raise ValueError(strError)
+        if not (iWorkers is None or iWorkers == 1):
+            dictArgs = {"clsTarget" : clsTarget, "dictTemplate" : dictTemplate,
+                        "bStrictTarget" : bStrictTarget,
+                        "bStrictSource" : bStrictSource,
+                        "bForceTarget" : bForceTarget}
+            dictResult = _parseFilesInPool(cls, strFolder, strlstFiles,
+                                    dictArgs, objLogger, iWorkers, bThreads)
+            return dictResult
         dictResult = collections.OrderedDict()
         for strFile in strlstFiles:
             if not isinstance(strFile, basestring):
@@ -583,10 +918,17 @@ class GenericParser(object):
 class TSV_Parser(GenericParser):
     """
     Specialized singleton class for parsing the TSV files. Derived from the
-    prototype class Generic_Parser. Redefines the helper class method
+    prototype class Generic_Parser. Redefines the helper class methods
         _loadFile()
             str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
                 -> list(list(str OR int OR float))
+        _iterFile()
+            str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
+                -> generator(list(str OR int OR float))
+        _iterMapped()
+            iterable(list(str OR int OR float)), class B, dict,
+                logging.Logger OR `LoggingFSIO.ConsoleLogger OR None,
+                    bool, bool, bool -> generator(type B)
     
     Inherits all class methods of the super class.
     
@@ -597,7 +939,11 @@ class TSV_Parser(GenericParser):
                     bool, bool, bool / -> type B
         parseFile()
             logging.Logger OR `LoggingFSIO.ConsoleLogger,
-                    bool OR None, bool, bool/ -> list(type A)
+                    bool OR None, bool, bool, bool/
+                        -> list(type A) OR iterator(type A)
+        iterFile()
+            logging.Logger OR `LoggingFSIO.ConsoleLogger,
+                    bool OR None, bool, bool/ -> iterator(type A)
         parseManyFiles()
             str, list(str)/, class A, dict
                 logging.Logger OR `LoggingFSIO.ConsoleLogger,
@@ -617,7 +963,7 @@ class TSV_Parser(GenericParser):
         the top level key 'HeaderOffset'. If such entry is absent, all lines
         are read.
         
-        Wraps the function fsio_lib.locale_fsio.LoadTable()
+        Returns the list of all rows yielded by the method _iterFile().
         
         Signature:
             str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
@@ -634,6 +980,36 @@ class TSV_Parser(GenericParser):
             list(list(str OR int OR float)): list of lists of individual objects
                 extracted from the file (rows of columns)
         
+        Version 0.1.0.0
+        """
+        return list(cls._iterFile(strFile, dictHints, objLogger = objLogger))
+    
+    @classmethod
+    def _iterFile(cls, strFile, dictHints, objLogger = None):
+        """
+        Helper generator class method for the incremental parsing of a data
+        file, which yields the lines (as rows of columns) one by one starting
+        from the offset specified within the template by the top level key
+        'HeaderOffset'. If such entry is absent, all lines are read.
+        
+        Wraps the function fsio_lib.locale_fsio.IterTable(), which reads the
+        file in chunks, so the entire content of the file is never held in
+        memory, and the header lines are skipped without being stored.
+        
+        Signature:
+            str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
+                -> generator(list(str OR int OR float))
+        
+        Args:
+            strFile: str, the path to a file to process
+            dictHints: dict, dictionary of hints for processing of the file, if
+                such are extracted from the mapping template
+            objLogger: logging.Logger OR `LoggingFSIO.ConsoleLogger, instance of
+                as a logger object with the standard API
+        
+        Yields:
+            list(str OR int OR float): a single row of columns
+        
         Version 0.1.0.0
         """
         if dictHints["HeaderOffset"] is None:
@@ -641,7 +1017,8 @@ class TSV_Parser(GenericParser):
         else:
             iOffset = dictHints["HeaderOffset"]
         try:
-            lstResult = LoadTable(strFile, iSkipLines = iOffset)
+            for glstRow in IterTable(strFile, iSkipLines = iOffset):
+                yield glstRow
         except (IOError, OSError) as Err:
             if not (objLogger is None):
                 strMessage = '{}: {}'.format(Err.__class__.__name__,
@@ -653,7 +1030,84 @@ class TSV_Parser(GenericParser):
                 strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
                 objLogger.error(strMessage)
             raise
-        return lstResult
+    
+    @classmethod
+    def _iterMapped(cls, iterEntries, clsTarget, dictTemplate, objLogger,
+                                    bStrictTarget, bStrictSource, bForceTarget):
+        """
+        Helper generator method, which maps the rows of a TSV file onto the new
+        instances of the target class in batches of TSV_BATCH_SIZE rows using
+        the function fsio_lib.StructureMapping.MapColumns(), i.e. column by
+        column, without the look-up of the source column for each row. The
+        rows are read from the file one batch ahead of the yielded objects.
+        
+        The messages issued during the mapping of a batch are collected and
+        passed to the logger only if the entire batch is mapped. Otherwise the
+        batch is re-mapped row by row by the class method parseSingleObject(),
+        so the rows preceding the failed one are yielded, and the exception is
+        raised (and logged) at the failed row. If the class method
+        parseSingleObject() is re-defined by a sub-class, all rows are mapped by
+        it, as by the super class method.
+        
+        Signature:
+            iterable(list(str OR int OR float)), class B, dict,
+                logging.Logger OR `LoggingFSIO.ConsoleLogger OR None,
+                    bool, bool, bool -> generator(type B)
+        
+        Yields:
+            type B: an instance of the target class
+        
+        Version 0.1.0.0
+        """
+        if not (cls.parseSingleObject.__func__ is
+                                    GenericParser.parseSingleObject.__func__):
+            for objTarget in super(TSV_Parser, cls)._iterMapped(iterEntries,
+                                clsTarget, dictTemplate, objLogger,
+                                    bStrictTarget, bStrictSource, bForceTarget):
+                yield objTarget
+            return
+        try:
+            cls._checkTemplate(dictTemplate)
+        except Exception as Err:
+            if not (objLogger is None):
+                strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
+                objLogger.error(strMessage)
+            raise
+        if objLogger is None:
+            iLevel = logging.CRITICAL + 1 #nothing is to be collected
+        elif hasattr(objLogger, 'getEffectiveLevel'):
+            iLevel = objLogger.getEffectiveLevel()
+        else:
+            iLevel = logging.NOTSET
+        iterEntries = iter(iterEntries)
+        while True:
+            glstRows = list(itertools.islice(iterEntries,
+                                                    max(TSV_BATCH_SIZE, 1)))
+            if not len(glstRows):
+                break
+            objBuffer = _LogBuffer(iLevel)
+            try:
+                objlstTargets = MapColumns(clsTarget, glstRows,
+                    dictTemplate['DataMapping'], objLogger = objBuffer,
+                        bStrictTarget = bStrictTarget,
+                            bStrictSource = bStrictSource,
+                                bForceTarget = bForceTarget)
+            except Exception:
+                #re-map row by row -> yield the good rows, raise at the bad one
+                for glstRow in glstRows:
+                    yield cls.parseSingleObject(glstRow, clsTarget,
+                        dictTemplate, objLogger = objLogger,
+                            bStrictTarget = bStrictTarget,
+                                bStrictSource = bStrictSource,
+                                    bForceTarget = bForceTarget)
+                continue
+            if not (objLogger is None):
+                for strLevel, strMessage in objBuffer.Records:
+                    getattr(objLogger, strLevel)(strMessage)
+            for glstRow, objTarget in itertools.izip(glstRows, objlstTargets):
+                if not (objLogger is None):
+                    objLogger.info('Mapped %s onto %s', glstRow, objTarget)
+                yield objTarget
 
 class JSON_Parser(GenericParser):
     """
@@ -664,6 +1118,9 @@ class JSON_Parser(GenericParser):
         _loadFile()
             str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
                 -> list(type A)
+        _iterFile()
+            str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
+                -> generator(type A)
     
     Note, that if the file parsing template is not provided, it is determined
     automatically based on the content of the already loaded data. If the
@@ -678,7 +1135,11 @@ class JSON_Parser(GenericParser):
                     bool, bool, bool / -> type B
         parseFile()
             logging.Logger OR `LoggingFSIO.ConsoleLogger,
-                    bool OR None, bool, bool/ -> list(type A)
+                    bool OR None, bool, bool, bool/
+                        -> list(type A) OR iterator(type A)
+        iterFile()
+            logging.Logger OR `LoggingFSIO.ConsoleLogger,
+                    bool OR None, bool, bool/ -> iterator(type A)
         parseManyFiles()
             str, list(str)/, class A, dict
                 logging.Logger OR `LoggingFSIO.ConsoleLogger,
@@ -789,10 +1250,8 @@ class JSON_Parser(GenericParser):
         Helper class method for the actual parsing of JSON data file.
         
         Parses a text file containing a single or multiple JSON objects and
-        returns a list of JSON objects representing the parsed data. Can handle
-        the proper multiple JSON objects file (stored as an array of objects)
-        as well as simple concatenation of multiple proper JSON file each
-        containing a single object.
+        returns a list of JSON objects representing the parsed data, i.e. all
+        objects yielded by the method _iterFile().
         
         Signature:
             str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
@@ -814,61 +1273,118 @@ class JSON_Parser(GenericParser):
                 measurements data each of the returned objects in the list is a
                 nested dictionary.
         
+        Version 0.1.0.0
+        """
+        return list(cls._iterFile(strFile, dictHints, objLogger = objLogger))
+    
+    @classmethod
+    def _iterFile(cls, strFile, dictHints, objLogger = None):
+        """
+        Helper generator class method for the incremental parsing of JSON data
+        file.
+        
+        Parses a text file containing a single or multiple JSON objects and
+        yields the JSON objects representing the parsed data one by one. Can
+        handle the proper multiple JSON objects file (stored as an array of
+        objects) as well as simple concatenation of multiple proper JSON file
+        each containing a single object.
+        
+        The file is read in chunks of JSON_CHUNK_SIZE bytes, and each "$"
+        character is replaced by "%" within each chunk. The start of the next
+        top level object (opening brace) is searched for using the regular
+        expression, whereas any content between the objects - whitespaces,
+        commas, the brackets of an array - is skipped. Each object is decoded
+        by the method raw_decode() of json.JSONDecoder starting from its
+        opening brace, which properly treats the braces within the string
+        literals and the escape sequences. If the object is not complete yet,
+        i.e. its opening brace is not matched by a closing brace within the
+        already read data (see _IsCompleteJSON()), the next chunks (of doubling
+        size) are read until it can be decoded or the end of the file is
+        reached. A complete but improper object raises ValueError at once,
+        without reading the rest of the file.
+        
+        Signature:
+            str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
+                -> generator(type A)
+        
+        Args:
+            strFile: str, the path to a file to process
+            dictHints: dict, dictionary of hints for processing of the file, if
+                such are extracted from the mapping template
+            objLogger: logging.Logger OR `LoggingFSIO.ConsoleLogger, instance of
+                as a logger object with the standard API
+        
+        Yields:
+            type A: individual object extracted from the file
+        
+        Raises:
+            ValueError: the content of the file cannot be spit properly into
+                separate JSON objects, e.g. a closing brace is found outside an
+                object or an object is not a proper JSON or it is not complete
+        
         Version 0.1.0.0
         """
         try:
-            with open(strFile, 'rt') as fFile:
-                strBuffer = fFile.read()
-            strBuffer = strBuffer.replace("$", "%") #walk-around for "$" keys in
-            # the calibration JSON files
+            fFile = open(strFile, 'rt')
         except (IOError, OSError) as Err:
             if not (objLogger is None):
                 strMessage = '{}: {}'.format(Err.__class__.__name__,
                                                 Err.errno, Err.strerror)
                 objLogger.error(strMessage)
             raise
-        except Exception as Err:
-            if not (objLogger is None):
-                strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
-                objLogger.error(strMessage)
-            raise
-        ituplstTemp = list()
-        iCount = 0
-        for iIdx, strChar in enumerate(strBuffer):
-            if str(strChar) == '{':
-                if not iCount:
-                    iStart = iIdx
-                iCount += 1
-            elif str(strChar) == '}':
-                if iCount <= 0:
+        objDecoder = json.JSONDecoder()
+        with fFile:
+            strBuffer = ''
+            iPos = 0
+            bEOF = False
+            while True:
+                objMatch = RE_JSON_BRACE.search(strBuffer, iPos)
+                if objMatch is None:
+                    if bEOF:
+                        break
+                    #walk-around for "$" keys in the calibration JSON files
+                    strBuffer = fFile.read(JSON_CHUNK_SIZE).replace("$", "%")
+                    iPos = 0
+                    bEOF = not len(strBuffer)
+                    continue
+                if objMatch.group() == '}':
                     strError = "Wrong file structure - not JSON in {}".format(
                                                                         strFile)
                     if not (objLogger is None):
                         strMessage = 'ValueError: {}'.format(strError)
                         objLogger.error(strMessage)
                     raise ValueError(strError)
-                iCount -= 1
-                if not iCount:
-                    ituplstTemp.append((iStart, iIdx))
-        dictlstResult = list()
-        try:
-            for itupPos in ituplstTemp:
-                dictlstResult.append(json.loads(
-                                        strBuffer[itupPos[0] : itupPos[1] + 1]))
-        except Exception as Err:
-            if not (objLogger is None):
-                strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
-                objLogger.error(strMessage)
-            raise
-        return dictlstResult
+                iStart = objMatch.start()
+                iReadSize = JSON_CHUNK_SIZE
+                while True:
+                    try:
+                        gEntry, iPos = objDecoder.raw_decode(strBuffer, iStart)
+                        break
+                    except ValueError as Err:
+                        if bEOF or _IsCompleteJSON(strBuffer, iStart):
+                            if not (objLogger is None):
+                                strMessage ='{}: {}'.format(
+                                        Err.__class__.__name__, Err.message)
+                                objLogger.error(strMessage)
+                            raise
+                    strChunk = fFile.read(iReadSize).replace("$", "%")
+                    if len(strChunk):
+                        strBuffer = strBuffer[iStart : ] + strChunk
+                        iStart = 0
+                        iReadSize *= 2
+                    else:
+                        bEOF = True
+                yield gEntry
 
 class XML_Parser(JSON_Parser):
     """
     Specialized singleton class for parsing the XML files. Derived from the
     class JSON_Parser. Redefines the helper class method
-        _loadFile()
+        _iterFile()
             str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
-                -> list(xml.etree.ElementTree.Element)
+                -> generator(xml.etree.ElementTree.Element)
+    
+    The inherited method _loadFile() returns 1 element list - the root node.
     
     Note, that if the file parsing template is not provided, it is determined
     automatically based on the content of the already loaded data. If the
@@ -883,7 +1399,11 @@ class XML_Parser(JSON_Parser):
                     bool, bool, bool / -> type B
         parseFile()
             logging.Logger OR `LoggingFSIO.ConsoleLogger,
-                    bool OR None, bool, bool/ -> list(type A)
+                    bool OR None, bool, bool, bool/
+                        -> list(type A) OR iterator(type A)
+        iterFile()
+            logging.Logger OR `LoggingFSIO.ConsoleLogger,
+                    bool OR None, bool, bool/ -> iterator(type A)
         parseManyFiles()
             str, list(str)/, class A, dict
                 logging.Logger OR `LoggingFSIO.ConsoleLogger,
@@ -902,13 +1422,17 @@ class XML_Parser(JSON_Parser):
     #'private' class methods
     
     @classmethod
-    def _loadFile(cls, strFile, dictHints, objLogger = None):
+    def _iterFile(cls, strFile, dictHints, objLogger = None):
         """
-        Helper class method for the actual parsing of XML data file.
+        Helper generator class method for the actual parsing of XML data file.
+        An XML file contains a single root node, which is the only individual
+        object yielded, thus the entire file is parsed before it is yielded.
+        The tags indexes of the wide nodes are built once for the parsed tree,
+        see StructureMapping.IndexXMLTree().
         
         Signature:
             str, dict/, logging.Logger OR `LoggingFSIO.ConsoleLogger/
-                -> list(xml.etree.ElementTree.Element)
+                -> generator(xml.etree.ElementTree.Element)
         
         Args:
             strFile: str, the path to a file to process
@@ -917,26 +1441,28 @@ class XML_Parser(JSON_Parser):
             objLogger: logging.Logger OR `LoggingFSIO.ConsoleLogger, instance of
                 as a logger object with the standard API
         
-        Returns:
-            list(xml.etree.ElementTree.Element): 1 element list - individual
-                object extracted from the file
+        Yields:
+            xml.etree.ElementTree.Element: individual object extracted from the
+                file - the root node
         
         Version 0.1.0.0
         """
         try:
             etTree = ElementTree.parse(strFile)
             eteRoot = etTree.getroot()
+            IndexXMLTree(eteRoot)
         except Exception as Err:
             if not (objLogger is None):
                 strMessage ='{}: {}'.format(Err.__class__.__name__, Err.message)
                 objLogger.error(strMessage)
             raise
-        return [eteRoot]
+        yield eteRoot
 
 #functions
 
 def parseFile(strFile, clsTarget = None, dictTemplate = None, objLogger = None,
-            bStrictTarget = None, bStrictSource = True, bForceTarget = False):
+            bStrictTarget = None, bStrictSource = True, bForceTarget = False,
+                                                                bLazy = False):
     """
     Parses a single data file according to the specified template and returns a
     list of instances of the target class. Wraps the corresponding methods of
@@ -950,9 +1476,15 @@ def parseFile(strFile, clsTarget = None, dictTemplate = None, objLogger = None,
     the content of the file to be processed - if this is not possible the
     ValueError is raised.
     
+    With the optional flag bLazy being True an iterator over the instances of
+    the target class is returned instead of a list, see GenericParser.iterFile().
+    In this case the parser is selected by successful mapping of the first
+    object in the file, and the exceptions related to the rest of the file are
+    raised during the iteration.
+    
     Signature:
         str/, class A, dict, logging.Logger OR `LoggingFSIO.ConsoleLogger,
-            bool OR None, bool, bool/ -> list(type A)
+            bool OR None, bool, bool, bool/ -> list(type A) OR iterator(type A)
     
     Args:
         strFile: str, full path to the data file to be parsed
@@ -971,9 +1503,13 @@ def parseFile(strFile, clsTarget = None, dictTemplate = None, objLogger = None,
         bForceTarget: (optional) bool, flag is the missing elements / paths are
             to be created in the target object, has an effect only if the value
             of bStrictTarget is False, the default value for bForceTarget False
+        bLazy: (optional) bool, flag if an iterator is to be returned instead of
+            a list, the default value is False
     
     Returns:
         list(type A): a list of an instances of the target class
+        iterator(type A): iterator over the instances of the target class, if
+            the flag bLazy is True
     
     Raises:
         TypeError: wrong mapping dictionary format or missmatch between the
@@ -1004,28 +1540,39 @@ def parseFile(strFile, clsTarget = None, dictTemplate = None, objLogger = None,
         lstClasses = [XML_Parser, TSV_Parser, JSON_Parser]
     else:
         lstClasses = [TSV_Parser, JSON_Parser, XML_Parser]
-    lstResult = []
+    gResult = None
     for clsParser in lstClasses:
         try:
-            lstResult = clsParser.parseFile(strFile, clsTarget = clsTarget,
-                dictTemplate = dictTemplate, objLogger = objLogger,
+            if bLazy:
+                iterResult = clsParser.iterFile(strFile, clsTarget = clsTarget,
+                    dictTemplate = dictTemplate, objLogger = objLogger,
                     bStrictTarget = bStrictTarget,
                     bStrictSource = bStrictSource, bForceTarget = bForceTarget)
+                gFirst = next(iterResult)
+                gResult = itertools.chain([gFirst], iterResult)
+            else:
+                lstResult = clsParser.parseFile(strFile, clsTarget = clsTarget,
+                    dictTemplate = dictTemplate, objLogger = objLogger,
+                    bStrictTarget = bStrictTarget,
+                    bStrictSource = bStrictSource, bForceTarget = bForceTarget)
+                if len(lstResult):
+                    gResult = lstResult
         except:
             pass
-        if len(lstResult):
+        if not (gResult is None):
             break
-    if not len(lstResult):
+    if gResult is None:
         strError = 'Cannot parse {} file'.format(strFile)
         if not (objLogger is None):
             strMessage ='ValueError: {}'.format(strError)
             objLogger.error(strMessage)
         raise ValueError(strError)
-    return lstResult
+    return gResult
 
 def parseManyFiles(strFolder, strlstFiles, clsTarget = None,
                     dictTemplate = None, objLogger = None, bStrictTarget = None,
-                                    bStrictSource = True, bForceTarget = False):
+                                    bStrictSource = True, bForceTarget = False,
+                                            iWorkers = None, bThreads = False):
     """
     Parses data from several specified data files within a single specified
     directory according to the specified template and returns an ordered
@@ -1050,10 +1597,19 @@ def parseManyFiles(strFolder, strlstFiles, clsTarget = None,
     by the content of the file to be processed - if this is not possible the
     ValueError is raised. Dynamically for each file.
     
+    With the optional argument iWorkers being an integer other than 1 the files
+    are distributed across a pool of worker processes (or threads, if the flag
+    bThreads is True), see _parseFilesInPool(). The order of the entries in the
+    returned dictionary is the same, and the messages logged during parsing of
+    each file are forwarded into the logger object in the order of the files.
+    The target class and the parsed objects must be picklable in the processes
+    mode.
+    
     Signature:
         str, list(str)/, class A, dict
             logging.Logger OR `LoggingFSIO.ConsoleLogger, bool OR None, bool,
-                bool/ -> collections.OrderedDict(str : list(type A))
+                bool, int OR None, bool/
+                    -> collections.OrderedDict(str : list(type A))
     
     Args:
         strFolder: str, path to a folder containing the data files
@@ -1074,6 +1630,11 @@ def parseManyFiles(strFolder, strlstFiles, clsTarget = None,
         bForceTarget: (optional) bool, flag is the missing elements / paths are
             to be created in the target object, has an effect only if the value
             of bStrictTarget is False, the default value for bForceTarget False
+        iWorkers: (optional) int OR None, number of the parallel workers; None
+            (default) or 1 - the files are parsed one by one in the calling
+            process, zero or negative - one worker per CPU
+        bThreads: (optional) bool, flag if a pool of threads is to be used
+            instead of a pool of processes, the default value is False
     
     Returns:
         collections.OrderedDict: an ordered dictionary of pairs of the base file
@@ -1084,7 +1645,8 @@ def parseManyFiles(strFolder, strlstFiles, clsTarget = None,
         TypeError: wrong mapping dictionary format or missmatch between the
             structure of the target and source objects and the mapping rules or
             the path to a foler is not a string or any file name is not a
-            string, or the list of base names is not a sequence
+            string, or the list of base names is not a sequence, or the number
+            of workers is neither None nor an integer
         ValueError: wrong mapping dictionary format or missmatch between the
             structure of the target and source objects and the mapping rules or
             the template has no key 'DataMapping' or the value bound to it is
@@ -1119,6 +1681,14 @@ def parseManyFiles(strFolder, strlstFiles, clsTarget = None,
             strMessage ='ValueError: {}'.format(strError)
             objLogger.error(strMessage)
         raise ValueError(strError)
+    if not (iWorkers is None or iWorkers == 1):
+        dictArgs = {"clsTarget" : clsTarget, "dictTemplate" : dictTemplate,
+                    "bStrictTarget" : bStrictTarget,
+                    "bStrictSource" : bStrictSource,
+                    "bForceTarget" : bForceTarget}
+        dictResult = _parseFilesInPool(None, strFolder, strlstFiles, dictArgs,
+                                            objLogger, iWorkers, bThreads)
+        return dictResult
     dictResult = collections.OrderedDict()
     for strFile in strlstFiles:
         if not isinstance(strFile, basestring):
@@ -1134,4 +1704,189 @@ def parseManyFiles(strFolder, strlstFiles, clsTarget = None,
                     bStrictSource = bStrictSource, bForceTarget = bForceTarget)
         if len(lstResults):
             dictResult[strFile] = lstResults
-    return dictResult
\ No newline at end of file
+    return dictResult
+
+#+ 'private' helper functions
+
+def _IsCompleteJSON(strBuffer, iStart):
+    """
+    Checks if the buffered data contains the entire JSON object starting at the
+    specified position, i.e. if its opening brace is matched by a closing
+    brace outside the string literals. Used to tell an improper JSON object
+    from an object truncated by the end of the buffer.
+    
+    Signature:
+        str, int -> bool
+    
+    Args:
+        strBuffer: str, the buffered content of a JSON file
+        iStart: int, the position of the opening brace of the object
+    
+    Returns:
+        bool: True if the object ends within the buffer, False otherwise
+    
+    Version 0.1.0.0
+    """
+    iDepth = 0
+    for objMatch in RE_JSON_TOKEN.finditer(strBuffer, iStart):
+        strToken = objMatch.group()
+        if strToken == '{':
+            iDepth += 1
+        elif strToken == '}':
+            iDepth -= 1
+            if not iDepth:
+                return True
+    return False
+
+def _parseFileWorker(tupTask):
+    """
+    Helper function executed by a worker process or thread of the pool created
+    by the function _parseFilesInPool(). Parses a single file using either the
+    class method parseFile() of the passed parser class or the module function
+    parseFile() if the parser class is None. The messages are logged into an
+    instance of the _LogBuffer class, and any raised exception is caught and
+    returned as its class and message, since neither the logger objects nor
+    all exceptions can be passed between the processes.
+    
+    Signature:
+        tuple(class GenericParser OR None, str, dict, int)
+            -> tuple(list(type A) OR None, list(tuple(str, str)),
+                                            tuple(class, str) OR None)
+    
+    Args:
+        tupTask: tuple(class GenericParser OR None, str, dict, int), the parser
+            class, the path to the file to parse, the dictionary of the
+            keyword arguments to be passed into the parseFile() and the minimal
+            logging level of the messages to be collected
+    
+    Returns:
+        tuple(list(type A) OR None, list(tuple(str, str)),
+            tuple(class, str) OR None): the list of the parsed objects (None if
+            an exception has been raised), the logged records and the class and
+            message of the raised exception (None if there was no exception)
+    
+    Version 0.1.0.0
+    """
+    clsParser, strFilename, dictArgs, iLevel = tupTask
+    objBuffer = _LogBuffer(iLevel)
+    try:
+        if clsParser is None:
+            lstResults = parseFile(strFilename, objLogger = objBuffer,
+                                                                    **dictArgs)
+        else:
+            lstResults = clsParser.parseFile(strFilename, objLogger = objBuffer,
+                                                                    **dictArgs)
+        tupError = None
+    except Exception as Err:
+        lstResults = None
+        tupError = (Err.__class__, str(Err))
+    return lstResults, objBuffer.Records, tupError
+
+def _parseFilesInPool(clsParser, strFolder, strlstFiles, dictArgs, objLogger,
+                                                        iWorkers, bThreads):
+    """
+    Helper function implementing the parallel mode of the function and class
+    methods parseManyFiles(). The files are distributed in chunks across a pool
+    of worker processes (multiprocessing.Pool) or threads
+    (multiprocessing.pool.ThreadPool), but the results are collected in the
+    order of the files, so the order of the entries in the returned ordered
+    dictionary is the same as in the sequential mode. The messages logged
+    during parsing of each file are forwarded into the passed logger object in
+    the same order, after the file is parsed.
+    
+    The first (in the order of the files) exception raised in a worker is
+    re-raised with the name of the corresponding file added to its message,
+    and the rest of the pending tasks are cancelled.
+    
+    Signature:
+        class GenericParser OR None, str, list(str), dict,
+            logging.Logger OR `LoggingFSIO.ConsoleLogger OR None, int, bool
+                -> collections.OrderedDict(str : list(type A))
+    
+    Args:
+        clsParser: class GenericParser OR None, the parser class to use, or None
+            for the automatic selection of the parser by the function
+            parseFile()
+        strFolder: str, path to a folder containing the data files
+        strlstFiles: list(str), base names of the data files to parse
+        dictArgs: dict, keyword arguments to be passed into parseFile()
+        objLogger: logging.Logger OR `LoggingFSIO.ConsoleLogger OR None,
+            the logger object
+        iWorkers: int, number of the workers, zero or negative - one per CPU
+        bThreads: bool, flag if a pool of threads is to be used instead of a
+            pool of processes
+    
+    Returns:
+        collections.OrderedDict: an ordered dictionary of pairs of the base file
+            names and lists of the objects containing the data extracted from
+            the corresponding file
+    
+    Raises:
+        TypeError: the number of workers is not an integer, or any file name is
+            not a string; or re-raised from a worker
+        ValueError: re-raised from a worker
+        AttributeError: re-raised from a worker
+    
+    Version 0.1.0.0
+    """
+    if (not isinstance(iWorkers, (int, long))) or isinstance(iWorkers, bool):
+        strError = "Wrong type of the number of workers {} argument".format(
+                                                                type(iWorkers))
+        strError = "{}, must be an integer or None".format(strError)
+        if not (objLogger is None):
+            strMessage ='TypeError: {}'.format(strError)
+            objLogger.error(strMessage)
+        raise TypeError(strError)
+    if objLogger is None:
+        iLevel = logging.CRITICAL + 1 #nothing is to be collected
+    elif hasattr(objLogger, 'getEffectiveLevel'):
+        iLevel = objLogger.getEffectiveLevel()
+    else:
+        iLevel = logging.NOTSET
+    lstTasks = []
+    for strFile in strlstFiles:
+        if not isinstance(strFile, basestring):
+            strError="Wrong type of the base file name {}".format(type(strFile))
+            strError = "{}, must be a string".format(strError)
+            if not (objLogger is None):
+                strMessage ='TypeError: {}'.format(strError)
+                objLogger.error(strMessage)
+            raise TypeError(strError)
+        lstTasks.append((clsParser, os.path.join(strFolder, strFile), dictArgs,
+                                                                        iLevel))
+    dictResult = collections.OrderedDict()
+    if not len(lstTasks):
+        return dictResult
+    if iWorkers < 1:
+        iWorkers = multiprocessing.cpu_count()
+    iWorkers = min(iWorkers, len(lstTasks))
+    iChunkSize = max(1, len(lstTasks) // (4 * iWorkers))
+    if bThreads:
+        objPool = multiprocessing.pool.ThreadPool(iWorkers)
+    else:
+        objPool = multiprocessing.Pool(iWorkers)
+    try:
+        iterResults = objPool.imap(_parseFileWorker, lstTasks, iChunkSize)
+        for strFile, tupResult in itertools.izip(strlstFiles, iterResults):
+            lstResults, lstRecords, tupError = tupResult
+            if not (objLogger is None):
+                for strLevel, strMessage in lstRecords:
+                    getattr(objLogger, strLevel)(strMessage)
+            if not (tupError is None):
+                clsError, strError = tupError
+                strError = '{} - in file {}'.format(strError,
+                                                os.path.join(strFolder, strFile))
+                try:
+                    Error = clsError(strError)
+                except Exception:
+                    Error = ValueError(strError)
+                raise Error
+            if len(lstResults):
+                dictResult[strFile] = lstResults
+    except:
+        objPool.terminate()
+        objPool.join()
+        raise
+    objPool.close()
+    objPool.join()
+    return dictResult
@@ -48,10 +48,27 @@ __status__ = "Production"
 #+standard libraries
 
 import os
+import sys
 import inspect
 import shutil
 import logging
+import types
 import datetime
+import time
+import multiprocessing
+import multiprocessing.pool
+import threading
+import Queue
+import atexit
+
+#+my libraries
+
+ROOT_FOLDER = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+from fsio_lib.fs_maintenance import CopyFile
 
 #classes
 
@@ -159,14 +176,22 @@ class ConsoleLogger(object):
         self._setFormatNoLineCode()
         self.enableConsoleLogging()
     
-    def __getattribute__(self, strName):
+    def __getattr__(self, strName):
         """
-        Modified getter method of the attributes resolution. Redirects the
-        resolution scheme such, that the attributes of an instance of the class
-        logging.Logger (referenced by the instance attribute self._logger) can
-        be accessed directly, e.g. the call self.info(msg) is equivalent to the
+        Modified fall-back getter method of the attributes resolution, which is
+        called only if the standard resolution (the instance's own attributes
+        and the attributes of its class and its ancestors) fails. Redirects the
+        resolution to an instance of the class logging.Logger (referenced by
+        the instance attribute self._logger), such that its attributes can be
+        accessed directly, e.g. the call self.info(msg) is equivalent to the
         call self._logger.info(msg).
         
+        Thus the own attributes of the instance and its class are found by the
+        standard resolution at no additional cost. The methods of the logger
+        object (bound to it) are also cached in the instance's dictionary, so
+        the subsequent calls like self.info(msg) cost as much as for the plain
+        logging.Logger; the data attributes are always looked up anew.
+        
         Signature:
             str -> type A
         
@@ -174,8 +199,7 @@ class ConsoleLogger(object):
             strName: string, name of an attribute to obtain
         
         Returns:
-            type A: the value of an attribute self._logger.strName (if exists)
-                or self.strName (if exists, but not within self._logger)
+            type A: the value of an attribute self._logger.strName
         
         Raises:
             AttributeError: an attribute with this name is not found within
@@ -184,24 +208,22 @@ class ConsoleLogger(object):
         
         Version 0.1.0.0
         """
-        if strName in ['__dict__', '__class__']:
-            objResult = object.__getattribute__(self, strName)
-        else:
-            bCond1 = strName in self.__dict__
-            bCond2 = any(map(lambda x: strName in x.__dict__,
-                                                        self.__class__.__mro__))
-            if bCond1 or bCond2:
-                objResult = object.__getattribute__(self, strName)
-            else:
-                try:
-                    objTemp = object.__getattribute__(self, '_logger')
-                    if hasattr(objTemp, strName):
-                        objResult=object.__getattribute__(self._logger, strName)
-                    else: #should result in AttributeError exception
-                        objResult = object.__getattribute__(self, strName)
-                except AttributeError:
-                    #should still result in AttributeError exception
-                    objResult = object.__getattribute__(self, strName)
+        dictSelf = self.__dict__
+        bFound = False
+        if '_logger' in dictSelf:
+            objLogger = dictSelf['_logger']
+            try:
+                objResult = getattr(objLogger, strName)
+                bFound = True
+            except AttributeError:
+                pass
+            if (bFound and isinstance(objResult, types.MethodType) and
+                            (objResult.__self__ is objLogger) and
+                                    not (strName in objLogger.__dict__)):
+                dictSelf[strName] = objResult
+        if not bFound:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                                            self.__class__.__name__, strName))
         return objResult
     
     def __setattr__(self, strName, gValue):
@@ -225,6 +247,7 @@ class ConsoleLogger(object):
             objTemp = object.__getattribute__(self, '_logger')
             if hasattr(objTemp, strName):
                 object.__setattr__(objTemp, strName, gValue)
+                self.__dict__.pop(strName, None) #cached bound method
             else:
                 object.__setattr__(self, strName, gValue)
         except AttributeError:
@@ -291,6 +314,27 @@ class ConsoleLogger(object):
                 '%(message)s']), '%Y-%m-%d %H:%M:%S')
         self.console.setFormatter(self.formatter)
     
+    def _getHandler(self, objHandler):
+        """
+        Helper method.
+        
+        Returns the handler, which is actually attached to the logger in place
+        of the passed handler - the handler itself.
+        
+        Signature:
+            logging.Handler -> logging.Handler
+        
+        Args:
+            objHandler: logging.Handler, instance of, the console or file
+                logging handler
+        
+        Returns:
+            logging.Handler: the same handler
+        
+        Version 0.1.0.0
+        """
+        return objHandler
+    
     #public instance methods
     
     def enableConsoleLogging(self):
@@ -307,7 +351,7 @@ class ConsoleLogger(object):
         Version 0.1.0.0
         """
         if isinstance(self.parent, logging.RootLogger):
-            self._logger.addHandler(self.console)
+            self._logger.addHandler(self._getHandler(self.console))
     
     def disableConsoleLogging(self):
         """
@@ -322,7 +366,7 @@ class ConsoleLogger(object):
         
         Version 0.1.0.0
         """
-        self._logger.removeHandler(self.console)
+        self._logger.removeHandler(self._getHandler(self.console))
     
     def setConsoleLoggingLevel(self, level):
         """
@@ -502,6 +546,13 @@ class DualLogger(ConsoleLogger):
             enabling of the file logging doesn't delete the previously made
             entries
     
+    The asynchronous (non-blocking) logging can be enabled on demand: the log
+    entries are formatted by the calling thread and put into a bounded queue,
+    whereas the console and file output is done by a background thread. On
+    overflow of the queue the calling thread either waits (blocking policy) or
+    the entry is dropped and counted. The method flush() waits until all queued
+    entries are written; it is also called at the interpreter's exit.
+    
     The default format is:
         * For the level below WARNING - 2 lines:
             - logging level, date and time in ASCII format, name of the module,
@@ -525,6 +576,9 @@ class DualLogger(ConsoleLogger):
             class, can be used for the direct access to the file logger handler
         formatter: instance of logging.Formatter class, can be used for the
             changing of the log entries format
+        dropped_records: (read-only property) int >= 0, number of the log
+            entries dropped due to the overflow of the queue since the
+            asynchronous logging is enabled
     
     Methods:
         setConsoleLoggingLevel()
@@ -541,6 +595,12 @@ class DualLogger(ConsoleLogger):
             None -> None
         changeLogFile()
             /str/ -> None
+        enableAsyncLogging()
+            /int >= 0, bool/ -> None
+        disableAsyncLogging()
+            None -> None
+        flush()
+            None -> None
         setLevel()
             int -> None
         debug()
@@ -601,6 +661,10 @@ class DualLogger(ConsoleLogger):
         
         Version 0.1.0.0
         """
+        self._queue = None
+        self._listener = None
+        self._wrappers = {}
+        self._atexit = False
         if strFileName is None:
             self.log_file = '{}_{}.log'.format(
                 datetime.datetime.now().strftime('%Y-%m-%d %H_%M_%S'), strName)
@@ -661,6 +725,52 @@ class DualLogger(ConsoleLogger):
         super(DualLogger, self)._setFormatNoLineCode()
         self.file_logging.setFormatter(self.formatter)
     
+    def _getHandler(self, objHandler):
+        """
+        Helper method.
+        
+        Returns the handler, which is actually attached to the logger in place
+        of the passed handler - the handler itself in the synchronous mode, or
+        its (cached) queued wrapper in the asynchronous mode.
+        
+        Signature:
+            logging.Handler -> logging.Handler
+        
+        Args:
+            objHandler: logging.Handler, instance of, the console or file
+                logging handler
+        
+        Returns:
+            logging.Handler: the same handler or its queued wrapper
+        
+        Version 0.1.0.0
+        """
+        if self._queue is None:
+            objResult = objHandler
+        else:
+            if not (objHandler in self._wrappers):
+                self._wrappers[objHandler] = _QueuedHandler(objHandler,
+                                                                self._queue)
+            objResult = self._wrappers[objHandler]
+        return objResult
+    
+    @property
+    def dropped_records(self):
+        """
+        Read-only property returning the number of the log entries dropped due
+        to the overflow of the queue since the asynchronous logging is enabled.
+        
+        Signature:
+            None -> int >= 0
+        
+        Version 0.1.0.0
+        """
+        if self._queue is None:
+            iResult = 0
+        else:
+            iResult = self._queue.Dropped
+        return iResult
+    
     #public instance methods
     
     def enableFileLogging(self):
@@ -686,12 +796,13 @@ class DualLogger(ConsoleLogger):
         """
         if isinstance(self.file_logging, logging.NullHandler):
             iCurrentLevel = self.file_logging.level
-            self._logger.removeHandler(self.file_logging)
+            self._logger.removeHandler(self._getHandler(self.file_logging))
+            self._wrappers.pop(self.file_logging, None)
             del self.file_logging
             self.file_logging = logging.FileHandler(self.log_file, mode = 'w')
             self.file_logging.setLevel(iCurrentLevel)
             self.file_logging.setFormatter(self.formatter)
-        self._logger.addHandler(self.file_logging)
+        self._logger.addHandler(self._getHandler(self.file_logging))
     
     def disableFileLogging(self):
         """
@@ -709,7 +820,7 @@ class DualLogger(ConsoleLogger):
         Version 0.1.0.0
         """
         if isinstance(self.file_logging, logging.FileHandler):
-            self._logger.removeHandler(self.file_logging)
+            self._logger.removeHandler(self._getHandler(self.file_logging))
     
     def setFileLoggingLevel(self, level):
         """
@@ -747,8 +858,12 @@ class DualLogger(ConsoleLogger):
                 on absolute / relative to the current working directory path is
                 applied.
         
+        In the asynchronous mode the already queued entries are written before
+        the switch.
+        
         Version 0.1.0.0
         """
+        self.flush()
         iCurrentLevel = self.file_logging.level
         if strFileName is None:
             self.log_file = '{}_{}.log'.format(
@@ -757,12 +872,105 @@ class DualLogger(ConsoleLogger):
         else:
             self.log_file = str(strFileName)
         self.file_logging.close()
-        self._logger.removeHandler(self.file_logging)
+        self._logger.removeHandler(self._getHandler(self.file_logging))
+        self._wrappers.pop(self.file_logging, None)
         del self.file_logging
         self.file_logging = logging.FileHandler(self.log_file, mode = 'w')
         self.file_logging.setLevel(iCurrentLevel)
         self.file_logging.setFormatter(self.formatter)
-        self._logger.addHandler(self.file_logging)
+        self._logger.addHandler(self._getHandler(self.file_logging))
+    
+    def enableAsyncLogging(self, iQueueSize = 10000, bBlock = True):
+        """
+        Method to enable the asynchronous logging: the console and file output
+        is done by a background thread, whereas the calling thread only formats
+        the log entries and puts them into a bounded queue. If the asynchronous
+        logging is already enabled, the call is ignored.
+        
+        Signature:
+            /int >= 0, bool/ -> None
+        
+        Args:
+            iQueueSize: (optional) int >= 0, maximum number of the queued log
+                entries, zero means unbounded queue; defaults to 10000
+            bBlock: (optional) bool, overflow policy - if True (default) the
+                calling thread waits until there is a free place in the queue,
+                otherwise the log entry is dropped and counted
+        
+        Raises:
+            TypeError: the queue size is not an integer
+            ValueError: the queue size is negative
+        
+        Version 0.1.0.0
+        """
+        if ((not isinstance(iQueueSize, (int, long))) or
+                                                isinstance(iQueueSize, bool)):
+            raise TypeError('Queue size must be int, not {}'.format(
+                                                            type(iQueueSize)))
+        if iQueueSize < 0:
+            raise ValueError('Queue size must be >= 0, not {}'.format(
+                                                                    iQueueSize))
+        if self._queue is None:
+            lstActive = [objHandler for objHandler in (self.console,
+                                                            self.file_logging)
+                                        if objHandler in self._logger.handlers]
+            for objHandler in lstActive:
+                self._logger.removeHandler(objHandler)
+            self._queue = _LogQueue(iQueueSize, bool(bBlock))
+            self._listener = threading.Thread(target = _processLogQueue,
+                                                        args = (self._queue, ))
+            self._listener.daemon = True
+            self._listener.start()
+            for objHandler in lstActive:
+                self._logger.addHandler(self._getHandler(objHandler))
+            if not self._atexit:
+                atexit.register(self.flush)
+                self._atexit = True
+    
+    def disableAsyncLogging(self):
+        """
+        Method to disable the asynchronous logging: all queued log entries are
+        written, the background thread is stopped, and the console and file
+        output is done by the calling thread again. If the asynchronous logging
+        is not enabled, the call is ignored.
+        
+        Signature:
+            None -> None
+        
+        Version 0.1.0.0
+        """
+        if not (self._queue is None):
+            self.flush()
+            lstActive = [objHandler for objHandler in (self.console,
+                                                            self.file_logging)
+                                if self._getHandler(objHandler) in
+                                                        self._logger.handlers]
+            for objHandler in lstActive:
+                self._logger.removeHandler(self._getHandler(objHandler))
+            self._queue.put(None)
+            self._listener.join()
+            self._queue = None
+            self._listener = None
+            self._wrappers = {}
+            for objHandler in lstActive:
+                self._logger.addHandler(objHandler)
+    
+    def flush(self):
+        """
+        Method to wait until all log entries queued in the asynchronous mode
+        are written, and to flush the console and file output streams. Should
+        be called before the shutdown of the application, although it is also
+        called automatically at the interpreter's exit.
+        
+        Signature:
+            None -> None
+        
+        Version 0.1.0.0
+        """
+        if not (self._queue is None):
+            self._queue.join()
+        self.console.flush()
+        self.file_logging.flush()
 
 class LoggingFSIO(object):
     """
@@ -785,13 +993,22 @@ class LoggingFSIO(object):
         1 : 'Not a string argument:',
         2 : 'Path is not found:',
         3 : 'System error:',
-        4 : 'Failed to perform an operation without system error:'
+        4 : 'Failed to perform an operation without system error:',
+        5 : 'Some operations of the batch failed:'
     
     The exit code > 0 is an error situation, in which case the string
     explanation is normally extended with the details of the error, e.g., with
     which file or folder there is a problem, or the details of the raised and
     caught exception.
     
+    The batch methods copyFiles(), moveFiles() and deleteFiles() execute a list
+    of the respective operations (optionally, by a pool of worker threads) and
+    return a 3-tuple: the error code 0 if all operations succeeded, 1 if the
+    batch itself is improper or 5 ('Some operations of the batch failed:'); the
+    summary string; and the list of the 2-tuples returned by the individual
+    operations in the same order. They log only a single summary record and an
+    error record per failed operation.
+    
     In addition, all methods log the progress of the work flow and the
     encountered problems at different severity levels:
         * DEBUG - normal work flow along the paths, which do not change the
@@ -814,13 +1031,23 @@ class LoggingFSIO(object):
         makeDirs()
             str -> int, str
         copyFile()
-            str\, str, str\ -> int, str
+            str\, str, str\, bool\ -> int, str
         deleteFile()
             str -> int, str
         moveFile()
             str, str\, str\ -> int, str
         renameFile()
             str, str -> int, str
+        copyFiles()
+            list(tuple(str\, str, str\))/, int OR None/
+                -> int, str, list(tuple(int, str))
+        moveFiles()
+            list(tuple(str, str\, str\))/, int OR None/
+                -> int, str, list(tuple(int, str))
+        deleteFiles()
+            list(str)/, int OR None/ -> int, str, list(tuple(int, str))
+        planMoves()
+            list(tuple(str, str\, str\)) -> int, str, list(tuple(int, str))
         setConsoleLoggingLevel()
             int -> None
         setLoggingLevel()
@@ -852,7 +1079,8 @@ class LoggingFSIO(object):
             1 : 'Not a string argument:',
             2 : 'Path is not found:',
             3 : 'System error:',
-            4 : 'Failed to perform an operation without system error:'
+            4 : 'Failed to perform an operation without system error:',
+            5 : 'Some operations of the batch failed:'
         }
     
     @classmethod
@@ -907,18 +1135,22 @@ class LoggingFSIO(object):
                         strMessage = 'Created {} folder'.format(_strFolder)
                         cls._Logger.info(strMessage)
                 except (IOError, OSError) as err:
-                    iError = 3
-                    strError = ' '.join([cls._dictErrors[iError],
-                                         '{}:'.format(err.__class__.__name__),
-                                         '[Errno {}]'.format(err.errno),
-                                         'on "{}" -'.format(_strFolder),
-                                         str(err.strerror)])
-                    cls._Logger.error(strError)
+                    if os.path.isdir(_strFolder): #created by another thread
+                        cls._Logger.debug('{} folder already exists'.format(
+                                                                    strFolder))
+                    else:
+                        iError = 3
+                        strError = ' '.join([cls._dictErrors[iError],
+                                        '{}:'.format(err.__class__.__name__),
+                                        '[Errno {}]'.format(err.errno),
+                                        'on "{}" -'.format(_strFolder),
+                                        str(err.strerror)])
+                        cls._Logger.error(strError)
         return iError, strError
     
     @classmethod
     def copyFile(cls, strSourceFilePath, strTargetFolder = None,
-                    strNewBaseName = None):
+                    strNewBaseName = None, bSync = False):
         """
         Method to copy a file into a new folder with the optional renaming of
         the created copy. Three major modes of operation are available depending
@@ -937,20 +1169,23 @@ class LoggingFSIO(object):
                 from the current one - a new copy of the file with a diffent
                 base name is created in the same (source) folder
         
-        Relies upon the Standard Python Library function shutil.copy2(), which
-        preserves the file's metadata. If this file cannot be copied into the
-        specified destination due to permission limitations, the normally
-        raised OSError or IOError exceptions are intercepted and converted into
-        the string textual explanation, which is returned together with the
-        error code 3.
+        Relies upon the function fs_maintenance.CopyFile(), which preserves the
+        file's metadata as shutil.copy2() does, but transfers the content within
+        the kernel where supported. The size of the copied file and the achieved
+        transfer rate (bytes per second) are logged. If this file cannot be
+        copied into the specified destination due to permission limitations,
+        the normally raised OSError or IOError exceptions are intercepted and
+        converted into the string textual explanation, which is returned
+        together with the error code 3.
         
-        Existing file in the target folder is overwritten.
+        Existing file in the target folder is overwritten. Optionally, the new
+        file is synchronized with the storage device (os.fsync()).
         
         Logs the work flow and encountered errors / exceptions using the class'
         logger.
         
         Signature:
-            str\, str, str\ -> int, str
+            str\, str, str\, bool\ -> int, str
         
         Args:
             strSourceFilePath: str, relative or absolute path to a file to be
@@ -969,6 +1204,8 @@ class LoggingFSIO(object):
                 strTargetFolder and strNewBaseName arguments cannot be None
                 simultaneously; such case is treated as an error with the return
                 code 1.
+            bSync: (optional) bool, if True the new file is synchronized with
+                the storage device before the method returns; defaults to False
         
         Returns:
             tuple(int, str): an unpacked tuple of an integer (error code, 0 is
@@ -1022,10 +1259,18 @@ class LoggingFSIO(object):
                                                                 strBaseName))
                 try:
                     if _strSourceFilePath != strNewFullPath:
-                        shutil.copy2(strSourceFilePath, strNewFullPath)
+                        fStart = time.time()
+                        iSize = CopyFile(strSourceFilePath, strNewFullPath,
+                                                                    bSync)
+                        fElapsed = time.time() - fStart
                         if os.path.isfile(strNewFullPath):
-                            strMessage = 'Copied {} file to {}'.format(
-                                            _strSourceFilePath, strNewFullPath)
+                            if fElapsed > 0:
+                                strRate = '{:.0f}'.format(iSize / fElapsed)
+                            else:
+                                strRate = 'n/a'
+                            strMessage = ('Copied {} file to {} - {} bytes, '
+                                        '{} bytes/s'.format(_strSourceFilePath,
+                                            strNewFullPath, iSize, strRate))
                             cls._Logger.info(strMessage)
                         else:
                             iError = 4
@@ -1132,14 +1377,19 @@ class LoggingFSIO(object):
         If the new base name is not provided (or the default None value is
         given), the base name of the file is not changed, only its location.
         
-        The original file is, at first, copied into a new location with optional
-        change of its base name. Only if copying operation is successful, the
-        original file is deleted. Thus, due to file permissions it is possible
-        that a new file is created but the original one is not deleted.
+        The move strategy depends on the devices of the file and of the target
+        folder (or its nearest existing parent folder), see planMoves(). On the
+        same device the file is simply renamed by os.rename(), which changes
+        only the file system's metadata. Otherwise, or if the renaming fails,
+        the original file is, at first, copied into a new location with the
+        optional change of its base name, and the copy is synchronized with the
+        storage device. Only if copying operation is successful, the original
+        file is deleted. Thus, due to file permissions it is possible that a
+        new file is created but the original one is not deleted.
         
         Existing file in the target folder is overwritten.
         
-        Wraps the class methods copyFile() and deleteFile().
+        Wraps the class methods makeDirs(), copyFile() and deleteFile().
         
         Logs the work flow and encountered errors / exceptions using the class'
         logger.
@@ -1163,42 +1413,35 @@ class LoggingFSIO(object):
         
         Version 0.1.0.0
         """
-        if not isinstance(strSourceFilePath, basestring):
-            iError = 1
-            strError =' '.join([cls._dictErrors[iError], str(strSourceFilePath),
-                                            'of', str(type(strSourceFilePath))])
-            cls._Logger.error(strError)
-        elif not os.path.isfile(os.path.abspath(strSourceFilePath)):
-            iError = 2
-            strError = '{} {}'.format(cls._dictErrors[iError],
-                                            os.path.abspath(strSourceFilePath))
-            cls._Logger.error(strError)
-        elif not isinstance(strTargetFolder, basestring):
-            iError = 1
-            strError = ' '.join([cls._dictErrors[iError], str(strTargetFolder),
-                                            'of', str(type(strTargetFolder))])
-            cls._Logger.error(strError)
-        elif ((not (strNewBaseName is None)) and
-                                (not isinstance(strNewBaseName, basestring))):
-            iError = 1
-            strError = ' '.join([cls._dictErrors[iError], str(strNewBaseName),
-                                            'of', str(type(strNewBaseName))])
+        iError, strError, strFullNewPath = cls._checkMove(strSourceFilePath,
+                                            strTargetFolder, strNewBaseName)
+        if iError:
             cls._Logger.error(strError)
         else:
             _strSourceFilePath = os.path.abspath(strSourceFilePath)
-            _strTargetFolder = os.path.abspath(strTargetFolder)
-            if not (strNewBaseName is None):
-                strFullNewPath = os.path.join(_strTargetFolder, strNewBaseName)
-            else:
-                strFullNewPath = os.path.join(_strTargetFolder,
-                                        os.path.basename(_strSourceFilePath))
-            
-            strFullNewPath = os.path.abspath(strFullNewPath)
-            if _strSourceFilePath != strFullNewPath:
-                strFolderPath = os.path.dirname(strFullNewPath)
+            strFolderPath = os.path.dirname(strFullNewPath)
+            strStrategy = _getMoveStrategy(_strSourceFilePath, strFullNewPath)
+            if strStrategy == 'none':
+                cls._Logger.warning('same path, file is not moved')
+            elif strStrategy == 'rename':
+                iError, strError = cls.makeDirs(strFolderPath)
+                if iError:
+                    cls._Logger.error(strError)
+                else:
+                    try:
+                        os.rename(_strSourceFilePath, strFullNewPath)
+                        strMessage = 'Moved {} file to {}'.format(
+                                            _strSourceFilePath, strFullNewPath)
+                        cls._Logger.info(strMessage)
+                    except (IOError, OSError) as err:
+                        cls._Logger.debug(
+                            'rename failed - {}, copying the file'.format(
+                                                            err.strerror))
+                        strStrategy = 'copy'
+            if strStrategy == 'copy':
                 strBaseFileName = os.path.basename(strFullNewPath)
                 iError, strError = cls.copyFile(_strSourceFilePath,
-                                                strFolderPath, strBaseFileName)
+                                strFolderPath, strBaseFileName, bSync = True)
                 if iError:
                     cls._Logger.error(strError)
                 else:
@@ -1208,10 +1451,6 @@ class LoggingFSIO(object):
                         cls._Logger.error(strError)
                     else:
                         cls._Logger.debug('file delete is ok')
-            else:
-                cls._Logger.warning('same path, file is not moved')
-                iError = 0
-                strError = cls._dictErrors[iError]
         return iError, strError
     
     @classmethod
@@ -1276,6 +1515,311 @@ class LoggingFSIO(object):
                     cls._Logger.debug('file rename is ok')
         return iError, strError
     
+    @classmethod
+    def copyFiles(cls, lstOperations, iWorkers = None):
+        """
+        Batch version of the method copyFile(). Each operation is a tuple of the
+        positional arguments of the method copyFile(): the source file path,
+        and the optional target folder and new base name. The operations are
+        performed in parallel by a pool of worker threads if the number of the
+        workers is an integer other than 1, and sequentially otherwise.
+        
+        Only a single summary record and an error record per failed operation
+        are logged.
+        
+        Signature:
+            list(tuple(str\, str, str\))/, int OR None/
+                -> int, str, list(tuple(int, str))
+        
+        Args:
+            lstOperations: list(tuple(str\, str, str\)), the arguments of the
+                individual copy operations
+            iWorkers: (optional) int OR None, number of the worker threads;
+                None (default) or 1 - sequential processing, zero or negative -
+                one per CPU
+        
+        Returns:
+            tuple(int, str, list(tuple(int, str))): an unpacked tuple of an
+                integer (error code, 0 is Ok, 5 - some operations failed), a
+                string (summary or textual description of an error), and a list
+                of the results of the individual operations
+        
+        Version 0.1.0.0
+        """
+        return cls._runBatch('copy', _QuietLoggingFSIO.copyFile, 1, 3,
+                                                    lstOperations, iWorkers)
+    
+    @classmethod
+    def moveFiles(cls, lstOperations, iWorkers = None):
+        """
+        Batch version of the method moveFile(). Each operation is a tuple of the
+        positional arguments of the method moveFile(): the source file path,
+        the target folder and the optional new base name. The operations are
+        performed in parallel by a pool of worker threads if the number of the
+        workers is an integer other than 1, and sequentially otherwise.
+        
+        Only a single summary record and an error record per failed operation
+        are logged.
+        
+        Signature:
+            list(tuple(str, str\, str\))/, int OR None/
+                -> int, str, list(tuple(int, str))
+        
+        Args:
+            lstOperations: list(tuple(str, str\, str\)), the arguments of the
+                individual move operations
+            iWorkers: (optional) int OR None, number of the worker threads;
+                None (default) or 1 - sequential processing, zero or negative -
+                one per CPU
+        
+        Returns:
+            tuple(int, str, list(tuple(int, str))): an unpacked tuple of an
+                integer (error code, 0 is Ok, 5 - some operations failed), a
+                string (summary or textual description of an error), and a list
+                of the results of the individual operations
+        
+        Version 0.1.0.0
+        """
+        return cls._runBatch('move', _QuietLoggingFSIO.moveFile, 2, 3,
+                                                    lstOperations, iWorkers)
+    
+    @classmethod
+    def deleteFiles(cls, lstOperations, iWorkers = None):
+        """
+        Batch version of the method deleteFile(). Each operation is a path to a
+        file to be deleted. The operations are performed in parallel by a pool
+        of worker threads if the number of the workers is an integer other than
+        1, and sequentially otherwise.
+        
+        Only a single summary record and an error record per failed operation
+        are logged.
+        
+        Signature:
+            list(str)/, int OR None/ -> int, str, list(tuple(int, str))
+        
+        Args:
+            lstOperations: list(str), the paths of the files to be deleted
+            iWorkers: (optional) int OR None, number of the worker threads;
+                None (default) or 1 - sequential processing, zero or negative -
+                one per CPU
+        
+        Returns:
+            tuple(int, str, list(tuple(int, str))): an unpacked tuple of an
+                integer (error code, 0 is Ok, 5 - some operations failed), a
+                string (summary or textual description of an error), and a list
+                of the results of the individual operations
+        
+        Version 0.1.0.0
+        """
+        lstArgs = lstOperations
+        if isinstance(lstOperations, (list, tuple)):
+            lstArgs = [(gItem, ) for gItem in lstOperations]
+        return cls._runBatch('delete', _QuietLoggingFSIO.deleteFile, 1, 1,
+                                                            lstArgs, iWorkers)
+    
+    @classmethod
+    def planMoves(cls, lstOperations):
+        """
+        Dry run of the method moveFiles() - determines the strategy, which the
+        method moveFile() would use for each operation, without any changes to
+        the file system. Each operation is a tuple of the positional arguments
+        of the method moveFile(). The strategies are:
+            'rename' - the file and the target folder (or its nearest existing
+                parent folder) are on the same device, the file is renamed
+            'copy' - different devices, the file is copied, the copy is
+                synchronized with the storage device, and the file is deleted
+            'none' - the source and the target paths are the same, the file is
+                not moved
+        
+        Only a single summary record and an error record per improper operation
+        are logged.
+        
+        Signature:
+            list(tuple(str, str\, str\)) -> int, str, list(tuple(int, str))
+        
+        Args:
+            lstOperations: list(tuple(str, str\, str\)), the arguments of the
+                individual move operations
+        
+        Returns:
+            tuple(int, str, list(tuple(int, str))): an unpacked tuple of an
+                integer (error code, 0 is Ok, 5 - some operations would fail), a
+                string (summary or textual description of an error), and a list
+                of the 2-tuples per operation - 0 and the strategy, or the
+                error code and the textual description of the error
+        
+        Version 0.1.0.0
+        """
+        tuplstResults = []
+        if not isinstance(lstOperations, (list, tuple)):
+            iError = 1
+            strError = ' '.join([cls._dictErrors[iError], str(lstOperations),
+                                            'of', str(type(lstOperations))])
+            cls._Logger.error(strError)
+        else:
+            dictDevices = {}
+            dictCounts = {'rename' : 0, 'copy' : 0, 'none' : 0}
+            iFailed = 0
+            for iIndex, gArgs in enumerate(lstOperations):
+                if not isinstance(gArgs, (list, tuple)):
+                    gArgs = (gArgs, )
+                if 2 <= len(gArgs) <= 3:
+                    iItemError, strItemError, strFullNewPath = cls._checkMove(
+                                                                        *gArgs)
+                else:
+                    iItemError = 1
+                    strItemError = ' '.join([cls._dictErrors[iItemError],
+                            str(gArgs), 'must have from 2 to 3 elements'])
+                if iItemError:
+                    iFailed += 1
+                    cls._Logger.error('move plan #{}: {}'.format(iIndex,
+                                                                strItemError))
+                else:
+                    strItemError = _getMoveStrategy(os.path.abspath(gArgs[0]),
+                                                strFullNewPath, dictDevices)
+                    dictCounts[strItemError] += 1
+                tuplstResults.append((iItemError, strItemError))
+            strSummary = ('Move plan: {} operations - {} rename, {} copy, {} '
+                        'none, {} failed'.format(len(tuplstResults),
+                                dictCounts['rename'], dictCounts['copy'],
+                                                dictCounts['none'], iFailed))
+            if iFailed:
+                iError = 5
+                strError = '{} {}'.format(cls._dictErrors[iError], strSummary)
+                cls._Logger.warning(strSummary)
+            else:
+                iError = 0
+                strError = strSummary
+                cls._Logger.info(strSummary)
+        return iError, strError, tuplstResults
+    
+    @classmethod
+    def _checkMove(cls, strSourceFilePath, strTargetFolder,
+                                                        strNewBaseName = None):
+        """
+        Helper method performing the sanity checks of the arguments of the
+        method moveFile() without logging, and resolving the absolute path of
+        the moved file.
+        
+        Signature:
+            str, str\, str\ -> int, str, str OR None
+        
+        Args:
+            strSourceFilePath: str, relative or absolute path to a file to be
+                moved
+            strTargetFolder: str, relative or absolute path to the target folder
+            strNewBaseName: (optional) str, new base name of the file
+        
+        Returns:
+            tuple(int, str, str OR None): an unpacked tuple of an integer (error
+                code, 0 is Ok), a string (textual description of an error) and
+                the absolute path of the moved file (None if an error)
+        
+        Version 0.1.0.0
+        """
+        strFullNewPath = None
+        iError = 0
+        strError = cls._dictErrors[iError]
+        if not isinstance(strSourceFilePath, basestring):
+            iError = 1
+            strError =' '.join([cls._dictErrors[iError], str(strSourceFilePath),
+                                            'of', str(type(strSourceFilePath))])
+        elif not os.path.isfile(os.path.abspath(strSourceFilePath)):
+            iError = 2
+            strError = '{} {}'.format(cls._dictErrors[iError],
+                                            os.path.abspath(strSourceFilePath))
+        elif not isinstance(strTargetFolder, basestring):
+            iError = 1
+            strError = ' '.join([cls._dictErrors[iError], str(strTargetFolder),
+                                            'of', str(type(strTargetFolder))])
+        elif ((not (strNewBaseName is None)) and
+                                (not isinstance(strNewBaseName, basestring))):
+            iError = 1
+            strError = ' '.join([cls._dictErrors[iError], str(strNewBaseName),
+                                            'of', str(type(strNewBaseName))])
+        else:
+            _strTargetFolder = os.path.abspath(strTargetFolder)
+            if not (strNewBaseName is None):
+                strFullNewPath = os.path.join(_strTargetFolder, strNewBaseName)
+            else:
+                strFullNewPath = os.path.join(_strTargetFolder,
+                                        os.path.basename(strSourceFilePath))
+            strFullNewPath = os.path.abspath(strFullNewPath)
+        return iError, strError, strFullNewPath
+    
+    @classmethod
+    def _runBatch(cls, strName, fOperation, iMinArgs, iMaxArgs, lstOperations,
+                                                                    iWorkers):
+        """
+        Helper method implementing the batch operations. The inputs of the
+        batch as a whole are checked only once, the individual operations are
+        performed by the not logging versions of the single file methods, and
+        their results are collected in the original order.
+        
+        Signature:
+            str, function, int > 0, int > 0, list(tuple), int OR None
+                -> int, str, list(tuple(int, str))
+        
+        Args:
+            strName: str, name of the operation for the log messages
+            fOperation: function, the single file operation to be performed
+            iMinArgs: int > 0, minimum number of the arguments of an operation
+            iMaxArgs: int > 0, maximum number of the arguments of an operation
+            lstOperations: list(tuple), the arguments of the operations
+            iWorkers: int OR None, number of the worker threads
+        
+        Returns:
+            tuple(int, str, list(tuple(int, str))): an unpacked tuple of an
+                integer (error code), a string (summary or textual description
+                of an error), and a list of the results of the operations
+        
+        Version 0.1.0.0
+        """
+        tuplstResults = []
+        if not isinstance(lstOperations, (list, tuple)):
+            iError = 1
+            strError = ' '.join([cls._dictErrors[iError], str(lstOperations),
+                                            'of', str(type(lstOperations))])
+            cls._Logger.error(strError)
+        elif not ((iWorkers is None) or (isinstance(iWorkers, (int, long))
+                                        and not isinstance(iWorkers, bool))):
+            iError = 1
+            strError = ' '.join([cls._dictErrors[iError], str(iWorkers), 'of',
+                                str(type(iWorkers)), 'as number of workers'])
+            cls._Logger.error(strError)
+        else:
+            lstTasks = [(fOperation, iMinArgs, iMaxArgs, gItem)
+                                                for gItem in lstOperations]
+            if (iWorkers is None) or (iWorkers == 1) or (len(lstTasks) < 2):
+                tuplstResults = map(_runBatchItem, lstTasks)
+            else:
+                if iWorkers < 1:
+                    iWorkers = multiprocessing.cpu_count()
+                objPool = multiprocessing.pool.ThreadPool(min(iWorkers,
+                                                                len(lstTasks)))
+                try:
+                    tuplstResults = objPool.map(_runBatchItem, lstTasks)
+                finally:
+                    objPool.close()
+                    objPool.join()
+            iFailed = 0
+            for iIndex, (iItemError, strItemError) in enumerate(tuplstResults):
+                if iItemError:
+                    iFailed += 1
+                    cls._Logger.error('{} #{}: {}'.format(strName, iIndex,
+                                                                strItemError))
+            strSummary = 'Batch {}: {} operations, {} failed'.format(strName,
+                                                    len(tuplstResults), iFailed)
+            if iFailed:
+                iError = 5
+                strError = '{} {}'.format(cls._dictErrors[iError], strSummary)
+                cls._Logger.warning(strSummary)
+            else:
+                iError = 0
+                strError = strSummary
+                cls._Logger.info(strSummary)
+        return iError, strError, tuplstResults
+    
     @classmethod
     def setLoggingLevel(cls, iLevel):
         """
@@ -1422,3 +1966,289 @@ class LoggingFSIO(object):
         Version 0.1.0.0
         """
         cls._Logger.disableFileLogging()
+    
+    @classmethod
+    def enableAsyncLogging(cls, iQueueSize = 10000, bBlock = True):
+        """
+        Method to enable the asynchronous logging: the console and file output
+        is done by a background thread using a bounded queue.
+        
+        Wraps the DualLogger.enableAsyncLogging() method.
+        
+        Signature:
+            /int >= 0, bool/ -> None
+        
+        Args:
+            iQueueSize: (optional) int >= 0, maximum number of the queued log
+                entries, zero means unbounded queue; defaults to 10000
+            bBlock: (optional) bool, overflow policy - if True (default) the
+                calling thread waits, otherwise the log entry is dropped
+        
+        Raises:
+            TypeError: the queue size is not an integer
+            ValueError: the queue size is negative
+        
+        Version 0.1.0.0
+        """
+        cls._Logger.enableAsyncLogging(iQueueSize = iQueueSize,
+                                                                bBlock = bBlock)
+    
+    @classmethod
+    def disableAsyncLogging(cls):
+        """
+        Method to disable the asynchronous logging after writing all queued log
+        entries.
+        
+        Wraps the DualLogger.disableAsyncLogging() method.
+        
+        Signature:
+            None -> None
+        
+        Version 0.1.0.0
+        """
+        cls._Logger.disableAsyncLogging()
+    
+    @classmethod
+    def flush(cls):
+        """
+        Method to wait until all queued log entries are written and to flush
+        the output streams.
+        
+        Wraps the DualLogger.flush() method.
+        
+        Signature:
+            None -> None
+        
+        Version 0.1.0.0
+        """
+        cls._Logger.flush()
+
+#+ 'private' helper classes
+
+class _LogQueue(Queue.Queue):
+    """
+    Helper class implementing the bounded queue of the asynchronous logging
+    with the overflow policy - blocking or dropping (and counting) of the new
+    entries. Used by the class DualLogger.
+    
+    Version 0.1.0.0
+    """
+    
+    def __init__(self, iQueueSize, bBlock):
+        """
+        Initialization. Sets the maximum size and the overflow policy.
+        
+        Signature:
+            int >= 0, bool -> None
+        
+        Version 0.1.0.0
+        """
+        Queue.Queue.__init__(self, iQueueSize)
+        self.Block = bBlock
+        self.Dropped = 0
+    
+    def putEntry(self, tupEntry):
+        """
+        Puts an entry into the queue, waiting for a free place or dropping the
+        entry on overflow, depending on the policy.
+        
+        Signature:
+            tuple(logging.Handler, str, logging.LogRecord) -> None
+        
+        Version 0.1.0.0
+        """
+        if self.Block:
+            self.put(tupEntry)
+        else:
+            try:
+                self.put_nowait(tupEntry)
+            except Queue.Full:
+                with self.mutex:
+                    self.Dropped += 1
+
+class _QueuedHandler(logging.Handler):
+    """
+    Helper class implementing a logging handler, which formats the log records
+    using the wrapped (console or file) handler within the calling thread, and
+    puts the resulting text into the queue processed by a background thread,
+    see the function _processLogQueue(). Used by the class DualLogger.
+    
+    Version 0.1.0.0
+    """
+    
+    def __init__(self, objHandler, objQueue):
+        """
+        Initialization. Stores the wrapped handler and the queue.
+        
+        Signature:
+            logging.StreamHandler, _LogQueue -> None
+        
+        Version 0.1.0.0
+        """
+        logging.Handler.__init__(self)
+        self.Target = objHandler
+        self.Queue = objQueue
+    
+    def emit(self, objRecord):
+        """
+        Formats the record with the current formatter of the wrapped handler
+        and queues it, if its level is not below the level of that handler.
+        
+        Signature:
+            logging.LogRecord -> None
+        
+        Version 0.1.0.0
+        """
+        if objRecord.levelno >= self.Target.level:
+            try:
+                strText = self.Target.format(objRecord)
+            except Exception:
+                self.handleError(objRecord)
+            else:
+                self.Queue.putEntry((self.Target, strText, objRecord))
+
+class _NullLogger(object):
+    """
+    Helper class implementing a logger, which ignores all messages. Used by the
+    class _QuietLoggingFSIO.
+    
+    Version 0.1.0.0
+    """
+    
+    def _ignore(self, *args, **kwargs):
+        """
+        Does nothing.
+        """
+        pass
+    
+    debug = info = warning = error = exception = critical = _ignore
+
+class _QuietLoggingFSIO(LoggingFSIO):
+    """
+    Helper class performing the same file operations as its parent class
+    LoggingFSIO, but without logging - used by the batch operations, which log
+    only the summary and the failed operations.
+    
+    Version 0.1.0.0
+    """
+    
+    _Logger = _NullLogger()
+
+#functions
+
+#+ 'private' helper functions
+
+def _processLogQueue(objQueue):
+    """
+    Helper function executed by the background thread of the asynchronous
+    logging: writes the formatted log entries from the queue into the streams
+    of their handlers until None is received, see the class _QueuedHandler.
+    
+    Signature:
+        _LogQueue -> None
+    
+    Version 0.1.0.0
+    """
+    bRun = True
+    while bRun:
+        tupEntry = objQueue.get()
+        if tupEntry is None:
+            bRun = False
+        else:
+            objHandler, strText, objRecord = tupEntry
+            objHandler.acquire()
+            try:
+                objStream = getattr(objHandler, 'stream', None)
+                if not (objStream is None):
+                    try:
+                        objStream.write(strText + '\n')
+                    except UnicodeError:
+                        objStream.write((strText + '\n').encode('UTF-8'))
+                    objHandler.flush()
+            except Exception:
+                objHandler.handleError(objRecord)
+            finally:
+                objHandler.release()
+        objQueue.task_done()
+
+def _runBatchItem(tupTask):
+    """
+    Helper function to perform a single operation of a batch, see the class
+    method LoggingFSIO._runBatch(). A not tuple argument of the operation is
+    treated as a single argument; the improper number of the arguments results
+    in the error code 1.
+    
+    Signature:
+        tuple(function, int > 0, int > 0, tuple OR type A) -> int, str
+    
+    Args:
+        tupTask: tuple(function, int > 0, int > 0, tuple OR type A), the
+            operation, the minimum and maximum numbers of its arguments and its
+            arguments
+    
+    Returns:
+        tuple(int, str): an unpacked tuple of an integer (error code, 0 is Ok)
+            and a string (textual description of an error).
+    
+    Version 0.1.0.0
+    """
+    fOperation, iMinArgs, iMaxArgs, gArgs = tupTask
+    if not isinstance(gArgs, (list, tuple)):
+        gArgs = (gArgs, )
+    if iMinArgs <= len(gArgs) <= iMaxArgs:
+        iError, strError = fOperation(*gArgs)
+    else:
+        iError = 1
+        strError = ' '.join([LoggingFSIO._dictErrors[iError], str(gArgs),
+                'must have from {} to {} elements'.format(iMinArgs, iMaxArgs)])
+    return iError, strError
+
+def _getMoveStrategy(strSource, strTarget, dictDevices = None):
+    """
+    Helper function to determine the strategy of moving a file: 'none' if the
+    source and target paths are the same, 'rename' if the file and the target
+    folder (or its nearest existing parent folder) are on the same device (by
+    st_dev), and 'copy' otherwise, including the case when the device cannot be
+    determined. The devices of the target folders can be cached in the passed
+    dictionary.
+    
+    Signature:
+        str, str/, dict(str -> int OR None)/ -> str
+    
+    Args:
+        strSource: str, absolute path to the file to be moved
+        strTarget: str, absolute path of the moved file
+        dictDevices: (optional) dict(str -> int OR None), cache of the devices
+            of the target folders; defaults to None - no caching
+    
+    Returns:
+        str: 'none', 'rename' or 'copy'
+    
+    Version 0.1.0.0
+    """
+    if strSource == strTarget:
+        strStrategy = 'none'
+    else:
+        if dictDevices is None:
+            dictDevices = {}
+        strFolder = os.path.dirname(strTarget)
+        if not (strFolder in dictDevices):
+            strExisting = strFolder
+            while not os.path.isdir(strExisting):
+                strParent = os.path.dirname(strExisting)
+                if strParent == strExisting:
+                    break
+                strExisting = strParent
+            try:
+                dictDevices[strFolder] = os.stat(strExisting).st_dev
+            except (IOError, OSError):
+                dictDevices[strFolder] = None
+        try:
+            iDevice = os.stat(strSource).st_dev
+        except (IOError, OSError):
+            iDevice = None
+        if (iDevice is None) or (iDevice != dictDevices[strFolder]):
+            strStrategy = 'copy'
+        else:
+            strStrategy = 'rename'
+    return strStrategy
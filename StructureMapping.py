@@ -21,11 +21,27 @@ Functions:
         type A, type B -> None
     AddElement()
         type A, type B, type C -> None
+    CompilePath()
+        type A -> CompiledPath
+    IndexXMLTree()
+        xml.etree.ElementTree.Element/, int/ -> int
+    CompileMapping()
+        dict/, logging.Logger OR 'fsio_lib.LoggingFSIO.ConsoleLogger, bool,
+            bool, bool/ -> CompiledMapping
     LoadDefinition()
         str/, logging.Logger OR 'LoggingFSIO.ConsoleLogger/ -> dict
     MapValues()
         type A, type B, dict/, logging.Logger OR
             'fsio_lib.LoggingFSIO.ConsoleLogger, bool, bool, bool/ -> None
+    MapColumns()
+        class A, seq(type B), dict/, logging.Logger OR
+            'fsio_lib.LoggingFSIO.ConsoleLogger, bool, bool, bool, bool/
+                -> list(type A) OR type A
+
+Classes:
+    Path
+    CompiledPath
+    CompiledMapping
 """
 
 __version__ = "0.1.0.0"
@@ -33,7 +49,9 @@ __date__ = "31-10-2018"
 __status__ = "Production"
 
 __all__ = ["FlattenPath", "ResolvePathSubstitutions", "GetElement", "MapValues",
-            "SetElement", "DeleteElement", "AddElement", "LoadDefinition"]
+            "SetElement", "DeleteElement", "AddElement", "LoadDefinition",
+            "CompilePath", "CompiledPath", "CompileMapping",
+            "CompiledMapping", "Path", "IndexXMLTree", "MapColumns"]
 #to prevent 'private' functions import with the 'import *' construct
 
 #imports
@@ -45,6 +63,1220 @@ import collections
 import xml.etree.ElementTree as ElementTree
 import json
 import string
+import itertools
+import threading
+import weakref
+
+#globals
+
+#+ compiled mapping plans cache used by MapValues()
+
+MAPPING_CACHE_SIZE = 64
+
+_MAPPING_CACHE = collections.OrderedDict()
+
+_MAPPING_CACHE_LOCK = threading.Lock()
+
+#+ flattened paths cache used by FlattenPath() and Path
+
+PATH_CACHE_SIZE = 1024
+
+_PATH_CACHE = dict()
+
+_PATH_CACHE_LOCK = threading.Lock()
+
+_PATH_CACHE_CLOCK = itertools.count()
+
+#+ tags index of the wide XML nodes, see IndexXMLTree()
+
+XML_INDEX_MIN_CHILDREN = 16
+
+_XML_TAG_INDEX = weakref.WeakKeyDictionary()
+
+#+ 'choice' dictionaries look-up indexes of the wide containers, which are
+#+ used only within the mapping operations, see _ChoiceIndexScope
+
+CHOICE_INDEX_MIN_SIZE = 16
+
+CHOICE_INDEX_CACHE_SIZE = 32
+
+_CHOICE_INDEX_SCOPE = threading.local() #per thread: nesting depth and cache
+
+_CHOICE_INDEX_CACHE_CLOCK = itertools.count()
+
+#+ marker of a value missing in a column, see CompiledMapping.applyColumns()
+
+_MISSING = object()
+
+#classes
+
+class Path(tuple):
+    """
+    Immutable and hashable flattened and unified path to an element /
+    attribute of an object, which can be used as a dictionary key. Each element
+    is either a non-negative integer or a string or a 'choice' dictionary,
+    which is frozen, i.e. it is read-only and hashable, but it is still a dict
+    sub-class and compares equal to the plain dictionary of the same content.
+    
+    The instantiation accepts the same input as the function FlattenPath(). A
+    dot notation string path is parsed only once per process - the instances
+    created from the strings are kept in a bounded cache (see PATH_CACHE_SIZE)
+    with the least recently used entries being removed, therefore the repeated
+    instantiation from the same string returns the same instance. An instance
+    of this class passed as the argument is returned as it is.
+    
+    Version 0.1.0.0
+    """
+    
+    __slots__ = ()
+    
+    #special methods
+    
+    def __new__(cls, gPath):
+        """
+        Instantiation method. Flattens, unifies and validates the path or takes
+        the already existing instance from the cache.
+        
+        Signature:
+            type A -> Path
+        
+        Args:
+            gPath: type A, a path or a single element of a path to be flatten
+                and unified, can be an integer or string or a dictionary of
+                string keys and numeric / boolean / string values or a (nested)
+                sequence of these types
+        
+        Raises:
+            TypeError: the input argument is not of the allowed type
+            ValueError: the input argument is not of the allowed values
+        
+        Version 0.1.0.0
+        """
+        if type(gPath) is Path:
+            objPath = gPath
+        elif isinstance(gPath, basestring):
+            objPath = _GetCachedPath(gPath)
+        else:
+            objPath = tuple.__new__(Path, _FlattenPath(gPath))
+        return objPath
+    
+    def __getnewargs__(self):
+        """
+        Returns the arguments to be passed into the method __new__() upon
+        unpickling.
+        
+        Signature:
+            None -> tuple(tuple(int OR str OR dict(str : int OR float OR str OR
+                bool)))
+        
+        Version 0.1.0.0
+        """
+        return (tuple(self), )
+    
+    def __repr__(self):
+        """
+        Returns the string representation of the instance.
+        
+        Signature:
+            None -> str
+        
+        Version 0.1.0.0
+        """
+        return '{}({})'.format(self.__class__.__name__, list(self))
+
+class CompiledPath(object):
+    """
+    Pre-compiled accessor to an arbitrary level deep nested element of an
+    object, which can be re-used with any number of target objects of the same
+    structure.
+    
+    The path is flattened, unified and validated only once during the
+    instantiation, and the kind of each path element (name, index or 'choice'
+    dictionary) is resolved into the corresponding element look-up helper
+    function at the same time. The 'choice' dictionaries are compiled
+    recursively. Therefore, each access only walks the target object along the
+    path once, without any repeated parsing of the path or the repeated
+    traversal of the same levels, and the error messages are constructed only
+    when an element is actually not found.
+    
+    The methods get(), set(), delete() and add() behave exactly as the
+    functions GetElement(), SetElement(), DeleteElement() and AddElement()
+    respectively, which are implemented via this class.
+    
+    Attributes:
+        path: (read-only property) list(int OR str OR dict(str : int OR float
+            OR str OR bool)), a copy of the flattened and unified path
+    
+    Methods:
+        get()
+            type A -> type B
+        set()
+            type A, type B -> None
+        setColumn()
+            seq(type A), seq(type B)/, function/ -> None
+        delete()
+            type A -> None
+        add()
+            type A, type B -> None
+    
+    Version 0.1.0.0
+    """
+    
+    #special methods
+    
+    def __init__(self, glstPath):
+        """
+        Initialization method. Flattens, unifies and validates the path and
+        resolves each of its elements into the corresponding look-up helper.
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            glstPath: type A, a path or a single element of a path to be flatten
+                and unified, can be an integer or string or a dictionary of
+                string keys and numeric / boolean / string values or a (nested)
+                sequence of these types
+        
+        Raises:
+            TypeError: the input argument is not of the allowed type
+            ValueError: the input argument is not of the allowed values
+        
+        Version 0.1.0.0
+        """
+        self._glstPath = Path(glstPath)
+        self._lstSteps = []
+        for gItem in self._glstPath:
+            if isinstance(gItem, basestring):
+                self._lstSteps.append((_GetByName, gItem))
+            elif isinstance(gItem, (int, long)):
+                self._lstSteps.append((_GetByIndex, gItem))
+            else: #'choice' dictionary, the only option left after FlattenPath
+                tuplstChoice = tuple((CompiledPath([Key]), Value)
+                                        for Key, Value in sorted(gItem.items()))
+                self._lstSteps.append((_GetByChoice, tuplstChoice))
+        self._lstParentSteps = self._lstSteps[:-1]
+        self._iLast = len(self._lstSteps) - 1
+    
+    def __repr__(self):
+        """
+        Returns the string representation of the instance.
+        
+        Signature:
+            None -> str
+        
+        Version 0.1.0.0
+        """
+        return '{}({})'.format(self.__class__.__name__, list(self._glstPath))
+    
+    #properties
+    
+    @property
+    def path(self):
+        """
+        Read-only property returning a copy of the flattened and unified path.
+        
+        Signature:
+            None -> list(int OR str OR dict(str : int OR float OR str OR bool))
+        
+        Version 0.1.0.0
+        """
+        return list(self._glstPath)
+    
+    #'private' instance methods
+    
+    def _raiseNotFound(self, objTarget, iIndex):
+        """
+        Raises AttributeError with the message constructed only at this point,
+        i.e. on the failure path.
+        
+        Signature:
+            type A, int -> None
+        
+        Args:
+            objTarget: type A, the target object
+            iIndex: int, index of the missing element in the path
+        
+        Raises:
+            AttributeError: always
+        
+        Version 0.1.0.0
+        """
+        strError = 'Object {} has no element index {} in path {}'.format(
+                                            objTarget, iIndex, self._glstPath)
+        raise AttributeError(strError)
+    
+    def _walk(self, objTarget, lstSteps):
+        """
+        Walks the target object along the passed compiled steps.
+        
+        Signature:
+            type A, list(tuple(function, type B)) -> type C
+        
+        Args:
+            objTarget: type A, the target object
+            lstSteps: list(tuple(function, type B)), the compiled path steps
+        
+        Returns:
+            type C: the element reached at the end of the steps (not converted)
+        
+        Raises:
+            AttributeError: any of the (nested) elements along the path is not
+                found in the object
+        
+        Version 0.1.0.0
+        """
+        objTemp = objTarget
+        iIndex = 0
+        try:
+            for fStep, gItem in lstSteps:
+                objTemp = fStep(objTemp, gItem)
+                iIndex += 1
+        except AttributeError:
+            self._raiseNotFound(objTarget, iIndex)
+        return objTemp
+    
+    def _invalidateParent(self, objTarget):
+        """
+        Marks the tags index of the 'grandparent' XML node of the end-path
+        element as outdated, i.e. of the node containing the modified node, when
+        the tag of the latter is changed.
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            objTarget: type A, the target object
+        
+        Version 0.1.0.0
+        """
+        if len(_XML_TAG_INDEX) and len(self._lstParentSteps):
+            _InvalidateTagIndex(self._walk(objTarget,
+                                                self._lstParentSteps[:-1]))
+    
+    def _invalidateChoices(self, objTarget):
+        """
+        Removes the 'choice' dictionaries look-up indexes of all containers
+        along the path down to the 'parent' of the end-path element, which is
+        about to be modified, since the modification of a nested element may
+        change the results of the look-up in any of them. Must be called before
+        the modification; the walk stops at the first missing element. Does
+        nothing if there are no indexes, e.g. outside the mapping operations.
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            objTarget: type A, the target object
+        
+        Version 0.1.0.0
+        """
+        if getattr(_CHOICE_INDEX_SCOPE, 'Cache', None):
+            objTemp = objTarget
+            try:
+                for fStep, gItem in self._lstParentSteps:
+                    objNext = fStep(objTemp, gItem)
+                    _InvalidateChoiceIndex(objTemp)
+                    objTemp = objNext
+            except AttributeError:
+                pass
+            _InvalidateChoiceIndex(objTemp)
+    
+    def _setLast(self, objTarget, objTemp, gValue):
+        """
+        Assigns a value to the end-path element within its already found
+        'parent' element. See set().
+        
+        Signature:
+            type A, type B, type C -> None
+        
+        Args:
+            objTarget: type A, the target object, used in the error messages
+            objTemp: type B, the 'parent' of the end-path element
+            gValue: type C, the value to be assigned to the element (if found)
+        
+        Raises:
+            TypeError: an XML node object is attempted to be assigned as an
+                attribute of another XML node object (not as a sub-element), or
+                a non XML node is attempted to be assigned to a sub-element of
+                an XML node, or an immutable sequence as the last element is
+                attempted to be modified
+            AttributeError: the end-path element is not found
+        
+        Version 0.1.0.0
+        """
+        fStep, gItem = self._lstSteps[-1]
+        try:
+            if fStep is _GetByChoice:
+                iIndex, objChild = _FindByChoice(objTemp, gItem)
+            else:
+                fStep(objTemp, gItem) #as sanity check on the last element
+        except AttributeError:
+            self._raiseNotFound(objTarget, self._iLast)
+        self._invalidateChoices(objTarget)
+        if isinstance(gItem, basestring):
+            if isinstance(objTemp, ElementTree.Element):
+                if not isinstance(gValue, ElementTree.Element):
+                    if gItem in ['text', 'tail', 'tag']:
+                        setattr(objTemp, gItem, str(gValue))
+                        if gItem == 'tag':
+                            self._invalidateParent(objTarget)
+                    elif gItem in objTemp.attrib:
+                        objTemp.set(gItem, str(gValue))
+                    else:
+                        _RaiseAssignError(objTarget, self._glstPath, gValue)
+                else:
+                    iIndex = _FindByTag(objTemp, gItem)
+                    if iIndex is None:
+                        _RaiseAssignError(objTarget, self._glstPath, gValue)
+                    objTemp[iIndex] = gValue
+                    _InvalidateTagIndex(objTemp)
+            elif isinstance(objTemp, collections.Mapping):
+                objTemp[gItem] = gValue
+            else:
+                setattr(objTemp, gItem, gValue)
+        elif fStep is _GetByIndex:
+            if isinstance(objTemp, ElementTree.Element):
+                if isinstance(gValue, ElementTree.Element):
+                    objTemp[gItem] = gValue
+                    _InvalidateTagIndex(objTemp)
+                else:
+                    _RaiseAssignError(objTarget, self._glstPath, gValue)
+            else:
+                objTemp[gItem] = gValue
+        else: #dictionary path element!
+            if isinstance(objTemp, ElementTree.Element): #XML sub-element!
+                if isinstance(gValue, ElementTree.Element):
+                    objTemp[iIndex] = gValue
+                    _InvalidateTagIndex(objTemp)
+                else:
+                    _RaiseAssignError(objTarget, self._glstPath, gValue)
+            else: #element of sequence
+                try:
+                    objTemp[iIndex] = gValue
+                except TypeError: #immutable sequence
+                    _RaiseAssignError(objTarget, self._glstPath, gValue)
+    
+    #public API
+    
+    def get(self, objTarget):
+        """
+        Extracts a value of the nested element of an object. The numbers
+        (floating point or integer) stored in a string are converted into float
+        and int respectively. See GetElement().
+        
+        Signature:
+            type A -> type B
+        
+        Args:
+            objTarget: type A, the target object, from which the value of an
+                element is to be obtained
+        
+        Returns:
+            type B: the value of the corresponding nested element
+        
+        Raises:
+            AttributeError: any of the (nested) elements along the path is not
+                found in the object
+        
+        Version 0.1.0.0
+        """
+        objTemp = self._walk(objTarget, self._lstSteps)
+        if isinstance(objTemp, basestring):
+            objTemp = _ConvertNumber(objTemp)
+        return objTemp
+    
+    def set(self, objTarget, gValue):
+        """
+        Assigns a value to the nested element of an object if such element is
+        found within the object. The object is walked only once up to the
+        'parent' of the end-path element. See SetElement().
+        
+        Signature:
+            type A, type B -> None
+        
+        Args:
+            objTarget: type A, the target object, in which the value of an
+                element is to be set
+            gValue: type B, the value to be assigned to the element (if found)
+        
+        Raises:
+            TypeError: an XML node object is attempted to be assigned as an
+                attribute of another XML node object (not as a sub-element), or
+                a non XML node is attempted to be assigned to a sub-element of
+                an XML node, or an immutable sequence as the last element is
+                attempted to be modified
+            AttributeError: any of the (nested) elements along the path is not
+                found in the object
+        
+        Version 0.1.0.0
+        """
+        objTemp = self._walk(objTarget, self._lstParentSteps)
+        self._setLast(objTarget, objTemp, gValue)
+    
+    def setColumn(self, seqTargets, seqValues, fOnError = None):
+        """
+        Assigns the values to the same nested element of several target
+        objects taken in parallel with the values from two sequences
+        (iterables), i.e. the first value to the first object, etc. The result
+        is the same as of the method set() called for each pair, but if the
+        end-path element is referenced by a name, the kind of its 'parent'
+        element (XML node, mapping or other object) is determined only once per
+        type of the 'parent', and the key / attribute is assigned directly.
+        
+        If the callback fOnError is provided, an exception raised for a target
+        object is passed into it together with this object and the value, and
+        the rest of the objects are processed; otherwise the exception is
+        re-raised immediately.
+        
+        Signature:
+            seq(type A), seq(type B)/, function/ -> None
+        
+        Args:
+            seqTargets: seq(type A), a sequence (iterable) of the target objects
+            seqValues: seq(type B), a sequence (iterable) of the values to be
+                assigned
+            fOnError: (optional) function(Exception, type A, type B) -> None,
+                the errors handler, by default is None
+        
+        Raises:
+            TypeError: see set(), unless the errors handler is provided
+            AttributeError: see set(), unless the errors handler is provided
+        
+        Version 0.1.0.0
+        """
+        lstParentSteps = self._lstParentSteps
+        fStep, gItem = self._lstSteps[-1]
+        bByName = fStep is _GetByName
+        dictKinds = {}
+        for objTarget, gValue in itertools.izip(seqTargets, seqValues):
+            try:
+                objTemp = self._walk(objTarget, lstParentSteps)
+                if bByName:
+                    clsTemp = type(objTemp)
+                    strKind = dictKinds.get(clsTemp, None)
+                    if strKind is None:
+                        if isinstance(objTemp, ElementTree.Element):
+                            strKind = 'node'
+                        elif isinstance(objTemp, collections.Mapping):
+                            strKind = 'mapping'
+                        else:
+                            strKind = 'object'
+                        dictKinds[clsTemp] = strKind
+                    if strKind == 'object':
+                        try:
+                            getattr(objTemp, gItem) #as sanity check
+                        except AttributeError:
+                            self._raiseNotFound(objTarget, self._iLast)
+                        self._invalidateChoices(objTarget)
+                        setattr(objTemp, gItem, gValue)
+                        continue
+                    if strKind == 'mapping':
+                        if not (gItem in objTemp):
+                            self._raiseNotFound(objTarget, self._iLast)
+                        self._invalidateChoices(objTarget)
+                        objTemp[gItem] = gValue
+                        continue
+                self._setLast(objTarget, objTemp, gValue)
+            except (TypeError, ValueError, AttributeError) as Err:
+                if fOnError is None:
+                    raise
+                fOnError(Err, objTarget, gValue)
+    
+    def delete(self, objTarget):
+        """
+        Deletes the nested element of an object if such element is found within
+        the object. The object is walked only once up to the 'parent' of the
+        end-path element. See DeleteElement().
+        
+        Signature:
+            type A -> None
+        
+        Args:
+            objTarget: type A, the target object, from which the an element is
+                to be deleted
+        
+        Raises:
+            TypeError: an element of an immutable object is attempted to be
+                deleted
+            AttributeError: any of the (nested) elements along the path is not
+                found in the object
+        
+        Version 0.1.0.0
+        """
+        objTemp = self._walk(objTarget, self._lstParentSteps)
+        fStep, gItem = self._lstSteps[-1]
+        try:
+            if fStep is _GetByChoice:
+                iIndex, objChild = _FindByChoice(objTemp, gItem)
+            else:
+                fStep(objTemp, gItem) #as sanity check on the last element
+        except AttributeError:
+            self._raiseNotFound(objTarget, self._iLast)
+        self._invalidateChoices(objTarget)
+        if isinstance(objTemp, ElementTree.Element):
+            if fStep is _GetByName:
+                if gItem in ['text', 'tail']:
+                    setattr(objTemp, gItem, None)
+                elif gItem == 'tag':
+                    setattr(objTemp, gItem, 'def_node')
+                    self._invalidateParent(objTarget)
+                else:
+                    iIndex = _FindByTag(objTemp, gItem)
+                    if iIndex is None:
+                        objTemp.attrib.pop(gItem, None)
+                    else:
+                        del objTemp[iIndex]
+            elif fStep is _GetByIndex:
+                del objTemp[gItem]
+            else:
+                del objTemp[iIndex]
+            _InvalidateTagIndex(objTemp)
+        elif isinstance(objTemp, (collections.Mapping, collections.Sequence)):
+            #due to the sanity check above, for mapping type the last element
+            #+ can be only a proper key, and for sequence - the proper index;
+            #+ the objects can be immutable, so the TypeError can be raised
+            if fStep is _GetByChoice: #only for sequences!
+                del objTemp[iIndex]
+            else:
+                del objTemp[gItem]
+        else:
+            delattr(objTemp, gItem)
+    
+    def add(self, objTarget, gValue):
+        """
+        Assigns a value to the nested element of an object if such element is
+        found within the object (overwrites) or attempts to create a new nested
+        element with all missing 'parent' nodes along the path as well. See
+        AddElement(). The object is walked only once up to the deepest existing
+        element along the path.
+        
+        Signature:
+            type A, type B -> None
+        
+        Args:
+            objTarget: type A, the target object
+            gValue: type B, the value to be assigned to the end-path element
+        
+        Raises:
+            TypeError: an XML node object is attempted to be assigned as an
+                attribute of another XML node object (not as a sub-element), or
+                a non XML node is attempted to be assigned to a sub-element of
+                an XML node, or an immutable object is attempted to be modified
+                - in case of the existing end-element being overwritten
+            AttributeError: the 'missing' part of the path after the 'branching'
+                point contains integer indexes or 'choice' dictionaries, or the
+                'branching' point is an immutable object / not XML node
+                (attribute)
+        
+        Version 0.1.0.0
+        """
+        objCurrentLevel = objTarget
+        iCurrentIndex = 0
+        for fStep, gItem in self._lstParentSteps:
+            try:
+                objCurrentLevel = fStep(objCurrentLevel, gItem)
+                #existing level -> go to the next
+                iCurrentIndex += 1
+            except AttributeError: #missing level - create from here!
+                break
+        bCreate = iCurrentIndex < self._iLast
+        if not bCreate: #the 'parent' is found - try to overwrite existing
+            try:
+                self._setLast(objTarget, objCurrentLevel, gValue)
+            except AttributeError: #or create the last element
+                bCreate = True
+        if bCreate: #found the deepest existing - create along the path!
+            glstPath = self._glstPath
+            glstRemainingPath = glstPath[iCurrentIndex:]
+            if any(map(lambda x: not isinstance(x, basestring),
+                                                            glstRemainingPath)):
+                strError = 'Not a name in the path {}, full path {}'.format(
+                                                    glstRemainingPath, glstPath)
+                raise AttributeError(strError)
+            self._invalidateChoices(objTarget)
+            #only names remain in the missing part of the path
+            #build-down the branch from the last existing element and attach
+            if isinstance(objTarget, ElementTree.Element): #XML
+                if not isinstance(objCurrentLevel, ElementTree.Element):
+                    strError = 'Not a node at {} in {}'.format(
+                                            glstPath[:iCurrentIndex], objTarget)
+                    raise AttributeError(strError)
+                _InvalidateTagIndex(objCurrentLevel)
+                for strName in glstRemainingPath[:-1]:
+                    objCurrentLevel = ElementTree.SubElement(objCurrentLevel,
+                                                                        strName)
+                strName = glstRemainingPath[-1]
+                if isinstance(gValue, ElementTree.Element):
+                    objCurrentLevel = ElementTree.SubElement(objCurrentLevel,
+                                                                        strName)
+                    objCurrentLevel.append(gValue)
+                else:
+                    if gValue is ['text', 'tail', 'tag']:
+                        setattr(objCurrentLevel, strName, str(gValue))
+                    else:
+                        objCurrentLevel.set(strName, str(gValue))
+            else: #non XML
+                bIsSequence = (isinstance(objCurrentLevel, collections.Sequence)
+                            and (not isinstance(objCurrentLevel, basestring)))
+                if bIsSequence:
+                    iStartIndex = 0
+                else:
+                    iStartIndex = 1
+                if iStartIndex < len(glstRemainingPath):
+                    objBranch = dict()
+                    objCurrentNode = objBranch
+                    for strName in glstRemainingPath[iStartIndex:-1]:
+                        objCurrentNode[strName] = dict()
+                        objCurrentNode = objCurrentNode[strName]
+                    objCurrentNode[glstRemainingPath[-1]] = gValue
+                else:
+                    objBranch = gValue
+                try:
+                    if iStartIndex:
+                        if isinstance(objCurrentLevel, collections.Mapping):
+                            objCurrentLevel[glstRemainingPath[0]] = objBranch
+                        else:
+                            setattr(objCurrentLevel, glstRemainingPath[0],
+                                                                    objBranch)
+                    else:
+                        objCurrentLevel.append(objBranch)
+                except (TypeError, AttributeError): #immutable object
+                    strError = 'Immutable element at {} in {}'.format(
+                                            glstPath[:iCurrentIndex], objTarget)
+                    raise AttributeError(strError)
+
+class CompiledMapping(object):
+    """
+    Pre-compiled mapping rules (plan), which can be applied to any number of
+    the target - source objects pairs without repeated validation and parsing of
+    the mapping rules dictionary.
+    
+    The mapping rules dictionary is validated and 'flattened' into the pairs of
+    the target and source paths only once during the instantiation, and each
+    path is compiled into a CompiledPath instance. The bound get() method of the
+    source path accessor and the set() / add() methods of the target path
+    accessor are stored for each pair, so the application of the plan to an
+    objects pair is reduced to walking both objects along the pre-compiled
+    paths. The error and warning messages are constructed only when an element
+    is actually missing or cannot be assigned.
+    
+    Note that the mapping rules dictionary is not copied, but its state at the
+    moment of the compilation is used; any later in-place modification of the
+    dictionary does not affect an existing plan.
+    
+    The source paths consisting of a single integer index are also resolved
+    into the column indexes, which are used by the methods applyColumns() and
+    applyColumnar() for the column-wise mapping of the tabulated data - the rows
+    of columns, e.g. read from a TSV file. Each such column is sliced out of all
+    rows at once, without the path walk for each 'cell'.
+    
+    The logger object passed upon instantiation is used for the compilation
+    errors and as the default logger of the mapping; each method applying the
+    rules also accepts a logger for this call only, thus a single plan can be
+    shared by the callers with different loggers.
+    
+    Methods:
+        apply()
+            type A, type B/, logging.Logger OR 'LoggingFSIO.ConsoleLogger/
+                -> None
+        applyMany()
+            seq(type A), seq(type B)/, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger/ -> None
+        applyColumns()
+            seq(type A), seq(type B)/, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger/ -> None
+        applyColumnar()
+            type A, seq(type B)/, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger/ -> None
+    
+    Version 0.1.0.0
+    """
+    
+    #special methods
+    
+    def __init__(self, dictMap, objLogger = None, bStrictTarget = True,
+                                    bStrictSource = True, bForceTarget = False):
+        """
+        Initialization method. Validates the mapping rules dictionary and
+        compiles all target - source paths pairs.
+        
+        Signature:
+            dict/, logging.Logger OR 'fsio_lib.LoggingFSIO.ConsoleLogger, bool,
+                bool, bool/ -> None
+        
+        Args:
+            dictMap: the mapping rules dictionary, see DE001 DSL specifications
+            objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+                instance of, the logger object used for the compilation errors
+                and as the default logger of the methods applying the rules, by
+                default is None
+            bStrictTarget: (optional) bool, flag if the target object MUST have
+                all expected elements, default value is True
+            bStrictSource: (optional) bool, flag if the source object MUST have
+                all expected elements, default value is True
+            bForceTarget: (optional) bool, flag is the missing elements / paths
+                are to be created in the target object, has an effect only if
+                the value of bStrictTarget is False, the default value is False
+        
+        Raises:
+            TypeError: wrong mapping dictionary format
+            ValueError: wrong mapping dictionary format
+        
+        Version 0.1.0.0
+        """
+        if not isinstance(dictMap, collections.Mapping):
+            strMessage = ' '.join(['wrong type of the mapping rules object',
+                    '{} of {} - not a dictionary'.format(dictMap, type(dictMap))])
+            _LogAndRaise(strMessage, TypeError, objLogger)
+        try:
+            self._lstPairs = []
+            self._lstColumns = []
+            for lstTargetPath, lstSourcePath in _GetPathsPairs(dictMap):
+                objTargetPath = CompiledPath(lstTargetPath)
+                objSourcePath = CompiledPath(lstSourcePath)
+                self._lstPairs.append((objSourcePath.get, objTargetPath.set,
+                                        objTargetPath.add, lstTargetPath,
+                                                                lstSourcePath))
+                glstPath = objSourcePath.path
+                if len(glstPath) == 1 and isinstance(glstPath[0], (int, long)):
+                    iColumn = glstPath[0]
+                else:
+                    iColumn = None
+                self._lstColumns.append((iColumn, objTargetPath.setColumn))
+        except Exception as Err:
+            strMessage = 'wrong format of the mapping dictionary {}'.format(
+                                                                        dictMap)
+            _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
+        self._objLogger = objLogger
+        self._bStrictTarget = bStrictTarget
+        self._bStrictSource = bStrictSource
+        self._bForceTarget = bForceTarget
+    
+    #public API
+    
+    def apply(self, gTarget, gSource, objLogger = None):
+        """
+        Copies the values of the elements of the source object into the target
+        object according to the compiled mapping rules, see MapValues().
+        
+        Signature:
+            type A, type B/, logging.Logger OR 'LoggingFSIO.ConsoleLogger/
+                -> None
+        
+        Args:
+            gTarget: type A, the target object, into which the data is to be
+                copied
+            gSource: type B, the source object, from which the data is to be
+                taken
+            objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+                instance of, the logger object to be used for this call instead
+                of the one passed upon instantiation, by default is None - the
+                latter is used
+        
+        Raises:
+            TypeError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            ValueError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            AttributeError: missing element of the target or source object if
+                the corresponding flags are set to True, or an immutable element
+                in the target object
+        
+        Version 0.1.0.0
+        """
+        if objLogger is None:
+            objLogger = self._objLogger
+        with _ChoiceIndexScope():
+            for tupPair in self._lstPairs:
+                fGet, fSet, fAdd, lstTargetPath, lstSourcePath = tupPair
+                #get value
+                try:
+                    gSourceValue = fGet(gSource)
+                except (TypeError, ValueError, AttributeError) as Err:
+                    self._onGetError(Err, gSource, lstSourcePath, objLogger)
+                    continue
+                #set value
+                try:
+                    fSet(gTarget, gSourceValue)
+                except (TypeError, ValueError, AttributeError) as Err:
+                    self._onSetError(Err, gTarget, gSourceValue, fAdd,
+                                                    lstTargetPath, objLogger)
+    
+    def applyMany(self, seqTargets, seqSources, objLogger = None):
+        """
+        Applies the compiled mapping rules to each pair of the target and
+        source objects taken from two sequences (iterables) in parallel, i.e.
+        the first source object is mapped onto the first target object, etc.
+        The iteration stops at the end of the shortest of the two sequences.
+        
+        Signature:
+            seq(type A), seq(type B)/, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger/ -> None
+        
+        Args:
+            seqTargets: seq(type A), a sequence (iterable) of the target objects
+            seqSources: seq(type B), a sequence (iterable) of the source objects
+            objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+                instance of, the logger object to be used for this call instead
+                of the one passed upon instantiation, by default is None - the
+                latter is used
+        
+        Raises:
+            TypeError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            ValueError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            AttributeError: missing element of the target or source object if
+                the corresponding flags are set to True, or an immutable element
+                in the target object
+        
+        Version 0.1.0.0
+        """
+        fApply = self.apply
+        for gTarget, gSource in itertools.izip(seqTargets, seqSources):
+            fApply(gTarget, gSource, objLogger)
+    
+    def applyColumns(self, seqTargets, seqRows, objLogger = None):
+        """
+        Column-wise version of the method applyMany() for the tabulated data:
+        the source objects are rows of columns. Each pair of the compiled rules
+        is applied to all rows before the next pair, and the values of a column
+        referenced by a single integer index are sliced out of all rows at once
+        instead of walking the path for each row, and then assigned to all
+        target objects by CompiledPath.setColumn(). The rows being not lists or
+        tuples as well as the columns missing in any row are treated exactly as
+        by the method apply(). The iteration stops at the end of the shortest of
+        the two sequences.
+        
+        The final state of each target object is the same as after the method
+        applyMany(), but the errors and warnings are reported column by column.
+        
+        Signature:
+            seq(type A), seq(type B)/, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger/ -> None
+        
+        Args:
+            seqTargets: seq(type A), a sequence (iterable) of the target objects
+            seqRows: seq(type B), a sequence (iterable) of the source objects,
+                usually the rows of columns
+            objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+                instance of, the logger object to be used for this call instead
+                of the one passed upon instantiation, by default is None - the
+                latter is used
+        
+        Raises:
+            TypeError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            ValueError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            AttributeError: missing element of the target or source object if
+                the corresponding flags are set to True, or an immutable element
+                in the target object
+        
+        Version 0.1.0.0
+        """
+        if objLogger is None:
+            objLogger = self._objLogger
+        lstTargets = list(seqTargets)
+        lstRows = list(seqRows)
+        iCount = min(len(lstTargets), len(lstRows))
+        del lstTargets[iCount:]
+        del lstRows[iCount:]
+        with _ChoiceIndexScope():
+            for tupColumn in self._iterColumns(lstRows, _MISSING, objLogger):
+                fSetColumn, fAdd, lstTargetPath, lstValues = tupColumn
+                if (not self._bStrictSource) and any(gValue is _MISSING
+                                                    for gValue in lstValues):
+                    tuplstPairs = [(gTarget, gValue) for gTarget, gValue
+                                    in itertools.izip(lstTargets, lstValues)
+                                                if not (gValue is _MISSING)]
+                    seqColumnTargets = [tupPair[0] for tupPair in tuplstPairs]
+                    lstValues = [tupPair[1] for tupPair in tuplstPairs]
+                else:
+                    seqColumnTargets = lstTargets
+                fOnError = (lambda Err, gTarget, gValue, fAdd = fAdd,
+                                    lstTargetPath = lstTargetPath:
+                        self._onSetError(Err, gTarget, gValue, fAdd,
+                                                    lstTargetPath, objLogger))
+                fSetColumn(seqColumnTargets, lstValues, fOnError)
+    
+    def applyColumnar(self, gTarget, seqRows, objLogger = None):
+        """
+        Maps the tabulated data onto a single column-oriented target object:
+        each element of the target object referenced by the compiled rules is
+        assigned the list of the values of the respective source element from
+        all rows, i.e. an entire column. The columns are extracted as by the
+        method applyColumns(); the values missing in the rows are replaced by
+        None if the source is not strict.
+        
+        Signature:
+            type A, seq(type B)/, logging.Logger OR 'LoggingFSIO.ConsoleLogger/
+                -> None
+        
+        Args:
+            gTarget: type A, the target object, into which the columns are to be
+                copied
+            seqRows: seq(type B), a sequence (iterable) of the source objects,
+                usually the rows of columns
+            objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+                instance of, the logger object to be used for this call instead
+                of the one passed upon instantiation, by default is None - the
+                latter is used
+        
+        Raises:
+            TypeError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            ValueError: missmatch between the structure of the target and source
+                objects and the mapping rules
+            AttributeError: missing element of the target or source object if
+                the corresponding flags are set to True, or an immutable element
+                in the target object
+        
+        Version 0.1.0.0
+        """
+        if objLogger is None:
+            objLogger = self._objLogger
+        with _ChoiceIndexScope():
+            for tupColumn in self._iterColumns(list(seqRows), None, objLogger):
+                fSetColumn, fAdd, lstTargetPath, lstValues = tupColumn
+                try:
+                    fSetColumn([gTarget], [lstValues])
+                except (TypeError, ValueError, AttributeError) as Err:
+                    self._onSetError(Err, gTarget, lstValues, fAdd,
+                                                    lstTargetPath, objLogger)
+    
+    #'private' instance methods
+    
+    def _iterColumns(self, lstRows, gMissing, objLogger):
+        """
+        Helper generator, which extracts the values of the source element of
+        each compiled rule from all rows. The values of a column referenced by a
+        single integer index are sliced out directly if all rows are lists or
+        tuples long enough; otherwise the compiled source path is walked for
+        each row, and the missing values are replaced by gMissing if the source
+        is not strict.
+        
+        Signature:
+            list(type A), type B, logging.Logger OR 'LoggingFSIO.ConsoleLogger
+                OR None -> generator(tuple(function, function, list,
+                    list(type C OR type B)))
+        
+        Yields:
+            tuple(function, function, list, list(type C OR type B)): the
+                setColumn() and add() bound methods of the target path, the
+                target path and the values of the source element from all rows
+        
+        Raises:
+            TypeError: missmatch between the structure of the source objects and
+                the mapping rules
+            ValueError: missmatch between the structure of the source objects
+                and the mapping rules
+            AttributeError: missing element of the source object if the source
+                is strict
+        
+        Version 0.1.0.0
+        """
+        if all(type(gRow) in (list, tuple) for gRow in lstRows):
+            iWidth = min(len(gRow) for gRow in lstRows) if len(lstRows) else 0
+        else:
+            iWidth = 0
+        for tupPair, tupColumn in itertools.izip(self._lstPairs,
+                                                            self._lstColumns):
+            fGet, _, fAdd, lstTargetPath, lstSourcePath = tupPair
+            iColumn, fSetColumn = tupColumn
+            if (not (iColumn is None)) and iColumn < iWidth:
+                lstValues = [_ConvertNumber(gRow[iColumn])
+                                if isinstance(gRow[iColumn], basestring)
+                                    else gRow[iColumn] for gRow in lstRows]
+            else:
+                lstValues = []
+                for gRow in lstRows:
+                    try:
+                        lstValues.append(fGet(gRow))
+                    except (TypeError, ValueError, AttributeError) as Err:
+                        self._onGetError(Err, gRow, lstSourcePath, objLogger)
+                        lstValues.append(gMissing)
+            yield fSetColumn, fAdd, lstTargetPath, lstValues
+    
+    def _onGetError(self, Err, gSource, lstSourcePath, objLogger):
+        """
+        Handles an exception raised on the look-up of an element of the source
+        object: logs and re-raises it, or only logs a warning if the source is
+        not strict and the element is missing (AttributeError).
+        
+        Signature:
+            Exception, type A, list, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger OR None -> None
+        
+        Raises:
+            TypeError: re-raised
+            ValueError: re-raised
+            AttributeError: re-raised if the source is strict
+        
+        Version 0.1.0.0
+        """
+        if self._bStrictSource or not isinstance(Err, AttributeError):
+            strMessage = ' '.join(['Unable to get value of an element at',
+                            '{} in object {}'.format(lstSourcePath, gSource)])
+            _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
+        if not (objLogger is None):
+            objLogger.warning(' '.join(['(%s: %s) => Unable to get',
+                                    'value of an element at %s in object %s']),
+                                    Err.__class__.__name__, Err.message,
+                                                        lstSourcePath, gSource)
+    
+    def _onSetError(self, Err, gTarget, gValue, fAdd, lstTargetPath,
+                                                                    objLogger):
+        """
+        Handles an exception raised on the assignment of a value to an element
+        of the target object: logs and re-raises it, or only logs a warning if
+        the target is not strict and the element is missing (AttributeError),
+        in which case the element is created if the target is forced.
+        
+        Signature:
+            Exception, type A, type B, function, list, logging.Logger OR
+                'LoggingFSIO.ConsoleLogger OR None -> None
+        
+        Raises:
+            TypeError: re-raised, or the forced creation of the element failed
+            ValueError: re-raised
+            AttributeError: re-raised if the target is strict, or the forced
+                creation of the element failed
+        
+        Version 0.1.0.0
+        """
+        if self._bStrictTarget or not isinstance(Err, AttributeError):
+            strMessage = self._getSetMessage(gTarget, lstTargetPath, gValue)
+            _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
+        if not (objLogger is None):
+            objLogger.warning(' '.join(['(%s: %s) => Unable to set %s',
+                                'value to an element at %s in object %s']),
+                                Err.__class__.__name__, Err.message,
+                                                gValue, lstTargetPath, gTarget)
+        if self._bForceTarget:
+            try:
+                if not (objLogger is None):
+                    objLogger.warning('Attempting to insert...')
+                fAdd(gTarget, gValue)
+                if not (objLogger is None):
+                    objLogger.warning('Inserted -> target modified')
+            except Exception as NewErr:
+                strMessage = self._getSetMessage(gTarget, lstTargetPath, gValue)
+                _LogAndRaise(strMessage, NewErr.__class__, objLogger, NewErr)
+    
+    def _getSetMessage(self, gTarget, lstTargetPath, gValue):
+        """
+        Constructs the error / warning message on the failed assignment of a
+        value to an element of the target object.
+        
+        Signature:
+            type A, list, type B -> str
+        
+        Version 0.1.0.0
+        """
+        return ' '.join(['Unable to set {} value'.format(gValue),
+                        'to an element at {} in object {}'.format(lstTargetPath,
+                                                                    gTarget)])
+
+#+ 'private' helper classes
+
+class _FrozenChoice(dict):
+    """
+    Read-only and hashable 'choice' dictionary used as an element of the class
+    Path instances. Any attempt to modify its content raises TypeError.
+    
+    Version 0.1.0.0
+    """
+    
+    #special methods
+    
+    def __hash__(self):
+        """
+        Returns the hash value of the dictionary based on its content.
+        
+        Signature:
+            None -> int
+        
+        Version 0.1.0.0
+        """
+        return hash(frozenset(self.items()))
+    
+    def __reduce__(self):
+        """
+        Returns the instructions for the pickling of the instance.
+        
+        Signature:
+            None -> tuple(type, tuple(dict))
+        
+        Version 0.1.0.0
+        """
+        return (self.__class__, (dict(self), ))
+    
+    def _raiseImmutable(self, *args, **kwargs):
+        """
+        Replacement for all modifying methods of the dictionary.
+        
+        Signature:
+            /*args, **kwargs/ -> None
+        
+        Raises:
+            TypeError: always
+        
+        Version 0.1.0.0
+        """
+        raise TypeError('Path choice element {} is immutable'.format(
+                                                                dict(self)))
+    
+    __setitem__ = __delitem__ = _raiseImmutable
+    
+    clear = pop = popitem = setdefault = update = _raiseImmutable
+
+class _ChoiceIndexScope(object):
+    """
+    Context manager enabling the 'choice' dictionaries look-up indexes in the
+    current thread for the duration of a mapping operation. Outside such scope
+    the containers are always scanned, since they can be modified directly
+    between the calls of the module functions. The nested scopes share the same
+    indexes, which are discarded upon exit from the outermost scope, thus no
+    references to the indexed containers are kept afterwards.
+    
+    Version 0.1.0.0
+    """
+    
+    __slots__ = ()
+    
+    #special methods
+    
+    def __enter__(self):
+        """
+        Entering the context - creates the empty indexes cache of the current
+        thread, unless it is a nested scope.
+        
+        Signature:
+            None -> _ChoiceIndexScope
+        
+        Version 0.1.0.0
+        """
+        iDepth = getattr(_CHOICE_INDEX_SCOPE, 'Depth', 0)
+        if not iDepth:
+            _CHOICE_INDEX_SCOPE.Cache = dict()
+        _CHOICE_INDEX_SCOPE.Depth = iDepth + 1
+        return self
+    
+    def __exit__(self, clsErr, objErr, objTraceback):
+        """
+        Exiting the context - discards the indexes cache of the current thread
+        upon exit from the outermost scope. The exceptions are not suppressed.
+        
+        Signature:
+            type A, A, traceback -> None
+        
+        Version 0.1.0.0
+        """
+        _CHOICE_INDEX_SCOPE.Depth -= 1
+        if not _CHOICE_INDEX_SCOPE.Depth:
+            _CHOICE_INDEX_SCOPE.Cache = None
 
 #functions
 
@@ -59,6 +1291,11 @@ def FlattenPath(gPath):
     / attribute is converted into a list of strings with each consecutive
     element referencing the corresponding level of the nesting.
     
+    A string path is parsed only once and then taken from the bounded cache
+    shared with the class Path, but the returned list is always a new one, and
+    its 'choice' dictionaries are plain (mutable) copies of the read-only ones
+    kept in the cache.
+    
     Signature:
         type A -> list(int OR str OR dict(str : int OR float OR str OR bool))
     
@@ -82,46 +1319,11 @@ def FlattenPath(gPath):
     Version 0.1.0.0
     """
     if isinstance(gPath, basestring):
-        if gPath.startswith('#') or gPath.startswith('$'):
-            if gPath == '#' or gPath == '$':
-                strError = 'Empty name {}'.format(gPath)
-                raise ValueError(strError)
-            glstResult = [gPath]
-        else:
-            glstResult = gPath.split(".")
-            if any(map(lambda x: not len(x), glstResult)):
-                strError = 'Empty name (in) {}'.format(gPath)
-                raise ValueError(strError)
-    elif isinstance(gPath, (int, long)) and not isinstance(gPath, bool):
-        if gPath < 0:
-            strError = "Negative index {}".format(gPath)
-            raise ValueError(strError)
-        glstResult = [gPath]
-    elif isinstance(gPath, collections.Mapping):
-        if not len(gPath):
-            strError = 'Empty choice element dictionary'
-            raise ValueError(strError)
-        for gKey, gValue in gPath.items():
-            if not isinstance(gKey, basestring):
-                strError = "Not a string key {} {} in dictionary {}".format(
-                                                        gKey, type(gKey), gPath)
-                raise TypeError(strError)
-            if not isinstance(gValue, (basestring, int, float, long)):
-                strError = "Not allowed {} value of key {} in dict {}".format(
-                                                    type(gValue), gKey, gPath)
-                raise TypeError(strError)
-        glstResult = [gPath]
-    elif isinstance(gPath, collections.Sequence):
-        if not len(gPath):
-            strError = 'Empty path elements sequence'
-            raise ValueError(strError)
-        glstResult = []
-        for gItem in gPath:
-            glstResult.extend(FlattenPath(gItem))
+        glstPath = _GetCachedPath(gPath)
     else:
-        strError = 'Not allowed type {} of the path (element) {}'.format(
-                                                            type(gPath), gPath)
-        raise TypeError(strError)
+        glstPath = _FlattenPath(gPath)
+    glstResult = [dict(gItem) if isinstance(gItem, _FrozenChoice) else gItem
+                                                        for gItem in glstPath]
     return glstResult
 
 def ResolvePathSubstitutions(dictPaths):
@@ -262,73 +1464,8 @@ def GetElement(objTarget, glstPath):
     
     Version 0.1.0.0
     """
-    _glstPath = FlattenPath(glstPath)
-    objTemp = objTarget
-    for iIndex, gItem in enumerate(_glstPath):
-        strError = 'Object {} has no element index {} in path {}'.format(
-                                                objTarget, iIndex, _glstPath)
-        if isinstance(gItem, basestring):
-            if isinstance(objTemp, ElementTree.Element):
-                if gItem in ['text', 'tail', 'tag']:
-                    objTemp = getattr(objTemp, gItem)
-                elif any(map(lambda x: x.tag == gItem, list(objTemp))):
-                    objTemp = objTemp.find(gItem)
-                elif gItem in objTemp.attrib:
-                    objTemp = objTemp.get(gItem)
-                else:
-                    raise AttributeError(strError) 
-            elif isinstance(objTemp, collections.Mapping):
-                if not (gItem in objTemp):
-                    raise AttributeError(strError)
-                objTemp = objTemp[gItem]
-            else:
-                if hasattr(objTemp, gItem):
-                    objTemp = getattr(objTemp, gItem)
-                else:
-                    raise AttributeError(strError)
-        elif isinstance(gItem, (int, long)):
-            if (isinstance(objTemp, (ElementTree.Element, collections.Sequence))
-                                    and (not isinstance(objTemp, basestring))):
-                try:
-                    objTemp = list(objTemp)[gItem]
-                except IndexError:
-                    raise AttributeError(strError)
-            else:
-                raise AttributeError(strError)
-        elif isinstance(gItem, collections.Mapping):
-            if (isinstance(objTemp, (ElementTree.Element, collections.Sequence))
-                                    and (not isinstance(objTemp, basestring))):
-                objFound = None
-                for objElement in list(objTemp):
-                    bEqual = False
-                    for Key, Value in gItem.items():
-                        try:
-                            bEqual = (Value == GetElement(objElement, [Key]))
-                        except AttributeError:
-                            pass
-                        if not bEqual:
-                            break
-                    if bEqual:
-                        objFound = objElement
-                        break
-                if not (objFound is None):
-                    objTemp = objFound
-                else:
-                    raise AttributeError(strError)
-            else:
-                raise AttributeError(strError)
-        else:
-            raise AttributeError(strError)
-    if isinstance(objTemp, basestring):
-        try:
-            objTemp = int(objTemp)
-        except (ValueError, TypeError):
-            try:
-                objTemp = float(objTemp)
-            except (ValueError, TypeError):
-                pass
-    return objTemp
-    
+    return CompiledPath(glstPath).get(objTarget)
+
 def SetElement(objTarget, glstPath, gValue):
     """
     Assigns a value to an arbitrary level deep nested element of an object if
@@ -383,67 +1520,7 @@ def SetElement(objTarget, glstPath, gValue):
     
     Version 0.1.0.0
     """
-    _glstPath = FlattenPath(glstPath)
-    GetElement(objTarget, _glstPath) #as sanity check on the path and elements
-    if len(_glstPath) > 1:
-        objTemp = GetElement(objTarget, _glstPath[:-1])
-    else:
-        objTemp = objTarget
-    gItem = _glstPath[-1]
-    strError = 'Cannot assign {} to element {} of {}'.format(gValue, _glstPath,
-                                                                    objTarget)
-    if isinstance(gItem, basestring):
-        if isinstance(objTemp, ElementTree.Element):
-            if not isinstance(gValue, ElementTree.Element):
-                if gItem in ['text', 'tail', 'tag']:
-                    setattr(objTemp, gItem, str(gValue))
-                elif gItem in objTemp.attrib:
-                    objTemp.set(gItem, str(gValue))
-                else:
-                    raise TypeError(strError)
-            else:
-                objChild = objTemp.find(gItem)
-                if not (objChild is None):
-                    for iIndex, objNode in enumerate(list(objTemp)):
-                        if objNode is objChild:
-                            break
-                    objTemp.remove(objChild)
-                    del objChild
-                    objTemp.insert(iIndex, gValue)
-                else:
-                    raise TypeError(strError)
-        elif isinstance(objTemp, collections.Mapping):
-            objTemp[gItem] = gValue
-        else:
-            setattr(objTemp, gItem, gValue)
-    elif isinstance(gItem, (int, long)):
-        if isinstance(objTemp, ElementTree.Element):
-            if isinstance(gValue, ElementTree.Element):
-                objChild = list(objTemp)[gItem]
-                objTemp.remove(objChild)
-                del objChild
-                objTemp.insert(gItem, gValue)
-            else:
-                raise TypeError(strError)
-        else:
-            objTemp[gItem] = gValue
-    else: #dictionary path element!
-        objChild = GetElement(objTemp, gItem)
-        for iIndex, objNode in enumerate(list(objTemp)):
-            if objNode is objChild:
-                break
-        if isinstance(objTemp, ElementTree.Element): #XML sub-element!
-            if isinstance(gValue, ElementTree.Element):
-                objTemp.remove(objChild)
-                del objChild
-                objTemp.insert(iIndex, gValue)
-            else:
-                raise TypeError(strError)
-        else: #element of sequence
-            try:
-                objTemp[iIndex] = gValue
-            except TypeError: #immutable sequence
-                raise TypeError(strError)
+    CompiledPath(glstPath).set(objTarget, gValue)
 
 def DeleteElement(objTarget, glstPath):
     """
@@ -497,45 +1574,7 @@ def DeleteElement(objTarget, glstPath):
     
     Version 0.1.0.0
     """
-    _glstPath = FlattenPath(glstPath)
-    GetElement(objTarget, _glstPath) #as sanity check on the path and elements
-    if len(_glstPath) > 1:
-        objTemp = GetElement(objTarget, _glstPath[:-1])
-    else:
-        objTemp = objTarget
-    gItem = _glstPath[-1]
-    if isinstance(objTemp, ElementTree.Element):
-        if isinstance(gItem, basestring):
-            if gItem in ['text', 'tail']:
-                setattr(objTemp, gItem, None)
-            elif gItem == 'tag':
-                setattr(objTemp, gItem, 'def_node')
-            elif gItem in [objItem.tag for objItem in list(objTemp)]:
-                objChild = objTemp.find(gItem)
-                objTemp.remove(objChild)
-                del objChild
-            else:
-                objTemp.attrib.pop(gItem, None)
-        elif isinstance(gItem, (int, long)):
-            objChild = list(objTemp)[gItem]
-            objTemp.remove(objChild)
-            del objChild
-        else:
-            objChild = GetElement(objTemp, gItem)
-            objTemp.remove(objChild)
-            del objChild
-    elif isinstance(objTemp, (collections.Mapping, collections.Sequence)):
-        #due to the sanity check above, for mapping type the last element can
-        #+ be only a proper key, and for sequence - the proper index; the
-        #+ objects can be immutable, so the TypeError can be raised
-        if isinstance(gItem, (basestring, int, long)):
-            del objTemp[gItem]
-        else: #dictionary -> only for sequences!
-            objChild = GetElement(objTemp, gItem)
-            iIndex = objTemp.index(objChild)
-            del objTemp[iIndex]
-    else:
-        delattr(objTemp, gItem)
+    CompiledPath(glstPath).delete(objTarget)
 
 def AddElement(objTarget, glstPath, gValue):
     """
@@ -605,116 +1644,523 @@ def AddElement(objTarget, glstPath, gValue):
         a node - the AttributeError exception is raised
     
     Signature:
-        type A, type B, type C -> None
+        type A, type B, type C -> None
+    
+    Args:
+        objTarget: type A, the target object, supposedly C-struct like object or
+            a sequence (container), or a dictionary (mapping type), or an XML
+            file content representation (xml.etree.ElementTree.Element)
+        glstPath: type B, a path or a single element of a path to be flatten and
+            unified, can be an integer or string or a dictionary of string keys
+            and numeric / boolean / string values or a (nested) sequence of
+            these types
+        gValue: type C, the value to be assigned to the end-path element
+    
+    Raises:
+        TypeError: the second input argument (path)is not of the allowed type,
+            or an XML node object is attempted to be assigned as an attribute of
+            another XML node object (not as a sub-element), or a non XML node is
+            attempted to be assigned to a sub-element of an XML node, or an
+            immutable object is attempted to be modified - in case of the
+            existing end-element being overwritten
+        ValueError: the second input argument (path) is not of the allowed
+            values, or an 'empty' path is used not with the target object and
+            new values both being XML nodes
+        AttributeError: the 'missing' part of the path after the 'branching'
+            point contains integer indexes or 'choice' dictionaries, or the
+            'branching' point is an immutable object / not XML node (attribute)
+    
+    Version 0.1.0.0
+    """
+    bCond1 = isinstance(glstPath, collections.Sequence) and (not len(glstPath))
+    if bCond1 or (glstPath is None):
+        if (isinstance(objTarget, ElementTree.Element)
+                                and isinstance(gValue, ElementTree.Element)):
+            objTarget.append(gValue)
+        else:
+            strError = 'Only XML node can be added to an XML node without path'
+            raise ValueError(strError)
+    else:
+        #also as a sanity check on the path!
+        CompiledPath(glstPath).add(objTarget, gValue)
+
+def CompilePath(glstPath):
+    """
+    Flattens, unifies and validates the path to an element / attribute of an
+    object once and returns a re-usable accessor object, which walks any target
+    object along the path without repeated parsing of the path. Should be used
+    instead of the functions GetElement(), SetElement(), DeleteElement() and
+    AddElement() when the same path is applied to many objects.
+    
+    Signature:
+        type A -> CompiledPath
+    
+    Args:
+        glstPath: type A, a path or a single element of a path to be flatten and
+            unified, can be an integer or string or a dictionary of string keys
+            and numeric / boolean / string values or a (nested) sequence of
+            these types
+    
+    Returns:
+        CompiledPath: instance of, the accessor object with the methods get(),
+            set(), delete() and add()
+    
+    Raises:
+        TypeError: the input argument is not of the allowed type
+        ValueError: the input argument is not of the allowed values
+    
+    Version 0.1.0.0
+    """
+    return CompiledPath(glstPath)
+
+def IndexXMLTree(objRoot, iMinChildren = None):
+    """
+    Builds the tags indexes of all nodes of an XML tree, which have, at least,
+    the specified number of the direct child sub-elements, so the look-up of a
+    child sub-element by its tag (name) does not require scanning of all
+    children. The indexes are kept as long as the nodes exist (weak
+    references), and they are updated automatically if the nodes are modified
+    via the functions SetElement(), AddElement(), DeleteElement() or the class
+    CompiledPath, as well as when the number of the children of a node changes.
+    After the replacement or re-naming of the child sub-elements directly via
+    the ElementTree API this function should be called again. The existing
+    indexes of the nodes with fewer children than required are removed.
+    
+    Signature:
+        xml.etree.ElementTree.Element/, int/ -> int
+    
+    Args:
+        objRoot: xml.etree.ElementTree.Element, instance of, the root node of
+            the tree (or sub-tree) to index
+        iMinChildren: (optional) int, the minimal number of the children of the
+            node to be indexed, defaults to XML_INDEX_MIN_CHILDREN
+    
+    Returns:
+        int: the number of the indexed nodes; 0 if the nodes do not support the
+            weak references (e.g. created by xml.etree.cElementTree)
+    
+    Raises:
+        TypeError: the object is not an XML node
+    
+    Version 0.1.0.0
+    """
+    if not isinstance(objRoot, ElementTree.Element):
+        strError = 'Not an XML node {} {}'.format(objRoot, type(objRoot))
+        raise TypeError(strError)
+    if iMinChildren is None:
+        iMinChildren = XML_INDEX_MIN_CHILDREN
+    iResult = 0
+    try:
+        for objNode in objRoot.iter():
+            if len(objNode) and len(objNode) >= iMinChildren:
+                _BuildTagIndex(objNode)
+                iResult += 1
+            else:
+                _XML_TAG_INDEX.pop(objNode, None)
+    except TypeError: #weak references are not supported
+        pass
+    return iResult
+
+#+ 'private' helper functions -> should not be visible of import *
+
+def _FindByTag(objNode, strTag):
+    """
+    Finds the index of the first direct child sub-element of an XML node with
+    the specified tag. The tags index of the node is used if the node is
+    indexed (see IndexXMLTree()), and the outdated index is re-built; otherwise
+    the child sub-elements are scanned.
+    
+    Signature:
+        xml.etree.ElementTree.Element, str -> int OR None
+    
+    Args:
+        objNode: xml.etree.ElementTree.Element, instance of, the parent node
+        strTag: str, the tag to look for
+    
+    Returns:
+        int: the index of the first child sub-element with this tag
+        None: there is no such child sub-element
+    
+    Version 0.1.0.0
+    """
+    if len(_XML_TAG_INDEX) and (objNode in _XML_TAG_INDEX):
+        tupEntry = _XML_TAG_INDEX[objNode]
+        if (tupEntry is None) or (tupEntry[0] != len(objNode)):
+            tupEntry = _BuildTagIndex(objNode)
+        iIndex = tupEntry[1].get(strTag, None)
+        if (not (iIndex is None)) and (objNode[iIndex].tag != strTag):
+            tupEntry = _BuildTagIndex(objNode) #modified directly
+            iIndex = tupEntry[1].get(strTag, None)
+    else:
+        iIndex = None
+        for iPosition, objChild in enumerate(objNode):
+            if objChild.tag == strTag:
+                iIndex = iPosition
+                break
+    return iIndex
+
+def _BuildTagIndex(objNode):
+    """
+    Builds the tags index of an XML node, i.e. the mapping of the tags of its
+    direct child sub-elements to the index of the first sub-element with such
+    tag, and stores it in the index together with the number of the children.
+    
+    Signature:
+        xml.etree.ElementTree.Element -> tuple(int, dict(str : int))
+    
+    Args:
+        objNode: xml.etree.ElementTree.Element, instance of, the node to index
+    
+    Returns:
+        tuple(int, dict(str : int)): the number of the child sub-elements and
+            the tags index
+    
+    Raises:
+        TypeError: the object does not support weak references
+    
+    Version 0.1.0.0
+    """
+    dictTags = dict()
+    for iIndex, objChild in enumerate(objNode):
+        dictTags.setdefault(objChild.tag, iIndex)
+    tupEntry = (len(objNode), dictTags)
+    _XML_TAG_INDEX[objNode] = tupEntry
+    return tupEntry
+
+def _InvalidateTagIndex(objNode):
+    """
+    Marks the tags index of an XML node as outdated, if the object is an XML
+    node, and it is indexed. The index is re-built upon the next look-up.
+    
+    Signature:
+        type A -> None
+    
+    Args:
+        objNode: type A, the modified object
+    
+    Version 0.1.0.0
+    """
+    if (len(_XML_TAG_INDEX) and isinstance(objNode, ElementTree.Element)
+                                            and (objNode in _XML_TAG_INDEX)):
+        _XML_TAG_INDEX[objNode] = None
+
+def _FindByChoice(objTemp, tuplstChoice):
+    """
+    Finds the first element of a sequence or the first direct child sub-element
+    of an XML node, which has all the required sub-elements with the required
+    values as in the compiled 'choice' dictionary.
+    
+    Within a mapping operation (see _ChoiceIndexScope) the containers with, at
+    least, CHOICE_INDEX_MIN_SIZE elements are indexed by the values of the keys
+    of the 'choice' dictionary at the first look-up, and the index is re-used
+    by all subsequent look-ups with the same set of keys (by any path) until
+    the end of the operation, see _LookUpChoiceIndex(). The element found via
+    the index is always re-checked; if the required values are not in the
+    index, the container is scanned unless the index has been just built.
+    Outside a mapping operation the container is always scanned.
+    
+    Signature:
+        type A, tuple(tuple(CompiledPath, int OR float OR str OR bool))
+            -> tuple(int, type B)
+    
+    Args:
+        objTemp: type A, the sequence or XML node object to search in
+        tuplstChoice: tuple(tuple(CompiledPath, int OR float OR str OR bool)),
+            the compiled 'choice' dictionary as pairs of the key path accessor
+            and the required value
+    
+    Returns:
+        tuple(int, type B): the index of the found element and the element
+    
+    Raises:
+        AttributeError: the object is not a sequence or an XML node, or the
+            required element is not found
+    
+    Version 0.1.0.0
+    """
+    if ((not isinstance(objTemp, (ElementTree.Element, collections.Sequence)))
+                                            or isinstance(objTemp, basestring)):
+        raise AttributeError
+    dictCache = getattr(_CHOICE_INDEX_SCOPE, 'Cache', None)
+    if (not (dictCache is None)) and len(objTemp) >= max(
+                                                    CHOICE_INDEX_MIN_SIZE, 1):
+        tupResult, bFresh = _LookUpChoiceIndex(dictCache, objTemp,
+                                                                tuplstChoice)
+    else:
+        tupResult, bFresh = None, False
+    if (tupResult is None) and (not bFresh):
+        for iIndex, objElement in enumerate(objTemp):
+            if _IsChoiceMatch(objElement, tuplstChoice):
+                tupResult = (iIndex, objElement)
+                break
+    if tupResult is None:
+        raise AttributeError
+    return tupResult
+
+def _IsChoiceMatch(objElement, tuplstChoice):
+    """
+    Checks if an element has all the required sub-elements with the required
+    values as in the compiled 'choice' dictionary.
+    
+    Signature:
+        type A, tuple(tuple(CompiledPath, int OR float OR str OR bool)) -> bool
+    
+    Args:
+        objElement: type A, the element to check
+        tuplstChoice: tuple(tuple(CompiledPath, int OR float OR str OR bool)),
+            the compiled 'choice' dictionary
+    
+    Returns:
+        bool: True if all required sub-elements are found and have the required
+            values, False otherwise
+    
+    Version 0.1.0.0
+    """
+    bEqual = False
+    for objKeyPath, Value in tuplstChoice:
+        try:
+            bEqual = (Value == objKeyPath.get(objElement))
+        except AttributeError:
+            bEqual = False
+        if not bEqual:
+            break
+    return bEqual
+
+def _LookUpChoiceIndex(dictCache, objTemp, tuplstChoice):
+    """
+    Looks up an element of a container in the index by the values of the keys
+    of the 'choice' dictionary, building the index if required.
+    
+    The indexes are kept in the bounded cache (CHOICE_INDEX_CACHE_SIZE entries)
+    of the current mapping operation keyed by the identity of the container;
+    each entry holds the reference to the container (so its identity cannot be
+    re-used while the entry is in the cache), its length and the indexes for
+    each set of the keys (paths). The index maps the tuple of the values of the
+    keys (sorted by the keys) onto the index and the reference to the first
+    element with such values. An entry is discarded if the length of the
+    container has changed or the container or any of its nested elements has
+    been modified via the module functions. When the cache is full, the least
+    recently used quarter of the entries is removed. If the found element is
+    not the same object at the same position in the container anymore or it
+    does not match the 'choice' dictionary, the index is re-built.
+    
+    Signature:
+        dict(int : list), type A,
+            tuple(tuple(CompiledPath, int OR float OR str OR bool))
+                -> tuple(tuple(int, type B) OR None, bool)
+    
+    Args:
+        dictCache: dict(int : list), the indexes cache of the current mapping
+            operation
+        objTemp: type A, the sequence or XML node object to search in
+        tuplstChoice: tuple(tuple(CompiledPath, int OR float OR str OR bool)),
+            the compiled 'choice' dictionary sorted by the keys
+    
+    Returns:
+        tuple(tuple(int, type B) OR None, bool): the index of the found element
+            and the element, or None if the values are not in the index, and
+            the flag if the index has been (re-) built during this call
+    
+    Version 0.1.0.0
+    """
+    tupKeys = tuple(objKeyPath._glstPath for objKeyPath, _ in tuplstChoice)
+    tupValues = tuple(Value for _, Value in tuplstChoice)
+    iLength = len(objTemp)
+    lstEntry = dictCache.get(id(objTemp), None)
+    if ((lstEntry is None) or (not (lstEntry[0] is objTemp))
+                                                or (lstEntry[1] != iLength)):
+        lstEntry = [objTemp, iLength, 0, dict()]
+        if len(dictCache) >= max(CHOICE_INDEX_CACHE_SIZE, 0):
+            iKeep = max(CHOICE_INDEX_CACHE_SIZE, 0) * 3 // 4
+            tuplstEntries = sorted(dictCache.items(), key = lambda x: x[1][2])
+            for iOldKey, _ in tuplstEntries[:len(tuplstEntries) - iKeep]:
+                del dictCache[iOldKey]
+        if CHOICE_INDEX_CACHE_SIZE > 0:
+            dictCache[id(objTemp)] = lstEntry
+    lstEntry[2] = next(_CHOICE_INDEX_CACHE_CLOCK)
+    dictIndex = lstEntry[3].get(tupKeys, None)
+    bFresh = dictIndex is None
+    if bFresh:
+        dictIndex = _BuildChoiceIndex(objTemp, tuplstChoice)
+        lstEntry[3][tupKeys] = dictIndex
+    tupResult = dictIndex.get(tupValues, None)
+    if not (tupResult is None):
+        iIndex, objElement = tupResult
+        if ((not (objTemp[iIndex] is objElement))
+                        or (not _IsChoiceMatch(objElement, tuplstChoice))):
+            bFresh = True #modified in place -> re-build
+            dictIndex = _BuildChoiceIndex(objTemp, tuplstChoice)
+            lstEntry[3][tupKeys] = dictIndex
+            tupResult = dictIndex.get(tupValues, None)
+    return tupResult, bFresh
+
+def _BuildChoiceIndex(objTemp, tuplstChoice):
+    """
+    Builds the index of the elements of a container by the values of the keys
+    of the 'choice' dictionary. The elements missing any of the keys or having
+    not hashable values are not indexed.
+    
+    Signature:
+        type A, tuple(tuple(CompiledPath, int OR float OR str OR bool))
+            -> dict(tuple(type B) : tuple(int, type C))
+    
+    Args:
+        objTemp: type A, the sequence or XML node object to index
+        tuplstChoice: tuple(tuple(CompiledPath, int OR float OR str OR bool)),
+            the compiled 'choice' dictionary sorted by the keys
+    
+    Returns:
+        dict(tuple(type B) : tuple(int, type C)): the mapping of the tuples of
+            the keys' values onto the index and the element
+    
+    Version 0.1.0.0
+    """
+    dictIndex = dict()
+    for iIndex, objElement in enumerate(objTemp):
+        try:
+            tupValues = tuple(objKeyPath.get(objElement)
+                                            for objKeyPath, _ in tuplstChoice)
+            dictIndex.setdefault(tupValues, (iIndex, objElement))
+        except (AttributeError, TypeError): #missing key or not hashable
+            pass
+    return dictIndex
+
+def _InvalidateChoiceIndex(objTemp):
+    """
+    Removes the 'choice' dictionaries look-up indexes of a modified container
+    from the cache of the current mapping operation, if there are any.
+    
+    Signature:
+        type A -> None
+    
+    Args:
+        objTemp: type A, the modified object
+    
+    Version 0.1.0.0
+    """
+    dictCache = getattr(_CHOICE_INDEX_SCOPE, 'Cache', None)
+    if dictCache:
+        lstEntry = dictCache.get(id(objTemp), None)
+        if (not (lstEntry is None)) and (lstEntry[0] is objTemp):
+            del dictCache[id(objTemp)]
+
+def _GetByName(objTemp, strName):
+    """
+    Single step look-up of an element of an object by its name, i.e. a key of a
+    mapping object, an attribute of an object, or a special attribute, a child
+    sub-element (by tag) or a normal attribute of an XML node - in this order.
+    
+    Signature:
+        type A, str -> type B
+    
+    Args:
+        objTemp: type A, the object to look in
+        strName: str, the name of the element
+    
+    Returns:
+        type B: the found element (as it is, not converted)
+    
+    Raises:
+        AttributeError: the element is not found; the exception is raised
+            without a message, which is to be formed by the caller
+    
+    Version 0.1.0.0
+    """
+    if isinstance(objTemp, ElementTree.Element):
+        if strName in ['text', 'tail', 'tag']:
+            return getattr(objTemp, strName)
+        iIndex = _FindByTag(objTemp, strName)
+        if not (iIndex is None):
+            return objTemp[iIndex]
+        if strName in objTemp.attrib:
+            return objTemp.get(strName)
+        raise AttributeError
+    elif isinstance(objTemp, collections.Mapping):
+        if not (strName in objTemp):
+            raise AttributeError
+        return objTemp[strName]
+    return getattr(objTemp, strName)
+
+def _GetByIndex(objTemp, iIndex):
+    """
+    Single step look-up of an element of a sequence or a direct child
+    sub-element of an XML node by its index.
+    
+    Signature:
+        type A, int -> type B
+    
+    Args:
+        objTemp: type A, the object to look in
+        iIndex: int, the index of the element
+    
+    Returns:
+        type B: the found element
+    
+    Raises:
+        AttributeError: the object is not a sequence or an XML node, or the
+            index is out of range; the exception is raised without a message,
+            which is to be formed by the caller
+    
+    Version 0.1.0.0
+    """
+    if isinstance(objTemp, ElementTree.Element):
+        if iIndex >= len(objTemp):
+            raise AttributeError
+        return objTemp[iIndex]
+    if ((not isinstance(objTemp, collections.Sequence))
+                                            or isinstance(objTemp, basestring)):
+        raise AttributeError
+    try:
+        return objTemp[iIndex]
+    except IndexError:
+        raise AttributeError
+
+def _GetByChoice(objTemp, tuplstChoice):
+    """
+    Single step look-up of an element of a sequence or a direct child
+    sub-element of an XML node by the compiled 'choice' dictionary.
+    
+    Signature:
+        type A, tuple(tuple(CompiledPath, int OR float OR str OR bool))
+            -> type B
     
     Args:
-        objTarget: type A, the target object, supposedly C-struct like object or
-            a sequence (container), or a dictionary (mapping type), or an XML
-            file content representation (xml.etree.ElementTree.Element)
-        glstPath: type B, a path or a single element of a path to be flatten and
-            unified, can be an integer or string or a dictionary of string keys
-            and numeric / boolean / string values or a (nested) sequence of
-            these types
-        gValue: type C, the value to be assigned to the end-path element
+        objTemp: type A, the object to look in
+        tuplstChoice: tuple(tuple(CompiledPath, int OR float OR str OR bool)),
+            the compiled 'choice' dictionary
+    
+    Returns:
+        type B: the found element
     
     Raises:
-        TypeError: the second input argument (path)is not of the allowed type,
-            or an XML node object is attempted to be assigned as an attribute of
-            another XML node object (not as a sub-element), or a non XML node is
-            attempted to be assigned to a sub-element of an XML node, or an
-            immutable object is attempted to be modified - in case of the
-            existing end-element being overwritten
-        ValueError: the second input argument (path) is not of the allowed
-            values, or an 'empty' path is used not with the target object and
-            new values both being XML nodes
-        AttributeError: the 'missing' part of the path after the 'branching'
-            point contains integer indexes or 'choice' dictionaries, or the
-            'branching' point is an immutable object / not XML node (attribute)
+        AttributeError: the element is not found; the exception is raised
+            without a message, which is to be formed by the caller
     
     Version 0.1.0.0
     """
-    bCond1 = isinstance(glstPath, collections.Sequence) and (not len(glstPath))
-    if bCond1 or (glstPath is None):
-        if (isinstance(objTarget, ElementTree.Element)
-                                and isinstance(gValue, ElementTree.Element)):
-            objTarget.append(gValue)
-        else:
-            strError = 'Only XML node can be added to an XML node without path'
-            raise ValueError(strError)
-    else:
-        glstPath = FlattenPath(glstPath) #also as a sanity check on the path!
-        try:
-            SetElement(objTarget, glstPath, gValue) #overwrite existing
-        except AttributeError: #or create along the path!
-            objCurrentLevel = objTarget
-            iCurrentIndex = 0
-            while iCurrentIndex < len(glstPath) - 1:
-                gCurrentPathItem = glstPath[iCurrentIndex]
-                try:
-                    objCurrentLevel = GetElement(objCurrentLevel,
-                                                            gCurrentPathItem)
-                    #existing level -> go to the next
-                    iCurrentIndex += 1
-                except AttributeError: #missing level - create from here!
-                    break
-            #found the deepest existing 
-            glstRemainingPath = glstPath[iCurrentIndex:]
-            if any(map(lambda x: not isinstance(x, basestring),
-                                                            glstRemainingPath)):
-                strError = 'Not a name in the path {}, full path {}'.format(
-                                                    glstRemainingPath, glstPath)
-                raise AttributeError(strError)
-            #only names remain in the missing part of the path
-            #build-down the branch from the last existing element and attach
-            if isinstance(objTarget, ElementTree.Element): #XML
-                if not isinstance(objCurrentLevel, ElementTree.Element):
-                    strError = 'Not a node at {} in {}'.format(
-                                            glstPath[:iCurrentIndex], objTarget)
-                    raise AttributeError(strError)
-                for strName in glstRemainingPath[:-1]:
-                    objCurrentLevel = ElementTree.SubElement(objCurrentLevel,
-                                                                        strName)
-                strName = glstRemainingPath[-1]
-                if isinstance(gValue, ElementTree.Element):
-                    objCurrentLevel = ElementTree.SubElement(objCurrentLevel,
-                                                                        strName)
-                    objCurrentLevel.append(gValue)
-                else:
-                    if gValue is ['text', 'tail', 'tag']:
-                        setattr(objCurrentLevel, strName, str(gValue))
-                    else:
-                        objCurrentLevel.set(strName, str(gValue))
-            else: #non XML
-                bIsSequence = (isinstance(objCurrentLevel, collections.Sequence)
-                            and (not isinstance(objCurrentLevel, basestring)))
-                if bIsSequence:
-                    iStartIndex = 0
-                else:
-                    iStartIndex = 1
-                if iStartIndex < len(glstRemainingPath):
-                    objBranch = dict()
-                    objCurrentNode = objBranch
-                    for strName in glstRemainingPath[iStartIndex:-1]:
-                        objCurrentNode[strName] = dict()
-                        objCurrentNode = objCurrentNode[strName]
-                    objCurrentNode[glstRemainingPath[-1]] = gValue
-                else:
-                    objBranch = gValue
-                strError = 'Immutable element at {} in {}'.format(
-                                            glstPath[:iCurrentIndex], objTarget)
-                try:
-                    if iStartIndex:
-                        if isinstance(objCurrentLevel, collections.Mapping):
-                            objCurrentLevel[glstRemainingPath[0]] = objBranch
-                        else:
-                            setattr(objCurrentLevel, glstRemainingPath[0],
-                                                                    objBranch)
-                    else:
-                        objCurrentLevel.append(objBranch)
-                except (TypeError, AttributeError): #immutable object
-                    raise AttributeError(strError)
+    return _FindByChoice(objTemp, tuplstChoice)[1]
 
-#+ 'private' helper functions -> should not be visible of import *
+def _RaiseAssignError(objTarget, glstPath, gValue):
+    """
+    Raises TypeError with the message on the impossible assignment, which is
+    constructed only at this point, i.e. on the failure path.
+    
+    Signature:
+        type A, list(int OR str OR dict), type B -> None
+    
+    Args:
+        objTarget: type A, the target object
+        glstPath: list(int OR str OR dict), the flattened path
+        gValue: type B, the value being assigned
+    
+    Raises:
+        TypeError: always
+    
+    Version 0.1.0.0
+    """
+    strError = 'Cannot assign {} to element {} of {}'.format(gValue, glstPath,
+                                                                    objTarget)
+    raise TypeError(strError)
 
 def _IsIdentifier(gValue):
     """
@@ -1257,13 +2703,15 @@ def _WalkDict(dictTarget, dictSubstitutions, strFile, objLogger = None):
     #replace str(int) -> int keys
     lstKeys = dictTarget.keys()
     for gKey in lstKeys:
-        strError = 'Improper key {} in {} in file {}'.format(gKey, dictTarget,
-                                                                        strFile)
-        if not isinstance(gKey, (basestring, int, long)):
-            _LogAndRaise(strError, ValueError, objLogger)
-        elif isinstance(gKey, (int, long)) and gKey < 0:
-            _LogAndRaise(strError, ValueError, objLogger)
-        elif isinstance(gKey, basestring) and (not _IsProperKey(gKey)):
+        if isinstance(gKey, basestring):
+            bImproper = not _IsProperKey(gKey)
+        elif isinstance(gKey, (int, long)):
+            bImproper = gKey < 0
+        else:
+            bImproper = True
+        if bImproper:
+            strError = 'Improper key {} in {} in file {}'.format(gKey,
+                                                            dictTarget, strFile)
             _LogAndRaise(strError, ValueError, objLogger)
         elif _IsNumberString(gKey):
                 iKey = int(gKey)
@@ -1516,6 +2964,160 @@ def _ApplyRemovals(dictRules, dictRemovals):
             del dictRules[strKey[1:]]
         del dictRemovals[strKey]
 
+def _FlattenPath(gPath):
+    """
+    Actual implementation of the function FlattenPath() without caching, with
+    the 'choice' dictionaries being frozen.
+    
+    Signature:
+        type A -> list(int OR str OR _FrozenChoice)
+    
+    Raises:
+        TypeError: the input argument is not of the allowed type
+        ValueError: the input argument is not of the allowed values
+    
+    Version 0.1.0.0
+    """
+    if isinstance(gPath, basestring):
+        if gPath.startswith('#') or gPath.startswith('$'):
+            if gPath == '#' or gPath == '$':
+                strError = 'Empty name {}'.format(gPath)
+                raise ValueError(strError)
+            glstResult = [gPath]
+        else:
+            glstResult = gPath.split(".")
+            if any(map(lambda x: not len(x), glstResult)):
+                strError = 'Empty name (in) {}'.format(gPath)
+                raise ValueError(strError)
+    elif isinstance(gPath, (int, long)) and not isinstance(gPath, bool):
+        if gPath < 0:
+            strError = "Negative index {}".format(gPath)
+            raise ValueError(strError)
+        glstResult = [gPath]
+    elif isinstance(gPath, collections.Mapping):
+        if not len(gPath):
+            strError = 'Empty choice element dictionary'
+            raise ValueError(strError)
+        for gKey, gValue in gPath.items():
+            if not isinstance(gKey, basestring):
+                strError = "Not a string key {} {} in dictionary {}".format(
+                                                        gKey, type(gKey), gPath)
+                raise TypeError(strError)
+            if not isinstance(gValue, (basestring, int, float, long)):
+                strError = "Not allowed {} value of key {} in dict {}".format(
+                                                    type(gValue), gKey, gPath)
+                raise TypeError(strError)
+        glstResult = [_FrozenChoice(gPath)]
+    elif isinstance(gPath, collections.Sequence):
+        if not len(gPath):
+            strError = 'Empty path elements sequence'
+            raise ValueError(strError)
+        glstResult = []
+        for gItem in gPath:
+            glstResult.extend(_FlattenPath(gItem))
+    else:
+        strError = 'Not allowed type {} of the path (element) {}'.format(
+                                                            type(gPath), gPath)
+        raise TypeError(strError)
+    return glstResult
+
+def _GetCachedPath(strPath):
+    """
+    Returns the Path instance for a string path from the bounded cache, or
+    creates it and puts into the cache. Each cache hit only updates the 'last
+    used' stamp of the entry, thus it requires neither locking nor re-ordering;
+    when the cache is full, the least recently used quarter of the entries is
+    removed at once. The cache key includes the type of the string, so the
+    'str' and 'unicode' paths are not mixed.
+    
+    Signature:
+        str -> Path
+    
+    Raises:
+        ValueError: the input argument is not of the allowed values
+    
+    Version 0.1.0.0
+    """
+    tupKey = (type(strPath), strPath)
+    lstEntry = _PATH_CACHE.get(tupKey, None)
+    if lstEntry is None:
+        lstEntry = [tuple.__new__(Path, _FlattenPath(strPath)), 0]
+        with _PATH_CACHE_LOCK:
+            if len(_PATH_CACHE) >= max(PATH_CACHE_SIZE, 0):
+                iKeep = max(PATH_CACHE_SIZE, 0) * 3 // 4
+                tuplstEntries = sorted(_PATH_CACHE.items(),
+                                                key = lambda x: x[1][1])
+                for tupOldKey, _ in tuplstEntries[:len(tuplstEntries) - iKeep]:
+                    del _PATH_CACHE[tupOldKey]
+            if PATH_CACHE_SIZE > 0:
+                _PATH_CACHE[tupKey] = lstEntry
+    lstEntry[1] = next(_PATH_CACHE_CLOCK)
+    return lstEntry[0]
+
+def _ConvertNumber(strValue):
+    """
+    Converts a string into int or float if it represents a number; otherwise
+    returns the string as it is.
+    
+    Signature:
+        str -> int OR float OR str
+    
+    Version 0.1.0.0
+    """
+    try:
+        gResult = int(strValue)
+    except (ValueError, TypeError):
+        try:
+            gResult = float(strValue)
+        except (ValueError, TypeError):
+            gResult = strValue
+    return gResult
+
+def _GetCompiledMapping(dictMap, objLogger, bStrictTarget, bStrictSource,
+                                                                bForceTarget):
+    """
+    Returns the compiled mapping plan from the bounded cache, or compiles it
+    and puts into the cache, removing the least recently used plan if the
+    cache is full. The cache key is the identity of the mapping rules
+    dictionary and the flags values; the cached entry holds the reference to
+    the dictionary, thus its identity cannot be re-used while the entry is in
+    the cache. The logger object is not a part of the key and is not bound to
+    the cached plan - it is used only to log the compilation errors, and it is
+    to be passed to the plan's methods with each call.
+    
+    Signature:
+        dict, logging.Logger OR 'fsio_lib.LoggingFSIO.ConsoleLogger OR None,
+            bool, bool, bool -> CompiledMapping
+    
+    Raises:
+        TypeError: wrong mapping dictionary format
+        ValueError: wrong mapping dictionary format
+    
+    Version 0.1.0.0
+    """
+    tupKey = (id(dictMap), bool(bStrictTarget), bool(bStrictSource),
+                                                            bool(bForceTarget))
+    with _MAPPING_CACHE_LOCK:
+        tupEntry = _MAPPING_CACHE.pop(tupKey, None)
+        if not (tupEntry is None):
+            _MAPPING_CACHE[tupKey] = tupEntry #most recently used -> to the end
+    if (tupEntry is None) or (not (tupEntry[0] is dictMap)):
+        try:
+            objPlan = CompiledMapping(dictMap, None, bStrictTarget,
+                                                bStrictSource, bForceTarget)
+        except (TypeError, ValueError) as Err:
+            if not (objLogger is None):
+                objLogger.error('{}: {}'.format(Err.__class__.__name__,
+                                                                    Err.message))
+            raise
+        with _MAPPING_CACHE_LOCK:
+            _MAPPING_CACHE[tupKey] = (dictMap, objPlan)
+            while len(_MAPPING_CACHE) > max(MAPPING_CACHE_SIZE, 0):
+                _MAPPING_CACHE.popitem(last = False)
+    else:
+        objPlan = tupEntry[1]
+    return objPlan
+
 #+ main functions
 
 def LoadDefinition(strFile, objLogger = None):
@@ -1646,6 +3248,14 @@ def MapValues(gTarget, gSource, dictMap, objLogger = None,
     If an optional logger object with the standard API is provided, all raised
     exceptions and warnings are logged.
     
+    The mapping rules are compiled (see CompileMapping()) at the first call
+    and the compiled plan is kept in a bounded cache (MAPPING_CACHE_SIZE
+    entries) keyed by the identity of the mapping rules dictionary, the logger
+    and the values of the flags, so the repeated calls with the same template
+    do not re-validate and re-parse it. Therefore, a mapping rules dictionary
+    must not be modified in-place after it has been used; use a new dictionary
+    (or a copy) instead.
+    
     Signature:
         type A, type B, dict/, logging.Logger OR
             'fsio_lib.LoggingFSIO.ConsoleLogger, bool, bool, bool/ -> None
@@ -1673,60 +3283,112 @@ def MapValues(gTarget, gSource, dictMap, objLogger = None,
             corresponding flags are set to True, or an immutable element in the
             target object
     """
-    #get source -> target paths pairs
-    strMessage = ' '.join(['wrong type of the mapping rules object',
-                '{} of {} - not a dictionary'.format(dictMap, type(dictMap))])
-    if not isinstance(dictMap, collections.Mapping):
-        _LogAndRaise(strMessage, TypeError, objLogger)
-    strMessage = 'wrong format of the mapping dictionary {}'.format(dictMap)
-    try:
-        tuplstPaths = _GetPathsPairs(dictMap)
-    except Exception as Err:
-        _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
-    #iterate through pairs
-    for lstTargetPath, lstSourcePath in tuplstPaths:
-        #get value
-        strMessage = ' '.join(['Unable to get value of an element at',
-                            '{} in object {}'.format(lstSourcePath, gSource)])
-        bFound = False
-        try:
-            gSourceValue = GetElement(gSource, lstSourcePath)
-            bFound = True
-        except (TypeError, ValueError) as Err:
-            _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
-        except AttributeError as Err:
-            if bStrictSource:
-                _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
-            else:
-                if not (objLogger is None):
-                    strLogMessage = "({}: {}) => {}".format(
-                                Err.__class__.__name__, Err.message, strMessage)
-                    objLogger.warning(strLogMessage)
-        if bFound:
-        #set value
-            strMessage =' '.join(['Unable to set {} value'.format(gSourceValue),
-                        'to an element at {} in object {}'.format(lstTargetPath,
-                                                                    gTarget)])
-            try:
-                SetElement(gTarget, lstTargetPath, gSourceValue)
-            except (TypeError, ValueError) as Err:
-                _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
-            except AttributeError as Err:
-                if (not bStrictTarget):
-                    if not (objLogger is None):
-                        strLogMessage = "({}: {}) => {}".format(
-                                Err.__class__.__name__, Err.message, strMessage)
-                        objLogger.warning(strLogMessage)
-                    if bForceTarget:
-                        try:
-                            if (not bStrictTarget):
-                                objLogger.warning('Attempting to insert...')
-                                AddElement(gTarget, lstTargetPath, gSourceValue)
-                                objLogger.warning('Inserted -> target modified')
-                            else:
-                                AddElement(gTarget, lstTargetPath, gSourceValue)
-                        except Exception as NewErr:
-                            _LogAndRaise(strMessage, NewErr.__class__,
-                                                            objLogger, NewErr)
-                else:
-                    _LogAndRaise(strMessage, Err.__class__, objLogger, Err)
+    objPlan = _GetCompiledMapping(dictMap, objLogger, bStrictTarget,
+                                                bStrictSource, bForceTarget)
+    objPlan.apply(gTarget, gSource, objLogger)
+
+def CompileMapping(dictMap, objLogger = None, bStrictTarget = True,
+                                    bStrictSource = True, bForceTarget = False):
+    """
+    Validates and compiles the mapping rules dictionary into a re-usable plan,
+    which can be applied to any number of the target - source objects pairs
+    without repeated parsing of the rules, see MapValues().
+    
+    Signature:
+        dict/, logging.Logger OR 'fsio_lib.LoggingFSIO.ConsoleLogger, bool,
+            bool, bool/ -> CompiledMapping
+    
+    Args:
+        dictMap: the mapping rules dictionary, see DE001 DSL specifications
+        objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+            instance of, the logger object, by default is None (not provided)
+        bStrictTarget: (optional) bool, flag if the target object MUST have all
+            expected elements, default value is True
+        bStrictSource: (optional) bool, flag if the source object MUST have all
+            expected elements, default value is True
+        bForceTarget: (optional) bool, flag is the missing elements / paths are
+            to be created in the target object, has an effect only if the value
+            of bStrictTarget is False, the default value for bForceTarget False
+    
+    Returns:
+        CompiledMapping: instance of, the compiled plan with the methods apply()
+            and applyMany()
+    
+    Raises:
+        TypeError: wrong mapping dictionary format
+        ValueError: wrong mapping dictionary format
+    
+    Version 0.1.0.0
+    """
+    return CompiledMapping(dictMap, objLogger = objLogger,
+                            bStrictTarget = bStrictTarget,
+                            bStrictSource = bStrictSource,
+                            bForceTarget = bForceTarget)
+
+def MapColumns(clsTarget, seqTable, dictMap, objLogger = None,
+            bStrictTarget = True, bStrictSource = True, bForceTarget = False,
+                                                            bColumnar = False):
+    """
+    Batch version of the function MapValues() for the tabulated data, e.g. the
+    rows of columns read from a TSV file. A new instance of the target class is
+    created for each row, and the values are mapped column by column: the
+    source column index of each target element referenced by a single integer
+    is resolved only once, and the entire column is assigned across all target
+    objects, see CompiledMapping.applyColumns().
+    
+    With the flag bColumnar being True a single column-oriented instance of the
+    target class is created and returned instead, with each mapped element
+    being assigned the list of the values of an entire column, see
+    CompiledMapping.applyColumnar().
+    
+    The mapping rules are compiled and cached as by the function MapValues().
+    
+    Signature:
+        class A, seq(type B), dict/, logging.Logger OR
+            'fsio_lib.LoggingFSIO.ConsoleLogger, bool, bool, bool, bool/
+                -> list(type A) OR type A
+    
+    Args:
+        clsTarget: class A, the target class, which must be instantiable
+            without arguments
+        seqTable: seq(type B), a sequence (iterable) of the source objects,
+            usually the rows of columns
+        dictMap: the mapping rules dictionary, see DE001 DSL specifications
+        objLogger: (optional) logging.Logger OR 'LoggingFSIO.ConsoleLogger,
+            instance of, the logger object, by default is None (not provided)
+        bStrictTarget: (optional) bool, flag if the target object MUST have all
+            expected elements, default value is True
+        bStrictSource: (optional) bool, flag if the source object MUST have all
+            expected elements, default value is True
+        bForceTarget: (optional) bool, flag is the missing elements / paths are
+            to be created in the target object, has an effect only if the value
+            of bStrictTarget is False, the default value for bForceTarget False
+        bColumnar: (optional) bool, flag if a single column-oriented target
+            object is to be returned, the default value is False
+    
+    Returns:
+        list(type A): the target objects, one per row, in the same order
+        type A: the single column-oriented target object, if the flag
+            bColumnar is True
+    
+    Raises:
+        TypeError: wrong mapping dictionary format or missmatch between the
+            structure of the target and source objects and the mapping rules
+        ValueError: wrong mapping dictionary format or missmatch between the
+            structure of the target and source objects and the mapping rules
+        AttributeError: missing element of the target or source object if the
+            corresponding flags are set to True, or an immutable element in the
+            target object
+    
+    Version 0.1.0.0
+    """
+    objPlan = _GetCompiledMapping(dictMap, objLogger, bStrictTarget,
+                                                bStrictSource, bForceTarget)
+    if bColumnar:
+        gResult = clsTarget()
+        objPlan.applyColumnar(gResult, seqTable, objLogger)
+    else:
+        lstRows = list(seqTable)
+        gResult = [clsTarget() for _ in lstRows]
+        objPlan.applyColumns(gResult, lstRows, objLogger)
+    return gResult
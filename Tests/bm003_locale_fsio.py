@@ -0,0 +1,215 @@
+#!/usr/bin/python
+"""
+Module Tests.bm003_locale_fsio
+
+Micro-benchmark of the functions LoadLines() and SplitLine() of the module
+locale_fsio against their original character-by-character implementations,
+which are kept here as the reference. Before the timing both implementations
+are checked to produce identical results on randomly generated data with the
+mixed line endings and columns separators.
+
+Usage:
+    python bm003_locale_fsio.py [iLines [iRepeat]]
+"""
+
+__version__ = "0.1.0.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import random
+import timeit
+
+#+ tested module
+
+LIB_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+ROOT_FOLDER = os.path.dirname(LIB_ROOT)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+import fsio_lib.locale_fsio as TestModule
+
+# checks on existance of the output folder
+
+strTemp = os.path.join(LIB_ROOT, 'Tests', 'Output')
+
+if not os.path.isdir(strTemp):
+    os.mkdir(strTemp)
+
+#globals
+
+TEST_FILE = os.path.join(LIB_ROOT, 'Tests', 'Output', 'bm003_lines.txt')
+
+#functions
+
+#+ reference implementations
+
+def LegacyLoadLines(strFileName, iSkipLines = 0):
+    """
+    Original character-by-character implementation of the function
+    locale_fsio.LoadLines().
+
+    Signature:
+        str/, int >= 0/ -> list(str)
+    """
+    with open(strFileName, 'rb') as fFile:
+        strBuffer = fFile.read()
+    strlstBuffer = []
+    strTemp = ''
+    bNewLine = False
+    for strChar in strBuffer:
+        if strChar == '\r':
+            if bNewLine:
+                strlstBuffer.append(strTemp)
+                strTemp = ''
+            else:
+                bNewLine = True
+        elif strChar == '\n':
+            bNewLine = False
+            strlstBuffer.append(strTemp)
+            strTemp = ''
+        else:
+            if not bNewLine:
+                strTemp += strChar
+            else:
+                strlstBuffer.append(strTemp)
+                bNewLine = False
+                strTemp = strChar
+    if len(strTemp) or bNewLine:
+        strlstBuffer.append(strTemp)
+    if isinstance(iSkipLines, (int, long)) and iSkipLines >= 0:
+        strlstBuffer = strlstBuffer[iSkipLines:]
+    return strlstBuffer
+
+def LegacySplitLine(strLine):
+    """
+    Original character-by-character implementation of the function
+    locale_fsio.SplitLine().
+
+    Signature:
+        str -> list(str)
+    """
+    if len(strLine):
+        bSpaceRun = False
+        strlstResult = []
+        strTemp = ''
+        for strChar in strLine:
+            if strChar != ' ' and strChar != '\t':
+                bSpaceRun = False
+                strTemp += strChar
+            elif strChar == '\t':
+                bSpaceRun = False
+                strlstResult.append(strTemp)
+                strTemp = ''
+            else:
+                if not bSpaceRun:
+                    bSpaceRun = True
+                    strlstResult.append(strTemp)
+                    strTemp = ''
+        strlstResult.append(strTemp)
+    else:
+        strlstResult = ['']
+    return strlstResult
+
+#+ helper functions
+
+def GenerateContent(iLines, bMixed = True):
+    """
+    Generates the content of a TSV file with the numbers and words in the
+    columns separated by TABs and runs of spaces, and with the randomly mixed
+    CR, LF and CRLF line endings, up to 6 columns. If bMixed is False - only
+    CRLF line endings and TAB separators, and 20 columns per line, as in a
+    typical instrument data file.
+
+    Signature:
+        int/, bool/ -> str
+    """
+    if bMixed:
+        strlstEndings = ['\r', '\n', '\r\n']
+        strlstSeparators = ['\t', ' ', '   ', '\t\t', ' \t', '\t  ']
+    else:
+        strlstEndings = ['\r\n']
+        strlstSeparators = ['\t']
+    strlstParts = []
+    for _ in xrange(iLines):
+        strlstCells = []
+        iColumns = random.randint(0, 6) if bMixed else 20
+        for _ in xrange(iColumns):
+            strlstCells.append(random.choice(['{:.4f}'.format(random.random()),
+                                str(random.randint(-1000, 1000)), 'abc', '']))
+            strlstCells.append(random.choice(strlstSeparators))
+        strlstParts.append(''.join(strlstCells))
+        strlstParts.append(random.choice(strlstEndings))
+    if len(strlstParts) and random.random() < 0.5:
+        strlstParts.pop()
+    return ''.join(strlstParts)
+
+def CheckSame(iCases = 300):
+    """
+    Checks that the new and the reference implementations produce identical
+    results on randomly generated files and lines.
+
+    Signature:
+        /int/ -> None
+
+    Raises:
+        AssertionError: the results differ
+    """
+    for iCase in xrange(iCases):
+        strContent = GenerateContent(random.randint(0, 20))
+        if iCase % 10 == 0:
+            strContent = ''.join(random.choice(['\r', '\n', 'a', ' ', '\t'])
+                                    for _ in xrange(random.randint(0, 12)))
+        with open(TEST_FILE, 'wb') as fFile:
+            fFile.write(strContent)
+        for iSkipLines in [0, 1, 3]:
+            strlstLines = TestModule.LoadLines(TEST_FILE, iSkipLines)
+            assert strlstLines == LegacyLoadLines(TEST_FILE, iSkipLines), (
+                                                                strContent)
+        for strLine in LegacyLoadLines(TEST_FILE):
+            assert TestModule.SplitLine(strLine) == LegacySplitLine(strLine), (
+                                                                    strLine)
+
+def Benchmark(iLines = 100000, iRepeat = 3):
+    """
+    Times the loading of a generated file into lines and the splitting of all
+    lines into columns by the new and the reference implementations, and
+    prints the best of iRepeat runs and the speed-up factor. Two files are
+    used: with the mixed line endings and separators, and with CRLF and TABs
+    only.
+
+    Signature:
+        /int, int/ -> None
+    """
+    for bMixed in [True, False]:
+        with open(TEST_FILE, 'wb') as fFile:
+            fFile.write(GenerateContent(iLines, bMixed = bMixed))
+        strlstLines = TestModule.LoadLines(TEST_FILE)
+        strKind = 'mixed' if bMixed else 'TAB only'
+        for strName, fNew, fOld in [
+                ('LoadLines', lambda: TestModule.LoadLines(TEST_FILE),
+                                        lambda: LegacyLoadLines(TEST_FILE)),
+                ('SplitLine', lambda: map(TestModule.SplitLine, strlstLines),
+                                    lambda: map(LegacySplitLine, strlstLines))]:
+            fNewTime = min(timeit.repeat(fNew, repeat = iRepeat, number = 1))
+            fOldTime = min(timeit.repeat(fOld, repeat = iRepeat, number = 1))
+            sys.stdout.write('{} ({}): {} lines - legacy {:.4f} s, new {:.4f} '
+                            's, x{:.1f}\n'.format(strName, strKind,
+                                    len(strlstLines), fOldTime, fNewTime,
+                                                        fOldTime / fNewTime))
+
+if __name__ == "__main__":
+    random.seed(0)
+    iLines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    iRepeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    CheckSame()
+    sys.stdout.write('Results of the new and legacy implementations match\n')
+    Benchmark(iLines, iRepeat)
+    os.remove(TEST_FILE)
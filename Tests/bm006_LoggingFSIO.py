@@ -0,0 +1,137 @@
+#!/usr/bin/python
+"""
+Module Tests.bm006_LoggingFSIO
+
+Micro-benchmark of the attribute resolution of the logger classes of the module
+LoggingFSIO. The per-call cost of the redirected logging methods (and of a
+redirected data attribute) of the classes ConsoleLogger and DualLogger is
+compared with the plain logging.Logger and with the original implementation of
+ConsoleLogger.__getattribute__(), which scans the entire MRO on each attribute
+access and is kept here as the reference. Two cases are timed: the message
+is filtered out by the level of the logger, and the message is emitted into a
+handler writing into an in-memory buffer.
+
+Usage:
+    python bm006_LoggingFSIO.py [iCalls [iRepeat]]
+"""
+
+__version__ = "0.1.0.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import logging
+import timeit
+import StringIO
+
+#+ tested module
+
+LIB_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+ROOT_FOLDER = os.path.dirname(LIB_ROOT)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+import fsio_lib.LoggingFSIO as TestModule
+
+#classes
+
+#+ reference implementation
+
+class LegacyConsoleLogger(TestModule.ConsoleLogger):
+    """
+    The class ConsoleLogger with the original implementation of the attribute
+    resolution.
+    """
+
+    def __getattribute__(self, strName):
+        """
+        Original implementation of the method ConsoleLogger.__getattribute__().
+
+        Signature:
+            str -> type A
+        """
+        if strName in ['__dict__', '__class__']:
+            objResult = object.__getattribute__(self, strName)
+        else:
+            bCond1 = strName in self.__dict__
+            bCond2 = any(map(lambda x: strName in x.__dict__,
+                                                        self.__class__.__mro__))
+            if bCond1 or bCond2:
+                objResult = object.__getattribute__(self, strName)
+            else:
+                try:
+                    objTemp = object.__getattribute__(self, '_logger')
+                    if hasattr(objTemp, strName):
+                        objResult=object.__getattribute__(self._logger, strName)
+                    else: #should result in AttributeError exception
+                        objResult = object.__getattribute__(self, strName)
+                except AttributeError:
+                    #should still result in AttributeError exception
+                    objResult = object.__getattribute__(self, strName)
+        return objResult
+
+#functions
+
+def MakeLoggers():
+    """
+    Creates the plain, legacy, console and dual loggers with the console
+    output disabled and a handler writing into an in-memory buffer, all at the
+    logging.INFO level.
+
+    Signature:
+        None -> list(tuple(str, type A))
+    """
+    lstLoggers = []
+    objPlain = logging.getLogger('bm006_plain')
+    lstLoggers.append(('logging.Logger', objPlain))
+    lstLoggers.append(('legacy ConsoleLogger',
+                                        LegacyConsoleLogger('bm006_legacy')))
+    lstLoggers.append(('ConsoleLogger',
+                                    TestModule.ConsoleLogger('bm006_console')))
+    lstLoggers.append(('DualLogger', TestModule.DualLogger('bm006_dual')))
+    for _, objLogger in lstLoggers:
+        if not (objLogger is objPlain):
+            objLogger.disableConsoleLogging()
+        objLogger.propagate = False
+        objLogger.setLevel(logging.INFO)
+        objLogger.addHandler(logging.StreamHandler(StringIO.StringIO()))
+    return lstLoggers
+
+def Benchmark(iCalls = 100000, iRepeat = 3):
+    """
+    Times the calls of the methods debug() (filtered out) and info() (emitted)
+    and the access to the attribute level for each logger, and prints the best
+    of iRepeat runs per call and the ratio to the plain logging.Logger.
+
+    Signature:
+        /int, int/ -> None
+    """
+    lstLoggers = MakeLoggers()
+    for strCase, fMake in [
+                ('debug() - filtered', lambda objLogger: lambda:
+                                                        objLogger.debug('m')),
+                ('info() - emitted', lambda objLogger: lambda:
+                                                        objLogger.info('m')),
+                ('level - attribute', lambda objLogger: lambda:
+                                                            objLogger.level)]:
+        fBaseTime = None
+        for strName, objLogger in lstLoggers:
+            fTime = min(timeit.repeat(fMake(objLogger), repeat = iRepeat,
+                                                            number = iCalls))
+            if fBaseTime is None:
+                fBaseTime = fTime
+            sys.stdout.write('{}: {} {:.3f} us per call, x{:.1f}\n'.format(
+                strCase, strName, 1000000 * fTime / iCalls, fTime / fBaseTime))
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    iCalls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    iRepeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    Benchmark(iCalls, iRepeat)
@@ -0,0 +1,204 @@
+#!/usr/bin/python
+"""
+Module Tests.bm007_fs_maintenance
+
+Benchmark of the parallel scanning and hashing in the module fs_maintenance.
+A synthetic folders tree with the required number of small files (with some
+duplicates) is created, and the function MakeFolderDictionary() is timed with
+the sequential processing and with the pools of worker threads of different
+sizes, in the default and the staged modes. The results of the parallel
+processing are checked to be identical to those of the sequential processing.
+
+Note that the operation system caches the files' content after the first run,
+thus on the local storage the parallel processing mostly speeds up the hashing;
+the effect of the overlapping I/O is best seen on a network storage.
+
+With the 'copy' mode the scaling of the function CopyNonPresent() is measured
+instead: the source trees of the doubling sizes (up to the requested number of
+files) consist of the files with only a few distinct base filenames but unique
+content, thus each copied file requires a name conflict resolution. The time
+per file should remain roughly constant.
+
+Usage:
+    python bm007_fs_maintenance.py [iFiles [iWorkers ...]]
+    python bm007_fs_maintenance.py copy [iFiles]
+"""
+
+__version__ = "0.1.0.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import shutil
+import random
+import timeit
+
+#+ tested module
+
+LIB_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+ROOT_FOLDER = os.path.dirname(LIB_ROOT)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+import fsio_lib.fs_maintenance as TestModule
+
+# checks on existance of the output folder
+
+strTemp = os.path.join(LIB_ROOT, 'Tests', 'Output')
+
+if not os.path.isdir(strTemp):
+    os.mkdir(strTemp)
+
+#globals
+
+TEST_FOLDER = os.path.join(LIB_ROOT, 'Tests', 'Output', 'bm007_tree')
+
+TARGET_FOLDER = os.path.join(LIB_ROOT, 'Tests', 'Output', 'bm007_target')
+
+#functions
+
+def GenerateTree(iFiles, iPerFolder = 500):
+    """
+    Creates a synthetic folders tree with the required number of files, at most
+    iPerFolder files per folder, nested up to 3 levels deep. The files are from
+    100 bytes to 64 KiB in size, and about 10% of them are duplicates of the
+    previously created files (same base filename and content).
+
+    Signature:
+        int/, int/ -> None
+    """
+    if os.path.isdir(TEST_FOLDER):
+        shutil.rmtree(TEST_FOLDER)
+    tuplstCreated = []
+    iFolder = 0
+    iCreated = 0
+    while iCreated < iFiles:
+        strFolder = os.path.join(TEST_FOLDER, *['d{}'.format(iFolder // iLevel)
+                                                    for iLevel in (100, 10, 1)])
+        os.makedirs(strFolder)
+        for iIndex in xrange(min(iPerFolder, iFiles - iCreated)):
+            if len(tuplstCreated) and random.random() < 0.1:
+                strName, strData = random.choice(tuplstCreated)
+                if os.path.isfile(os.path.join(strFolder, strName)):
+                    continue
+            else:
+                strName = 'f{}.dat'.format(iIndex)
+                strData = os.urandom(random.randint(100, 65536))
+                if len(tuplstCreated) < 1000:
+                    tuplstCreated.append((strName, strData))
+            with open(os.path.join(strFolder, strName), 'wb') as fFile:
+                fFile.write(strData)
+            iCreated += 1
+        iFolder += 1
+
+def Benchmark(iFiles = 100000, ilstWorkers = [2, 4, 8], iRepeat = 1):
+    """
+    Creates the synthetic tree, times the function MakeFolderDictionary() in
+    the default and staged modes with the sequential and parallel processing,
+    checks that the results are identical, and prints the best of iRepeat runs
+    and the speed-up factor.
+
+    Signature:
+        /int, list(int), int/ -> None
+
+    Raises:
+        AssertionError: the results differ
+    """
+    sys.stdout.write('Creating {} files...\n'.format(iFiles))
+    sys.stdout.flush()
+    GenerateTree(iFiles)
+    for bStaged in [False, True]:
+        strMode = 'staged' if bStaged else 'default'
+        dictCheck = TestModule.MakeFolderDictionary(TEST_FOLDER,
+                                                        bStaged = bStaged)
+        fBaseTime = min(timeit.repeat(
+                    lambda: TestModule.MakeFolderDictionary(TEST_FOLDER,
+                                                        bStaged = bStaged),
+                                                repeat = iRepeat, number = 1))
+        sys.stdout.write('MakeFolderDictionary ({}): sequential {:.3f} s\n'
+                                                .format(strMode, fBaseTime))
+        for iWorkers in ilstWorkers:
+            dictResult = TestModule.MakeFolderDictionary(TEST_FOLDER,
+                                        bStaged = bStaged, iWorkers = iWorkers)
+            assert dictResult == dictCheck, iWorkers
+            fTime = min(timeit.repeat(
+                    lambda: TestModule.MakeFolderDictionary(TEST_FOLDER,
+                                        bStaged = bStaged, iWorkers = iWorkers),
+                                                repeat = iRepeat, number = 1))
+            sys.stdout.write('MakeFolderDictionary ({}): {} workers {:.3f} s, '
+                        'x{:.1f}\n'.format(strMode, iWorkers, fTime,
+                                                        fBaseTime / fTime))
+        sys.stdout.flush()
+
+def GenerateSameNamed(iFiles, iNames = 10):
+    """
+    Creates a synthetic folders tree with the required number of files with
+    unique content, but only iNames distinct base filenames - one file of each
+    name per folder.
+
+    Signature:
+        int/, int/ -> None
+    """
+    if os.path.isdir(TEST_FOLDER):
+        shutil.rmtree(TEST_FOLDER)
+    for iIndex in xrange(iFiles):
+        strFolder = os.path.join(TEST_FOLDER, 'd{}'.format(iIndex // iNames))
+        if not (iIndex % iNames):
+            os.makedirs(strFolder)
+        strName = 'f{}.dat'.format(iIndex % iNames)
+        with open(os.path.join(strFolder, strName), 'wb') as fFile:
+            fFile.write(str(iIndex))
+
+def BenchmarkCopyNonPresent(iFiles = 100000):
+    """
+    Times the function CopyNonPresent() copying the trees of the same named
+    files of the doubling sizes up to iFiles into an empty target folder, and
+    prints the time per file for each size.
+
+    Signature:
+        /int/ -> None
+
+    Raises:
+        AssertionError: not all files are copied
+    """
+    ilstSizes = []
+    iSize = iFiles
+    while iSize >= 1000 and len(ilstSizes) < 4:
+        ilstSizes.insert(0, iSize)
+        iSize //= 2
+    for iSize in ilstSizes:
+        GenerateSameNamed(iSize)
+        if os.path.isdir(TARGET_FOLDER):
+            shutil.rmtree(TARGET_FOLDER)
+        os.mkdir(TARGET_FOLDER)
+        fTime = timeit.timeit(lambda: TestModule.CopyNonPresent(TARGET_FOLDER,
+                                                    TEST_FOLDER), number = 1)
+        assert len(os.listdir(TARGET_FOLDER)) == iSize, iSize
+        sys.stdout.write('CopyNonPresent: {} files {:.3f} s, {:.1f} us per '
+                        'file\n'.format(iSize, fTime, 1000000 * fTime / iSize))
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    random.seed(0)
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == 'copy':
+            iFiles = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+            BenchmarkCopyNonPresent(iFiles)
+        else:
+            iFiles = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+            if len(sys.argv) > 2:
+                ilstWorkers = [int(strItem) for strItem in sys.argv[2:]]
+            else:
+                ilstWorkers = [2, 4, 8]
+            Benchmark(iFiles, ilstWorkers)
+    finally:
+        for strFolder in [TEST_FOLDER, TARGET_FOLDER]:
+            if os.path.isdir(strFolder):
+                shutil.rmtree(strFolder)
@@ -18,6 +18,7 @@ import os
 import unittest
 import xml.etree.ElementTree as ElementTree
 import copy
+import pickle
 
 #+ tested module
 
@@ -93,6 +94,24 @@ class OuterClass(object):
     def __init__(self):
         self.a = [{"test" : 1}, [{"b" : 2}, InnerClass()]]
 
+class CountingList(list):
+    
+    Iterations = 0
+    
+    def __iter__(self):
+        CountingList.Iterations += 1
+        return super(CountingList, self).__iter__()
+
+class CountingDict(dict):
+    
+    def __init__(self, *args, **kwargs):
+        super(CountingDict, self).__init__(*args, **kwargs)
+        self.LookUps = 0
+    
+    def __contains__(self, gKey):
+        self.LookUps += 1
+        return super(CountingDict, self).__contains__(gKey)
+
 # Instance of OuterClass has the following structure
 # OuterClass(
 #   a = [
@@ -107,6 +126,28 @@ class OuterClass(object):
 # ]
 # )
 
+#functions
+
+#+ helper functions
+
+def DumpObject(gObject):
+    """
+    Converts a (nested) object into a comparable representation: XML nodes into
+    strings and struct-like objects into dictionaries of their attributes.
+    """
+    if isinstance(gObject, ElementTree.Element):
+        gResult = ElementTree.tostring(gObject)
+    elif isinstance(gObject, dict):
+        gResult = dict((Key, DumpObject(Value))
+                                            for Key, Value in gObject.items())
+    elif isinstance(gObject, (list, tuple)):
+        gResult = [DumpObject(Item) for Item in gObject]
+    elif hasattr(gObject, '__dict__'):
+        gResult = DumpObject(vars(gObject))
+    else:
+        gResult = gObject
+    return gResult
+
 #+ test cases
 
 class Test_FlattenPath(unittest.TestCase):
@@ -187,6 +228,419 @@ class Test_FlattenPath(unittest.TestCase):
         """
         for gInput, gOutput in self.TestGoodCases:
             self.assertEqual(self.TestFunction(gInput), gOutput)
+    
+    def test_MutableChoice(self):
+        """
+        Tests that the 'choice' dictionaries elements of the returned path are
+        plain dictionaries, which can be modified, also in the resolved path
+        substitutions.
+        
+        Test ID - TEST-T-102. Covers REQ-FUN-100.
+        """
+        glstPath = self.TestFunction(['a', {'x' : 1}])
+        self.assertIs(type(glstPath[1]), dict)
+        glstPath[1]['y'] = 2
+        self.assertEqual(glstPath, ['a', {'x' : 1, 'y' : 2}])
+        self.assertEqual(self.TestFunction(['a', {'x' : 1}]), ['a', {'x' : 1}])
+        dictPaths = TestModule.ResolvePathSubstitutions({'$1' : {'x' : 1},
+                                                        '$2' : ['$1', 'b']})
+        for glstPath in dictPaths.values():
+            self.assertIs(type(glstPath[0]), dict)
+            glstPath[0]['y'] = 2
+
+class Test_Path(unittest.TestCase):
+    """
+    Test cases for the class Path of the module StructureMapping and the
+    caching of the flattened paths.
+    
+    Implements tests ID TEST-T-103, TEST-T-104.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = TestModule.Path
+    
+    def test_Immutable(self):
+        """
+        Tests that the class accepts the same input as the function FlattenPath
+        and that its instances are immutable and hashable and can be used as
+        dictionary keys, including the 'choice' dictionaries elements.
+        
+        Test ID - TEST-T-103. Covers REQ-FUN-106, REQ-AWM-100, REQ-AWM-101.
+        """
+        for gInput, gOutput in Test_FlattenPath.TestGoodCases:
+            objPath = self.TestClass(gInput)
+            self.assertIsInstance(objPath, tuple)
+            self.assertEqual(list(objPath), gOutput)
+            self.assertIs(self.TestClass(objPath), objPath)
+            self.assertEqual(self.TestClass(list(objPath)), objPath)
+            self.assertEqual(pickle.loads(pickle.dumps(objPath, 2)), objPath)
+            dictTest = {objPath : 1}
+            self.assertEqual(dictTest[self.TestClass(gInput)], 1)
+        for gItem in Test_FlattenPath.TestTypeError:
+            with self.assertRaises(TypeError):
+                self.TestClass(gItem)
+        for gItem in Test_FlattenPath.TestValueError:
+            with self.assertRaises(ValueError):
+                self.TestClass(gItem)
+        objPath = self.TestClass(["a", {"test" : "check", "id" : 2}])
+        dictChoice = objPath[1]
+        self.assertIsInstance(dictChoice, dict)
+        self.assertEqual(dictChoice, {"test" : "check", "id" : 2})
+        with self.assertRaises(TypeError):
+            dictChoice["id"] = 3
+        with self.assertRaises(TypeError):
+            del dictChoice["id"]
+        for strMethod, tupArgs in [("clear", tuple()), ("pop", ("id", )),
+                                ("popitem", tuple()), ("setdefault", ("a", 1)),
+                                ("update", ({"a" : 1}, ))]:
+            with self.assertRaises(TypeError):
+                getattr(dictChoice, strMethod)(*tupArgs)
+        self.assertEqual(dictChoice, {"test" : "check", "id" : 2})
+        self.assertEqual(hash(dictChoice),
+                        hash(self.TestClass({"id" : 2, "test" : "check"})[0]))
+        #the choice elements returned by FlattenPath are mutable copies
+        glstPath = TestModule.FlattenPath(objPath)
+        glstPath[1]["id"] = 3
+        self.assertEqual(objPath[1], {"test" : "check", "id" : 2})
+    
+    def test_Cache(self):
+        """
+        Tests that a string path is parsed only once and that the cache size is
+        limited, whereas the result of FlattenPath is a new list each time.
+        
+        Test ID - TEST-T-104. Covers REQ-FUN-106.
+        """
+        iOldSize = TestModule.PATH_CACHE_SIZE
+        try:
+            TestModule.PATH_CACHE_SIZE = 8
+            objPath = self.TestClass("a.b.c")
+            self.assertIs(self.TestClass("a.b.c"), objPath)
+            self.assertEqual(self.TestClass(u"a.b.c"), objPath)
+            self.assertIsInstance(self.TestClass(u"a.b.c")[0], unicode)
+            self.assertIsInstance(self.TestClass("a.b.c")[0], str)
+            glstPath = TestModule.FlattenPath("a.b.c")
+            self.assertIsInstance(glstPath, list)
+            glstPath.append("d")
+            self.assertEqual(TestModule.FlattenPath("a.b.c"), ["a", "b", "c"])
+            for iIndex in range(20):
+                self.TestClass("x{}.y".format(iIndex))
+                self.assertIs(self.TestClass("a.b.c"), objPath) #recently used
+                self.assertLessEqual(len(TestModule._PATH_CACHE), 8)
+            self.assertIs(self.TestClass("a.b.c"), objPath)
+            TestModule.PATH_CACHE_SIZE = 0
+            self.assertEqual(self.TestClass("e.f"), ("e", "f"))
+            self.assertEqual(len(TestModule._PATH_CACHE), 0)
+        finally:
+            TestModule.PATH_CACHE_SIZE = iOldSize
+
+class Test_IndexXMLTree(unittest.TestCase):
+    """
+    Test cases for the function IndexXMLTree of the module StructureMapping and
+    the use of the XML tags index by the element access functions.
+    
+    Implements tests ID TEST-T-105.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case: a wide XML node with 100 children with
+        10 distinct tags, some children having sub-elements.
+        """
+        self.Root = ElementTree.Element('root')
+        for iIndex in range(100):
+            objChild = ElementTree.SubElement(self.Root,
+                                                'tag{}'.format(iIndex % 10))
+            objChild.set('id', str(iIndex))
+            if iIndex < 3:
+                ElementTree.SubElement(objChild, 'sub').text = str(iIndex)
+    
+    def test_RaiseTypeError(self):
+        """
+        Tests that the function raises TypeError exception if the argument is
+        not an XML node.
+        
+        Test ID - TEST-T-105. Covers REQ-FUN-107.
+        """
+        for gItem in [1, 'a', {}, [ElementTree.Element('a')], None]:
+            with self.assertRaises(TypeError):
+                TestModule.IndexXMLTree(gItem)
+    
+    def test_IndexedLookUp(self):
+        """
+        Tests that only the nodes with enough children are indexed, and that
+        the look-up results with the indexed nodes are the same as without the
+        index, also after the modifications of the tree.
+        
+        Test ID - TEST-T-105. Covers REQ-FUN-107.
+        """
+        objCopy = copy.deepcopy(self.Root)
+        self.assertEqual(TestModule.IndexXMLTree(self.Root), 1)
+        self.assertEqual(TestModule.IndexXMLTree(self.Root, 3), 1)
+        self.assertEqual(TestModule.IndexXMLTree(self.Root, 1), 4)
+        self.assertEqual(TestModule.IndexXMLTree(ElementTree.Element('a')), 0)
+        self.assertEqual(TestModule.IndexXMLTree(self.Root), 1)
+        self.assertIn(self.Root, TestModule._XML_TAG_INDEX)
+        self.assertNotIn(self.Root[0], TestModule._XML_TAG_INDEX)
+        for glstPath in ['tag0.id', 'tag9.id', 'tag2.sub.text', [5, 'id'],
+                                                [99, 'id'], 'tag0', 'tag11']:
+            try:
+                gCheck = TestModule.GetElement(objCopy, glstPath)
+            except AttributeError:
+                gCheck = AttributeError
+            try:
+                gResult = TestModule.GetElement(self.Root, glstPath)
+            except AttributeError:
+                gResult = AttributeError
+            if isinstance(gCheck, ElementTree.Element):
+                self.assertEqual(ElementTree.tostring(gResult),
+                                                ElementTree.tostring(gCheck))
+            else:
+                self.assertEqual(gResult, gCheck)
+        #modification via the module functions
+        for objTest in [self.Root, objCopy]:
+            TestModule.DeleteElement(objTest, 'tag0')
+            TestModule.SetElement(objTest, 'tag1.tag', 'tag3')
+            TestModule.SetElement(objTest, 'tag5', ElementTree.Element('new'))
+            TestModule.AddElement(objTest, 'added.value', 1)
+            TestModule.SetElement(objTest, 6, ElementTree.Element('tag0'))
+        self.assertEqual(len(self.Root), len(objCopy))
+        for strTag in ['tag0', 'tag1', 'tag3', 'tag5', 'new', 'added']:
+            self.assertEqual(ElementTree.tostring(
+                                    TestModule.GetElement(self.Root, strTag)),
+                ElementTree.tostring(TestModule.GetElement(objCopy, strTag)))
+        self.assertIsNone(TestModule.GetElement(self.Root, 'tag0').get('id'))
+        self.assertEqual(TestModule.GetElement(self.Root, 'tag1.id'), 11)
+        self.assertEqual(TestModule.GetElement(self.Root, 'tag3.id'), 1)
+        self.assertEqual(TestModule.GetElement(self.Root, 'added.value'), 1)
+        #direct modification changing the number of children
+        self.Root.insert(0, ElementTree.Element('tag9', {'id' : '-1'}))
+        self.assertEqual(TestModule.GetElement(self.Root, 'tag9.id'), -1)
+        del self.Root[0]
+        self.assertEqual(TestModule.GetElement(self.Root, 'tag9.id'), 9)
+
+class Test_ChoiceIndex(unittest.TestCase):
+    """
+    Test cases for the indexed look-up by the 'choice' dictionaries in the
+    module StructureMapping.
+    
+    Implements tests ID TEST-T-106.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case: a list of 100 dictionaries with 50
+        distinct names, and an XML node with 100 children with 50 distinct
+        values of an attribute.
+        """
+        self.MinSize = TestModule.CHOICE_INDEX_MIN_SIZE
+        self.CacheSize = TestModule.CHOICE_INDEX_CACHE_SIZE
+        self.Data = {"channels" : [{"name" : "c{}".format(iIndex % 50),
+                                    "id" : iIndex, "unit" : "V"}
+                                                for iIndex in range(100)]}
+        self.Data["channels"][7]["unit"] = ["not", "hashable"]
+        del self.Data["channels"][8]["unit"]
+        self.Root = ElementTree.Element('root')
+        for iIndex in range(100):
+            ElementTree.SubElement(self.Root, 'node', {'name' : 'c{}'.format(
+                                    iIndex % 50), 'id' : str(iIndex)})
+        self.Paths = []
+        for iIndex in list(range(0, 60, 3)) + [120]:
+            for strUnit in ["V", "A"]:
+                self.Paths.append(["channels",
+                        {"name" : "c{}".format(iIndex), "unit" : strUnit},
+                                                                        "id"])
+            self.Paths.append(["channels", {"name" : "c{}".format(iIndex)},
+                                                                        "id"])
+    
+    def tearDown(self):
+        """
+        Restores the default settings after each test case.
+        """
+        TestModule.CHOICE_INDEX_MIN_SIZE = self.MinSize
+        TestModule.CHOICE_INDEX_CACHE_SIZE = self.CacheSize
+    
+    def getCache(self):
+        """
+        Helper method, which returns the indexes cache of the current thread,
+        which is None outside the mapping operations.
+        """
+        return getattr(TestModule._CHOICE_INDEX_SCOPE, 'Cache', None)
+    
+    def getAll(self, objTarget, lstPaths):
+        """
+        Helper method, which looks up all paths and returns the list of the
+        values or AttributeError class for the missing elements.
+        """
+        lstResult = []
+        for glstPath in lstPaths:
+            try:
+                lstResult.append(TestModule.GetElement(objTarget, glstPath))
+            except AttributeError:
+                lstResult.append(AttributeError)
+        return lstResult
+    
+    def test_SameAsScan(self):
+        """
+        Tests that the look-up results with the index are the same as without
+        the index, the first matching element is found, and the index is built
+        once per set of keys of the 'choice' dictionary and only within the
+        mapping operation scope.
+        
+        Test ID - TEST-T-106. Covers REQ-FUN-108.
+        """
+        lstXMLPaths = [[{"name" : "c{}".format(iIndex)}, "id"]
+                                            for iIndex in range(0, 60, 3)]
+        lstCheck = self.getAll(self.Data, self.Paths)
+        lstXMLCheck = self.getAll(self.Root, lstXMLPaths)
+        self.assertIsNone(self.getCache())
+        self.assertIn(AttributeError, lstCheck)
+        self.assertIn(AttributeError, lstXMLCheck)
+        self.assertEqual(lstCheck[0], 0)
+        with TestModule._ChoiceIndexScope():
+            with TestModule._ChoiceIndexScope(): #nested scope
+                for _ in range(2):
+                    self.assertEqual(self.getAll(self.Data, self.Paths),
+                                                                    lstCheck)
+                    self.assertEqual(self.getAll(self.Root, lstXMLPaths),
+                                                                lstXMLCheck)
+            dictCache = self.getCache()
+            self.assertEqual(len(dictCache), 2)
+            lstEntry = dictCache[id(self.Data["channels"])]
+            self.assertIs(lstEntry[0], self.Data["channels"])
+            self.assertEqual(len(lstEntry[3]), 2)
+            objPath = TestModule.CompilePath(["channels", {"unit" : "V",
+                                                        "name" : "c3"}, "id"])
+            self.assertEqual(objPath.get(self.Data), 3)
+            self.assertEqual(len(lstEntry[3]), 2)
+        self.assertIsNone(self.getCache())
+        #the mapping operations
+        dictTarget = {"a" : None, "b" : None}
+        TestModule.MapValues(dictTarget, self.Data,
+                                            {"a" : self.Paths[2],
+                                            "b" : self.Paths[5]})
+        self.assertEqual(dictTarget, {"a" : lstCheck[2], "b" : lstCheck[5]})
+        self.assertIsNone(self.getCache())
+        objPlan = TestModule.CompileMapping({"a" : self.Paths[2]})
+        lstTargets = [{"a" : None} for _ in range(3)]
+        lstSources = [copy.deepcopy(self.Data) for _ in range(3)]
+        objPlan.applyMany(lstTargets, lstSources)
+        self.assertEqual(lstTargets, [{"a" : lstCheck[2]}] * 3)
+        self.assertIsNone(self.getCache())
+        with self.assertRaises(AttributeError):
+            objPlan.apply({}, self.Data)
+        self.assertIsNone(self.getCache())
+    
+    def test_FirstMatch(self):
+        """
+        Tests that the first matching element is found outside the mapping
+        operation scope after any modification of the container, including the
+        direct in-place modifications of its elements.
+        
+        Test ID - TEST-T-106. Covers REQ-FUN-108.
+        """
+        lstData = [{"name" : "n{}".format(iIndex), "v" : iIndex}
+                                                        for iIndex in range(20)]
+        glstPath = [{"name" : "n5"}, "v"]
+        self.assertEqual(TestModule.GetElement(lstData, glstPath), 5)
+        TestModule.SetElement(lstData, [0, "name"], "n5")
+        self.assertEqual(TestModule.GetElement(lstData, glstPath), 0)
+        lstData[0]["name"] = "n0"
+        self.assertEqual(TestModule.GetElement(lstData, glstPath), 5)
+        lstData[1]["name"] = "n5"
+        self.assertEqual(TestModule.GetElement(lstData, glstPath), 1)
+    
+    def test_Modifications(self):
+        """
+        Tests that the index follows the modifications of the container or any
+        of its nested elements via the module functions within the mapping
+        operation scope, as well as the direct replacement, addition and
+        modification of the elements, which are found via the index.
+        
+        Test ID - TEST-T-106. Covers REQ-FUN-108.
+        """
+        glstPath = ["channels", {"name" : "c3"}]
+        with TestModule._ChoiceIndexScope():
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), 3)
+            TestModule.DeleteElement(self.Data, glstPath)
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), 53)
+            TestModule.SetElement(self.Data, glstPath, {"name" : "c3",
+                                                                    "id" : -1})
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), -1)
+            TestModule.SetElement(self.Data, ["channels", 0], {"name" : "c3",
+                                                                    "id" : -2})
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), -2)
+            #nested elements modifications
+            TestModule.SetElement(self.Data, ["channels", 0, "name"], "c0")
+            TestModule.SetElement(self.Data, ["channels", 1, "name"], "c3")
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), 1)
+            TestModule.AddElement(self.Data, ["channels", 0, "name"], "c3")
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), -2)
+            TestModule.DeleteElement(self.Data, ["channels", 0, "name"])
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), 1)
+            objPath = TestModule.CompilePath(["channels", 1, "name"])
+            objPath.setColumn([self.Data], ["c1"])
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                                        glstPath + ["id"]), -1)
+            #direct modifications
+            self.assertEqual(self.Data["channels"][52]["id"], -1)
+            self.Data["channels"][52]["name"] = "new"
+            with self.assertRaises(AttributeError):
+                TestModule.GetElement(self.Data, glstPath + ["id"])
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                    ["channels", {"name" : "new"}, "id"]), -1)
+            self.Data["channels"].append({"name" : "last", "id" : 100})
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                    ["channels", {"name" : "last"}, "id"]), 100)
+            self.Data["channels"][-1] = {"name" : "other", "id" : 101}
+            with self.assertRaises(AttributeError):
+                TestModule.GetElement(self.Data,
+                                        ["channels", {"name" : "last"}, "id"])
+            self.assertEqual(TestModule.GetElement(self.Data,
+                                ["channels", {"name" : "other"}, "id"]), 101)
+            #XML node
+            glstPath = [{"name" : "c5"}, "id"]
+            self.assertEqual(TestModule.GetElement(self.Root, glstPath), 5)
+            TestModule.DeleteElement(self.Root, glstPath[:1])
+            self.assertEqual(TestModule.GetElement(self.Root, glstPath), 55)
+            TestModule.SetElement(self.Root, [53, "name"], "c5")
+            self.assertEqual(TestModule.GetElement(self.Root, glstPath), 54)
+    
+    def test_CacheSize(self):
+        """
+        Tests that the number of the indexed containers is limited, and the
+        small containers are not indexed.
+        
+        Test ID - TEST-T-106. Covers REQ-FUN-108.
+        """
+        TestModule.CHOICE_INDEX_CACHE_SIZE = 4
+        lstData = [copy.deepcopy(self.Data) for _ in range(10)]
+        with TestModule._ChoiceIndexScope():
+            dictCache = self.getCache()
+            for dictData in lstData:
+                self.assertEqual(TestModule.GetElement(dictData,
+                                                        self.Paths[2]), 0)
+                self.assertEqual(TestModule.GetElement(lstData[0],
+                                                        self.Paths[2]), 0)
+                self.assertLessEqual(len(dictCache), 4)
+            self.assertIn(id(lstData[0]["channels"]), dictCache)
+            dictCache.clear()
+            dictData = {"channels" : self.Data["channels"][:5]}
+            self.assertEqual(TestModule.GetElement(dictData, self.Paths[2]), 0)
+            self.assertEqual(len(dictCache), 0)
+            TestModule.CHOICE_INDEX_CACHE_SIZE = 0
+            self.assertEqual(TestModule.GetElement(self.Data, self.Paths[2]), 0)
+            self.assertEqual(len(dictCache), 0)
 
 class Test_ResolvePathSubstitutions(unittest.TestCase):
     """
@@ -917,6 +1371,118 @@ class Test_AddElement(unittest.TestCase):
             self.TestFunction(objTest, gPath, objNewNode)
             self.assertEqual(TestModule.GetElement(objTest, 'node').tag, 'node')
 
+class Test_CompilePath(unittest.TestCase):
+    """
+    Test cases for the function CompilePath and the class CompiledPath of the
+    module StructureMapping.
+    
+    Implements tests ID TEST-T-180, TEST-T-181, TEST-T-182.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(TestModule.CompilePath)
+        cls.TestObjects = Test_GetElement.TestObjects
+        cls.TestMissingPaths = Test_GetElement.TestBadCases
+    
+    def test_RaiseTypeValueErrorPath(self):
+        """
+        Tests that the function raises TypeError or ValueError exception already
+        during the compilation if at least one element of the path is of
+        improper type or value. Uses test cases values from the
+        Test_FlattenPath.TestTypeError and Test_FlattenPath.TestValueError.
+        
+        Test ID - TEST-T-180. Covers requirements REQ-AWM-100, REQ-AWM-101.
+        """
+        for gPath in Test_FlattenPath.TestTypeError:
+            with self.assertRaises(TypeError):
+                self.TestFunction(gPath)
+        for gPath in Test_FlattenPath.TestValueError:
+            with self.assertRaises(ValueError):
+                self.TestFunction(gPath)
+    
+    def test_RaiseAttributeError(self):
+        """
+        Tests that the methods get(), set() and delete() of the compiled path
+        raise AttributeError exception if at least one element of the path is
+        not found.
+        
+        Test ID - TEST-T-180 - part 2. Covers requirement REQ-AWM-102.
+        """
+        for gPath in self.TestMissingPaths:
+            objPath = self.TestFunction(gPath)
+            for gTestObject in self.TestObjects:
+                objTest = copy.deepcopy(gTestObject)
+                with self.assertRaises(AttributeError):
+                    objPath.get(objTest)
+                with self.assertRaises(AttributeError):
+                    objPath.set(objTest, 1)
+                with self.assertRaises(AttributeError):
+                    objPath.delete(objTest)
+    
+    def test_SameAsFunctions(self):
+        """
+        A compiled path must be re-usable with different objects and it must
+        give exactly the same results as the functions GetElement(),
+        SetElement(), DeleteElement() and AddElement().
+        
+        Test ID - TEST-T-181. Covers requirement REQ-FUN-101.
+        """
+        for glstPath, _ in Test_GetElement.TestGoodCases:
+            objPath = self.TestFunction(glstPath)
+            self.assertEqual(objPath.path, TestModule.FlattenPath(glstPath))
+            for gTestObject in self.TestObjects:
+                self.assertEqual(objPath.get(gTestObject),
+                                TestModule.GetElement(gTestObject, glstPath))
+                for strMethod, fFunction, tupArgs in [
+                                    ('set', TestModule.SetElement, (5, )),
+                                    ('delete', TestModule.DeleteElement, ()),
+                                    ('add', TestModule.AddElement, (6, ))]:
+                    objTest1 = copy.deepcopy(gTestObject)
+                    objTest2 = copy.deepcopy(gTestObject)
+                    getattr(objPath, strMethod)(objTest1, *tupArgs)
+                    fFunction(objTest2, glstPath, *tupArgs)
+                    self.assertEqual(DumpObject(objTest1),
+                                                        DumpObject(objTest2))
+        #new branches
+        objPath = self.TestFunction("a.b.c")
+        for objTest in [{}, ElementTree.Element('test'), InnerClass()]:
+            objPath.add(objTest, 1)
+            self.assertEqual(objPath.get(objTest), 1)
+            self.assertEqual(TestModule.GetElement(objTest, "a.b.c"), 1)
+    
+    def test_NoCopyNoRewalk(self):
+        """
+        Tests that the access to an element of a sequence by its index does not
+        iterate over (copy) the sequence, and that the method add() walks the
+        target object only once.
+        
+        Test ID - TEST-T-182. Covers requirement REQ-FUN-109.
+        """
+        CountingList.Iterations = 0
+        objTest = {"a" : CountingList(range(100)), "b" : tuple(range(10))}
+        objPath = self.TestFunction(["a", 99])
+        self.assertEqual(objPath.get(objTest), 99)
+        objPath.set(objTest, -1)
+        self.assertEqual(objTest["a"][99], -1)
+        objPath.add(objTest, -2)
+        self.assertEqual(objTest["a"][99], -2)
+        objPath.delete(objTest)
+        self.assertEqual(len(objTest["a"]), 99)
+        with self.assertRaises(AttributeError):
+            objPath.get(objTest)
+        self.assertEqual(self.TestFunction(["b", 9]).get(objTest), 9)
+        self.assertEqual(CountingList.Iterations, 0)
+        for glstPath, iLookUps in [("x.y", 1), ("x.y", 1), ("x.z", 1),
+                                                            ("v.w.u", 1)]:
+            objTest = CountingDict(x = CountingDict(y = 1))
+            self.TestFunction(glstPath).add(objTest, 2)
+            self.assertEqual(TestModule.GetElement(objTest, glstPath), 2)
+            self.assertEqual(objTest.LookUps, iLookUps + 1)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_FlattenPath)
@@ -926,10 +1492,15 @@ TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_GetElement)
 TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_SetElement)
 TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_DeleteElement)
 TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_AddElement)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_CompilePath)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_Path)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_IndexXMLTree)
+TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_ChoiceIndex)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
-                    TestSuite6])
+                    TestSuite6, TestSuite7, TestSuite8, TestSuite9,
+                    TestSuite10])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting fsio_lib.StuctureMapping module tests...\n")
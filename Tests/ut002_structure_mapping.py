@@ -149,6 +149,36 @@ class OuterClass(object):
         self.a = [{"test" : InitValue}, 
                                 [{"b" : InitValue}, InnerClass(InitValue)]]
 
+class CountedClass(object):
+    
+    Calls = 0
+    
+    def __init__(self, InitValue = 1):
+        self.b = InitValue
+    
+    def __repr__(self):
+        CountedClass.Calls += 1
+        return 'CountedClass({})'.format(self.b)
+    
+    __str__ = __repr__
+
+class RecordingLogger(object):
+    
+    def __init__(self):
+        self.Messages = []
+    
+    def warning(self, strMessage, *args):
+        self.Messages.append(('WARNING', strMessage % args))
+    
+    def error(self, strMessage, *args):
+        self.Messages.append(('ERROR', strMessage % args))
+
+class RowClass(OuterClass):
+    
+    def __init__(self):
+        super(RowClass, self).__init__(0)
+        self.b = None
+
 #+ test cases
 
 class Test_LoadDefinition(unittest.TestCase):
@@ -239,7 +269,7 @@ class Test_MapValues(unittest.TestCase):
     """
     Test cases for the function MapValues of the module StructureMapping.
     
-    Implements test IDs - TEST-T-170, TEST-T-171, TEST-T-172
+    Implements test IDs - TEST-T-170, TEST-T-171, TEST-T-172, TEST-T-173
     """
     
     @classmethod
@@ -569,13 +599,313 @@ class Test_MapValues(unittest.TestCase):
         self.assertEqual(Target.a[1][1].c, TestValue)
         self.assertEqual(Target.a[1][1].value, TestValue)
 
+    def test_LazyMessages(self):
+        """
+        The source and target objects are not converted into strings unless a
+        mapping rule fails, and the warnings are formatted only if they are
+        actually logged.
+        
+        Test ID - TEST-T-173. Covers requirements REQ-FUN-105, REQ-AWM-122.
+        """
+        objLogger = logging.getLogger('ut002_lazy')
+        objLogger.propagate = False
+        lstRecords = []
+        objHandler = logging.Handler()
+        objHandler.emit = lambda objRecord: lstRecords.append(
+                                                        objRecord.getMessage())
+        objLogger.addHandler(objHandler)
+        MapDict = {"a" : "a.b", "c" : "a.c"}
+        for bStrictSource, bStrictTarget in [(True, True), (False, False)]:
+            Target = CountedClass(0)
+            Target.a = 0
+            Target.c = 0
+            Source = CountedClass(0)
+            Source.a = CountedClass(5)
+            Source.a.c = 6
+            CountedClass.Calls = 0
+            self.TestFunction(Target, Source, MapDict, objLogger,
+                                                bStrictTarget = bStrictTarget,
+                                                bStrictSource = bStrictSource)
+            self.assertEqual(Target.a, 5)
+            self.assertEqual(Target.c, 6)
+            self.assertEqual(CountedClass.Calls, 0)
+        MapDict = {"a" : "a.b", "c" : "a.d", "d" : {"e" : "a.c"}}
+        for iLevel, iMessages in [(logging.ERROR, 0), (logging.WARNING, 2)]:
+            objLogger.setLevel(iLevel)
+            del lstRecords[:]
+            self.TestFunction(Target, Source, MapDict, objLogger,
+                                bStrictTarget = False, bStrictSource = False)
+            self.assertEqual(len(lstRecords), iMessages)
+        self.assertIn('Unable to get value of an element at', lstRecords[0])
+        self.assertIn('Unable to set 6 value to an element at', lstRecords[1])
+        self.assertIn('CountedClass(0)', lstRecords[0])
+        with self.assertRaises(AttributeError):
+            self.TestFunction(Target, Source, MapDict, objLogger,
+                                bStrictTarget = True, bStrictSource = False)
+        objLogger.removeHandler(objHandler)
+
+class Test_CompileMapping(unittest.TestCase):
+    """
+    Test cases for the function CompileMapping and the class CompiledMapping of
+    the module StructureMapping, as well as for the compiled plans cache used by
+    the function MapValues.
+    
+    Implements test IDs - TEST-T-190, TEST-T-191.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(TestModule.CompileMapping)
+        cls.TestValue = 42
+        cls.MapDict = {"a" : {
+                    0 : {"test" : ["a", 0, "test"]},
+                    1 : {
+                        0 : {"b" : ["a", 1, 0, "b"]},
+                        1 : {
+                            "c" : ["a", 1, {"c" : cls.TestValue}, "c"],
+                            "value" : ["a", 1, 1, "value"],
+                        }
+                    }}}
+    
+    def test_RaiseTypeValueError(self):
+        """
+        The function raises TypeError or ValueError if the mapping dictionary is
+        not of the proper type or format, already during the compilation.
+        
+        Test ID - TEST-T-190. Covers requirements REQ-AWM-110, REQ-AWM-111.
+        """
+        for gTestObject in [list, tuple, int, float, str, [], tuple(), 1, 2.0,
+                                                                        "test"]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(gTestObject)
+        for gTestObject in [{"a.b" : 'a'}, {-1 : 'a'}, {"a" : {"$b" : 'a'}},
+                            {"a" : 1.0}, {"a" : [{"name" : [1]}]}, {"a" : ''},
+                            {"a" : {"b" : []}}]:
+            with self.assertRaises((TypeError, ValueError)):
+                self.TestFunction(gTestObject)
+    
+    def test_SetsProperly(self):
+        """
+        The compiled plan is re-usable and gives the same results as the
+        function MapValues() for a single objects pair as well as for the
+        sequences of pairs. Missing source elements are skipped if the source
+        is not strict, and missing target elements are created if forced.
+        
+        Test ID - TEST-T-191. Covers requirements REQ-FUN-100, REQ-FUN-104.
+        """
+        objPlan = self.TestFunction(self.MapDict)
+        for iIndex in range(3):
+            Target = OuterClass(iIndex)
+            objPlan.apply(Target, OuterClass(self.TestValue))
+            self.assertEqual(Target.a[0]["test"], self.TestValue)
+            self.assertEqual(Target.a[1][0]["b"], self.TestValue)
+            self.assertEqual(Target.a[1][1].value, self.TestValue)
+        lstTargets = [OuterClass(0) for _ in range(5)]
+        objPlan.applyMany(lstTargets, [OuterClass(self.TestValue)] * 5)
+        for Target in lstTargets:
+            self.assertEqual(Target.a[0]["test"], self.TestValue)
+            self.assertEqual(Target.a[1][0]["b"], self.TestValue)
+            self.assertEqual(Target.a[1][1].c, self.TestValue)
+            self.assertEqual(Target.a[1][1].value, self.TestValue)
+        #strict source
+        with self.assertRaises(AttributeError):
+            objPlan.apply(OuterClass(0), {"a" : []})
+        #non-strict source - skipped
+        objPlan = self.TestFunction({"a" : "a", "b" : "b"},
+                                                        bStrictSource = False)
+        Target = {"a" : 0, "b" : 0}
+        objPlan.apply(Target, {"b" : 2})
+        self.assertEqual(Target, {"a" : 0, "b" : 2})
+        #forced target, also without a logger
+        objPlan = self.TestFunction({"a" : {"b" : "b"}}, bStrictTarget = False,
+                                                        bForceTarget = True)
+        Target = {}
+        objPlan.apply(Target, {"b" : 2})
+        self.assertEqual(Target, {"a" : {"b" : 2}})
+        #same as MapValues
+        Target1 = [0, 0]
+        Target2 = [0, 0]
+        MapDict = {0 : "b", 1 : ["a", {"c" : 3}, "d"]}
+        Source = {"a" : [{"c" : 1, "d" : 2}, {"c" : 3, "d" : 4}], "b" : 5}
+        self.TestFunction(MapDict).apply(Target1, Source)
+        TestModule.MapValues(Target2, Source, MapDict)
+        self.assertEqual(Target1, [5, 4])
+        self.assertEqual(Target1, Target2)
+    
+    def test_MapValuesCache(self):
+        """
+        The function MapValues() caches the compiled plans by the identity of
+        the mapping dictionary, and the cache is bounded.
+        
+        Test ID - TEST-T-191 - part 2. Covers requirement REQ-FUN-100.
+        """
+        MapDict = {0 : "b"}
+        TestModule.MapValues([0], {"b" : 1}, MapDict)
+        iLength = len(TestModule._MAPPING_CACHE)
+        tupEntry = TestModule._MAPPING_CACHE[list(TestModule._MAPPING_CACHE)[-1]]
+        self.assertIs(tupEntry[0], MapDict)
+        Target = [0]
+        TestModule.MapValues(Target, {"b" : 2}, MapDict)
+        self.assertEqual(Target, [2])
+        self.assertEqual(len(TestModule._MAPPING_CACHE), iLength)
+        for _ in range(TestModule.MAPPING_CACHE_SIZE + 10):
+            TestModule.MapValues(Target, {"b" : 3}, {0 : "b"})
+        self.assertEqual(len(TestModule._MAPPING_CACHE),
+                                                TestModule.MAPPING_CACHE_SIZE)
+        self.assertEqual(Target, [3])
+    
+    def test_MapValuesCacheLogger(self):
+        """
+        The cached plans are shared by the calls with different loggers: the
+        logger is neither a part of the cache key nor bound to the cached plan,
+        but each call reports the warnings and errors to its own logger.
+        
+        Test ID - TEST-T-191 - part 3. Covers requirement REQ-FUN-100.
+        """
+        MapDict = {"a" : "a", "b" : "b"}
+        lstLoggers = [RecordingLogger() for _ in range(3)]
+        for objLogger in lstLoggers:
+            Target = {"a" : 0, "b" : 0}
+            TestModule.MapValues(Target, {"b" : 2}, MapDict, objLogger,
+                                                        bStrictSource = False)
+            self.assertEqual(Target, {"a" : 0, "b" : 2})
+            self.assertEqual(len(objLogger.Messages), 1)
+            self.assertEqual(objLogger.Messages[0][0], 'WARNING')
+        lstEntries = [tupEntry
+                            for tupEntry in TestModule._MAPPING_CACHE.values()
+                                                if tupEntry[0] is MapDict]
+        self.assertEqual(len(lstEntries), 1)
+        dictState = vars(lstEntries[0][-1])
+        for objLogger in lstLoggers:
+            self.assertFalse(any(gItem is objLogger
+                                                for gItem in lstEntries[0]))
+            self.assertFalse(any(gItem is objLogger
+                                            for gItem in dictState.values()))
+        #errors go to the logger of the call, also by MapColumns()
+        objLogger = RecordingLogger()
+        with self.assertRaises(AttributeError):
+            TestModule.MapValues({}, {"b" : 2}, MapDict, objLogger)
+        self.assertEqual(objLogger.Messages[-1][0], 'ERROR')
+        self.assertEqual(len(lstLoggers[-1].Messages), 1)
+        objLogger = RecordingLogger()
+        lstResult = TestModule.MapColumns(dict, [[1], [2]], {"a" : 1},
+                                            objLogger, bStrictSource = False)
+        self.assertEqual(lstResult, [{}, {}])
+        self.assertEqual(len(objLogger.Messages), 2)
+        #compilation errors are logged as well
+        objLogger = RecordingLogger()
+        with self.assertRaises(ValueError):
+            TestModule.MapValues({}, {}, {"a" : []}, objLogger)
+        self.assertEqual(len(objLogger.Messages), 1)
+        self.assertTrue(objLogger.Messages[0][1].startswith('ValueError: '))
+
+class Test_MapColumns(unittest.TestCase):
+    """
+    Test cases for the function MapColumns and the methods applyColumns() and
+    applyColumnar() of the class CompiledMapping of the module
+    StructureMapping.
+    
+    Implements test IDs - TEST-T-1A0, TEST-T-1A1.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(TestModule.MapColumns)
+        cls.MapDict = {"a" : {0 : {"test" : 1}, 1 : {1 : {"value" : 0}}},
+                                                                    "b" : 2}
+        cls.Rows = [[iIndex, 'x{}'.format(iIndex), str(iIndex * 2)]
+                                                    for iIndex in range(20)]
+    
+    def test_SameAsMapValues(self):
+        """
+        The function returns one new target object per row with the same
+        content as after the function MapValues() applied row by row. The
+        string values of the columns are converted into numbers as by the
+        function GetElement(). The method applyColumns() stops at the end of
+        the shortest sequence.
+        
+        Test ID - TEST-T-1A0. Covers requirements REQ-FUN-100, REQ-FUN-10A.
+        """
+        MapDict = self.MapDict
+        lstResult = self.TestFunction(RowClass, iter(self.Rows), MapDict)
+        self.assertIsInstance(lstResult, list)
+        self.assertEqual(len(lstResult), len(self.Rows))
+        for Target, glstRow in zip(lstResult, self.Rows):
+            Expected = RowClass()
+            TestModule.MapValues(Expected, glstRow, MapDict)
+            self.assertEqual(Target.a[0], Expected.a[0])
+            self.assertEqual(Target.a[1][1].value, Expected.a[1][1].value)
+            self.assertEqual(Target.b, Expected.b)
+            self.assertEqual(Target.b, 2 * glstRow[0])
+        #other sequences / mixed rows - via the paths
+        clsRow = type('Row', (list, ), {})
+        lstRows = [tuple(self.Rows[0]), clsRow(self.Rows[1])]
+        lstResult = self.TestFunction(dict, lstRows,
+                    {"test" : 1, "value" : 0}, bStrictTarget = False,
+                                                        bForceTarget = True)
+        self.assertEqual(lstResult, [{"test" : "x0", "value" : 0},
+                                                {"test" : "x1", "value" : 1}])
+        self.assertEqual(self.TestFunction(dict, [], {"a" : 0}), [])
+        objPlan = TestModule.CompileMapping({"a" : 0})
+        lstTargets = [{"a" : None} for _ in range(5)]
+        objPlan.applyColumns(lstTargets, self.Rows[:3])
+        self.assertEqual([Target["a"] for Target in lstTargets],
+                                                    [0, 1, 2, None, None])
+    
+    def test_MissingElements(self):
+        """
+        The missing source and target elements are treated as by the function
+        MapValues(), depending on the flags. In the columnar mode a single
+        target object is returned with the entire columns assigned to its
+        elements, and the missing values are replaced by None.
+        
+        Test ID - TEST-T-1A1. Covers requirements REQ-FUN-10A, REQ-AWM-122.
+        """
+        lstRows = [[1, 'a', 2.5], [2, 'b'], [3, 'c', 4]]
+        with self.assertRaises(AttributeError):
+            self.TestFunction(dict, lstRows, {"a" : 2},
+                                                        bStrictTarget = False,
+                                                        bForceTarget = True)
+        with self.assertRaises(AttributeError):
+            self.TestFunction(dict, lstRows, {"a" : 0})
+        with self.assertRaises(TypeError):
+            self.TestFunction(dict, lstRows, [0])
+        lstResult = self.TestFunction(dict, lstRows, {"a" : 0, "b" : 2},
+                                bStrictSource = False, bStrictTarget = False,
+                                                        bForceTarget = True)
+        self.assertEqual(lstResult, [{"a" : 1, "b" : 2.5}, {"a" : 2},
+                                                        {"a" : 3, "b" : 4}])
+        lstResult = self.TestFunction(lambda : {"a" : 0}, lstRows,
+                                {"a" : 0, "b" : 1}, bStrictTarget = False)
+        self.assertEqual(lstResult, [{"a" : 1}, {"a" : 2}, {"a" : 3}])
+        #columnar mode
+        Target = self.TestFunction(dict, lstRows, {"a" : 0, "b" : 2},
+                                bStrictSource = False, bStrictTarget = False,
+                                        bForceTarget = True, bColumnar = True)
+        self.assertEqual(Target, {"a" : [1, 2, 3], "b" : [2.5, None, 4]})
+        Target = self.TestFunction(RowClass, self.Rows, self.MapDict,
+                                                            bColumnar = True)
+        self.assertEqual(Target.a[0]["test"],
+                                        [glstRow[1] for glstRow in self.Rows])
+        self.assertEqual(Target.b, [2 * glstRow[0] for glstRow in self.Rows])
+        with self.assertRaises(AttributeError):
+            self.TestFunction(dict, lstRows, {"a" : 0}, bColumnar = True)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_LoadDefinition)
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_MapValues)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_CompileMapping)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_MapColumns)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting fsio_lib.StructureMapping module tests 2...\n")
@@ -271,6 +271,24 @@ class Test_LoadLines(unittest.TestCase):
                 strlstResult = self.TestFunc(self.TempFile, iIndex)
                 self.assertEqual(self.TestData[iIndex:], strlstResult)
         os.remove(self.TempFile)
+    
+    def test_MixedEndings(self):
+        """
+        Proper treatment of the mixed line endings within the same file,
+        including the consecutive CR characters, LF followed by CR and the line
+        ending at the very end of the file.
+        
+        Test ID - TEST-T-401. Covers requirement REQ-FUN-400.
+        """
+        for strContent, strlstCheck in [
+                ('a\r\rb\n\rc\r', ['a', '', 'b', '', 'c']),
+                ('a\r\n\r\nb', ['a', '', 'b']), ('\r', ['']), ('\n', ['']),
+                ('\r\r', ['', '']), ('', []), ('a\tb \n\n', ['a\tb ', ''])]:
+            with open(self.TempFile, 'wb') as fFile:
+                fFile.write(strContent)
+            strlstResult = self.TestFunc(self.TempFile)
+            self.assertEqual(strlstResult, strlstCheck)
+        os.remove(self.TempFile)
 
 class Test_SplitLine(unittest.TestCase):
     """
@@ -398,6 +416,194 @@ class Test_LoadTable(unittest.TestCase):
         self.assertAlmostEqual(Result[577][1], 435.196)
         self.assertAlmostEqual(Result[577][2], 1144.86)
 
+class Test_IterTable(unittest.TestCase):
+    """
+    Test cases for the function IterTable of the module locale_fsio -
+    integration test.
+    
+    Test ID - TEST-T-405. Covers requirements REQ-FUN-400 to REQ-FUN-404.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunc = staticmethod(TestModule.IterTable)
+        strInFolder = os.path.join(LIB_ROOT, 'Tests', 'Input')
+        strOutFolder = os.path.join(LIB_ROOT, 'Tests', 'Output')
+        cls.TestFiles = [os.path.join(strInFolder, strFile) for strFile in
+                        ['test.fbr', 'test.lin', 'test.lmp', 'test_sp.txt']]
+        cls.TestFile = os.path.join(strOutFolder, 'ut003_iter_table.txt')
+        #ambiguous notation up to the last line, which is definitely dutch
+        TestModule.SaveForcedNewLine(cls.TestFile,
+                        ['header', '1,500\t2', '3\t4,250', '1.234.567,8\tx'], '\n')
+    
+    def test_SameAsLoadTable(self):
+        """
+        The yielded rows must be exactly the same as the loaded by the whole
+        file with the notation detection over all 'cells' - including the
+        skipping of the header lines.
+        
+        Test ID - TEST-T-405. Covers requirements REQ-FUN-400 to REQ-FUN-404.
+        """
+        for strFile in self.TestFiles + [self.TestFile]:
+            for iSkipLines in [0, 1, 3]:
+                strlstlstBuffer = map(TestModule.SplitLine,
+                                TestModule.LoadLines(strFile, iSkipLines))
+                iNotation = TestModule.DetectNotation([strItem
+                                            for strlstRow in strlstlstBuffer
+                                                for strItem in strlstRow])
+                glstlstCheck = [[TestModule.ConvertFromString(strItem,
+                                    iNotation) for strItem in strlstRow]
+                                                for strlstRow in strlstlstBuffer]
+                Result = self.TestFunc(strFile, iSkipLines = iSkipLines)
+                self.assertFalse(isinstance(Result, list))
+                self.assertEqual(list(Result), glstlstCheck)
+                self.assertEqual(TestModule.LoadTable(strFile, iSkipLines),
+                                                                glstlstCheck)
+    
+    def test_Notation(self):
+        """
+        The rows buffered before the first definite number notation 'cell' are
+        converted using that notation.
+        
+        Test ID - TEST-T-405 - part 2. Covers requirement REQ-FUN-401.
+        """
+        Result = list(self.TestFunc(self.TestFile, iSkipLines = 1))
+        self.assertEqual(len(Result), 3)
+        self.assertAlmostEqual(Result[0][0], 1.5)
+        self.assertEqual(Result[0][1], 2)
+        self.assertAlmostEqual(Result[1][1], 4.25)
+        self.assertAlmostEqual(Result[2][0], 1234567.8)
+        self.assertEqual(Result[2][1], 'x')
+
+@unittest.skipIf(TestModule.numpy is None, 'NumPy is not installed')
+class Test_LoadTableArray(unittest.TestCase):
+    """
+    Test cases for the array (NumPy) mode of the function LoadTable of the
+    module locale_fsio.
+    
+    Test ID - TEST-T-406. Covers requirements REQ-FUN-401 and REQ-FUN-404.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunc = staticmethod(TestModule.LoadTable)
+        strInFolder = os.path.join(LIB_ROOT, 'Tests', 'Input')
+        strOutFolder = os.path.join(LIB_ROOT, 'Tests', 'Output')
+        cls.TestFiles = [os.path.join(strInFolder, strFile) for strFile in
+                        ['test.fbr', 'test.lin', 'test.lmp', 'test_sp.txt']]
+        cls.TestFile = os.path.join(strOutFolder, 'ut003_array_table.txt')
+        TestModule.SaveForcedNewLine(cls.TestFile,
+                        ['header', '1\t1,500\ta', '2\t3\tb', '3\t4,250\t'], '\n')
+    
+    def test_SameAsLoadTable(self):
+        """
+        The columns of the returned record array must hold the same values as
+        the columns of the nested lists returned in the default mode, including
+        the skipping of the header lines.
+        
+        Test ID - TEST-T-406. Covers requirements REQ-FUN-401 and REQ-FUN-404.
+        """
+        for strFile in self.TestFiles + [self.TestFile]:
+            for iSkipLines in [1, 2, 5]:
+                glstlstCheck = self.TestFunc(strFile, iSkipLines = iSkipLines)
+                Result = self.TestFunc(strFile, iSkipLines = iSkipLines,
+                                                                bArray = True)
+                self.assertIsInstance(Result, TestModule.numpy.recarray)
+                self.assertEqual(len(Result), len(glstlstCheck))
+                for iColumn, gtupColumn in enumerate(zip(*glstlstCheck)):
+                    glstColumn = Result['f{}'.format(iColumn)].tolist()
+                    self.assertEqual(glstColumn, list(gtupColumn))
+    
+    def test_ColumnTypes(self):
+        """
+        Purely integer columns are converted into int64 arrays, integer and
+        float mixed columns - into float64 arrays, and the rest - into object
+        arrays with the 'cells' converted individually.
+        
+        Test ID - TEST-T-406. Covers requirements REQ-FUN-401 and REQ-FUN-404.
+        """
+        Result = self.TestFunc(self.TestFile, iSkipLines = 1, bArray = True)
+        self.assertEqual(Result.dtype.names, ('f0', 'f1', 'f2'))
+        self.assertEqual(Result['f0'].dtype, TestModule.numpy.int64)
+        self.assertEqual(Result['f1'].dtype, TestModule.numpy.float64)
+        self.assertEqual(Result['f2'].dtype, object)
+        self.assertEqual(Result['f0'].tolist(), [1, 2, 3])
+        self.assertEqual(Result['f1'].tolist(), [1.5, 3.0, 4.25])
+        self.assertEqual(Result['f2'].tolist(), ['a', 'b', ''])
+        Result = self.TestFunc(self.TestFile, iSkipLines = 10, bArray = True)
+        self.assertEqual(len(Result), 0)
+    
+    def test_RaisesValueError(self):
+        """
+        ValueError is raised if the rows have different number of columns.
+        
+        Test ID - TEST-T-406. Covers requirements REQ-FUN-404.
+        """
+        with self.assertRaises(ValueError):
+            self.TestFunc(self.TestFile, bArray = True)
+
+class Test_IterLines(unittest.TestCase):
+    """
+    Test cases for the function IterLines of the module locale_fsio.
+    
+    Test ID - TEST-T-407. Covers requirement REQ-FUN-400, REQ-FUN-402.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunc = staticmethod(TestModule.IterLines)
+        cls.TempFile = os.path.join(LIB_ROOT, 'Tests', 'Output',
+                                                        'ut003_iter_lines.txt')
+    
+    def test_SameAsLoadLines(self):
+        """
+        The yielded lines must be exactly the same as returned by the function
+        LoadLines() regardless of the chunk size, i.e. the CRLF sequences and
+        the lines split between the chunks must be treated properly, as well as
+        the skipping of the first lines.
+        
+        Test ID - TEST-T-407. Covers requirement REQ-FUN-400, REQ-FUN-402.
+        """
+        strlstParts = ['\r', '\n', '\r\n', 'a', 'bc', ' ', '\t', '1,5']
+        for _ in range(200):
+            strContent = ''.join([random.choice(strlstParts)
+                                    for _ in range(random.randint(0, 30))])
+            with open(self.TempFile, 'wb') as fFile:
+                fFile.write(strContent)
+            for iSkipLines in [0, 1, 3, -1]:
+                strlstCheck = TestModule.LoadLines(self.TempFile, iSkipLines)
+                for iChunkSize in [1, 2, 3, 7, 1024]:
+                    Result = self.TestFunc(self.TempFile, iSkipLines,
+                                                                    iChunkSize)
+                    self.assertFalse(isinstance(Result, list))
+                    self.assertEqual(list(Result), strlstCheck)
+        os.remove(self.TempFile)
+    
+    def test_DefaultChunkSize(self):
+        """
+        Non-integer or not positive chunk size is ignored, the default one is
+        used instead.
+        
+        Test ID - TEST-T-407. Covers requirement REQ-FUN-400.
+        """
+        strlstData = GenerateStringsList()
+        TestModule.SaveForcedNewLine(self.TempFile, strlstData)
+        strlstCheck = TestModule.LoadLines(self.TempFile)
+        for gChunkSize in [0, -1, 1.5, '2', None]:
+            strlstResult = list(self.TestFunc(self.TempFile,
+                                                    iChunkSize = gChunkSize))
+            self.assertEqual(strlstResult, strlstCheck)
+        os.remove(self.TempFile)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_LineEndings)
@@ -406,10 +612,14 @@ TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_ConvertFromString)
 TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_LoadLines)
 TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_SplitLine)
 TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_LoadTable)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_IterTable)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_LoadTableArray)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_IterLines)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
-                    TestSuite5, TestSuite6])
+                    TestSuite5, TestSuite6, TestSuite7, TestSuite8,
+                    TestSuite9])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting fsio_lib.locale_fsio module tests...")
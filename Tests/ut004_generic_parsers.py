@@ -15,6 +15,8 @@ __status__ = "Testing"
 
 import sys
 import os
+import re
+import json
 import unittest
 import logging
 import copy
@@ -31,6 +33,7 @@ if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
 import fsio_lib.GenericParsers as TestModule
+import fsio_lib.StructureMapping as StructureMapping
 from fsio_lib.LoggingFSIO import DualLogger
 from fsio_lib.Tests.ut004_helper_class import HelperClass as HelperClass1
 
@@ -781,7 +784,7 @@ class Test_XML_Parser(Test_JSON_Parser):
     
     Test IDs - TEST-T-600, TEST-T-601, TEST-T-602, TEST-T-603, TEST-T-604,
     TEST-T-605, TEST-T-606, TEST-T-607, TEST-T-608, TEST-T-609, TEST-T-60A,
-    TEST-T-60B and TEST-T-620.
+    TEST-T-60B, TEST-T-620 and TEST-T-621.
     """
     
     TestID = "ut004_4"
@@ -895,6 +898,32 @@ class Test_XML_Parser(Test_JSON_Parser):
             self.TestClass.parseManyFiles(self.InFolder, [self.BadFile],
                 clsTarget = self.TargetClass, dictTemplate = self.Template,
                     objLogger = self.Logger)
+    
+    def test_IndexesWideNodes(self):
+        """
+        The parsed XML tree has the tags indexes built for the nodes with many
+        child sub-elements, and the mapping uses them.
+        
+        Test ID - TEST-T-621. Covers requirements REQ-FUN-607.
+        """
+        strFile = os.path.join(LIB_ROOT, 'Tests', 'Output', 'ut004_wide.xml')
+        with open(strFile, 'wt') as fFile:
+            fFile.write('<root>')
+            for iIndex in range(100):
+                fFile.write('<item{} value="{}" />'.format(iIndex, iIndex))
+            fFile.write('<node id="1" type="dummy">')
+            fFile.write('<test result="PASS" value="1" /></node>')
+            fFile.write('</root>')
+        lstResult = list(self.TestClass._iterFile(strFile, {}))
+        self.assertEqual(len(lstResult), 1)
+        self.assertIn(lstResult[0], StructureMapping._XML_TAG_INDEX)
+        objTest = self.TestClass.parseFile(strFile,
+            clsTarget = self.TargetClass, dictTemplate = self.Template,
+                objLogger = self.Logger)[0]
+        self.assertEqual(objTest.report["id"], 1)
+        self.assertEqual(objTest.report["type"], "dummy")
+        self.assertEqual(objTest.result, 1)
+        os.remove(strFile)
 
 class Test_parseFile(unittest.TestCase):
     """
@@ -1041,6 +1070,517 @@ class Test_parseManyFiles(unittest.TestCase):
             self.assertEqual(objTest.report["type"], "dummy")
             self.assertEqual(objTest.result, 1)
 
+class Test_iterFile(unittest.TestCase):
+    """
+    Test cases for the lazy (streaming) parsing mode - the class methods
+    iterFile() and parseFile() with bLazy = True of the parser classes, and the
+    function parseFile() with bLazy = True of the module GenericParsers, as
+    well as the batch mapping of the TSV files.
+    
+    Test ID - TEST-T-60D, TEST-T-622.
+    """
+    
+    TestID = "ut004_7"
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Logger = DualLogger(cls.__name__, bLogToFile = True,
+                            strFileName = os.path.join(LIB_ROOT, 'Tests',
+                                        'Output', '{}.log'.format(cls.TestID)))
+        cls.Logger.setFileLoggingLevel(logging.INFO)
+        cls.Logger.disableConsoleLogging()
+        cls.InFolder = os.path.join(LIB_ROOT, 'Tests', 'Input')
+        cls.Cases = [
+            (TestModule.TSV_Parser, 'dummy.txt', Test_TSV_Parser.Template),
+            (TestModule.JSON_Parser, 'dummy.json', Test_JSON_Parser.Template),
+            (TestModule.XML_Parser, 'dummy.xml', Test_XML_Parser.Template)]
+        cls.Files = ['dummy.json', 'dummy.xml']
+    
+    def checkSame(self, objlstFirst, objlstSecond):
+        """
+        Helper method to compare two sequences of the HelperClass instances.
+        """
+        self.assertEqual(len(objlstFirst), len(objlstSecond))
+        for objFirst, objSecond in zip(objlstFirst, objlstSecond):
+            self.assertIs(type(objFirst), type(objSecond))
+            self.assertEqual(objFirst.report, objSecond.report)
+            self.assertEqual(objFirst.result, objSecond.result)
+    
+    def test_IterFileSameAsParseFile(self):
+        """
+        The class methods iterFile() and parseFile() with bLazy = True return
+        an iterator (not a list), which yields the same target objects in the
+        same order as the eager parseFile() returns.
+        
+        Test ID - TEST-T-60D. Covers requirements REQ-FUN-605.
+        """
+        for clsParser, strFileName, dictTemplate in self.Cases:
+            strFile = os.path.join(self.InFolder, strFileName)
+            lstExpected = clsParser.parseFile(strFile, clsTarget = HelperClass,
+                        dictTemplate = dictTemplate, objLogger = self.Logger)
+            iterResult = clsParser.iterFile(strFile, clsTarget = HelperClass,
+                        dictTemplate = dictTemplate, objLogger = self.Logger)
+            self.assertNotIsInstance(iterResult, list)
+            self.assertIs(iter(iterResult), iterResult)
+            self.checkSame(list(iterResult), lstExpected)
+            iterResult = clsParser.parseFile(strFile, clsTarget = HelperClass,
+                        dictTemplate = dictTemplate, objLogger = self.Logger,
+                                                                bLazy = True)
+            self.assertNotIsInstance(iterResult, list)
+            self.checkSame(list(iterResult), lstExpected)
+    
+    def test_IterFileEmpty(self):
+        """
+        The class method iterFile() returns an empty iterator if the source
+        file contains no records.
+        
+        Test ID - TEST-T-60D. Covers requirements REQ-FUN-605.
+        """
+        strFile = os.path.join(LIB_ROOT, 'Tests', 'Output',
+                                                        'ut004_empty.json')
+        with open(strFile, 'wt') as fFile:
+            fFile.write('')
+        iterResult = TestModule.JSON_Parser.iterFile(strFile,
+                                                        objLogger = self.Logger)
+        self.assertEqual(list(iterResult), [])
+        os.remove(strFile)
+    
+    def test_IterFileRaisesEagerly(self):
+        """
+        The class method iterFile() performs the checks of the arguments and of
+        the source file existence immediately, not upon the iteration.
+        
+        Test ID - TEST-T-60D. Covers requirements REQ-FUN-605.
+        """
+        strFile = os.path.join(self.InFolder, 'foo_bar.baz')
+        for clsParser, _, _ in self.Cases:
+            with self.assertRaises(ValueError):
+                clsParser.iterFile(strFile, objLogger = self.Logger)
+            with self.assertRaises(TypeError):
+                clsParser.iterFile(1, objLogger = self.Logger)
+    
+    def test_ParseFileLazy(self):
+        """
+        Function parseFile() with bLazy = True automatically selects the
+        parser and returns an iterator yielding the same objects as the eager
+        mode.
+        
+        Test ID - TEST-T-60D. Covers requirements REQ-FUN-605.
+        """
+        for strFileName in self.Files:
+            strFile = os.path.join(self.InFolder, strFileName)
+            lstExpected = TestModule.parseFile(strFile, objLogger = self.Logger)
+            iterResult = TestModule.parseFile(strFile, objLogger = self.Logger,
+                                                                bLazy = True)
+            self.assertNotIsInstance(iterResult, list)
+            lstResult = list(iterResult)
+            self.checkSame(lstResult, lstExpected)
+            self.assertIsInstance(lstResult[0], HelperClass1)
+    
+    def test_TSVBatches(self):
+        """
+        The class TSV_Parser maps the rows in batches column by column, and the
+        results in the eager and lazy modes are the same as of the row by row
+        mapping by the class method parseSingleObject(), regardless of the
+        size of the batch.
+        
+        Test ID - TEST-T-622. Covers requirements REQ-FUN-605, REQ-FUN-608.
+        """
+        strFile = os.path.join(LIB_ROOT, 'Tests', 'Output', 'ut004_batch.txt')
+        with open(strFile, 'wt') as fFile:
+            fFile.write('id\ttype\tvalue\n')
+            for iIndex in range(50):
+                fFile.write('{}\tdummy{}\t{}\n'.format(iIndex, iIndex % 3,
+                                                                iIndex * 0.5))
+        clsParser = TestModule.TSV_Parser
+        dictTemplate = Test_TSV_Parser.Template
+        lstExpected = [clsParser.parseSingleObject(glstRow, HelperClass,
+                                                                dictTemplate)
+                        for glstRow in clsParser._loadFile(strFile,
+                                                    {"HeaderOffset" : 1})]
+        self.assertEqual(len(lstExpected), 50)
+        iOldSize = TestModule.TSV_BATCH_SIZE
+        try:
+            for iSize in [1, 7, 50, 1024]:
+                TestModule.TSV_BATCH_SIZE = iSize
+                lstResult = clsParser.parseFile(strFile,
+                                    clsTarget = HelperClass,
+                                        dictTemplate = dictTemplate,
+                                                    objLogger = self.Logger)
+                self.checkSame(lstResult, lstExpected)
+                iterResult = clsParser.iterFile(strFile,
+                                    clsTarget = HelperClass,
+                                        dictTemplate = dictTemplate)
+                self.checkSame(list(iterResult), lstExpected)
+        finally:
+            TestModule.TSV_BATCH_SIZE = iOldSize
+        self.assertEqual(lstExpected[3].report, {"id" : 3, "type" : "dummy0"})
+        self.assertEqual(lstExpected[3].result, 1.5)
+        os.remove(strFile)
+    
+    def test_TSVBatchesFailure(self):
+        """
+        If a batch of rows cannot be mapped, the class TSV_Parser re-maps it row
+        by row, so the rows preceding the failed one are yielded before the
+        exception is raised, regardless of the size of the batch. A re-defined
+        class method parseSingleObject() of a sub-class is used for all rows.
+        
+        Test ID - TEST-T-622. Covers requirements REQ-FUN-605, REQ-FUN-608.
+        """
+        strFile = os.path.join(LIB_ROOT, 'Tests', 'Output', 'ut004_short.txt')
+        with open(strFile, 'wt') as fFile:
+            fFile.write('id\ttype\tvalue\n')
+            fFile.write('1\tdummy1\t0.5\n')
+            fFile.write('2\tdummy2\t1.0\n')
+            fFile.write('3\tdummy3\n')
+            fFile.write('4\tdummy4\t2.0\n')
+        clsParser = TestModule.TSV_Parser
+        dictTemplate = Test_TSV_Parser.Template
+        iOldSize = TestModule.TSV_BATCH_SIZE
+        try:
+            for iSize in [1, 2, 3, 1024]:
+                TestModule.TSV_BATCH_SIZE = iSize
+                iterResult = clsParser.iterFile(strFile,
+                                    clsTarget = HelperClass,
+                                        dictTemplate = dictTemplate,
+                                                    objLogger = self.Logger)
+                lstResult = []
+                with self.assertRaises(AttributeError):
+                    for objTarget in iterResult:
+                        lstResult.append(objTarget)
+                self.assertEqual([objTarget.report["id"]
+                                    for objTarget in lstResult], [1, 2])
+                self.assertEqual([objTarget.result
+                                    for objTarget in lstResult], [0.5, 1.0])
+                with self.assertRaises(AttributeError):
+                    clsParser.parseFile(strFile, clsTarget = HelperClass,
+                                                dictTemplate = dictTemplate)
+        finally:
+            TestModule.TSV_BATCH_SIZE = iOldSize
+        
+        class CountingParser(TestModule.TSV_Parser):
+            
+            Calls = 0
+            
+            @classmethod
+            def parseSingleObject(cls, *args, **kwargs):
+                CountingParser.Calls += 1
+                return super(CountingParser, cls).parseSingleObject(*args,
+                                                                    **kwargs)
+        
+        lstResult = CountingParser.parseFile(strFile, clsTarget = HelperClass,
+                                            dictTemplate = dictTemplate,
+                                                    bStrictSource = False)
+        self.assertEqual(CountingParser.Calls, 4)
+        self.assertEqual([objTarget.report["id"] for objTarget in lstResult],
+                                                                [1, 2, 3, 4])
+        os.remove(strFile)
+
+class Test_parseManyFilesParallel(unittest.TestCase):
+    """
+    Test cases for the parallel mode of the class method parseManyFiles() of
+    the parser classes and of the function parseManyFiles() of the module
+    GenericParsers.
+    
+    Test IDs - TEST-T-60E, TEST-T-60F.
+    """
+    
+    TestID = "ut004_8"
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Logger = DualLogger(cls.__name__, bLogToFile = True,
+                            strFileName = os.path.join(LIB_ROOT, 'Tests',
+                                        'Output', '{}.log'.format(cls.TestID)))
+        cls.Logger.setFileLoggingLevel(logging.INFO)
+        cls.Logger.disableConsoleLogging()
+        cls.InFolder = os.path.join(LIB_ROOT, 'Tests', 'Input')
+        cls.Cases = [
+            (TestModule.TSV_Parser, ['dummy.txt', 'dummy1.txt'] * 3,
+                                                    Test_TSV_Parser.Template),
+            (TestModule.JSON_Parser, ['dummy.json', 'dummy1.json'] * 3,
+                                                    Test_JSON_Parser.Template),
+            (TestModule.XML_Parser, ['dummy.xml', 'dummy1.xml'] * 3,
+                                                    Test_XML_Parser.Template)]
+        cls.Files = ['dummy.json', 'dummy.xml', 'dummy1.json']
+        cls.Modes = [(2, False), (2, True), (0, False), (4, True)]
+    
+    def checkSame(self, odFirst, odSecond):
+        """
+        Helper method to compare two ordered dictionaries of the lists of the
+        HelperClass instances.
+        """
+        self.assertIsInstance(odFirst, collections.OrderedDict)
+        self.assertEqual(list(odFirst.keys()), list(odSecond.keys()))
+        for strKey, objlstFirst in odFirst.items():
+            objlstSecond = odSecond[strKey]
+            self.assertEqual(len(objlstFirst), len(objlstSecond))
+            for objFirst, objSecond in zip(objlstFirst, objlstSecond):
+                self.assertIs(type(objFirst), type(objSecond))
+                self.assertEqual(objFirst.report, objSecond.report)
+                self.assertEqual(objFirst.result, objSecond.result)
+    
+    def test_SameAsSequential(self):
+        """
+        The class methods parseManyFiles() of the parser classes and the
+        function parseManyFiles() return the same results in the same order in
+        the processes and threads pool modes as in the sequential mode.
+        
+        Test ID - TEST-T-60E. Covers requirements REQ-FUN-605.
+        """
+        for clsParser, strlstFiles, dictTemplate in self.Cases:
+            odExpected = clsParser.parseManyFiles(self.InFolder, strlstFiles,
+                clsTarget = HelperClass, dictTemplate = dictTemplate,
+                                                        objLogger = self.Logger)
+            for iWorkers, bThreads in self.Modes:
+                odResult = clsParser.parseManyFiles(self.InFolder, strlstFiles,
+                    clsTarget = HelperClass, dictTemplate = dictTemplate,
+                        objLogger = self.Logger, iWorkers = iWorkers,
+                                                            bThreads = bThreads)
+                self.checkSame(odResult, odExpected)
+        odExpected = TestModule.parseManyFiles(self.InFolder, self.Files,
+                                                        objLogger = self.Logger)
+        for iWorkers, bThreads in self.Modes:
+            odResult = TestModule.parseManyFiles(self.InFolder, self.Files,
+                                    objLogger = self.Logger, iWorkers = iWorkers,
+                                                            bThreads = bThreads)
+            self.checkSame(odResult, odExpected)
+    
+    def test_LoggerForwarding(self):
+        """
+        The messages logged during parsing of the files in the parallel mode
+        are forwarded into the logger object in the same order as they are
+        logged in the sequential mode.
+        
+        Test ID - TEST-T-60E. Covers requirements REQ-FUN-605.
+        """
+        objExpected = TestModule._LogBuffer()
+        TestModule.parseManyFiles(self.InFolder, self.Files,
+                                                    objLogger = objExpected)
+        self.assertGreater(len(objExpected.Records), 0)
+        strlstExpected = [re.sub(' at 0x[0-9a-fA-F]+', '', strMessage)
+                                for _, strMessage in objExpected.Records]
+        for iWorkers, bThreads in self.Modes:
+            objTest = TestModule._LogBuffer()
+            TestModule.parseManyFiles(self.InFolder, self.Files,
+                objLogger = objTest, iWorkers = iWorkers, bThreads = bThreads)
+            self.assertEqual([strLevel for strLevel, _ in objTest.Records],
+                            [strLevel for strLevel, _ in objExpected.Records])
+            strlstTest = [re.sub(' at 0x[0-9a-fA-F]+', '', strMessage)
+                                for _, strMessage in objTest.Records]
+            self.assertEqual(strlstTest, strlstExpected)
+    
+    def test_RaisesFirstError(self):
+        """
+        In the parallel mode the first (in the order of the files) exception is
+        re-raised with the same type and the name of the file added to the
+        message.
+        
+        Test ID - TEST-T-60E. Covers requirements REQ-AWM-601 and REQ-AWM-602.
+        """
+        clsParser, _, dictTemplate = self.Cases[1]
+        strlstFiles = ['dummy.json', 'bad_4.json', 'dummy1.json',
+                                                                'foo_bar.baz']
+        for iWorkers, bThreads in self.Modes:
+            with self.assertRaises(ValueError) as objContext:
+                clsParser.parseManyFiles(self.InFolder, strlstFiles,
+                    clsTarget = HelperClass, dictTemplate = dictTemplate,
+                        objLogger = self.Logger, iWorkers = iWorkers,
+                                                            bThreads = bThreads)
+            self.assertIn('bad_4.json', str(objContext.exception))
+            with self.assertRaises(ValueError) as objContext:
+                TestModule.parseManyFiles(self.InFolder, strlstFiles[2:],
+                    objLogger = self.Logger, iWorkers = iWorkers,
+                                                            bThreads = bThreads)
+            self.assertIn('foo_bar.baz', str(objContext.exception))
+    
+    def test_RaisesTypeError(self):
+        """
+        The class method and the function parseManyFiles() raise TypeError if
+        the number of the workers is neither None nor an integer, or if any of
+        the base file names is not a string.
+        
+        Test ID - TEST-T-60E. Covers requirements REQ-AWM-601.
+        """
+        for gWorkers in ['2', 2.0, False, [2]]:
+            with self.assertRaises(TypeError):
+                TestModule.TSV_Parser.parseManyFiles(self.InFolder,
+                    ['dummy.txt'], clsTarget = HelperClass,
+                        dictTemplate = Test_TSV_Parser.Template,
+                            objLogger = self.Logger, iWorkers = gWorkers)
+            with self.assertRaises(TypeError):
+                TestModule.parseManyFiles(self.InFolder, self.Files,
+                                objLogger = self.Logger, iWorkers = gWorkers)
+        with self.assertRaises(TypeError):
+            TestModule.parseManyFiles(self.InFolder, ['dummy.json', 1],
+                                        objLogger = self.Logger, iWorkers = 2)
+
+    def test_LazyLogging(self):
+        """
+        The messages are formatted with their arguments only if they pass the
+        level of the logger, also when collected from the workers of a pool.
+        
+        Test ID - TEST-T-60F. Covers requirements REQ-FUN-606.
+        """
+        objBuffer = TestModule._LogBuffer(logging.WARNING)
+        objBuffer.debug('%s', self)
+        objBuffer.info('Mapped %s onto %s', self, self)
+        objBuffer.warning('%s - %d%%', 'warning', 1)
+        objBuffer.error('%(name)s', {'name' : 'error'})
+        objBuffer.error('100%')
+        self.assertListEqual(objBuffer.Records, [('warning', 'warning - 1%'),
+                                        ('error', 'error'), ('error', '100%')])
+        objLogger = logging.getLogger('{}_lazy'.format(self.TestID))
+        objLogger.propagate = False
+        strlstMessages = []
+        objHandler = logging.Handler()
+        objHandler.emit = lambda objRecord: strlstMessages.append(
+                                                        objRecord.getMessage())
+        objLogger.addHandler(objHandler)
+        for iWorkers, bThreads in [(1, False), (2, True), (2, False)]:
+            for iLevel in [logging.WARNING, logging.INFO]:
+                objLogger.setLevel(iLevel)
+                del strlstMessages[:]
+                TestModule.parseManyFiles(self.InFolder, self.Files,
+                                    objLogger = objLogger, iWorkers = iWorkers,
+                                                        bThreads = bThreads)
+                if iLevel == logging.WARNING:
+                    self.assertListEqual(strlstMessages, [])
+                else:
+                    self.assertGreaterEqual(len([strMessage
+                                            for strMessage in strlstMessages
+                                        if strMessage.startswith('Mapped ')]),
+                                                        len(self.Files))
+        objLogger.removeHandler(objHandler)
+
+class Test_JSON_Splitter(unittest.TestCase):
+    """
+    Test cases for the streaming splitting of a JSON file into separate objects
+    implemented by the helper class method _iterFile() of the class
+    JSON_Parser.
+    
+    Test ID - TEST-T-611.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(TestModule.JSON_Parser._iterFile)
+        cls.TestFile = os.path.join(LIB_ROOT, 'Tests', 'Output',
+                                                            'ut004_split.json')
+        cls.Objects = [{"a" : 1, "b" : "{[}]"}, {"c$" : 'quote " and }'},
+                        {"d" : [{"e" : "\\\\"}, {"f" : None}], "g" : "$"}]
+        cls.Expected = [{"a" : 1, "b" : "{[}]"}, {"c%" : 'quote " and }'},
+                        {"d" : [{"e" : "\\\\"}, {"f" : None}], "g" : "%"}]
+        cls.ChunkSize = TestModule.JSON_CHUNK_SIZE
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean-up after all test cases, done only once.
+        """
+        if os.path.isfile(cls.TestFile):
+            os.remove(cls.TestFile)
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        TestModule.JSON_CHUNK_SIZE = self.ChunkSize
+    
+    def writeFile(self, strContent):
+        """
+        Helper method to create the test file.
+        """
+        with open(self.TestFile, 'wt') as fFile:
+            fFile.write(strContent)
+    
+    def test_Formats(self):
+        """
+        The proper JSON array of objects and the concatenated objects with or
+        without commas between them are split into the same objects, regardless
+        of the braces and escaped quotes within the string literals and of the
+        size of the chunks, in which the file is read.
+        
+        Test ID - TEST-T-611. Covers requirements REQ-FUN-605.
+        """
+        strlstObjects = [json.dumps(dictItem) for dictItem in self.Objects]
+        strlstContent = [', '.join(strlstObjects), ' '.join(strlstObjects),
+                        '\n'.join(strlstObjects), ''.join(strlstObjects),
+                        '[{}]'.format(', '.join(strlstObjects)),
+                        json.dumps(self.Objects, indent = 4)]
+        for iChunkSize in [1, 3, 16, self.ChunkSize]:
+            TestModule.JSON_CHUNK_SIZE = iChunkSize
+            for strContent in strlstContent:
+                self.writeFile(strContent)
+                lstResult = list(self.TestFunction(self.TestFile, {}))
+                self.assertEqual(lstResult, self.Expected)
+            self.writeFile(strlstObjects[0])
+            lstResult = list(self.TestFunction(self.TestFile, {}))
+            self.assertEqual(lstResult, self.Expected[:1])
+            self.writeFile('')
+            lstResult = list(self.TestFunction(self.TestFile, {}))
+            self.assertEqual(lstResult, [])
+    
+    def test_RaisesValueError(self):
+        """
+        ValueError is raised if a closing brace is found outside an object, or
+        an object is not a proper JSON or it is not complete.
+        
+        Test ID - TEST-T-611. Covers requirements REQ-AWM-610.
+        """
+        strlstContent = ['} {"a" : 1}', '{"a" : 1}}', '{"a" : 1} {"b" : 2',
+                            '{"a" : 1} {"b" : }', '{"a" : "}"']
+        for iChunkSize in [1, 3, self.ChunkSize]:
+            TestModule.JSON_CHUNK_SIZE = iChunkSize
+            for strContent in strlstContent:
+                self.writeFile(strContent)
+                with self.assertRaises(ValueError):
+                    list(self.TestFunction(self.TestFile, {}))
+    
+    def test_MalformedStopsReading(self):
+        """
+        An improper JSON object, which is complete within the already read
+        data, raises ValueError without reading the rest of the file, whereas
+        an object truncated by the end of a chunk is still decoded.
+        
+        Test ID - TEST-T-611. Covers requirements REQ-FUN-605, REQ-AWM-610.
+        """
+        ilstRead = []
+        
+        class CountingFile(file):
+            def read(self, *args):
+                strChunk = super(CountingFile, self).read(*args)
+                ilstRead.append(len(strChunk))
+                return strChunk
+        
+        TestModule.JSON_CHUNK_SIZE = 64
+        strTail = ' {"b" : "}"}' * 10000
+        TestModule.open = CountingFile
+        try:
+            for strHead, iMaxRead in [('{"a" : x}', 64),
+                                ('{"a" : [1, 2, {"c" : "}"}, x]}', 64),
+                                ('{"a" : "' + 'y' * 100 + '", "b" : x}', 448)]:
+                del ilstRead[:]
+                self.writeFile(strHead + strTail)
+                with self.assertRaises(ValueError):
+                    list(self.TestFunction(self.TestFile, {}))
+                self.assertLessEqual(sum(ilstRead), iMaxRead)
+            self.writeFile('{"a" : "' + 'y' * 100 + '", "b" : 1}' + strTail)
+            iterResult = self.TestFunction(self.TestFile, {})
+            self.assertEqual(next(iterResult), {"a" : 'y' * 100, "b" : 1})
+            self.assertEqual(next(iterResult), {"b" : "}"})
+        finally:
+            del TestModule.open
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_GenericParser)
@@ -1049,10 +1589,14 @@ TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_JSON_Parser)
 TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_XML_Parser)
 TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_parseFile)
 TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_parseManyFiles)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_iterFile)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(
+                                                Test_parseManyFilesParallel)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_JSON_Splitter)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
-    TestSuite6])
+    TestSuite6, TestSuite7, TestSuite8, TestSuite9])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting fsio_lib.GenericParsers module tests...\n")
@@ -330,12 +330,364 @@ class Test_LoggingFSIO(unittest.TestCase):
         #not a base filename!
         self.assertEqual(iError, 2)
 
+class Test_BatchOperations(unittest.TestCase):
+    """
+    Test cases for the batch methods of the class LoggingFSIO from the module
+    LoggingFSIO.
+    
+    Implements tests ID TEST-T-360, TEST-T-361 and TEST-T-370.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = TestModule.LoggingFSIO
+        cls.Root = os.path.join(TEST_ROOT, 'test_batch')
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the files and starts to
+        collect the log records.
+        """
+        self.Source = os.path.join(self.Root, 'source')
+        os.makedirs(self.Source)
+        self.Files = []
+        for iIndex in range(20):
+            strPath = os.path.join(self.Source, '{}.txt'.format(iIndex))
+            with open(strPath, 'wb') as fFile:
+                fFile.write(str(iIndex))
+            self.Files.append(strPath)
+        self.Records = []
+        self.Handler = logging.Handler()
+        self.Handler.emit = self.Records.append
+        logging.getLogger('LoggingFSIO').addHandler(self.Handler)
+        self.GetMoveStrategy = TestModule._getMoveStrategy
+        self.Rename = os.rename
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        logging.getLogger('LoggingFSIO').removeHandler(self.Handler)
+        TestModule._getMoveStrategy = self.GetMoveStrategy
+        os.rename = self.Rename
+        shutil.rmtree(self.Root)
+    
+    def test_Batches(self):
+        """
+        Checks that the methods copyFiles(), moveFiles() and deleteFiles()
+        perform as specified with the sequential and parallel execution, and
+        only the summary is logged.
+        
+        Test ID - TEST-T-360. Covers requirements REQ-FUN-312 and REQ-AWM-312.
+        """
+        for iWorkers in [None, 1, 4, 0]:
+            strTarget = os.path.join(self.Root, 'target', str(iWorkers), 'a')
+            lstOperations = [(strPath, strTarget) for strPath in self.Files]
+            iError, strError, tuplstResults = self.TestClass.copyFiles(
+                                            lstOperations, iWorkers = iWorkers)
+            self.assertEqual(iError, 0)
+            self.assertIn('20 operations, 0 failed', strError)
+            self.assertEqual(len(tuplstResults), 20)
+            self.assertTrue(all(iItem == 0 for iItem, _ in tuplstResults))
+            for strPath in self.Files:
+                strNewPath = os.path.join(strTarget, os.path.basename(strPath))
+                with open(strNewPath, 'rb') as fFile:
+                    self.assertEqual(fFile.read(), os.path.basename(
+                                                            strPath)[:-4])
+                self.assertAlmostEqual(os.path.getmtime(strPath),
+                                                os.path.getmtime(strNewPath), 4)
+            strMoved = os.path.join(self.Root, 'moved', str(iWorkers))
+            lstOperations = [(os.path.join(strTarget, strName), strMoved,
+                            'm' + strName) for strName in os.listdir(strTarget)]
+            iError, _, tuplstResults = self.TestClass.moveFiles(lstOperations,
+                                                        iWorkers = iWorkers)
+            self.assertEqual(iError, 0)
+            self.assertEqual(len(os.listdir(strTarget)), 0)
+            self.assertEqual(len(os.listdir(strMoved)), 20)
+            lstOperations = [os.path.join(strMoved, strName)
+                                            for strName in os.listdir(strMoved)]
+            iError, _, tuplstResults = self.TestClass.deleteFiles(lstOperations,
+                                                        iWorkers = iWorkers)
+            self.assertEqual(iError, 0)
+            self.assertEqual(len(os.listdir(strMoved)), 0)
+        self.assertEqual(len(self.Records), 12)
+        self.assertTrue(all(objRecord.levelno == logging.INFO
+                                            for objRecord in self.Records))
+    
+    def test_Batches_Errors(self):
+        """
+        Checks that the batch methods do not raise exceptions, return the
+        results of all operations in the original order and log the failed
+        operations.
+        
+        Test ID - TEST-T-361. Covers requirements REQ-FUN-312 and REQ-AWM-312.
+        """
+        strTarget = os.path.join(self.Root, 'target')
+        for gTemp in [None, 1, 'a', {'a' : 1}]:
+            for fMethod in [self.TestClass.copyFiles, self.TestClass.moveFiles,
+                                                    self.TestClass.deleteFiles]:
+                iError, _, tuplstResults = fMethod(gTemp)
+                self.assertEqual(iError, 1)
+                self.assertEqual(tuplstResults, [])
+        for gTemp in [1.0, '2', True, [2]]:
+            iError, _, _ = self.TestClass.copyFiles([(self.Files[0],
+                                            strTarget)], iWorkers = gTemp)
+            self.assertEqual(iError, 1)
+        self.assertEqual(len(self.Records), 16)
+        self.assertFalse(os.path.isdir(strTarget))
+        del self.Records[:]
+        for iWorkers in [None, 3]:
+            lstOperations = [(strPath, strTarget) for strPath in self.Files]
+            lstOperations[3] = (os.path.join(self.Root, 'none.txt'), strTarget)
+            lstOperations[7] = (self.Files[7], strTarget, 'a', 'b')
+            lstOperations[9] = self.Files[9]
+            lstOperations[11] = (1, strTarget)
+            iError, strError, tuplstResults = self.TestClass.copyFiles(
+                                            lstOperations, iWorkers = iWorkers)
+            self.assertEqual(iError, 5)
+            self.assertIn('20 operations, 4 failed', strError)
+            self.assertEqual([iItem for iItem, _ in tuplstResults],
+                                [0, 0, 0, 2, 0, 0, 0, 1, 0, 1, 0, 1] + [0] * 8)
+            self.assertEqual(len(os.listdir(strTarget)), 16)
+            lstOperations = [os.path.join(strTarget, strName)
+                                        for strName in os.listdir(strTarget)]
+            lstOperations.insert(5, strTarget)
+            iError, strError, tuplstResults = self.TestClass.deleteFiles(
+                                            lstOperations, iWorkers = iWorkers)
+            self.assertEqual(iError, 5)
+            self.assertIn('17 operations, 1 failed', strError)
+            self.assertEqual(tuplstResults[5][0], 3)
+            self.assertEqual(len(os.listdir(strTarget)), 0)
+        self.assertEqual(len(self.Records), 14)
+        self.assertEqual(len([objRecord for objRecord in self.Records
+                                if objRecord.levelno == logging.ERROR]), 10)
+
+    def test_MoveStrategy(self):
+        """
+        Checks that the method moveFile() renames the files on the same device
+        and copies them otherwise, and that the method planMoves() reports the
+        strategies without changes to the file system.
+        
+        Test ID - TEST-T-370. Covers requirements REQ-FUN-313 and REQ-AWM-312.
+        """
+        strTarget = os.path.join(self.Root, 'target', 'a')
+        lstOperations = [(strPath, strTarget) for strPath in self.Files[:5]]
+        lstOperations.append((self.Files[5], self.Source))
+        lstOperations.append((self.Files[6], self.Source, '6a.txt'))
+        lstOperations.append(self.Files[7])
+        lstOperations.append((os.path.join(self.Root, 'none.txt'), strTarget))
+        iError, strError, tuplstResults = self.TestClass.planMoves(
+                                                                lstOperations)
+        self.assertEqual(iError, 5)
+        self.assertIn('9 operations - 6 rename, 0 copy, 1 none, 2 failed',
+                                                                    strError)
+        self.assertEqual(tuplstResults[:7], [(0, 'rename')] * 5 + [(0, 'none'),
+                                                                (0, 'rename')])
+        self.assertEqual([iItem for iItem, _ in tuplstResults[7:]], [1, 2])
+        self.assertFalse(os.path.isdir(os.path.join(self.Root, 'target')))
+        self.assertEqual(len(os.listdir(self.Source)), 20)
+        self.assertEqual(len(self.Records), 3)
+        iError, _, _ = self.TestClass.planMoves(None)
+        self.assertEqual(iError, 1)
+        dictDevices = {strTarget : -1}
+        self.assertEqual(TestModule._getMoveStrategy(self.Files[0],
+                        os.path.join(strTarget, '0.txt'), dictDevices), 'copy')
+        self.assertEqual(TestModule._getMoveStrategy(self.Files[0],
+                            os.path.join(self.Source, '0a.txt'), dictDevices),
+                                                                    'rename')
+        self.assertEqual(dictDevices[self.Source],
+                                                os.stat(self.Source).st_dev)
+        lstRenamed = []
+        def CountedRename(strOld, strNew):
+            lstRenamed.append(strOld)
+            self.Rename(strOld, strNew)
+        os.rename = CountedRename
+        os.utime(self.Files[1], (1000000000, 1000000000))
+        iError, _ = self.TestClass.moveFile(self.Files[0], strTarget)
+        self.assertEqual(iError, 0)
+        self.assertEqual(lstRenamed, [self.Files[0]])
+        strNewPath = os.path.join(strTarget, '0.txt')
+        self.assertTrue(os.path.isfile(strNewPath))
+        self.assertFalse(os.path.isfile(self.Files[0]))
+        TestModule._getMoveStrategy = lambda *args: 'copy'
+        iError, _ = self.TestClass.moveFile(self.Files[1], strTarget, '0.txt')
+        self.assertEqual(iError, 0)
+        self.assertEqual(len(lstRenamed), 1)
+        self.assertFalse(os.path.isfile(self.Files[1]))
+        with open(strNewPath, 'rb') as fFile:
+            self.assertEqual(fFile.read(), '1')
+        self.assertAlmostEqual(os.path.getmtime(strNewPath), 1000000000, 4)
+        iError, _, _ = self.TestClass.moveFiles(lstOperations[2:5],
+                                                                iWorkers = 2)
+        self.assertEqual(iError, 0)
+        self.assertEqual(len(lstRenamed), 1)
+        self.assertItemsEqual(os.listdir(strTarget), ['0.txt', '2.txt',
+                                                        '3.txt', '4.txt'])
+        TestModule._getMoveStrategy = self.GetMoveStrategy
+        iError, _, _ = self.TestClass.moveFiles(lstOperations[5:7])
+        self.assertEqual(iError, 0)
+        self.assertEqual(lstRenamed, [self.Files[0], self.Files[6]])
+        self.assertTrue(os.path.isfile(self.Files[5]))
+        self.assertTrue(os.path.isfile(os.path.join(self.Source, '6a.txt')))
+
+class Test_AsyncLogging(unittest.TestCase):
+    """
+    Test cases for the asynchronous logging mode of the class DualLogger from
+    the module LoggingFSIO.
+    
+    Implements tests ID TEST-T-303 and TEST-T-304.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates a file logger.
+        """
+        self.LogFile = os.path.join(TEST_ROOT, 'Output', 'ut006_async.log')
+        self.Logger = TestModule.DualLogger('ut006_async', bLogToFile = True,
+                                                strFileName = self.LogFile)
+        self.Logger.disableConsoleLogging()
+        self.Logger.setFileLoggingLevel(logging.DEBUG)
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        self.Logger.disableAsyncLogging()
+        self.Logger.disableFileLogging()
+        self.Logger.file_logging.close()
+    
+    def getLines(self):
+        """
+        Helper method returning the lines of the log file.
+        """
+        with open(self.LogFile, 'rt') as fFile:
+            strlstLines = fFile.read().splitlines()
+        return strlstLines
+    
+    def test_AsyncLogging(self):
+        """
+        Checks that in the asynchronous mode all log entries are written in
+        order and with the proper format, after flush(), and that the handlers
+        are restored when the mode is disabled.
+        
+        Test ID - TEST-T-303. Covers requirement REQ-FUN-303.
+        """
+        objFileHandler = self.Logger.file_logging
+        self.Logger.enableAsyncLogging(iQueueSize = 2)
+        self.assertNotIn(objFileHandler, self.Logger.handlers)
+        self.Logger.enableAsyncLogging() #ignored
+        for iIndex in range(50):
+            self.Logger.info('message {}'.format(iIndex))
+        self.Logger.warning('warning')
+        self.Logger.flush()
+        strlstLines = self.getLines()
+        self.assertEqual(len(strlstLines), 103)
+        self.assertListEqual(strlstLines[1:100:2],
+                            ['message {}'.format(iIndex)
+                                                for iIndex in range(50)])
+        self.assertTrue(strlstLines[100].startswith('<<WARNING>>'))
+        self.assertTrue(strlstLines[101].startswith('Line '))
+        self.assertEqual(strlstLines[102], 'warning')
+        self.assertEqual(self.Logger.dropped_records, 0)
+        self.Logger.changeLogFile(self.LogFile)
+        self.Logger.info('changed')
+        self.Logger.flush()
+        self.assertEqual(self.getLines()[1:], ['changed'])
+        self.Logger.disableAsyncLogging()
+        self.assertIn(self.Logger.file_logging, self.Logger.handlers)
+        self.Logger.info('sync')
+        self.assertEqual(self.getLines()[3:], ['sync'])
+        with self.assertRaises(TypeError):
+            self.Logger.enableAsyncLogging(iQueueSize = 1.0)
+        with self.assertRaises(TypeError):
+            self.Logger.enableAsyncLogging(iQueueSize = True)
+        with self.assertRaises(ValueError):
+            self.Logger.enableAsyncLogging(iQueueSize = -1)
+    
+    def test_DropPolicy(self):
+        """
+        Checks that with the drop policy the log entries are dropped and
+        counted on overflow of the queue instead of blocking the caller.
+        
+        Test ID - TEST-T-304. Covers requirement REQ-FUN-303.
+        """
+        self.Logger.enableAsyncLogging(iQueueSize = 1, bBlock = False)
+        self.Logger.file_logging.acquire() #stalls the background thread
+        try:
+            for iIndex in range(10):
+                self.Logger.info('message {}'.format(iIndex))
+        finally:
+            self.Logger.file_logging.release()
+        self.Logger.flush()
+        iDropped = self.Logger.dropped_records
+        self.assertGreaterEqual(iDropped, 8)
+        self.assertEqual(len(self.getLines()), 2 * (10 - iDropped))
+
+class Test_LoggerProxy(unittest.TestCase):
+    """
+    Test cases for the attribute resolution redirection of the classes
+    ConsoleLogger and DualLogger from the module LoggingFSIO.
+    
+    Implements test ID TEST-T-305.
+    """
+    
+    def test_AttributeResolution(self):
+        """
+        Checks that the own attributes of the logger classes are resolved as
+        usual, the other attributes are redirected to the wrapped logging.Logger
+        instance for reading and writing, and the cached bound methods follow
+        the changes.
+        
+        Test ID - TEST-T-305. Covers requirement REQ-FUN-304.
+        """
+        for TestClass in [TestModule.ConsoleLogger, TestModule.DualLogger]:
+            objTest = TestClass('ut006_proxy_{}'.format(TestClass.__name__))
+            objLogger = objTest._logger
+            self.assertIsInstance(objLogger, logging.Logger)
+            self.assertIsInstance(objTest.console, logging.StreamHandler)
+            self.assertNotIn('console', objLogger.__dict__)
+            self.assertEqual(objTest.warning.__func__,
+                                            TestClass.warning.__func__)
+            for _ in range(2):
+                self.assertEqual(objTest.info, objLogger.info)
+                self.assertEqual(objTest.setLevel, objLogger.setLevel)
+            objTest.setLevel(logging.ERROR)
+            self.assertEqual(objTest.level, logging.ERROR)
+            objTest.level = logging.INFO
+            self.assertEqual(objLogger.level, logging.INFO)
+            self.assertEqual(objTest.level, logging.INFO)
+            self.assertNotIn('level', objTest.__dict__)
+            objTest.propagate = False
+            self.assertFalse(objLogger.propagate)
+            lstCalls = []
+            objTest.info = lstCalls.append
+            self.assertEqual(objLogger.info, lstCalls.append)
+            objTest.info('message')
+            self.assertListEqual(lstCalls, ['message'])
+            del objLogger.info
+            self.assertEqual(objTest.info, objLogger.info)
+            objTest.new_attribute = 1
+            self.assertEqual(objTest.new_attribute, 1)
+            self.assertFalse(hasattr(objLogger, 'new_attribute'))
+            with self.assertRaises(AttributeError):
+                objTest.not_existing
+            objTest.disableConsoleLogging()
+        with self.assertRaises(AttributeError):
+            TestModule.ConsoleLogger.__new__(TestModule.ConsoleLogger).info
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_LoggingFSIO)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_BatchOperations)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_AsyncLogging)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_LoggerProxy)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3,
+                                                                TestSuite4])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting fsio_lib.LoggingFSIO module tests...\n")
@@ -35,6 +35,41 @@ import fsio_lib.fs_maintenance as TestModule
 
 #classes
 
+#+ helper classes
+
+class CountedHashing(object):
+    """
+    Mix-in for the test cases counting the full and partial hashing of the
+    files by the functions of the tested module. The hashed files are recorded
+    in the lists Calls and PartialCalls as the paths relative to the folder
+    Root of the test case.
+    """
+    
+    def countHashing(self):
+        """
+        Replaces the hashing functions of the tested module by the counting
+        wrappers and clears the records of the calls.
+        """
+        self.HashFile = TestModule._HashFile
+        self.HashFileEnds = TestModule._HashFileEnds
+        self.Calls = []
+        self.PartialCalls = []
+        def CountedHashFile(strPath):
+            self.Calls.append(os.path.relpath(strPath, self.Root))
+            return self.HashFile(strPath)
+        def CountedHashFileEnds(strPath, iSize):
+            self.PartialCalls.append(os.path.relpath(strPath, self.Root))
+            return self.HashFileEnds(strPath, iSize)
+        TestModule._HashFile = CountedHashFile
+        TestModule._HashFileEnds = CountedHashFileEnds
+    
+    def restoreHashing(self):
+        """
+        Restores the original hashing functions of the tested module.
+        """
+        TestModule._HashFile = self.HashFile
+        TestModule._HashFileEnds = self.HashFileEnds
+
 #+ test cases
 
 class Test_fs_maitenance(unittest.TestCase):
@@ -418,6 +453,47 @@ class Test_fs_maitenance(unittest.TestCase):
         shutil.rmtree(strRoot)
         self.assertFalse(os.path.isdir(strRoot))
     
+    def test_CopyNonPresentSuffixes(self):
+        """
+        Tests the resolution of the names conflicts by the function
+        CopyNonPresent() with many same named files - the smallest free
+        suffixes are used.
+
+        Test ID - TEST-T-561. Covers requirement REQ-FUN-561.
+        """
+        strRoot = os.path.join(TEST_ROOT, 'test_cnps')
+        strSource = os.path.join(strRoot, 'source')
+        strTarget = os.path.join(strRoot, 'target')
+        TestModule.TouchFolder(os.path.join(strTarget, 'a'))
+        for strFile, strData in [('x.txt', 'x'), ('x_1.txt', 'x1'),
+                                (os.path.join('a', 'x_3.txt'), 'x3'),
+                                ('y', 'y'), ('x.dat', 'x')]:
+            with open(os.path.join(strTarget, strFile), 'wb') as fFile:
+                fFile.write(strData)
+        for iIndex in range(5):
+            strFolder = os.path.join(strSource, str(iIndex))
+            TestModule.TouchFolder(strFolder)
+            for strFile in ['x.txt', 'y', 'x.dat']:
+                with open(os.path.join(strFolder, strFile), 'wb') as fFile:
+                    fFile.write('{}{}'.format(strFile, iIndex))
+        with open(os.path.join(strSource, 'x.txt'), 'wb') as fFile:
+            fFile.write('x')
+        TestModule.CopyNonPresent(strTarget, strSource)
+        self.assertItemsEqual(os.listdir(strTarget), ['a', 'x.txt', 'x_1.txt',
+                            'x_2.txt', 'x_4.txt', 'x_5.txt', 'x_6.txt',
+                            'x_7.txt', 'y', 'y_1', 'y_2', 'y_3', 'y_4', 'y_5',
+                            'x.dat', 'x_1.dat', 'x_2.dat', 'x_3.dat', 'x_4.dat',
+                            'x_5.dat'])
+        strlstData = []
+        for strFile in os.listdir(strTarget):
+            strPath = os.path.join(strTarget, strFile)
+            if os.path.isfile(strPath):
+                with open(strPath, 'rb') as fFile:
+                    strlstData.append(fFile.read())
+        self.assertEqual(len(set(strlstData)), len(strlstData) - 1)
+        shutil.rmtree(strRoot)
+        self.assertFalse(os.path.isdir(strRoot))
+    
     def test_CopyMerge(self):
         """
         Tests the performance of the function CopyMerge().
@@ -483,12 +559,736 @@ class Test_fs_maitenance(unittest.TestCase):
         shutil.rmtree(strRoot)
         self.assertFalse(os.path.isdir(strRoot))
 
+class Test_CheckSum(CountedHashing, unittest.TestCase):
+    """
+    Test cases for the function GetCheckSum() and the class CheckSumCache from
+    the module fs_maintenance.
+    
+    Implements tests ID TEST-T-580, TEST-T-590.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the test folder with files and
+        counts the actual hashing of the files.
+        """
+        self.Root = os.path.join(TEST_ROOT, 'test_cs')
+        TestModule.TouchFolder(self.Root)
+        self.Files = []
+        for iIndex, strData in enumerate(['', 'test', 'x' * 5000, 'test']):
+            strPath = os.path.join(self.Root, '{}.txt'.format(iIndex))
+            with open(strPath, 'wb') as fFile:
+                fFile.write(strData)
+            self.Files.append((strPath, hashlib.md5(strData).hexdigest()))
+        self.countHashing()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        self.restoreHashing()
+        TestModule.HASH_CHUNK_SIZE = 1048576
+        shutil.rmtree(self.Root)
+    
+    def test_GetCheckSum(self):
+        """
+        Tests the performance of the function GetCheckSum() - chunked reading.
+
+        Test ID - TEST-T-580. Covers requirement REQ-FUN-580.
+        """
+        for iChunkSize in [1, 3, 4096, 1048576]:
+            TestModule.HASH_CHUNK_SIZE = iChunkSize
+            for strPath, strCheckSum in self.Files:
+                self.assertEqual(TestModule.GetCheckSum(strPath), strCheckSum)
+        self.assertEqual(len(self.Calls), 4 * len(self.Files))
+    
+    def test_CheckSumCache(self):
+        """
+        Tests the performance of the class CheckSumCache - the files are hashed
+        only once, unless changed, and the cache is persistent.
+
+        Test ID - TEST-T-590. Covers requirement REQ-FUN-590.
+        """
+        strCacheFile = os.path.join(self.Root, 'cache.json')
+        with TestModule.CheckSumCache(strCacheFile) as objCache:
+            for _ in range(2):
+                for strPath, strCheckSum in self.Files:
+                    self.assertEqual(TestModule.GetCheckSum(strPath, objCache),
+                                                                    strCheckSum)
+            self.assertEqual(len(self.Calls), len(self.Files))
+            self.assertEqual(len(objCache), len(self.Files))
+        self.assertTrue(os.path.isfile(strCacheFile))
+        objCache = TestModule.CheckSumCache(strCacheFile)
+        self.assertEqual(len(objCache), len(self.Files))
+        for strPath, strCheckSum in self.Files:
+            self.assertEqual(objCache.getCheckSum(strPath), strCheckSum)
+        self.assertEqual(len(self.Calls), len(self.Files))
+        strPath = self.Files[1][0]
+        with open(strPath, 'ab') as fFile:
+            fFile.write('changed')
+        self.assertEqual(objCache.getCheckSum(strPath),
+                                        hashlib.md5('testchanged').hexdigest())
+        self.assertEqual(len(self.Calls), len(self.Files) + 1)
+        with open(self.Files[3][0], 'ab') as fFile:
+            fFile.write('changed')
+        objCache = TestModule.CheckSumCache()
+        TestModule.RemoveFilesCopies(self.Root, objCache)
+        self.assertEqual(len(objCache), len(self.Files) + 1)
+        self.assertItemsEqual(os.listdir(self.Root),
+                                ['0.txt', '1.txt', '2.txt', 'cache.json'])
+
+class Test_CopyFile(CountedHashing, unittest.TestCase):
+    """
+    Test cases for the functions CopyFile() and CompareFiles() from the module
+    fs_maintenance.
+    
+    Implements tests ID TEST-T-511.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the test folder with files of
+        different sizes and counts the actual hashing of the files.
+        """
+        self.Root = os.path.join(TEST_ROOT, 'test_cf')
+        TestModule.TouchFolder(self.Root)
+        self.Files = []
+        for iIndex, strData in enumerate(['', 'test', 'x' * 5000 + 'y',
+                                                            'x' * 5001]):
+            strPath = os.path.join(self.Root, '{}.txt'.format(iIndex))
+            with open(strPath, 'wb') as fFile:
+                fFile.write(strData)
+            self.Files.append((strPath, strData))
+        os.utime(self.Files[1][0], (1000000000, 1000000000))
+        self.countHashing()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        self.restoreHashing()
+        TestModule.COPY_CHUNK_SIZE = 8388608
+        TestModule.HASH_CHUNK_SIZE = 1048576
+        shutil.rmtree(self.Root)
+    
+    def test_CopyFile(self):
+        """
+        Tests the performance of the function CopyFile() - the content and the
+        metadata are copied into a file or a folder, with any chunk size.
+
+        Test ID - TEST-T-511. Covers requirement REQ-FUN-511.
+        """
+        strFolder = os.path.join(self.Root, 'copy')
+        TestModule.TouchFolder(strFolder)
+        for iChunkSize in [1, 3, 4096]:
+            TestModule.COPY_CHUNK_SIZE = iChunkSize
+            for strPath, strData in self.Files:
+                strNewPath = os.path.join(strFolder, os.path.basename(strPath))
+                self.assertEqual(TestModule.CopyFile(strPath, strFolder),
+                                                                len(strData))
+                with open(strNewPath, 'rb') as fFile:
+                    self.assertEqual(fFile.read(), strData)
+                self.assertAlmostEqual(os.path.getmtime(strPath),
+                                                os.path.getmtime(strNewPath), 4)
+        strNewPath = os.path.join(strFolder, 'new.txt')
+        self.assertEqual(TestModule.CopyFile(self.Files[2][0], strNewPath),
+                                                        len(self.Files[2][1]))
+        self.assertEqual(TestModule.CopyFile(self.Files[1][0], strNewPath), 4)
+        with open(strNewPath, 'rb') as fFile:
+            self.assertEqual(fFile.read(), 'test')
+        with self.assertRaises(shutil.Error):
+            TestModule.CopyFile(strNewPath, strNewPath)
+        with open(strNewPath, 'rb') as fFile:
+            self.assertEqual(fFile.read(), 'test')
+        with self.assertRaises((IOError, OSError)):
+            TestModule.CopyFile(os.path.join(self.Root, 'none.txt'), strFolder)
+    
+    def test_CompareFiles(self):
+        """
+        Tests the performance of the function CompareFiles() - the sizes are
+        compared first, and the content is compared directly without a cache.
+
+        Test ID - TEST-T-511. Covers requirement REQ-FUN-511.
+        """
+        strCopy = os.path.join(self.Root, 'copy.txt')
+        for iChunkSize in [1, 3, 4096]:
+            TestModule.HASH_CHUNK_SIZE = iChunkSize
+            for strPath, _ in self.Files:
+                shutil.copy(strPath, strCopy)
+                self.assertTrue(TestModule.CompareFiles(strPath, strCopy))
+                for strOther, _ in self.Files:
+                    self.assertEqual(TestModule.CompareFiles(strPath, strOther),
+                                                        strPath == strOther)
+        self.assertEqual(len(self.Calls), 0)
+        objCache = TestModule.CheckSumCache()
+        self.assertFalse(TestModule.CompareFiles(self.Files[0][0],
+                                                self.Files[1][0], objCache))
+        self.assertEqual(len(self.Calls), 0)
+        self.assertFalse(TestModule.CompareFiles(self.Files[2][0],
+                                                self.Files[3][0], objCache))
+        self.assertTrue(TestModule.CompareFiles(self.Files[3][0], strCopy,
+                                                                    objCache))
+        self.assertEqual(len(self.Calls), 3)
+
+class Test_FolderIndex(CountedHashing, unittest.TestCase):
+    """
+    Test cases for the class FolderIndex and its use by the functions
+    CopyNonPresent(), CopyMerge() and RemoveDuplicateFiles() from the module
+    fs_maintenance.
+    
+    Implements test ID TEST-T-5A0.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the target and source folders
+        with files and counts the actual hashing of the files.
+        """
+        self.Root = os.path.join(TEST_ROOT, 'test_fi')
+        self.Target = os.path.join(self.Root, 'target')
+        self.Source = os.path.join(self.Root, 'source')
+        for strFolder, dictFiles in [
+                            (self.Target, {'1.txt' : 'test', '2.txt' : 'abcd',
+                                        os.path.join('a', '3.txt') : 'xyzw'}),
+                            (self.Source, {'1.txt' : 'test', '4.txt' : 'tset',
+                                        os.path.join('b', '2.txt') : 'abcd'})]:
+            for strFile, strData in dictFiles.items():
+                strPath = os.path.join(strFolder, strFile)
+                TestModule.TouchFolder(os.path.dirname(strPath))
+                with open(strPath, 'wb') as fFile:
+                    fFile.write(strData)
+        self.countHashing()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        self.restoreHashing()
+        shutil.rmtree(self.Root)
+    
+    def test_FolderIndex(self):
+        """
+        The files within the folder are indexed under their relative paths and
+        hashed only once, unless changed; the files outside the folder are not
+        stored; the entries of the removed files can be discarded or pruned.
+
+        Test ID - TEST-T-5A0. Covers requirement REQ-FUN-5A0.
+        """
+        strIndexFile = os.path.join(self.Target, TestModule.INDEX_FILE_NAME)
+        strlstPaths = [os.path.join(self.Target, '1.txt'),
+                        os.path.join(self.Target, 'a', '3.txt'),
+                        os.path.join(self.Source, '4.txt')]
+        with TestModule.FolderIndex(self.Target) as objIndex:
+            for _ in range(2):
+                self.assertEqual(TestModule.GetCheckSum(strlstPaths[0],
+                                objIndex), hashlib.md5('test').hexdigest())
+                self.assertEqual(objIndex.getCheckSum(strlstPaths[1]),
+                                                hashlib.md5('xyzw').hexdigest())
+                self.assertEqual(objIndex.getCheckSum(strlstPaths[2]),
+                                                hashlib.md5('tset').hexdigest())
+            self.assertEqual(len(self.Calls), 3)
+            self.assertItemsEqual(objIndex.Entries.keys(), ['1.txt', 'a/3.txt'])
+        self.assertTrue(os.path.isfile(strIndexFile))
+        objIndex = TestModule.FolderIndex(self.Target)
+        self.assertItemsEqual(objIndex.Entries.keys(), ['1.txt', 'a/3.txt'])
+        for strPath in strlstPaths[:2]:
+            objIndex.getCheckSum(strPath)
+        self.assertEqual(len(self.Calls), 3)
+        with open(strlstPaths[0], 'ab') as fFile:
+            fFile.write('changed')
+        self.assertEqual(objIndex.getCheckSum(strlstPaths[0]),
+                                        hashlib.md5('testchanged').hexdigest())
+        self.assertEqual(len(self.Calls), 4)
+        objIndex.discard(strlstPaths[0])
+        objIndex.discard(strlstPaths[2])
+        self.assertItemsEqual(objIndex.Entries.keys(), ['a/3.txt'])
+        os.remove(strlstPaths[1])
+        objIndex.prune()
+        self.assertEqual(len(objIndex), 0)
+    
+    def test_NonAsciiNames(self):
+        """
+        The files with the names in UTF-8, Latin-1 or containing a backslash
+        are indexed under the same keys after the index is saved and re-loaded,
+        thus they are neither re-hashed nor duplicated; an index stored with
+        the unescaped UTF-8 keys is also read.
+
+        Test ID - TEST-T-5A0. Covers requirement REQ-FUN-5A0.
+        """
+        strIndexFile = os.path.join(self.Target, TestModule.INDEX_FILE_NAME)
+        strlstNames = ['caf\xc3\xa9.txt', 'lat\xe9.txt', 'back\\slash.txt']
+        for strName in strlstNames:
+            with open(os.path.join(self.Target, strName), 'wb') as fFile:
+                fFile.write(strName)
+        for _ in range(2):
+            with TestModule.FolderIndex(self.Target) as objIndex:
+                for strName in strlstNames:
+                    self.assertEqual(objIndex.getCheckSum(
+                                        os.path.join(self.Target, strName)),
+                                        hashlib.md5(strName).hexdigest())
+            self.assertEqual(len(self.Calls), 3)
+            objIndex = TestModule.FolderIndex(self.Target)
+            self.assertItemsEqual(objIndex.Entries.keys(), strlstNames)
+        with open(strIndexFile, 'wb') as fFile:
+            fFile.write('{"caf\xc3\xa9.txt" : [5, 1.5, "abc"]}')
+        objIndex = TestModule.FolderIndex(self.Target)
+        self.assertEqual(objIndex.Entries,
+                                    {'caf\xc3\xa9.txt' : [5, 1.5, 'abc']})
+    
+    def test_UnicodeRoots(self):
+        """
+        The files are indexed under the same byte string keys for the unicode
+        and byte string paths, also with a non-ASCII name (if supported by the
+        file system encoding), thus they are neither re-hashed nor duplicated
+        after re-loading; the files outside the folder are hashed by unicode
+        paths, and the functions accept the unicode roots with the index.
+
+        Test ID - TEST-T-5A0. Covers requirement REQ-FUN-5A0.
+        """
+        strEncoding = sys.getfilesystemencoding() or 'utf_8'
+        strName = u'caf\xe9.txt'
+        try:
+            strByteName = strName.encode(strEncoding)
+        except UnicodeError:
+            strName = u'plain.txt'
+            strByteName = strName.encode(strEncoding)
+        with open(os.path.join(self.Target, strByteName), 'wb') as fFile:
+            fFile.write('unicode')
+        strTarget = self.Target.decode(strEncoding)
+        strSource = self.Source.decode(strEncoding)
+        for _ in range(2):
+            with TestModule.FolderIndex(strTarget) as objIndex:
+                for strPath in [os.path.join(strTarget, strName),
+                                os.path.join(self.Target, strByteName)]:
+                    self.assertEqual(objIndex.getCheckSum(strPath),
+                                            hashlib.md5('unicode').hexdigest())
+                self.assertEqual(objIndex.getCheckSum(os.path.join(strSource,
+                                    u'4.txt')), hashlib.md5('tset').hexdigest())
+            objIndex = TestModule.FolderIndex(strTarget)
+            self.assertEqual(objIndex.Entries.keys(), [strByteName])
+            self.assertIs(type(objIndex.Entries.keys()[0]), str)
+        self.assertEqual(len(self.Calls), 3)
+        TestModule.CopyNonPresent(strTarget, strSource, bIndex = True)
+        TestModule.CopyMerge(strSource, strTarget, bIndex = True)
+        self.assertIn('4.txt', os.listdir(self.Target))
+        objIndex = TestModule.FolderIndex(self.Target)
+        self.assertIn(strByteName, objIndex.Entries)
+        for strKey in objIndex.Entries:
+            self.assertIs(type(strKey), str)
+    
+    def test_CopyNonPresent(self):
+        """
+        The repeated synchronization re-hashes only the new files, and the
+        index file is neither scanned nor copied.
+
+        Test ID - TEST-T-5A0. Covers requirement REQ-FUN-5A0.
+        """
+        strIndexFile = os.path.join(self.Target, TestModule.INDEX_FILE_NAME)
+        TestModule.CopyNonPresent(self.Target, self.Source, bStaged = False,
+                                                                bIndex = True)
+        self.assertEqual(len(self.Calls), 6)
+        self.assertTrue(os.path.isfile(strIndexFile))
+        self.assertItemsEqual(os.listdir(self.Target), ['1.txt', '2.txt', 'a',
+                                    '4.txt', TestModule.INDEX_FILE_NAME])
+        self.Calls = []
+        with open(os.path.join(self.Source, '5.txt'), 'wb') as fFile:
+            fFile.write('new')
+        TestModule.CopyNonPresent(self.Target, self.Source, bStaged = False,
+                                                                bIndex = True)
+        self.assertItemsEqual(self.Calls, [os.path.join('target', '4.txt'),
+                    os.path.join('source', '1.txt'),
+                    os.path.join('source', '4.txt'),
+                    os.path.join('source', '5.txt'),
+                    os.path.join('source', 'b', '2.txt')])
+        self.Calls = []
+        TestModule.CopyNonPresent(self.Target, self.Source, bStaged = False,
+                                                                bIndex = True)
+        self.assertListEqual([strPath for strPath in self.Calls
+                                            if strPath.startswith('target')],
+                                            [os.path.join('target', '5.txt')])
+        dictResult = TestModule.MakeFolderDictionary(self.Target)
+        self.assertNotIn(TestModule.INDEX_FILE_NAME, dictResult)
+    
+    def test_CopyMerge(self):
+        """
+        The index of the target folder is used and updated, and the index of
+        the source folder is not copied into the existing target folder. The
+        index remains valid after the folder is moved.
+
+        Test ID - TEST-T-5A0. Covers requirement REQ-FUN-5A0.
+        """
+        with TestModule.FolderIndex(self.Source) as objIndex:
+            objIndex.getCheckSum(os.path.join(self.Source, '1.txt'))
+        TestModule.CopyMerge(self.Source, self.Target, bIndex = True)
+        self.assertItemsEqual(os.listdir(self.Target), ['1.txt', '2.txt', 'a',
+                                'b', '4.txt', TestModule.INDEX_FILE_NAME])
+        objIndex = TestModule.FolderIndex(self.Target)
+        self.assertItemsEqual(objIndex.Entries.keys(), ['1.txt'])
+        strMoved = os.path.join(self.Root, 'moved')
+        os.rename(self.Source, strMoved)
+        objIndex = TestModule.FolderIndex(strMoved)
+        self.Calls = []
+        objIndex.getCheckSum(os.path.join(strMoved, '1.txt'))
+        self.assertEqual(len(self.Calls), 0)
+        os.rename(strMoved, self.Source)
+    
+    def test_RemoveDuplicateFiles(self):
+        """
+        The entries of the removed duplicates are discarded from the index.
+
+        Test ID - TEST-T-5A0. Covers requirement REQ-FUN-5A0.
+        """
+        with open(os.path.join(self.Target, 'a', '1.txt'), 'wb') as fFile:
+            fFile.write('test')
+        TestModule.RemoveDuplicateFiles(self.Target, [''], bStaged = False,
+                                                                bIndex = True)
+        self.assertFalse(os.path.isfile(os.path.join(self.Target, 'a',
+                                                                    '1.txt')))
+        objIndex = TestModule.FolderIndex(self.Target)
+        self.assertItemsEqual(objIndex.Entries.keys(), ['1.txt', '2.txt',
+                                                                    'a/3.txt'])
+
+class Test_StagedDetection(CountedHashing, unittest.TestCase):
+    """
+    Test cases for the staged duplicates detection in the functions
+    MakeFolderDictionary(), RemoveDuplicateFiles() and CopyNonPresent() from the
+    module fs_maintenance.
+    
+    Implements test ID TEST-T-531.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the test folder with files and
+        counts the full and partial hashing of the files.
+        """
+        self.Root = os.path.join(TEST_ROOT, 'test_sd')
+        strBase = 'x' * (3 * TestModule.PARTIAL_HASH_SIZE)
+        strMiddle = strBase[:len(strBase) // 2] + 'y' + strBase[
+                                                        len(strBase) // 2 + 1:]
+        self.Data = {'a' : {'1.txt' : 'test', '2.txt' : strBase,
+                            '3.txt' : strBase, '4.txt' : 'unique size'},
+                    'b' : {'1.txt' : 'test', '2.txt' : strMiddle,
+                            '3.txt' : strBase, '4.txt' : 'y' + strBase[1:]},
+                    'c' : {'1.txt' : 'tset', '5.txt' : 'x' * 100}}
+        for strFolder, dictFiles in self.Data.items():
+            TestModule.TouchFolder(os.path.join(self.Root, strFolder))
+            for strFile, strData in dictFiles.items():
+                with open(os.path.join(self.Root, strFolder, strFile),
+                                                            'wb') as fFile:
+                    fFile.write(strData)
+        self.countHashing()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        self.restoreHashing()
+        shutil.rmtree(self.Root)
+    
+    def test_MakeFolderDictionary(self):
+        """
+        Only the files with the same size and the same head and tail are hashed
+        entirely, and the files are grouped as in the default mode.
+
+        Test ID - TEST-T-531. Covers requirement REQ-FUN-531.
+        """
+        dictCheck = TestModule.MakeFolderDictionary(self.Root)
+        self.Calls = []
+        dictResult = TestModule.MakeFolderDictionary(self.Root, bStaged = True)
+        self.assertItemsEqual(self.Calls, [os.path.join('a', '1.txt'),
+                                os.path.join('b', '1.txt'),
+                                os.path.join('c', '1.txt'),
+                                os.path.join('a', '2.txt'),
+                                os.path.join('a', '3.txt'),
+                                os.path.join('b', '2.txt'),
+                                os.path.join('b', '3.txt')])
+        self.assertItemsEqual(self.PartialCalls, [os.path.join('a', '2.txt'),
+                                os.path.join('a', '3.txt'),
+                                os.path.join('b', '2.txt'),
+                                os.path.join('b', '3.txt'),
+                                os.path.join('b', '4.txt')])
+        self.assertItemsEqual(dictResult.keys(), dictCheck.keys())
+        for strFile, dictEntry in dictResult.items():
+            dictTemp = dictCheck[strFile]
+            self.assertItemsEqual(
+                        [sorted(lstItems) for lstItems in dictEntry.values()],
+                        [sorted(lstItems) for lstItems in dictTemp.values()])
+        strPath = os.path.join(self.Root, 'c', '5.txt')
+        self.assertEqual(dictResult['5.txt'].keys(), [strPath])
+    
+    def test_RemoveDuplicateFiles(self):
+        """
+        Only the duplicated files are removed, as in the default mode.
+
+        Test ID - TEST-T-531. Covers requirement REQ-FUN-531.
+        """
+        TestModule.RemoveDuplicateFiles(self.Root, ['b'])
+        for strFolder, dictFiles in self.Data.items():
+            for strFile in dictFiles:
+                bExists = os.path.isfile(os.path.join(self.Root, strFolder,
+                                                                    strFile))
+                bRemoved = strFolder == 'a' and strFile in ['1.txt', '3.txt']
+                self.assertEqual(bExists, not bRemoved)
+    
+    def test_CopyNonPresent(self):
+        """
+        Only the files not present in the target folder are copied, as in the
+        default mode.
+
+        Test ID - TEST-T-531. Covers requirement REQ-FUN-531.
+        """
+        strSource = os.path.join(self.Root, 'b')
+        strTarget = os.path.join(self.Root, 'a')
+        TestModule.CopyNonPresent(strTarget, strSource)
+        self.assertItemsEqual(os.listdir(strTarget), ['1.txt', '2.txt',
+                                '3.txt', '4.txt', '2_1.txt', '4_1.txt'])
+        for strFile, strCheck in [('2_1.txt', '2.txt'), ('4_1.txt', '4.txt')]:
+            with open(os.path.join(strTarget, strFile), 'rb') as fFile:
+                self.assertEqual(fFile.read(), self.Data['b'][strCheck])
+
+class Test_ParallelScanning(CountedHashing, unittest.TestCase):
+    """
+    Test cases for the parallel scanning and hashing in the functions
+    MakeFolderDictionary(), RemoveFilesCopies() and CopyMerge() from the module
+    fs_maintenance.
+    
+    Implements test ID TEST-T-532.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the test folders tree and
+        counts the actual hashing of the files.
+        """
+        self.Root = os.path.join(TEST_ROOT, 'test_ps')
+        for iIndex, strSubPath in enumerate(['', 'a', os.path.join('a', 'b'),
+                                    os.path.join('a', 'c'), 'd', 'e', 'f']):
+            strFolder = os.path.join(self.Root, 'source', strSubPath)
+            TestModule.TouchFolder(strFolder)
+            for strFile, strData in [('1.txt', 'test'), ('2.txt', 'test'),
+                                    ('3.txt', str(iIndex)), ('4.txt', 'x')]:
+                with open(os.path.join(strFolder, strFile), 'wb') as fFile:
+                    fFile.write(strData)
+        if hasattr(os, 'symlink'):
+            os.symlink(os.path.join(self.Root, 'source', 'a'),
+                                    os.path.join(self.Root, 'source', 'link'))
+        self.countHashing()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        self.restoreHashing()
+        shutil.rmtree(self.Root)
+    
+    def test_MakeFolderDictionary(self):
+        """
+        The result of the parallel processing is exactly the same as of the
+        sequential processing. Improper number of workers results in TypeError.
+
+        Test ID - TEST-T-532. Covers requirement REQ-FUN-532.
+        """
+        strSource = os.path.join(self.Root, 'source')
+        for bStaged in [False, True]:
+            dictCheck = TestModule.MakeFolderDictionary(strSource,
+                                                            bStaged = bStaged)
+            for iWorkers in [2, 3, 0, -1]:
+                dictResult = TestModule.MakeFolderDictionary(strSource,
+                                        bStaged = bStaged, iWorkers = iWorkers)
+                self.assertEqual(dictResult, dictCheck)
+        for gWorkers in [2.5, '2', False, [2], True, 1.0]:
+            with self.assertRaises(TypeError):
+                TestModule.MakeFolderDictionary(strSource, iWorkers = gWorkers)
+    
+    def test_RemoveFilesCopies(self):
+        """
+        The same files are removed as by the sequential processing.
+
+        Test ID - TEST-T-532. Covers requirement REQ-FUN-532.
+        """
+        strSource = os.path.join(self.Root, 'source')
+        TestModule.RemoveFilesCopies(strSource, iWorkers = 3)
+        for strPath, _, strlstFiles in os.walk(strSource):
+            self.assertItemsEqual(strlstFiles, ['1.txt', '3.txt', '4.txt'])
+    
+    def test_CopyMerge(self):
+        """
+        The folders are merged as by the sequential processing.
+
+        Test ID - TEST-T-532. Covers requirement REQ-FUN-532.
+        """
+        strSource = os.path.join(self.Root, 'source')
+        strTarget = os.path.join(self.Root, 'target')
+        strCheck = os.path.join(self.Root, 'check')
+        for strPath in [strTarget, strCheck]:
+            TestModule.TouchFolder(os.path.join(strPath, 'a'))
+            with open(os.path.join(strPath, 'a', '3.txt'), 'wb') as fFile:
+                fFile.write('1')
+            with open(os.path.join(strPath, 'a', '4.txt'), 'wb') as fFile:
+                fFile.write('y')
+        TestModule.CopyMerge(strSource, strCheck)
+        TestModule.CopyMerge(strSource, strTarget, iWorkers = 3)
+        tuplstCheck = []
+        tuplstResult = []
+        for strPath, tuplstItems in [(strCheck, tuplstCheck),
+                                                (strTarget, tuplstResult)]:
+            for strFolder, _, strlstFiles in os.walk(strPath):
+                for strFile in strlstFiles:
+                    strFullPath = os.path.join(strFolder, strFile)
+                    with open(strFullPath, 'rb') as fFile:
+                        tuplstItems.append((os.path.relpath(strFullPath,
+                                                    strPath), fFile.read()))
+        self.assertItemsEqual(tuplstResult, tuplstCheck)
+        self.assertIn((os.path.join('a', '4 (copy).txt'), 'x'), tuplstResult)
+        self.assertIn((os.path.join('a', '3.txt'), '1'), tuplstResult)
+    
+    def test_CopyMergeSizes(self):
+        """
+        Only the same named source and target files of the same size are
+        hashed in advance, the other ones are rejected by the size, as by the
+        sequential processing, and the result is the same.
+
+        Test ID - TEST-T-532. Covers requirement REQ-FUN-532.
+        """
+        strSource = os.path.join(self.Root, 'sizes')
+        for strFolder in [strSource, os.path.join(self.Root, 'target'),
+                                            os.path.join(self.Root, 'check')]:
+            TestModule.TouchFolder(strFolder)
+            for iIndex in range(10):
+                if strFolder == strSource:
+                    strData = 'x' * (iIndex + 1)
+                else:
+                    strData = 'y' * (iIndex + 2)
+                with open(os.path.join(strFolder, '{}.txt'.format(iIndex)),
+                                                                'wb') as fFile:
+                    fFile.write(strData)
+            with open(os.path.join(strFolder, 'same.txt'), 'wb') as fFile:
+                fFile.write(strFolder[-1])
+        TestModule.CopyMerge(strSource, os.path.join(self.Root, 'check'))
+        self.assertEqual(len(self.Calls), 0)
+        TestModule.CopyMerge(strSource, os.path.join(self.Root, 'target'),
+                                                                iWorkers = 3)
+        self.assertItemsEqual(self.Calls, [os.path.join('sizes', 'same.txt'),
+                                        os.path.join('target', 'same.txt')])
+        self.assertItemsEqual(os.listdir(os.path.join(self.Root, 'target')),
+                                os.listdir(os.path.join(self.Root, 'check')))
+
+class Test_TreeSnapshot(unittest.TestCase):
+    """
+    Test cases for the single traversal of the folders trees by the functions
+    RemoveEmptyFolders(), CopyMerge() and MakeFolderDictionary() from the
+    module fs_maintenance.
+    
+    Implements test ID TEST-T-521.
+    """
+    
+    def setUp(self):
+        """
+        Preparation for each test case - creates the test folders tree with
+        empty branches and counts the listing of the folders.
+        """
+        self.Root = os.path.join(TEST_ROOT, 'test_ts')
+        for strSubPath in [os.path.join('a', 'b', 'c'), os.path.join('a', 'd'),
+                                        os.path.join('x', 'y'), 'z', 'e']:
+            TestModule.TouchFolder(os.path.join(self.Root, 'target',
+                                                                strSubPath))
+        with open(os.path.join(self.Root, 'target', 'a', 'd', '1.txt'),
+                                                                'wb') as fFile:
+            fFile.write('test')
+        if hasattr(os, 'symlink'):
+            os.symlink(os.path.join(self.Root, 'target', 'a'),
+                                os.path.join(self.Root, 'target', 'z', 'link'))
+        else:
+            with open(os.path.join(self.Root, 'target', 'z', 'link'),
+                                                                'wb') as fFile:
+                fFile.write('link')
+        for strSubPath in [os.path.join('x', 'y'), os.path.join('w', 'v')]:
+            TestModule.TouchFolder(os.path.join(self.Root, 'source',
+                                                                strSubPath))
+        with open(os.path.join(self.Root, 'source', 'x', 'y', '2.txt'),
+                                                                'wb') as fFile:
+            fFile.write('test')
+        self.ListFolder = TestModule._ListFolder
+        self.Calls = []
+        def CountedListFolder(strPath):
+            self.Calls.append(os.path.relpath(strPath, self.Root))
+            return self.ListFolder(strPath)
+        TestModule._ListFolder = CountedListFolder
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case.
+        """
+        TestModule._ListFolder = self.ListFolder
+        shutil.rmtree(self.Root)
+    
+    def test_RemoveEmptyFolders(self):
+        """
+        Each folder is listed exactly once, and all dead branches are removed,
+        whereas the folders with files or links to folders remain.
+
+        Test ID - TEST-T-521. Covers requirement REQ-FUN-521.
+        """
+        strTarget = os.path.join(self.Root, 'target')
+        TestModule.RemoveEmptyFolders(strTarget)
+        self.assertItemsEqual(self.Calls, ['target',
+                    os.path.join('target', 'a'), os.path.join('target', 'x'),
+                    os.path.join('target', 'z'), os.path.join('target', 'e'),
+                    os.path.join('target', 'a', 'b'),
+                    os.path.join('target', 'a', 'd'),
+                    os.path.join('target', 'x', 'y'),
+                    os.path.join('target', 'a', 'b', 'c')])
+        self.assertItemsEqual(os.listdir(strTarget), ['a', 'z'])
+        self.assertItemsEqual(os.listdir(os.path.join(strTarget, 'a')), ['d'])
+        self.assertItemsEqual(os.listdir(os.path.join(strTarget, 'z')),
+                                                                    ['link'])
+    
+    def test_CopyMerge(self):
+        """
+        Each folder of the source and the target is listed exactly once. The
+        empty target folders receiving the copied files remain, other dead
+        branches are removed; the empty source folders are not copied.
+
+        Test ID - TEST-T-521. Covers requirement REQ-FUN-521.
+        """
+        strSource = os.path.join(self.Root, 'source')
+        strTarget = os.path.join(self.Root, 'target')
+        TestModule.CopyMerge(strSource, strTarget)
+        self.assertEqual(len(self.Calls), 14)
+        self.assertEqual(len(set(self.Calls)), 14)
+        self.assertItemsEqual(os.listdir(strTarget), ['a', 'x', 'z'])
+        self.assertItemsEqual(os.listdir(os.path.join(strTarget, 'x', 'y')),
+                                                                    ['2.txt'])
+    
+    def test_MakeFolderDictionary(self):
+        """
+        Each folder is listed exactly once, and the files' attributes are
+        taken from the listing.
+
+        Test ID - TEST-T-521. Covers requirement REQ-FUN-521.
+        """
+        strTarget = os.path.join(self.Root, 'target')
+        dictResult = TestModule.MakeFolderDictionary(strTarget, bStaged = True)
+        self.assertEqual(len(self.Calls), 9)
+        self.assertEqual(len(set(self.Calls)), 9)
+        self.assertItemsEqual(dictResult.keys(), ['1.txt'])
+        self.assertEqual(dictResult['1.txt'].values()[0][0][0],
+                                                        os.path.join('a', 'd'))
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_fs_maitenance)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_CheckSum)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_StagedDetection)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_ParallelScanning)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_TreeSnapshot)
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_FolderIndex)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_CopyFile)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                                        TestSuite5, TestSuite6, TestSuite7])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting fsio_lib.fs_maintenance module tests...\n")
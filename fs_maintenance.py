@@ -7,25 +7,41 @@ recursive removal of the duplicating files, recursive folder's renaming,
 recursive deletion of empty sub-folders, pulling of the non-present files from
 another folder, etc.
 
+Classes:
+    CheckSumCache
+    FolderIndex
+
 Functions:
-    SmartCopy(strSource, strTarget):
-        str, str -> None
+    GetCheckSum(strPath, objCache = None):
+        str/, CheckSumCache/ -> str
+    CopyFile(strSource, strTarget, bSync = False):
+        str, str/, bool/ -> int >= 0
+    CompareFiles(strFirst, strSecond, objCache = None):
+        str, str/, CheckSumCache/ -> bool
+    SmartCopy(strSource, strTarget, objCache = None):
+        str, str/, CheckSumCache/ -> None
     TouchFolder(strFolder):
         str -> None
     RemoveEmptyFolders(strFolder):
         str -> None
-    RenameSubFolders(strFolder, strNewName, lstPaterns = []):
-        str, str/, list(str)/ -> None
-    MakeFolderDictionary(strFolder):
-        str -> dict(str -> dict(str -> list(tuple(str, str))))
-    RemoveDuplicateFiles(strFolder, lstSearchOrder = []):
-        str/, list(str)/ -> None
-    RemoveFilesCopies(strFolder):
-        str -> None
-    CopyNonPresent(strTargetPath, strSourcePath):
-        str, str -> None
-    CopyMerge(strSource, strTarget):
-        str, str -> None
+    RenameSubFolders(strFolder, strNewName, lstPaterns = [],
+                                                            objCache = None):
+        str, str/, list(str), CheckSumCache/ -> None
+    MakeFolderDictionary(strFolder, objCache = None, bStaged = False,
+                                                            iWorkers = None):
+        str/, CheckSumCache, bool, int OR None/
+            -> dict(str -> dict(str -> list(tuple(str, str))))
+    RemoveDuplicateFiles(strFolder, lstSearchOrder = [], objCache = None,
+                            bStaged = True, iWorkers = None, bIndex = False):
+        str/, list(str), CheckSumCache, bool, int OR None, bool/ -> None
+    RemoveFilesCopies(strFolder, objCache = None, iWorkers = None):
+        str/, CheckSumCache, int OR None/ -> None
+    CopyNonPresent(strTargetPath, strSourcePath, objCache = None,
+                            bStaged = True, iWorkers = None, bIndex = False):
+        str, str/, CheckSumCache, bool, int OR None, bool/ -> None
+    CopyMerge(strSource, strTarget, objCache = None, iWorkers = None,
+                                                                bIndex = False):
+        str, str/, CheckSumCache, int OR None, bool/ -> None
 """
 
 __version__ = "1.0.0.0"
@@ -41,10 +57,644 @@ import os
 import datetime
 import hashlib
 import shutil
+import stat
+import json
+import functools
+import multiprocessing
+import multiprocessing.pool
+
+#globals
+
+HASH_CHUNK_SIZE = 1048576 #1 MiB
+
+PARTIAL_HASH_SIZE = 4096 #size of the head and tail of a file to hash first
+
+COPY_CHUNK_SIZE = 8388608 #8 MiB per a system call or a read / write pair
+
+INDEX_FILE_NAME = '.fs_maintenance_index.json' #folder index in the root
+
+#classes
+
+class CheckSumCache(object):
+    """
+    Persistent cache of the md5 check sums of the files. Each check sum is
+    stored under a key constructed from the device number, the inode number,
+    the size and the last modification time of a file, therefore a file is re-
+    hashed only if it is changed (or replaced), and it is not re-hashed after
+    being moved or renamed within the same device. On the systems not
+    supporting the inode numbers (e.g. MS Windows) the absolute path to a file
+    is used in the key instead.
+    
+    The cache is stored on the disk as a JSON file, which is loaded upon
+    instantiation (if exists) and re-written by the method save() only if new
+    entries have been added. The keys are stored escaped into ASCII, thus the
+    paths in any encoding are preserved byte by byte. The method getCheckSum()
+    can be called from several threads concurrently. The instance can be used
+    as a context manager, which saves the cache upon exit from the context.
+    
+    Attributes:
+        CacheFile: str OR None, path to the file storing the cache, None for the
+            in-memory only cache
+        Entries: dict(str -> str), the cached check sums under the files' keys
+    
+    Methods:
+        getCheckSum(strPath):
+            str -> str
+        load():
+            None -> None
+        save():
+            None -> None
+    
+    Version 0.1.0.0
+    """
+    
+    def __init__(self, strCacheFile = None):
+        """
+        Initialization. Loads the stored cache if the file exists.
+        
+        Signature:
+            /str OR None/ -> None
+        
+        Args:
+            strCacheFile: (optional) str OR None, path to the file storing the
+                cache, defaults to None - the cache is kept only in memory
+        
+        Raises:
+            ValueError: the existing cache file is not a valid JSON file
+        
+        Version 0.1.0.0
+        """
+        self.CacheFile = strCacheFile
+        self.Entries = dict()
+        self._bModified = False
+        if not (strCacheFile is None) and os.path.isfile(strCacheFile):
+            self.load()
+    
+    def __enter__(self):
+        """
+        Entering the context - returns the instance itself.
+        
+        Signature:
+            None -> CheckSumCache
+        
+        Version 0.1.0.0
+        """
+        return self
+    
+    def __exit__(self, clsErr, objErr, objTraceback):
+        """
+        Exiting the context - saves the cache. The exceptions are not
+        suppressed.
+        
+        Signature:
+            type A, A, traceback -> None
+        
+        Version 0.1.0.0
+        """
+        self.save()
+    
+    def __len__(self):
+        """
+        Returns the number of the cached check sums.
+        
+        Signature:
+            None -> int >= 0
+        
+        Version 0.1.0.0
+        """
+        return len(self.Entries)
+    
+    def getCheckSum(self, strPath):
+        """
+        Returns the md5 check sum of a file, which is calculated only if it is
+        not yet in the cache for the current size and last modification time of
+        the file.
+        
+        Signature:
+            str -> str
+        
+        Args:
+            strPath: str, path to a file
+        
+        Returns:
+            str: the hexadecimal md5 check sum of the file's content
+        
+        Raises:
+            IOError, OSError: the file does not exist or is not accessible
+        
+        Version 0.1.0.0
+        """
+        objStat = os.stat(strPath)
+        if objStat.st_ino:
+            strKey = '{}:{}:{}:{!r}'.format(objStat.st_dev, objStat.st_ino,
+                                        objStat.st_size, objStat.st_mtime)
+        else:
+            strKey = '{}:{}:{!r}'.format(os.path.abspath(_EncodePath(strPath)),
+                                        objStat.st_size, objStat.st_mtime)
+        strCheckSum = self.Entries.get(strKey, None)
+        if strCheckSum is None:
+            strCheckSum = _HashFile(strPath)
+            self.Entries[strKey] = strCheckSum
+            self._bModified = True
+        return strCheckSum
+    
+    def load(self):
+        """
+        (Re-) loads the cache from the file, replacing the current entries.
+        Does nothing for the in-memory only cache.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            IOError, OSError: the cache file does not exist or is not accessible
+            ValueError: the cache file is not a valid JSON file
+        
+        Version 0.1.0.0
+        """
+        if not (self.CacheFile is None):
+            with open(self.CacheFile, 'rb') as fFile:
+                dictEntries = json.load(fFile)
+            self.Entries = dict((_DecodeKey(strKey), gValue)
+                                for strKey, gValue in dictEntries.items())
+            self._bModified = False
+    
+    def save(self):
+        """
+        Saves the cache into the file if new entries have been added since the
+        last loading or saving. The data is written into a temporary file first,
+        which then replaces the cache file, thus an interrupted saving does not
+        corrupt the already stored cache. Does nothing for the in-memory only
+        cache.
+        
+        Signature:
+            None -> None
+        
+        Raises:
+            IOError, OSError: the cache file is not accessible
+        
+        Version 0.1.0.0
+        """
+        if not (self.CacheFile is None) and self._bModified:
+            strTemp = '{}.tmp'.format(self.CacheFile)
+            dictEntries = dict((_EncodeKey(strKey), gValue)
+                                for strKey, gValue in self.Entries.items())
+            with open(strTemp, 'wb') as fFile:
+                json.dump(dictEntries, fFile)
+            if os.name == 'nt' and os.path.isfile(self.CacheFile):
+                os.remove(self.CacheFile)
+            os.rename(strTemp, self.CacheFile)
+            self._bModified = False
+
+class FolderIndex(CheckSumCache):
+    """
+    Persistent index of the files within a folder, stored as the JSON file
+    INDEX_FILE_NAME in the root of the folder. For each file within the folder
+    or any of its sub-folders the sub-path relative to the root (with '/' as
+    the separator), the size, the last modification time and the md5 check sum
+    are stored, thus a file is re-hashed only if it is changed or replaced.
+    Unlike the base class the index does not depend on the device and inode
+    numbers, therefore it remains valid after the entire folder is renamed or
+    moved, and the entries of the removed files can be discarded.
+    
+    The check sums of the files outside the indexed folder are cached only in
+    memory and are not stored. The index file itself is ignored by all
+    functions of this module scanning the folders.
+    
+    Attributes:
+        Root: str, absolute path to the indexed folder (a byte string, also for
+            a unicode path)
+        CacheFile: str, path to the index file
+        Entries: dict(str -> list(int, float, str)), the indexed files as sub-
+            path -> [size, last modification time, md5 check sum]
+    
+    Methods:
+        getCheckSum(strPath):
+            str -> str
+        discard(strPath):
+            str -> None
+        prune():
+            None -> None
+        load():
+            None -> None
+        save():
+            None -> None
+    
+    Version 0.1.0.0
+    """
+    
+    def __init__(self, strFolder):
+        """
+        Initialization. Loads the stored index if the file exists in the root
+        of the folder.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strFolder: str, path to the indexed folder
+        
+        Raises:
+            ValueError: the existing index file is not a valid JSON file
+        
+        Version 0.1.0.0
+        """
+        self.Root = os.path.abspath(_EncodePath(strFolder))
+        self._dictExternal = dict()
+        super(FolderIndex, self).__init__(os.path.join(self.Root,
+                                                            INDEX_FILE_NAME))
+    
+    def getCheckSum(self, strPath):
+        """
+        Returns the md5 check sum of a file, which is calculated only if it is
+        not yet indexed with the current size and last modification time of
+        the file.
+        
+        Signature:
+            str -> str
+        
+        Args:
+            strPath: str, path to a file
+        
+        Returns:
+            str: the hexadecimal md5 check sum of the file's content
+        
+        Raises:
+            IOError, OSError: the file does not exist or is not accessible
+        
+        Version 0.1.0.0
+        """
+        objStat = os.stat(strPath)
+        strKey = self._getKey(strPath)
+        if strKey is None:
+            strKey = '{}:{}:{!r}'.format(os.path.abspath(_EncodePath(strPath)),
+                                        objStat.st_size, objStat.st_mtime)
+            strCheckSum = self._dictExternal.get(strKey, None)
+            if strCheckSum is None:
+                strCheckSum = _HashFile(strPath)
+                self._dictExternal[strKey] = strCheckSum
+        else:
+            lstEntry = self.Entries.get(strKey, None)
+            if (lstEntry is None or lstEntry[0] != objStat.st_size
+                                        or lstEntry[1] != objStat.st_mtime):
+                strCheckSum = _HashFile(strPath)
+                self.Entries[strKey] = [objStat.st_size, objStat.st_mtime,
+                                                                strCheckSum]
+                self._bModified = True
+            else:
+                strCheckSum = lstEntry[2]
+        return strCheckSum
+    
+    def discard(self, strPath):
+        """
+        Removes the entry of a file (e.g. deleted) from the index. Does nothing
+        if the file is not indexed or it is outside the indexed folder.
+        
+        Signature:
+            str -> None
+        
+        Args:
+            strPath: str, path to a file
+        
+        Version 0.1.0.0
+        """
+        strKey = self._getKey(strPath)
+        if not (strKey is None) and (strKey in self.Entries):
+            del self.Entries[strKey]
+            self._bModified = True
+    
+    def prune(self):
+        """
+        Removes the entries of all files, which no longer exist, from the
+        index.
+        
+        Signature:
+            None -> None
+        
+        Version 0.1.0.0
+        """
+        for strKey in list(self.Entries.keys()):
+            strPath = os.path.join(self.Root, *strKey.split('/'))
+            if not os.path.isfile(strPath):
+                del self.Entries[strKey]
+                self._bModified = True
+    
+    def _getKey(self, strPath):
+        """
+        Returns the key of a file within the indexed folder - the sub-path
+        relative to the root with '/' as the separator, always as a byte
+        string, see _EncodePath().
+        
+        Signature:
+            str OR unicode -> str OR None
+        
+        Args:
+            strPath: str, path to a file
+        
+        Returns:
+            str: the key of the file
+            None: the file is outside the indexed folder
+        
+        Version 0.1.0.0
+        """
+        strFullPath = os.path.abspath(_EncodePath(strPath))
+        strPrefix = os.path.join(self.Root, '')
+        if strFullPath.startswith(strPrefix):
+            strKey = strFullPath[len(strPrefix):].replace(os.sep, '/')
+        else:
+            strKey = None
+        return strKey
+
+#+ 'private' helper classes
+
+class _TreeSnapshot(object):
+    """
+    Helper class - a snapshot of a folders tree made by a single traversal.
+    Each folder is listed only once, and the attributes of each entry are read
+    only once, see _ListFolder(), thus the found files' sizes and the last
+    modification date-time stamps are cached and shared by the scanning, the
+    merging and the removal of the empty sub-folders. With a pool of worker
+    threads passed the folders of the same nesting level are listed in
+    parallel. The folders are iterated in the same order as by os.walk().
+    
+    Attributes:
+        Root: str, path to the top folder of the tree
+        Folders: dict(str -> tuple(list(str), list(tuple(str, int, str)),
+            bool)), mapping of the sub-paths of the folders ('' for the top
+            folder) to the sub-paths of their sub-folders, the files as tuples
+            (base filename, size, date-time stamp) and the flag if the folder
+            has any other content (symbolic links to folders) or cannot be
+            listed
+    
+    Methods:
+        getPath(strSubPath):
+            str -> str
+        iterFolders():
+            None -> iterator(str)
+        getFiles():
+            None -> list(tuple(str, str, str, int, str))
+        getEmptyFolders():
+            None -> list(str)
+        addFile(strSubPath, strFile, iSize, strDateTime):
+            str, str, int, str -> None
+    
+    Version 0.1.0.0
+    """
+    
+    def __init__(self, strFolder, objPool = None):
+        """
+        Initialization. Traverses the folders tree breadth first, one nesting
+        level at a time.
+        
+        Signature:
+            str/, multiprocessing.pool.ThreadPool OR None/ -> None
+        
+        Args:
+            strFolder: str, path to the top folder of the tree
+            objPool: (optional) multiprocessing.pool.ThreadPool OR None, pool of
+                the worker threads to use, defaults to None - sequential
+                listing
+        
+        Raises:
+            OSError: the attributes of a file cannot be read
+        
+        Version 0.1.0.0
+        """
+        self.Root = strFolder
+        self.Folders = dict()
+        strlstLevel = ['']
+        while len(strlstLevel):
+            strlstPaths = [self.getPath(strSubPath)
+                                                for strSubPath in strlstLevel]
+            if objPool is None:
+                lstListings = map(_ListFolder, strlstPaths)
+            else:
+                lstListings = objPool.map(_ListFolder, strlstPaths)
+            strlstNext = []
+            for strSubPath, tupListing in zip(strlstLevel, lstListings):
+                strlstFolders = [os.path.join(strSubPath, strName)
+                                                for strName in tupListing[0]]
+                self.Folders[strSubPath] = (strlstFolders, tupListing[1],
+                                                                tupListing[2])
+                strlstNext.extend(strlstFolders)
+            strlstLevel = strlstNext
+    
+    def getPath(self, strSubPath):
+        """
+        Returns the path to a folder of the tree.
+        
+        Signature:
+            str -> str
+        
+        Args:
+            strSubPath: str, sub-path of the folder, '' for the top folder
+        
+        Returns:
+            str: the path to the folder
+        
+        Version 0.1.0.0
+        """
+        if len(strSubPath):
+            strPath = os.path.join(self.Root, strSubPath)
+        else:
+            strPath = self.Root
+        return strPath
+    
+    def iterFolders(self):
+        """
+        Generator - iterates over the sub-paths of all folders in the tree
+        depth first, i.e. in the same order as os.walk() with the default
+        top-down traversal, starting with the top folder ('').
+        
+        Signature:
+            None -> iterator(str)
+        
+        Version 0.1.0.0
+        """
+        strlstStack = ['']
+        while len(strlstStack):
+            strSubPath = strlstStack.pop()
+            yield strSubPath
+            strlstStack.extend(reversed(self.Folders[strSubPath][0]))
+    
+    def getFiles(self):
+        """
+        Returns all found files in the tree in the same order as by os.walk().
+        
+        Signature:
+            None -> list(tuple(str, str, str, int, str))
+        
+        Returns:
+            list(tuple(str, str, str, int, str)): list of the found files as
+                tuples (base filename, sub-path, full path, size, date-time
+                stamp)
+        
+        Version 0.1.0.0
+        """
+        tuplstResult = []
+        for strSubPath in self.iterFolders():
+            strPath = self.getPath(strSubPath)
+            for strFile, iSize, strDateTime in self.Folders[strSubPath][1]:
+                tuplstResult.append((strFile, strSubPath,
+                        os.path.join(strPath, strFile), iSize, strDateTime))
+        return tuplstResult
+    
+    def getEmptyFolders(self):
+        """
+        Returns the sub-paths of all empty sub-folders, i.e. those which do not
+        contain files (or any other entries) as the end-nodes of themselves or
+        any of their sub-sub-folders. Each sub-folder is listed before its
+        parent folder, thus they can be removed in this order. The top folder is
+        never included.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 0.1.0.0
+        """
+        strlstResult = []
+        dictContent = dict()
+        for strSubPath in reversed(list(self.iterFolders())):
+            strlstFolders, tuplstFiles, bOther = self.Folders[strSubPath]
+            bContent = (bOther or len(tuplstFiles) > 0 or
+                    any(dictContent[strFolder] for strFolder in strlstFolders))
+            dictContent[strSubPath] = bContent
+            if not bContent and len(strSubPath):
+                strlstResult.append(strSubPath)
+        return strlstResult
+    
+    def addFile(self, strSubPath, strFile, iSize, strDateTime):
+        """
+        Registers a file added to the tree after the snapshot is made, e.g. by
+        copying, adding the missing folders along its sub-path.
+        
+        Signature:
+            str, str, int, str -> None
+        
+        Args:
+            strSubPath: str, sub-path of the folder containing the file
+            strFile: str, base filename of the file
+            iSize: int, size of the file in bytes
+            strDateTime: str, the last modification date-time stamp of the file
+        
+        Version 0.1.0.0
+        """
+        strlstMissing = []
+        strPath = strSubPath
+        while not (strPath in self.Folders):
+            strlstMissing.append(strPath)
+            strPath = os.path.dirname(strPath)
+        for strPath in reversed(strlstMissing):
+            self.Folders[os.path.dirname(strPath)][0].append(strPath)
+            self.Folders[strPath] = ([], [], False)
+        self.Folders[strSubPath][1].append((strFile, iSize, strDateTime))
 
 #functions
 
-def SmartCopy(strSource, strTarget):
+def GetCheckSum(strPath, objCache = None):
+    """
+    Calculates the md5 check sum of a file reading it in the binary mode in the
+    chunks of HASH_CHUNK_SIZE bytes, thus the file is never loaded into memory
+    entirely. If the check sums cache is passed, it is used instead.
+    
+    Signature:
+        str/, CheckSumCache/ -> str
+    
+    Args:
+        strPath: str, path to a file
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sum is always calculated
+    
+    Returns:
+        str: the hexadecimal md5 check sum of the file's content
+    
+    Raises:
+        IOError, OSError: the file does not exist or is not accessible
+    
+    Version 0.1.0.0
+    """
+    if objCache is None:
+        strCheckSum = _HashFile(strPath)
+    else:
+        strCheckSum = objCache.getCheckSum(strPath)
+    return strCheckSum
+
+def CopyFile(strSource, strTarget, bSync = False):
+    """
+    Copies a file together with its metadata (permissions, modification and
+    access time stamps) - same as the function shutil.copy2(), but the content
+    is transferred within the kernel using the system call copy_file_range() or
+    sendfile() if available, without passing the data through the user space.
+    If neither is available or supported by the file system, the content is
+    copied in the chunks of COPY_CHUNK_SIZE bytes. The existing target file is
+    overwritten. Optionally, the content of the new file is flushed onto the
+    storage device before the function returns.
+    
+    Signature:
+        str, str/, bool/ -> int >= 0
+    
+    Args:
+        strSource: str, path to a file to be copied
+        strTarget: str, path to the new file or to a folder, where to copy the
+            file with the same base filename
+        bSync: (optional) bool, if True the new file is synchronized with the
+            storage device by os.fsync(); defaults to False
+    
+    Returns:
+        int >= 0: the number of the copied bytes
+    
+    Raises:
+        shutil.Error: the source and the target are the same file
+        IOError, OSError: the file does not exist or is not accessible, or the
+            target is not writable
+    
+    Version 0.1.0.0
+    """
+    if os.path.isdir(strTarget):
+        strTarget = os.path.join(strTarget, os.path.basename(strSource))
+    if os.path.isfile(strTarget) and _IsSameFile(strSource, strTarget):
+        raise shutil.Error('{} and {} are the same file'.format(strSource,
+                                                                    strTarget))
+    iSize = _CopyFileData(strSource, strTarget, bSync)
+    shutil.copystat(strSource, strTarget)
+    return iSize
+
+def CompareFiles(strFirst, strSecond, objCache = None):
+    """
+    Checks if two files have the same content. The files of different sizes
+    are different. Otherwise, if the check sums cache is passed, the cached (or
+    calculated and cached) md5 check sums are compared; without the cache the
+    files are compared byte by byte in the chunks of HASH_CHUNK_SIZE bytes until
+    the first difference, thus each file is read at most once and usually only
+    partially.
+    
+    Signature:
+        str, str/, CheckSumCache/ -> bool
+    
+    Args:
+        strFirst: str, path to a file
+        strSecond: str, path to another file
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the content is compared directly
+    
+    Returns:
+        bool: True if the files have the same content, False otherwise
+    
+    Raises:
+        IOError, OSError: any of the files does not exist or is not accessible
+    
+    Version 0.1.0.0
+    """
+    if os.path.getsize(strFirst) != os.path.getsize(strSecond):
+        bResult = False
+    elif objCache is None:
+        bResult = _CompareFileData(strFirst, strSecond)
+    else:
+        bResult = (objCache.getCheckSum(strFirst) ==
+                                            objCache.getCheckSum(strSecond))
+    return bResult
+
+def SmartCopy(strSource, strTarget, objCache = None):
     """
     Copies a specified file into a specified directory, unless there is already
     a file in the target folder with the same md5 check sum and base filename is
@@ -56,12 +706,18 @@ def SmartCopy(strSource, strTarget):
     suffix just before the file's extention, where {num} is replaced by a
     positive integer (1, 2, 3, etc.).
     
+    The files are compared by the function CompareFiles() - by the sizes first,
+    and then by the cached check sums or the content, and copied by the function
+    CopyFile().
+    
     Signature:
-        str, str -> None
+        str, str/, CheckSumCache/ -> None
     
     Args:
         strSource: str, full path to a file to be copied
         strTarget: str, path to a folder, where to copy
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
     
     Version 0.1.0.0
     """
@@ -70,13 +726,9 @@ def SmartCopy(strSource, strTarget):
     strBaseName = os.path.basename(strSource)
     strNewPath = os.path.join(strTarget, strBaseName)
     if not os.path.isfile(strNewPath):
-        shutil.copy2(strSource, strTarget)
+        CopyFile(strSource, strNewPath)
     else:
-        with open(strSource, 'r') as fFile:
-            OldSum = hashlib.md5(fFile.read()).hexdigest()
-        with open(strNewPath, 'r') as fFile:
-            NewSum = hashlib.md5(fFile.read()).hexdigest()
-        if OldSum != NewSum:
+        if not CompareFiles(strSource, strNewPath, objCache):
             iNumber = 1
             lstParts = strBaseName.split('.')
             if len(lstParts) == 1:
@@ -89,13 +741,10 @@ def SmartCopy(strSource, strTarget):
                                                         strMainName, strExt))
             while True:
                 if not os.path.isfile(strNewTarget):
-                    shutil.copy2(strSource, strNewTarget)
+                    CopyFile(strSource, strNewTarget)
+                    break
+                elif CompareFiles(strSource, strNewTarget, objCache):
                     break
-                else:
-                    with open(strNewTarget, 'r') as fFile:
-                        NewSum = hashlib.md5(fFile.read()).hexdigest()
-                    if OldSum == NewSum:
-                        break
                 strNewTarget = os.path.join(strTarget, '{} (copy {}){}'.format(
                                                 strMainName, iNumber, strExt))
                 iNumber += 1
@@ -122,6 +771,9 @@ def RemoveEmptyFolders(strFolder):
     those which do not contain files as the end-nodes of themselves or any of
     their sub-sub-folders.
     
+    The folder is traversed only once, see _TreeSnapshot, and the empty sub-
+    folders are removed bottom-up without re-listing their parent folders.
+    
     Signature:
         str -> None
     
@@ -130,25 +782,9 @@ def RemoveEmptyFolders(strFolder):
     
     Version 0.1.0.0
     """
-    lstPaths = []
-    for strPath, strlstFolders, strlstFiles in os.walk(strFolder):
-        bCond1 = strPath != strFolder
-        bCond2 = not len(strlstFolders)
-        bCond3 = not len(strlstFiles)
-        if bCond1 and bCond2 and bCond3:
-            lstPaths.append(strPath)
-    for strPath in lstPaths:
-        if os.path.isdir(strPath):
-            os.rmdir(strPath)
-            strParent = os.path.dirname(strPath)
-            while len(strParent) > len(strFolder):
-                if not len(os.listdir(strParent)):
-                    os.rmdir(strParent)
-                    strParent = os.path.dirname(strParent)
-                else:
-                    break
+    _RemoveEmptyFolders(_TreeSnapshot(strFolder))
 
-def RenameSubFolders(strFolder, strNewName, lstPaterns = []):
+def RenameSubFolders(strFolder, strNewName, lstPaterns = [], objCache = None):
     """
     Recursively renames all sub-folders matching the provided simple match
     patterns. The following rules are applied:
@@ -166,19 +802,23 @@ def RenameSubFolders(strFolder, strNewName, lstPaterns = []):
             names and md5 check sums
     
     Signature:
-        str, str/, list(str)/ -> None
+        str, str/, list(str), CheckSumCache/ -> None
     
     Args:
         strFolder: str, path to a folder to analyze
         strNewName: str, the replacement name for the sub-folders
         lstPaterns: list(str), list of simple match patterns, names of the
             sub-folders, which base names must be replaced
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
     
     Version 0.1.0.0
     """
     lstCandidates = [strItem.lower() for strItem in lstPaterns]
-    lstPaths = list(sorted([strPath for strPath, _, _ in os.walk(strFolder)
-                            if strPath != strFolder],
+    objSnapshot = _TreeSnapshot(strFolder)
+    lstPaths = list(sorted([objSnapshot.getPath(strSubPath)
+                            for strSubPath in objSnapshot.iterFolders()
+                                                            if len(strSubPath)],
                             key = lambda Entry: len(Entry), reverse = True))
     for strPath in lstPaths:
         if os.path.isdir(strPath):
@@ -200,11 +840,12 @@ def RenameSubFolders(strFolder, strNewName, lstPaterns = []):
                             strNewFolder = strNewPath
                         for strFile in lstFiles:
                             strFullPath = os.path.join(strOldPath, strFile)
-                            SmartCopy(strFullPath, strNewFolder)
+                            SmartCopy(strFullPath, strNewFolder, objCache)
                             os.remove(strFullPath)
     RemoveEmptyFolders(strFolder)
 
-def MakeFolderDictionary(strFolder):
+def MakeFolderDictionary(strFolder, objCache = None, bStaged = False,
+                                                            iWorkers = None):
     """
     Constructs a look-up table, as in a glossary, listing all found files in a
     folder including all its sub-folders. The files are grouped by their base
@@ -213,42 +854,56 @@ def MakeFolderDictionary(strFolder):
     check sum the sub-path within the top folder and the last file's
     modification date-time stamp are stored.
     
+    In the staged mode the md5 check sum is calculated only for the files,
+    which may have duplicates, see _GetContentKeys(). Each file with unique
+    content is sub-grouped under its full path instead of the check sum. Thus
+    the files are grouped exactly as in the default mode, but the unique files
+    are not read entirely or even not read at all.
+    
+    With the optional argument iWorkers being an integer other than 1 the
+    folders are listed, the files' attributes are read and the files are hashed
+    by a pool of worker threads, thus the I/O operations overlap. The result is
+    exactly the same as of the sequential processing, including the order of
+    the entries.
+    
     Signature:
-        str -> dict(str -> dict(str -> list(tuple(str, str))))
+        str/, CheckSumCache, bool, int OR None/
+            -> dict(str -> dict(str -> list(tuple(str, str))))
     
     Args:
         strFolder: str, path to a folder to analyze
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
+        bStaged: (optional) bool, flag if the staged duplicates detection is to
+            be used, defaults to False
+        iWorkers: (optional) int OR None, number of the worker threads for the
+            parallel scanning and hashing; None or 1 - sequential processing,
+            zero or negative - one per CPU; defaults to None
     
     Returns:
         dict(str -> list(dict(str -> str))): a dictionary implementing the
-            following mapping: base filename -> md5 check sum -> [(sub-path,
-            date-time stamp), ...]
+            following mapping: base filename -> md5 check sum (or full path in
+            the staged mode) -> [(sub-path, date-time stamp), ...]
+    
+    Raises:
+        TypeError: the number of workers is not an integer or None
     
     Version 0.1.0.0
     """
-    iLength = len(strFolder)
-    dictResult = dict()
-    for strPath, _, strlstFiles in os.walk(strFolder):
-        if len(strPath) == iLength:
-            strSubPath = ''
+    objPool = _GetPool(iWorkers)
+    try:
+        tuplstFiles = _TreeSnapshot(strFolder, objPool).getFiles()
+        if bStaged:
+            dictKeys = _GetContentKeys(tuplstFiles, objCache, objPool)
         else:
-            strSubPath = strPath[iLength + 1:]
-        for strFile in strlstFiles :
-            iTimeStamp = os.stat(os.path.join(strPath, strFile)).st_mtime
-            strDateTime = datetime.datetime.fromtimestamp(iTimeStamp).strftime(
-                                                            '%Y-%m-%d %H:%M:%S')
-            dictTemp = dictResult.get(strFile, dict())
-            strFullPath = os.path.join(strPath, strFile)
-            with open(strFullPath, 'r') as fFile:
-                strData = fFile.read()
-                strCheckSum = hashlib.md5(strData).hexdigest()
-            lstValue = dictTemp.get(strCheckSum, list())
-            lstValue.append((strSubPath, strDateTime))
-            dictTemp[strCheckSum] = lstValue
-            dictResult[strFile] = dictTemp
-    return dictResult
+            dictKeys = _HashFiles([tupEntry[2] for tupEntry in tuplstFiles],
+                                                            objCache, objPool)
+    finally:
+        _ClosePool(objPool)
+    return _MakeDictionary(tuplstFiles, dictKeys)
 
-def RemoveDuplicateFiles(strFolder, lstSearchOrder = []):
+def RemoveDuplicateFiles(strFolder, lstSearchOrder = [], objCache = None,
+                            bStaged = True, iWorkers = None, bIndex = False):
     """
     Removes the fully duplicated files, i.e. those with the identical base
     filenames and md5 check sums (content) but placed into different subfolders,
@@ -262,18 +917,42 @@ def RemoveDuplicateFiles(strFolder, lstSearchOrder = []):
         * If several copies with the latest date-time stamp exist - the shortest
             sub-path is chosen
     
+    The duplicates are found using the staged detection by default, see
+    MakeFolderDictionary(), which gives the same result. The folder can be
+    scanned and the files hashed in parallel, see MakeFolderDictionary().
+    
+    With the optional flag bIndex set and no cache passed the persistent index
+    of the folder is used (see FolderIndex) and saved afterwards; the entries
+    of the removed files are discarded from the index used as the cache.
+    
     Signature:
-        str/, list(str)/ -> None
+        str/, list(str), CheckSumCache, bool, int OR None, bool/ -> None
     
     Args:
         strFolder: str, path to a folder to analyze
         lstSearchOrder: (optional) list(str), list of sub-paths within this
             folder in the order of preference, where the copy of a duplicated
             file should remain; defaults to an empty list
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
+        bStaged: (optional) bool, flag if the staged duplicates detection is to
+            be used, defaults to True
+        iWorkers: (optional) int OR None, number of the worker threads for the
+            parallel scanning and hashing; None or 1 - sequential processing,
+            zero or negative - one per CPU; defaults to None
+        bIndex: (optional) bool, flag if the persistent index of the analyzed
+            folder is to be used when no cache is passed, defaults to False
+    
+    Raises:
+        TypeError: the number of workers is not an integer or None
     
     Version 0.1.0.0
     """
-    dictTree = MakeFolderDictionary(strFolder)
+    objIndex = None
+    if bIndex and (objCache is None):
+        objIndex = FolderIndex(strFolder)
+        objCache = objIndex
+    dictTree = MakeFolderDictionary(strFolder, objCache, bStaged, iWorkers)
     for strBaseName, dictIssues in dictTree.items():
         for _, lstCopies in dictIssues.items():
             if len(lstCopies) > 1: #duplicated files
@@ -293,39 +972,60 @@ def RemoveDuplicateFiles(strFolder, lstSearchOrder = []):
                         strFullPath = os.path.join(strFolder, strSubPath,
                                                                     strBaseName)
                         os.remove(strFullPath)
+                        if isinstance(objCache, FolderIndex):
+                            objCache.discard(strFullPath)
+    if not (objIndex is None):
+        objIndex.save()
 
-def RemoveFilesCopies(strFolder):
+def RemoveFilesCopies(strFolder, objCache = None, iWorkers = None):
     """
     Removes copies of the same file (same md5 check sum but different base
     filenames) situated in the same sub-folder. The copy with the shortest base
     filename is selected to remain, other copies are deleted. This process is
     recursively applied to all sub-folders within the specified path.
     
+    The folder can be scanned and the files hashed in parallel, see
+    MakeFolderDictionary().
+    
     Signature:
-        str -> None
+        str/, CheckSumCache, int OR None/ -> None
     
     Args:
         strFolder: str, path to a folder to analyze
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
+        iWorkers: (optional) int OR None, number of the worker threads for the
+            parallel scanning and hashing; None or 1 - sequential processing,
+            zero or negative - one per CPU; defaults to None
+    
+    Raises:
+        TypeError: the number of workers is not an integer or None
     
     Version 0.1.0.0
     """
+    objPool = _GetPool(iWorkers)
+    try:
+        tuplstFiles = _TreeSnapshot(strFolder, objPool).getFiles()
+        dictKeys = _HashFiles([tupEntry[2] for tupEntry in tuplstFiles],
+                                                            objCache, objPool)
+    finally:
+        _ClosePool(objPool)
+    dictFolders = dict()
+    for _, strSubPath, strFullName, _, _ in tuplstFiles:
+        dictTemp = dictFolders.setdefault(strSubPath, dict())
+        dictTemp.setdefault(dictKeys[strFullName], []).append(strFullName)
     lstFiles2Delete = []
-    for strPath, _, lstFiles in os.walk(strFolder):
-        dictTemp = dict()
-        for strBaseName in lstFiles:
-            strFullName = os.path.join(strPath, strBaseName)
-            with open(strFullName, 'r') as fFile:
-                CheckSum = hashlib.md5(fFile.read()).hexdigest()
-            lstTemp = dictTemp.get(CheckSum, [])
-            lstTemp.append(strFullName)
-            dictTemp[CheckSum] = lstTemp
+    for dictTemp in dictFolders.values():
         for lstItem in dictTemp.values():
             if len(lstItem) > 1:
                 lstFiles2Delete.extend(list(sorted(lstItem))[1:])
     for strPath in lstFiles2Delete:
         os.remove(strPath)
+        if isinstance(objCache, FolderIndex):
+            objCache.discard(strPath)
 
-def CopyNonPresent(strTargetPath, strSourcePath):
+def CopyNonPresent(strTargetPath, strSourcePath, objCache = None,
+                            bStaged = True, iWorkers = None, bIndex = False):
     """
     Copies files found in any sub-folder of the source folder into the 'root'
     of the target folder if a file with the same base filename and md5 check sum
@@ -335,29 +1035,67 @@ def CopyNonPresent(strTargetPath, strSourcePath):
     underscore ('_') and an integer number if a file with the same name exists
     anywhere in the target folder.
     
+    By default the staged duplicates detection is applied to the files of the
+    both folders together, see MakeFolderDictionary(), which gives the same
+    result. The folders can be scanned and the files hashed in parallel, see
+    MakeFolderDictionary().
+    
+    The names present in the target folder are kept in a set, and the next
+    free suffix is tracked per name and extension, thus the names of the
+    copied files are resolved in constant time even with many same named files.
+    
+    With the optional flag bIndex set and no cache passed the persistent index
+    of the target folder is used (see FolderIndex) and saved afterwards, thus
+    the already indexed files of the target folder are not re-hashed.
+    
     Signature:
-        str, str -> None
+        str, str/, CheckSumCache, bool, int OR None, bool/ -> None
     
     Args:
         strTargetPath: str, path to the target folder
         strSourcePath: str, path to the source folder
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
+        bStaged: (optional) bool, flag if the staged duplicates detection is to
+            be used, defaults to True
+        iWorkers: (optional) int OR None, number of the worker threads for the
+            parallel scanning and hashing; None or 1 - sequential processing,
+            zero or negative - one per CPU; defaults to None
+        bIndex: (optional) bool, flag if the persistent index of the target
+            folder is to be used when no cache is passed, defaults to False
+    
+    Raises:
+        TypeError: the number of workers is not an integer or None
     
     Version 0.1.0.0
     """
-    dictMaster = MakeFolderDictionary(strTargetPath)
+    objIndex = None
+    if bIndex and (objCache is None):
+        objIndex = FolderIndex(strTargetPath)
+        objCache = objIndex
+    objPool = _GetPool(iWorkers)
+    try:
+        tuplstTarget = _TreeSnapshot(strTargetPath, objPool).getFiles()
+        tuplstSource = _TreeSnapshot(strSourcePath, objPool).getFiles()
+        if bStaged:
+            dictKeys = _GetContentKeys(tuplstTarget + tuplstSource, objCache,
+                                                                    objPool)
+        else:
+            dictKeys = _HashFiles([tupEntry[2] for tupEntry in
+                            tuplstTarget + tuplstSource], objCache, objPool)
+    finally:
+        _ClosePool(objPool)
+    dictMaster = _MakeDictionary(tuplstTarget, dictKeys)
     dictMasterCS = dict()
-    lstMasterNames = []
+    setMasterNames = set(dictMaster.keys())
     for strBaseName, dictEntry in dictMaster.items():
-        if not (strBaseName in lstMasterNames):
-            lstMasterNames.append(strBaseName)
         for strCheckSum in dictEntry.keys():
-            lstTemp = dictMasterCS.get(strCheckSum, [])
-            lstTemp.append(strBaseName)
-            dictMasterCS[strCheckSum] = lstTemp
-    dictOther = MakeFolderDictionary(strSourcePath)
+            dictMasterCS.setdefault(strCheckSum, set()).add(strBaseName)
+    dictSuffixes = dict()
+    dictOther = _MakeDictionary(tuplstSource, dictKeys)
     for strBaseName, dictEntry in dictOther.items():
         for strCheckSum, lstItems in dictEntry.items():
-            if not (strBaseName in dictMasterCS.get(strCheckSum, [])):
+            if not (strBaseName in dictMasterCS.get(strCheckSum, ())):
                 strPath = list(sorted(lstItems, key = lambda x: x[1],
                                                         reverse = True))[0][0]
                 lstParts = strBaseName.split('.')
@@ -368,19 +1106,23 @@ def CopyNonPresent(strTargetPath, strSourcePath):
                     strExt = ''
                     strName = strBaseName
                 strNewName = '{}{}'.format(strName, strExt)
-                iIndex = 1
-                while strNewName in lstMasterNames:
+                if strNewName in setMasterNames:
+                    iIndex = dictSuffixes.get((strName, strExt), 1)
                     strNewName = '{}_{}{}'.format(strName, iIndex, strExt)
-                    iIndex += 1
-                lstMasterNames.append(strNewName)
-                lstTemp = dictMasterCS.get(strCheckSum, [])
-                lstTemp.append(strNewName)
-                dictMasterCS[strCheckSum] = lstTemp
+                    while strNewName in setMasterNames:
+                        iIndex += 1
+                        strNewName = '{}_{}{}'.format(strName, iIndex, strExt)
+                    dictSuffixes[(strName, strExt)] = iIndex + 1
+                setMasterNames.add(strNewName)
+                dictMasterCS.setdefault(strCheckSum, set()).add(strNewName)
                 strOldPath = os.path.join(strSourcePath, strPath, strBaseName)
                 strNewPath = os.path.join(strTargetPath, strNewName)
                 shutil.copy2(strOldPath, strNewPath)
+    if not (objIndex is None):
+        objIndex.save()
 
-def CopyMerge(strSource, strTarget):
+def CopyMerge(strSource, strTarget, objCache = None, iWorkers = None,
+                                                                bIndex = False):
     """
     Merges the content, files and folders structure of the target folder with
     those of the source folder. Non-existing sub-folders are created,
@@ -392,30 +1134,574 @@ def CopyMerge(strSource, strTarget):
     the name before the extension. Empty sub-folders are not copied: itself or
     any of its sub-sub-folders must contain, at least, one file.
     
+    With the optional argument iWorkers being an integer other than 1 the
+    source folder is scanned by a pool of worker threads, and all files, which
+    are to be compared with the already existing in the target folder files,
+    are hashed in parallel beforehand, using an in-memory check sums cache if
+    the cache is not passed. The files are copied sequentially.
+    
+    With the optional flag bIndex set and no cache passed the persistent index
+    of the target folder is used (see FolderIndex) and saved afterwards, unless
+    the target folder does not exist yet, in which case the source folder is
+    simply copied.
+    
     Signature:
-        str, str -> None
+        str, str/, CheckSumCache, int OR None, bool/ -> None
     
     Args:
         strSource: str, path to the source folder
         strTarget: str, path to the target folder
+        objCache: (optional) CheckSumCache, instance of, the check sums cache to
+            use; defaults to None - the check sums are always calculated
+        iWorkers: (optional) int OR None, number of the worker threads for the
+            parallel scanning and hashing; None or 1 - sequential processing,
+            zero or negative - one per CPU; defaults to None
+        bIndex: (optional) bool, flag if the persistent index of the target
+            folder is to be used when no cache is passed, defaults to False
+    
+    Raises:
+        TypeError: the number of workers is not an integer or None
     
     Version 0.1.0.0
     """
     strSourcePath = os.path.abspath(strSource)
     strTargetPath = os.path.abspath(strTarget)
-    iSourceLen = len(strSourcePath)
+    objPool = _GetPool(iWorkers)
     if not os.path.isdir(strTarget):
+        _ClosePool(objPool)
         shutil.copytree(strSource, strTarget)
     else:
-        for strRoot, _, lstFiles in os.walk(strSource):
-            strOldPath = os.path.abspath(strRoot)
-            if strOldPath != strSourcePath:
-                strNewPath = os.path.join(strTargetPath,
-                                                    strOldPath[iSourceLen + 1:])
-            else:
-                strNewPath = strTargetPath
-            if len(lstFiles):
+        objIndex = None
+        if bIndex and (objCache is None):
+            objIndex = FolderIndex(strTarget)
+            objCache = objIndex
+        try:
+            tuplstFiles = _TreeSnapshot(strSourcePath, objPool).getFiles()
+            objTarget = _TreeSnapshot(strTargetPath, objPool)
+            if not (objPool is None):
+                if objCache is None:
+                    objCache = CheckSumCache()
+                #only the same named files of the same size are compared by
+                #+ the check sums, the other ones are rejected by the size
+                dictSizes = dict(((strSubPath, strFile), iSize)
+                        for strSubPath, tupFolder in objTarget.Folders.items()
+                                        for strFile, iSize, _ in tupFolder[1])
+                strlstPaths = []
+                for tupFile in tuplstFiles:
+                    strFile, strSubPath, strFullPath, iSize, _ = tupFile
+                    if dictSizes.get((strSubPath, strFile), None) == iSize:
+                        strNewFile = os.path.join(
+                                    objTarget.getPath(strSubPath), strFile)
+                        strlstPaths.extend([strFullPath, strNewFile])
+                _HashFiles(strlstPaths, objCache, objPool)
+        finally:
+            _ClosePool(objPool)
+        for strFile, strSubPath, strFullPath, iSize, strDateTime in tuplstFiles:
+            strNewPath = objTarget.getPath(strSubPath)
+            if not (strSubPath in objTarget.Folders):
                 TouchFolder(strNewPath)
-            for strFile in lstFiles:
-                SmartCopy(os.path.join(strRoot, strFile), strNewPath)
-        RemoveEmptyFolders(strTarget)
\ No newline at end of file
+            SmartCopy(strFullPath, strNewPath, objCache)
+            objTarget.addFile(strSubPath, strFile, iSize, strDateTime)
+        _RemoveEmptyFolders(objTarget)
+        if not (objIndex is None):
+            objIndex.save()
+
+#+ 'private' helper functions
+
+def _EncodePath(strPath):
+    """
+    Helper function to convert a unicode path into a byte string using the
+    file system encoding (or UTF-8, if not possible), so the keys of the cache
+    and index are of the same type regardless of the type of the passed paths.
+    A byte string path is returned as it is.
+    
+    Signature:
+        str OR unicode -> str
+    
+    Args:
+        strPath: str OR unicode, a path
+    
+    Returns:
+        str: the path as a byte string
+    
+    Version 0.1.0.0
+    """
+    if isinstance(strPath, unicode):
+        try:
+            strPath = strPath.encode(sys.getfilesystemencoding() or 'utf_8')
+        except UnicodeError:
+            strPath = strPath.encode('utf_8')
+    return strPath
+
+def _EncodeKey(strKey):
+    """
+    Helper function to escape a key of the stored cache or index into ASCII,
+    so the paths in any encoding (e.g. UTF-8 or Latin-1) can be stored in a
+    JSON file. The unicode keys are converted into UTF-8 first.
+    
+    Signature:
+        str OR unicode -> str
+    
+    Args:
+        strKey: str OR unicode, a key as used in memory
+    
+    Returns:
+        str: the ASCII escaped key
+    
+    Version 0.1.0.0
+    """
+    if isinstance(strKey, unicode):
+        strKey = strKey.encode('utf_8')
+    return strKey.encode('string_escape')
+
+def _DecodeKey(strKey):
+    """
+    Helper function to restore a key of the stored cache or index, escaped by
+    the function _EncodeKey(), as the original byte string. The non-ASCII
+    characters of a key stored unescaped are converted into UTF-8.
+    
+    Signature:
+        str OR unicode -> str
+    
+    Args:
+        strKey: str OR unicode, a key as loaded from a JSON file
+    
+    Returns:
+        str: the key as used in memory
+    
+    Version 0.1.0.0
+    """
+    return strKey.encode('utf_8').decode('string_escape')
+
+def _HashFile(strPath):
+    """
+    Helper function to calculate the md5 check sum of a file reading it in the
+    binary mode in the chunks of HASH_CHUNK_SIZE bytes.
+    
+    Signature:
+        str -> str
+    
+    Args:
+        strPath: str, path to a file
+    
+    Returns:
+        str: the hexadecimal md5 check sum of the file's content
+    
+    Raises:
+        IOError, OSError: the file does not exist or is not accessible
+    
+    Version 0.1.0.0
+    """
+    objHash = hashlib.md5()
+    with open(strPath, 'rb') as fFile:
+        while True:
+            strChunk = fFile.read(HASH_CHUNK_SIZE)
+            if not len(strChunk):
+                break
+            objHash.update(strChunk)
+    return objHash.hexdigest()
+
+def _HashFileEnds(strPath, iSize):
+    """
+    Helper function to calculate the md5 check sum of the first and the last
+    PARTIAL_HASH_SIZE bytes of a file - the head and the tail.
+    
+    Signature:
+        str, int >= 0 -> str
+    
+    Args:
+        strPath: str, path to a file
+        iSize: int >= 0, the size of the file in bytes
+    
+    Returns:
+        str: the hexadecimal md5 check sum of the file's head and tail
+    
+    Raises:
+        IOError, OSError: the file does not exist or is not accessible
+    
+    Version 0.1.0.0
+    """
+    objHash = hashlib.md5()
+    with open(strPath, 'rb') as fFile:
+        objHash.update(fFile.read(PARTIAL_HASH_SIZE))
+        fFile.seek(max(PARTIAL_HASH_SIZE, iSize - PARTIAL_HASH_SIZE))
+        objHash.update(fFile.read(PARTIAL_HASH_SIZE))
+    return objHash.hexdigest()
+
+def _IsSameFile(strFirst, strSecond):
+    """
+    Helper function to check if two paths refer to the same file - by the
+    device and inode numbers where supported, otherwise by the normalized
+    absolute paths.
+    
+    Signature:
+        str, str -> bool
+    
+    Version 0.1.0.0
+    """
+    if hasattr(os.path, 'samefile'):
+        bResult = os.path.samefile(strFirst, strSecond)
+    else:
+        bResult = (os.path.normcase(os.path.abspath(strFirst)) ==
+                                os.path.normcase(os.path.abspath(strSecond)))
+    return bResult
+
+def _CopyFileData(strSource, strTarget, bSync = False):
+    """
+    Helper function to copy the content of a file, see the function CopyFile().
+    The kernel-space copying by os.copy_file_range() or os.sendfile() is tried
+    first, if either is provided by the Python interpreter and the platform;
+    upon an OSError (e.g., not supported by the file system or across the
+    devices) the rest of the file is copied in chunks instead.
+    
+    Signature:
+        str, str/, bool/ -> int >= 0
+    
+    Args:
+        strSource: str, path to a file to be copied
+        strTarget: str, path to the new file
+        bSync: (optional) bool, if True the new file is synchronized with the
+            storage device before closing; defaults to False
+    
+    Returns:
+        int >= 0: the number of the copied bytes
+    
+    Raises:
+        IOError, OSError: the file does not exist or is not accessible, or the
+            target is not writable
+    
+    Version 0.1.0.0
+    """
+    iSize = 0
+    with open(strSource, 'rb', 0) as fSource:
+        with open(strTarget, 'wb', 0) as fTarget:
+            iSource = fSource.fileno()
+            iTarget = fTarget.fileno()
+            bKernel = True
+            while bKernel:
+                try:
+                    if hasattr(os, 'copy_file_range'):
+                        iCopied = os.copy_file_range(iSource, iTarget,
+                                            COPY_CHUNK_SIZE, iSize, iSize)
+                    elif hasattr(os, 'sendfile'):
+                        iCopied = os.sendfile(iTarget, iSource, iSize,
+                                                            COPY_CHUNK_SIZE)
+                    else:
+                        iCopied = None
+                except OSError:
+                    iCopied = None
+                if iCopied is None:
+                    bKernel = False
+                    fSource.seek(iSize)
+                    fTarget.seek(iSize)
+                    while True:
+                        strChunk = fSource.read(COPY_CHUNK_SIZE)
+                        if not len(strChunk):
+                            break
+                        fTarget.write(strChunk)
+                        iSize += len(strChunk)
+                elif not iCopied:
+                    bKernel = False
+                else:
+                    iSize += iCopied
+            if bSync:
+                os.fsync(iTarget)
+    return iSize
+
+def _CompareFileData(strFirst, strSecond):
+    """
+    Helper function to compare the content of two files in the chunks of
+    HASH_CHUNK_SIZE bytes until the first difference.
+    
+    Signature:
+        str, str -> bool
+    
+    Returns:
+        bool: True if the files have the same content, False otherwise
+    
+    Raises:
+        IOError, OSError: any of the files does not exist or is not accessible
+    
+    Version 0.1.0.0
+    """
+    bResult = True
+    with open(strFirst, 'rb') as fFirst:
+        with open(strSecond, 'rb') as fSecond:
+            while bResult:
+                strChunk = fFirst.read(HASH_CHUNK_SIZE)
+                bResult = strChunk == fSecond.read(HASH_CHUNK_SIZE)
+                if not len(strChunk):
+                    break
+    return bResult
+
+def _RemoveEmptyFolders(objSnapshot):
+    """
+    Helper function to remove all empty sub-folders found in a folders tree
+    snapshot, see the function RemoveEmptyFolders() and the method
+    _TreeSnapshot.getEmptyFolders().
+    
+    Signature:
+        _TreeSnapshot -> None
+    
+    Args:
+        objSnapshot: _TreeSnapshot, instance of, the snapshot of the folders
+            tree
+    
+    Raises:
+        OSError: a sub-folder cannot be removed
+    
+    Version 0.1.0.0
+    """
+    for strSubPath in objSnapshot.getEmptyFolders():
+        os.rmdir(objSnapshot.getPath(strSubPath))
+
+def _GetContentKeys(tuplstFiles, objCache, objPool = None):
+    """
+    Helper function implementing the staged duplicates detection. The files are
+    grouped by their sizes first, and a file with a unique size cannot have
+    duplicates. The files with the same size are sub-grouped by the md5 check
+    sum of their heads and tails (PARTIAL_HASH_SIZE bytes each), and, again, a
+    file with a unique partial check sum cannot have duplicates. The full md5
+    check sum is calculated only for the remaining candidates and for all small
+    files with the same size (not larger than 2 * PARTIAL_HASH_SIZE), for which
+    the partial check sum is, basically, the full check sum.
+    
+    The content key of a file is its full md5 check sum, if calculated, or its
+    full path otherwise; thus two files have the same key if and only if they
+    have the same md5 check sum.
+    
+    If a pool of worker threads is passed, all partial and then all full check
+    sums are calculated in parallel.
+    
+    Signature:
+        list(tuple(str, str, str, int, str)), CheckSumCache OR None
+            /, multiprocessing.pool.ThreadPool OR None/ -> dict(str -> str)
+    
+    Args:
+        tuplstFiles: list(tuple(str, str, str, int, str)), list of the files as
+            returned by _TreeSnapshot.getFiles()
+        objCache: CheckSumCache OR None, instance of, the check sums cache to
+            use for the full check sums
+        objPool: (optional) multiprocessing.pool.ThreadPool OR None, pool of
+            the worker threads to use, defaults to None - sequential hashing
+    
+    Returns:
+        dict(str -> str): mapping of the full paths to the content keys
+    
+    Version 0.1.0.0
+    """
+    dictSizes = dict()
+    for tupEntry in tuplstFiles:
+        dictSizes.setdefault(tupEntry[3], []).append(tupEntry[2])
+    dictKeys = dict()
+    strlstCandidates = []
+    tuplstPartial = []
+    for iSize, strlstPaths in dictSizes.items():
+        if len(strlstPaths) == 1:
+            dictKeys[strlstPaths[0]] = strlstPaths[0]
+        elif iSize <= 2 * PARTIAL_HASH_SIZE:
+            strlstCandidates.extend(strlstPaths)
+        else:
+            tuplstPartial.extend((strPath, iSize) for strPath in strlstPaths)
+    if objPool is None:
+        strlstPartial = [_HashFileEnds(strPath, iSize)
+                                        for strPath, iSize in tuplstPartial]
+    else:
+        strlstPartial = objPool.map(_HashFileEndsTask, tuplstPartial)
+    dictPartial = dict()
+    for tupEntry, strPartial in zip(tuplstPartial, strlstPartial):
+        dictPartial.setdefault((tupEntry[1], strPartial), []).append(
+                                                                tupEntry[0])
+    for strlstGroup in dictPartial.values():
+        if len(strlstGroup) == 1:
+            dictKeys[strlstGroup[0]] = strlstGroup[0]
+        else:
+            strlstCandidates.extend(strlstGroup)
+    dictKeys.update(_HashFiles(strlstCandidates, objCache, objPool))
+    return dictKeys
+
+def _MakeDictionary(tuplstFiles, dictKeys):
+    """
+    Helper function to construct the look-up table of the files as in the
+    function MakeFolderDictionary().
+    
+    Signature:
+        list(tuple(str, str, str, int, str)), dict(str -> str)
+            -> dict(str -> dict(str -> list(tuple(str, str))))
+    
+    Args:
+        tuplstFiles: list(tuple(str, str, str, int, str)), list of the files as
+            returned by _TreeSnapshot.getFiles()
+        dictKeys: dict(str -> str), mapping of the full paths to the md5 check
+            sums or the content keys
+    
+    Returns:
+        dict(str -> list(dict(str -> str))): a dictionary implementing the
+            following mapping: base filename -> md5 check sum (content key) ->
+            [(sub-path, date-time stamp), ...]
+    
+    Version 0.1.0.0
+    """
+    dictResult = dict()
+    for strFile, strSubPath, strFullPath, _, strDateTime in tuplstFiles:
+        dictTemp = dictResult.setdefault(strFile, dict())
+        dictTemp.setdefault(dictKeys[strFullPath], []).append((strSubPath,
+                                                                strDateTime))
+    return dictResult
+
+def _HashFileEndsTask(tupTask):
+    """
+    Helper function to calculate the md5 check sum of the head and the tail of
+    a file by a worker thread, see _HashFileEnds().
+    
+    Signature:
+        tuple(str, int >= 0) -> str
+    
+    Args:
+        tupTask: tuple(str, int >= 0), path to a file and its size in bytes
+    
+    Returns:
+        str: the hexadecimal md5 check sum of the file's head and tail
+    
+    Version 0.1.0.0
+    """
+    return _HashFileEnds(*tupTask)
+
+def _HashFiles(strlstPaths, objCache, objPool = None):
+    """
+    Helper function to calculate the md5 check sums of the files, see the
+    function GetCheckSum(), sequentially or, if a pool of worker threads is
+    passed, in parallel.
+    
+    Signature:
+        list(str), CheckSumCache OR None/, multiprocessing.pool.ThreadPool OR
+            None/ -> dict(str -> str)
+    
+    Args:
+        strlstPaths: list(str), paths to the files to hash
+        objCache: CheckSumCache OR None, instance of, the check sums cache to
+            use
+        objPool: (optional) multiprocessing.pool.ThreadPool OR None, pool of
+            the worker threads to use, defaults to None - sequential hashing
+    
+    Returns:
+        dict(str -> str): mapping of the paths to the md5 check sums
+    
+    Version 0.1.0.0
+    """
+    if objPool is None:
+        strlstCheckSums = [GetCheckSum(strPath, objCache)
+                                                    for strPath in strlstPaths]
+    else:
+        strlstCheckSums = objPool.map(functools.partial(GetCheckSum,
+                                        objCache = objCache), strlstPaths)
+    return dict(zip(strlstPaths, strlstCheckSums))
+
+def _ListFolder(strPath):
+    """
+    Helper function to list a single folder, also by a worker thread. The
+    content is split into the sub-folders to descend into and the files (any
+    other entries), same as by os.walk() - i.e. the symbolic links to folders
+    are neither followed nor treated as files. The attributes of each entry are
+    read only once with os.lstat(), and os.stat() is called only for the
+    symbolic links, thus the size and the last modification date-time stamp of
+    each file are obtained at the same time. A broken symbolic link is treated
+    as a file with the attributes of the link itself. The folder index file
+    (INDEX_FILE_NAME) is not listed as a file, but as other content.
+    
+    Signature:
+        str -> tuple(list(str), list(tuple(str, int, str)), bool)
+    
+    Args:
+        strPath: str, path to a folder
+    
+    Returns:
+        tuple(list(str), list(tuple(str, int, str)), bool): the names of the
+            sub-folders to descend into, the files as tuples (base filename,
+            size, date-time stamp), and the flag if the folder contains
+            symbolic links to folders or cannot be listed
+    
+    Raises:
+        OSError: the attributes of an entry cannot be read
+    
+    Version 0.1.0.0
+    """
+    try:
+        strlstNames = os.listdir(strPath)
+    except OSError:
+        return [], [], True
+    strlstFolders = []
+    tuplstFiles = []
+    bOther = False
+    for strName in strlstNames:
+        if strName == INDEX_FILE_NAME:
+            bOther = True
+            continue
+        strFullPath = os.path.join(strPath, strName)
+        objStat = os.lstat(strFullPath)
+        bLink = stat.S_ISLNK(objStat.st_mode)
+        if bLink:
+            try:
+                objStat = os.stat(strFullPath)
+            except OSError:
+                pass
+        if stat.S_ISDIR(objStat.st_mode):
+            if bLink:
+                bOther = True
+            else:
+                strlstFolders.append(strName)
+        else:
+            strDateTime = datetime.datetime.fromtimestamp(
+                            objStat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+            tuplstFiles.append((strName, objStat.st_size, strDateTime))
+    return strlstFolders, tuplstFiles, bOther
+
+def _GetPool(iWorkers):
+    """
+    Helper function to create a pool of the worker threads for the parallel
+    scanning and hashing.
+    
+    Signature:
+        int OR None -> multiprocessing.pool.ThreadPool OR None
+    
+    Args:
+        iWorkers: int OR None, number of the worker threads; None or 1 -
+            sequential processing, zero or negative - one per CPU
+    
+    Returns:
+        multiprocessing.pool.ThreadPool: the pool of the worker threads
+        None: sequential processing is requested
+    
+    Raises:
+        TypeError: the number of workers is not an integer or None
+    
+    Version 0.1.0.0
+    """
+    if iWorkers is None:
+        return None
+    if (not isinstance(iWorkers, (int, long))) or isinstance(iWorkers, bool):
+        strError = "Wrong type of the number of workers {} argument".format(
+                                                                type(iWorkers))
+        raise TypeError("{}, must be an integer or None".format(strError))
+    if iWorkers == 1:
+        return None
+    if iWorkers < 1:
+        iWorkers = multiprocessing.cpu_count()
+    return multiprocessing.pool.ThreadPool(iWorkers)
+
+def _ClosePool(objPool):
+    """
+    Helper function to shut down a pool of the worker threads created by the
+    function _GetPool().
+    
+    Signature:
+        multiprocessing.pool.ThreadPool OR None -> None
+    
+    Args:
+        objPool: multiprocessing.pool.ThreadPool OR None, the pool to shut down
+    
+    Version 0.1.0.0
+    """
+    if not (objPool is None):
+        objPool.close()
+        objPool.join()
@@ -12,6 +12,8 @@ Functions:
         str, seq(str)/, str = '\r\n'/ -> None
     LoadLines()
         str/, int >= 0/ -> list(str)
+    IterLines()
+        str/, int >= 0, int > 0/ -> generator(str)
     SplitLine()
         str -> list(str)
     DetectNotation()
@@ -19,7 +21,10 @@ Functions:
     ConvertFromString()
         str, int -> int OR float OR str
     LoadTable()
-        str/, int >= 0/ -> list(list(int OR float OR str))
+        str/, int >= 0, bool/
+            -> list(list(int OR float OR str)) OR numpy.recarray
+    IterTable()
+        str/, int >= 0/ -> generator(list(int OR float OR str))
 """
 
 __version__ = "0.1.0.0"
@@ -32,6 +37,13 @@ __status__ = "Production"
 
 import re
 
+#+ optional 3rd party libraries
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # globals
 
 #+ definitely dutch number representation regular patters
@@ -52,6 +64,14 @@ RE_INT2 = re.compile(r'(^|\D)(\+|-)?\d{1,3},\d{3}(,\d{3})+($|\D)')
 RE_INT3 = re.compile(r'(^|\D)(\+|-)?\d{1,3}(,\d{3})+\.\d*($|\D)')
 RE_INT4 = re.compile(r'(^|\D)\d+\.(\d{0,2}|\d{4}\d*)($|D)')
 
+#+ columns separator - a single TAB or a run of spaces
+
+RE_COLUMNS_SEPARATOR = re.compile(r'\t| +')
+
+#+ default size of the chunks for the streaming reading of the files
+
+LINES_CHUNK_SIZE = 65536
+
 #functions
 
 def SaveForcedNewLine(strFileName, strseqLines, strNewLine = '\r\n'):
@@ -82,6 +102,11 @@ def LoadLines(strFileName, iSkipLines = 0):
     characters (CR and LF - alone or in CRLF combination), (optionally) skips
     the first iSkipLines, and returns the result as a list of strings.
     
+    The file is read in the binary mode, and the content is split by the string
+    method splitlines(), which treats exactly CR, LF and CRLF as the line
+    endings for the byte strings. A line ending at the very end of the file
+    does not produce an extra empty line.
+    
     Signature:
         str/, int >= 0/ -> list(str)
     
@@ -94,33 +119,64 @@ def LoadLines(strFileName, iSkipLines = 0):
     """
     with open(strFileName, 'rb') as fFile:
         strBuffer = fFile.read()
-    strlstBuffer = []
-    strTemp = ''
-    bNewLine = False
-    for strChar in strBuffer:
-        if strChar == '\r':
-            if bNewLine:
-                strlstBuffer.append(strTemp)
-                strTemp = ''
-            else:
-                bNewLine = True
-        elif strChar == '\n':
-            bNewLine = False
-            strlstBuffer.append(strTemp)
-            strTemp = ''
-        else:
-            if not bNewLine:
-                strTemp += strChar
-            else:
-                strlstBuffer.append(strTemp)
-                bNewLine = False
-                strTemp = strChar
-    if len(strTemp) or bNewLine:
-        strlstBuffer.append(strTemp)
+    strlstBuffer = strBuffer.splitlines()
     if isinstance(iSkipLines, (int, long)) and iSkipLines >= 0:
         strlstBuffer = strlstBuffer[iSkipLines:]
     return strlstBuffer
 
+def IterLines(strFileName, iSkipLines = 0, iChunkSize = LINES_CHUNK_SIZE):
+    """
+    Generator version of the function LoadLines(), which reads a file in the
+    binary mode in the chunks of the fixed size and yields its lines (as
+    strings) one by one with the end line characters (CR and LF - alone or in
+    CRLF combination) stripped, (optionally) skipping the first iSkipLines.
+    
+    Only the current chunk and the incomplete last line of the previous chunk
+    are held in memory. Such incomplete line includes a CR at the very end of a
+    chunk, since the next chunk may start with the paired LF. The skipped lines
+    are split off the chunks but never stored. The yielded lines are exactly
+    the same as the elements of the list returned by LoadLines().
+    
+    Signature:
+        str/, int >= 0, int > 0/ -> generator(str)
+    
+    Args:
+        strFileName: str, name of (path to) the file to read
+        iSkipLines: (optional) int, not negative, the number of the first lines
+            to skip, defaults to 0; non-integer or negative values are ignored
+        iChunkSize: (optional) int, positive, the size of the chunks in bytes,
+            defaults to LINES_CHUNK_SIZE; non-integer or not positive values
+            are ignored
+    
+    Yields:
+        str: the next line of the file
+    
+    Version 0.1.0.0
+    """
+    if not (isinstance(iSkipLines, (int, long)) and iSkipLines >= 0):
+        iSkipLines = 0
+    if not (isinstance(iChunkSize, (int, long)) and iChunkSize > 0):
+        iChunkSize = LINES_CHUNK_SIZE
+    strTail = ''
+    with open(strFileName, 'rb') as fFile:
+        while True:
+            strChunk = fFile.read(iChunkSize)
+            if not len(strChunk):
+                break
+            strlstLines = (strTail + strChunk).splitlines(True)
+            if strlstLines[-1].endswith('\n'):
+                strTail = ''
+            else:
+                strTail = strlstLines.pop()
+            if iSkipLines:
+                iSkipped = min(iSkipLines, len(strlstLines))
+                iSkipLines -= iSkipped
+                strlstLines = strlstLines[iSkipped:]
+            for strLine in strlstLines:
+                yield strLine.rstrip('\r\n')
+    if len(strTail) and not iSkipLines:
+        yield strTail.rstrip('\r\n')
+
 def SplitLine(strLine):
     """
     Splits the passed string into substrings, returned as a list of strings, by
@@ -128,31 +184,18 @@ def SplitLine(strLine):
     spaces are also converted into empty strings (columns). An empty string is
     converted into a list containg a single element - an empty string.
     
+    A line without spaces is split by the string method split('\t'), otherwise
+    the pre-compiled regular expression RE_COLUMNS_SEPARATOR is used.
+    
     Signature:
         str -> list(str)
     
     Version 0.1.0.0
     """
-    if len(strLine):
-        bSpaceRun = False
-        strlstResult = []
-        strTemp = ''
-        for strChar in strLine:
-            if strChar != ' ' and strChar != '\t':
-                bSpaceRun = False
-                strTemp += strChar
-            elif strChar == '\t':
-                bSpaceRun = False
-                strlstResult.append(strTemp)
-                strTemp = ''
-            else:
-                if not bSpaceRun:
-                    bSpaceRun = True
-                    strlstResult.append(strTemp)
-                    strTemp = ''
-        strlstResult.append(strTemp)
+    if ' ' in strLine:
+        strlstResult = RE_COLUMNS_SEPARATOR.split(strLine)
     else:
-        strlstResult = ['']
+        strlstResult = strLine.split('\t')
     return strlstResult
 
 def DetectNotation(strseqSamples):
@@ -175,22 +218,16 @@ def DetectNotation(strseqSamples):
     
     Version 0.1.0.0
     """
-    bDefInt = False
-    bDefDutch = False
     bPosDutch = False
     for strSample in strseqSamples:
-        bDefInt = any(map(lambda x: not (x.match(strSample) is None),
-                                        [RE_INT1, RE_INT2, RE_INT3, RE_INT4]))
-        if not bDefInt:
-            bDefDutch = any(map(lambda x: not (x.match(strSample) is None),
-                                        [RE_NL1, RE_NL2, RE_NL3, RE_NL4]))
-            if not (bDefDutch or bPosDutch):
-                bPosDutch = RE_NL5.match(strSample)
-        if bDefDutch or bDefInt:
-            break
-    if bDefInt:
-        bResult = 0
-    elif bDefDutch or bPosDutch:
+        iClass = _ClassifyNotation(strSample)
+        if iClass == 0:
+            return 0
+        elif iClass == 1:
+            return 1
+        elif iClass == 2:
+            bPosDutch = True
+    if bPosDutch:
         bResult = 1
     else:
         bResult = 0
@@ -232,7 +269,7 @@ def ConvertFromString(strItem, iNotation):
             gResult = strItem
     return gResult
 
-def LoadTable(strFileName, iSkipLines = 0):
+def LoadTable(strFileName, iSkipLines = 0, bArray = False):
     """
     Generic locale-independent loader of a data file saved in a TSV format with:
         * CR, LF or CRLF line endings
@@ -244,28 +281,208 @@ def LoadTable(strFileName, iSkipLines = 0):
             (i.e. ',' or '.' as the decimal separator) with or without the
             decimal delimiters ('.' or ',' respectively)
     
+    With the optional flag bArray being True the data is returned as a NumPy
+    record (structured) array instead, with one field per column - see
+    _LoadArray(). This mode requires the NumPy library.
+    
     Signature:
     
-        str/, int >= 0/ -> list(list(int OR float OR str))
+        str/, int >= 0, bool/
+            -> list(list(int OR float OR str)) OR numpy.recarray
     
     Args:
         strFileName: str, name of (path to) a file to load
         iSkipLines: (optional) int, non-negative, number of the first lines to
             skip, defaults to 0. Non-integer or negative value is ignored
+        bArray: (optional) bool, flag if a NumPy record array is to be returned,
+            defaults to False
     
     Returns:
         list(list(int OR float OR str)): the tabulated data converted into
             nested lists (equal number of columns is not guaranteed), with the
             values of the 'cells' converted into int or float when possible
+        numpy.recarray: the tabulated data as a record array with the fields
+            'f0', 'f1', etc. - one per column, if the flag bArray is True
+    
+    Raises:
+        ImportError: the flag bArray is True, but NumPy is not installed
+        ValueError: the flag bArray is True, but the rows of the table have
+            different number of columns
+    
+    Version 0.1.0.0
+    """
+    if bArray:
+        gResult = _LoadArray(strFileName, iSkipLines)
+    else:
+        gResult = list(IterTable(strFileName, iSkipLines = iSkipLines))
+    return gResult
+
+def IterTable(strFileName, iSkipLines = 0):
+    """
+    Generator version of the function LoadTable(), which yields the rows of the
+    tabulated data one by one, with the values of the 'cells' converted into
+    int or float when possible - exactly as LoadTable() does.
+    
+    The number notation is determined by the first definite (unambiguous)
+    'cell' as in DetectNotation(), therefore only the rows up to and including
+    the first one containing such 'cell' are buffered before being yielded. If
+    there are no definite cells in the file at all, all rows are buffered until
+    the end of the file is reached.
+    
+    Signature:
+        str/, int >= 0/ -> generator(list(int OR float OR str))
+    
+    Args:
+        strFileName: str, name of (path to) a file to load
+        iSkipLines: (optional) int, non-negative, number of the first lines to
+            skip, defaults to 0. Non-integer or negative value is ignored
+    
+    Yields:
+        list(int OR float OR str): the next row of the table
     
     Version 0.1.0.0
     """
-    strlstLines = LoadLines(strFileName, iSkipLines)
-    strlstlstBuffer= map(SplitLine, strlstLines)
-    strlstTemp = []
-    for strlstItem in strlstlstBuffer:
-        strlstTemp.extend(strlstItem)
-    iNotation = DetectNotation(strlstTemp)
-    glstlstResult = [map(lambda x: ConvertFromString(x, iNotation), strlstTemp)
-                                            for strlstTemp in strlstlstBuffer]
-    return glstlstResult
\ No newline at end of file
+    iNotation = None
+    bPosDutch = False
+    strlstlstBuffer = []
+    for strLine in IterLines(strFileName, iSkipLines):
+        strlstRow = SplitLine(strLine)
+        if iNotation is None:
+            strlstlstBuffer.append(strlstRow)
+            for strItem in strlstRow:
+                iClass = _ClassifyNotation(strItem)
+                if iClass == 2:
+                    bPosDutch = True
+                elif not (iClass is None):
+                    iNotation = iClass
+                    break
+            if not (iNotation is None):
+                for strlstItem in strlstlstBuffer:
+                    yield [ConvertFromString(strItem, iNotation)
+                                                    for strItem in strlstItem]
+                strlstlstBuffer = []
+        else:
+            yield [ConvertFromString(strItem, iNotation)
+                                                    for strItem in strlstRow]
+    if iNotation is None:
+        if bPosDutch:
+            iNotation = 1
+        else:
+            iNotation = 0
+        for strlstItem in strlstlstBuffer:
+            yield [ConvertFromString(strItem, iNotation)
+                                                    for strItem in strlstItem]
+
+#+ 'private' helper functions
+
+def _ClassifyNotation(strSample):
+    """
+    Matches a single string against the defined (as globals) regular expression
+    patterns of the number notations.
+    
+    Signature:
+        str -> int OR None
+    
+    Args:
+        strSample: str, a string to check
+    
+    Returns:
+        int: 0 for the definite international, 1 for the definite Dutch and 2
+            for the possibly Dutch notation
+        None: no match
+    
+    Version 0.1.0.0
+    """
+    for objPattern in (RE_INT1, RE_INT2, RE_INT3, RE_INT4):
+        if not (objPattern.match(strSample) is None):
+            return 0
+    for objPattern in (RE_NL1, RE_NL2, RE_NL3, RE_NL4):
+        if not (objPattern.match(strSample) is None):
+            return 1
+    if not (RE_NL5.match(strSample) is None):
+        return 2
+    return None
+
+def _LoadArray(strFileName, iSkipLines):
+    """
+    Helper function implementing the array mode of the function LoadTable().
+    The number notation is determined for the entire table exactly as in the
+    list mode. The type of each column is detected once: the entire column is
+    converted into a 64-bit integer array, or, if not possible, into a 64-bit
+    float array in bulk. Only if neither is possible each 'cell' of such column
+    is converted individually by the function ConvertFromString() and the
+    column is stored as an array of Python objects.
+    
+    Signature:
+        str, int -> numpy.recarray
+    
+    Args:
+        strFileName: str, name of (path to) a file to load
+        iSkipLines: int, non-negative, number of the first lines to skip.
+            Non-integer or negative value is ignored
+    
+    Returns:
+        numpy.recarray: the tabulated data as a record array with the fields
+            'f0', 'f1', etc. - one per column
+    
+    Raises:
+        ImportError: NumPy is not installed
+        ValueError: the rows of the table have different number of columns
+    
+    Version 0.1.0.0
+    """
+    if numpy is None:
+        raise ImportError('NumPy is required for the array mode of LoadTable()')
+    strlstlstRows = [SplitLine(strLine)
+                            for strLine in IterLines(strFileName, iSkipLines)]
+    if not len(strlstlstRows):
+        return numpy.zeros(0, dtype = []).view(numpy.recarray)
+    iColumns = len(strlstlstRows[0])
+    for iRow, strlstRow in enumerate(strlstlstRows):
+        if len(strlstRow) != iColumns:
+            strError = 'Row {} has {} columns instead of {} in {}'.format(
+                            iRow + 1, len(strlstRow), iColumns, strFileName)
+            raise ValueError(strError)
+    iNotation = DetectNotation(strItem for strlstRow in strlstlstRows
+                                                    for strItem in strlstRow)
+    lstColumns = [_ConvertColumn(strtupColumn, iNotation)
+                                    for strtupColumn in zip(*strlstlstRows)]
+    return numpy.rec.fromarrays(lstColumns)
+
+def _ConvertColumn(strseqColumn, iNotation):
+    """
+    Helper function to convert an entire column of the table in the array mode
+    of the function LoadTable(). Removes the decimal delimiters and replaces
+    the decimal separator ',' (comma) by '.' (dot) in all elements at once,
+    using a single TAB-joined string (the 'cells' cannot contain TABs), and
+    attempts to convert the column into integers, and, if failed, into floats,
+    so at most two exceptions are raised per column instead of per 'cell'. If
+    also failed, converts each element by ConvertFromString().
+    
+    Signature:
+        seq(str), int -> numpy.ndarray(int OR float OR object)
+    
+    Args:
+        strseqColumn: seq(str), the 'cells' of a column
+        iNotation: int, 0 for international, 1 for dutch
+    
+    Returns:
+        numpy.ndarray(int OR float OR object): the converted column
+    
+    Version 0.1.0.0
+    """
+    strBuffer = '\t'.join(strseqColumn)
+    if iNotation == 1:
+        strBuffer = strBuffer.replace('.', '').replace(',', '.')
+    else:
+        strBuffer = strBuffer.replace(',', '')
+    strlstNew = strBuffer.split('\t')
+    for clsType, clsDType in ((int, numpy.int64), (float, numpy.float64)):
+        try:
+            return numpy.array(map(clsType, strlstNew), dtype = clsDType)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    aResult = numpy.empty(len(strseqColumn), dtype = object)
+    aResult[:] = [ConvertFromString(strItem, iNotation)
+                                                for strItem in strseqColumn]
+    return aResult